@@ -1 +1,105 @@
-from app.db.session import get_db 
\ No newline at end of file
+from typing import Optional, Union
+
+from fastapi import Depends, HTTPException, Query, WebSocket, WebSocketException, status
+from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.pubsub import StreamHub, stream_hub
+from app.core.security import verify_token
+from app.db.session import get_db, get_async_db
+from app.services.auth_service import Principal, PrincipalCache, principal_cache
+from app.trading.portfolio import PortfolioBook, portfolio_book
+from app.trading.streams import PortfolioView
+from app.trading.upbit.async_api import AsyncUpbitAPI
+
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
+
+
+def get_stream_hub() -> StreamHub:
+    """대시보드 스트림 허브"""
+    return stream_hub
+
+
+def get_portfolio_book(hub: StreamHub = Depends(get_stream_hub)) -> Union[PortfolioBook, PortfolioView]:
+    """포트폴리오 장부 (API 워커는 엔진 프로세스가 복제한 포지션 상태)"""
+    if settings.APP_ROLE == "api":
+        return PortfolioView(hub)
+    return portfolio_book
+
+
+def get_quote_client() -> AsyncUpbitAPI:
+    """시세 조회용 클라이언트 (공개 API만 사용하므로 키 없음)"""
+    return AsyncUpbitAPI("", "")
+
+
+def get_principal_cache() -> PrincipalCache:
+    """인증 사용자 캐시"""
+    return principal_cache
+
+
+def _credentials_error() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="인증 정보가 유효하지 않습니다.",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+async def _resolve_principal(token: Optional[str], db: AsyncSession, cache: PrincipalCache) -> Principal:
+    payload = verify_token(token) if token else None
+    subject = payload.get("sub") if payload else None
+    try:
+        user_id = int(subject)
+    except (TypeError, ValueError):
+        raise _credentials_error()
+    principal = await cache.resolve(db, user_id)
+    if principal is None:
+        raise _credentials_error()
+    return principal
+
+
+async def get_current_principal(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db),
+    cache: PrincipalCache = Depends(get_principal_cache),
+) -> Principal:
+    """
+    토큰의 사용자 조회
+
+    토큰 서명은 미리 만든 키 객체로 한 번만 검증하고, 사용자는 캐시에서 찾는다.
+    세션은 캐시에 없을 때만 연결을 얻는다.
+    """
+    return await _resolve_principal(token, db, cache)
+
+
+async def get_current_active_principal(principal: Principal = Depends(get_current_principal)) -> Principal:
+    """활성 사용자만 허용"""
+    if not principal.is_active:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="비활성화된 사용자입니다.")
+    return principal
+
+
+async def get_websocket_principal(
+    websocket: WebSocket,
+    token: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_async_db),
+    cache: PrincipalCache = Depends(get_principal_cache),
+) -> Principal:
+    """
+    WebSocket 연결의 활성 사용자 조회
+
+    브라우저 WebSocket은 헤더를 지정할 수 없으므로 token 쿼리 파라미터로 인증한다.
+    실패하면 정책 위반(1008) 코드로 연결을 닫는다.
+    """
+    try:
+        return await get_current_active_principal(await _resolve_principal(token, db, cache))
+    except HTTPException as e:
+        raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION, reason=e.detail)
+
+
+async def get_current_admin_principal(principal: Principal = Depends(get_current_active_principal)) -> Principal:
+    """운영 관리자(settings.ADMIN_USERNAMES)만 허용"""
+    if principal.username not in settings.ADMIN_USERNAMES:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="관리자만 사용할 수 있습니다.")
+    return principal
@@ -0,0 +1,68 @@
+"""
+HTTP 요청 계측 미들웨어와 Prometheus 수집 엔드포인트
+"""
+
+import time
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.metrics import REGISTRY, Gauge, Histogram
+
+# HTTP 요청
+HTTP_REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds", "요청 수신부터 응답 본문 전송 완료까지 걸린 시간 (라우트별)",
+    labelnames=("method", "route", "status"),
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge("http_requests_in_progress", "처리 중인 HTTP 요청 수")
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+router = APIRouter()
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp):
+        """
+        라우트별 요청 지연 계측 미들웨어 초기화
+
+        BaseHTTPMiddleware와 달리 응답을 감싸지 않는 순수 ASGI 미들웨어라 스트리밍 응답도 그대로 흘려보낸다.
+        라우트 라벨은 경로 템플릿(/api/v1/api-keys/{key_id})을 쓰므로 경로 값마다 지표가 늘지 않고,
+        일치하는 라우트가 없으면 "unmatched"로 묶는다. SSE처럼 오래 열린 응답은 연결이 끝날 때 기록된다.
+
+        Args:
+            app (ASGIApp): 감쌀 애플리케이션
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_PROGRESS.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - start
+            HTTP_REQUESTS_IN_PROGRESS.dec()
+            # 라우팅이 scope에 일치한 라우트를 남김
+            route = scope.get("route")
+            path = getattr(route, "path", None) or "unmatched"
+            HTTP_REQUEST_LATENCY.labels(scope["method"], path, str(status)).observe(elapsed)
+
+
+@router.get(settings.METRICS_PATH, include_in_schema=False)
+async def get_metrics() -> PlainTextResponse:
+    """프로세스 지표를 Prometheus 텍스트 형식으로 반환"""
+    return PlainTextResponse(REGISTRY.render(), media_type=CONTENT_TYPE)
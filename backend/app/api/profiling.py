@@ -0,0 +1,45 @@
+"""
+요청 프로파일링 미들웨어
+"""
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.profiling import RequestProfiler, request_profiler
+
+
+class ProfilingMiddleware:
+    def __init__(self, app: ASGIApp, profiler: RequestProfiler = request_profiler):
+        """
+        요청 스택 샘플링 미들웨어 초기화
+
+        느린 요청 기록과 요청 프로파일링이 모두 꺼져 있으면 플래그 하나만 확인하고 그대로 넘긴다.
+
+        Args:
+            app (ASGIApp): 감쌀 애플리케이션
+            profiler (RequestProfiler): 요청 프로파일러
+        """
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        profiler = self.profiler
+        if not profiler.active or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        watch = profiler.begin()
+        if watch is None:
+            await self.app(scope, receive, send)
+            return
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            profiler.end(watch, scope["method"], route, scope["path"], status)
@@ -3,7 +3,11 @@ API 라우터
 """
 
 from fastapi import APIRouter
-from app.api.v1.endpoints import api_keys
+from app.api.v1.endpoints import api_keys, auth, dashboard, stream, system
 
 api_router = APIRouter()
-api_router.include_router(api_keys.router, prefix="/api-keys", tags=["api-keys"]) 
\ No newline at end of file
+api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
+api_router.include_router(api_keys.router, prefix="/api-keys", tags=["api-keys"]) 
+api_router.include_router(dashboard.router, prefix="/dashboard", tags=["dashboard"])
+api_router.include_router(stream.router, prefix="/stream", tags=["stream"])
+api_router.include_router(system.router, prefix="/system", tags=["system"])
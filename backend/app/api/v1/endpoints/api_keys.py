@@ -2,28 +2,78 @@
 API 키 관리 엔드포인트
 """
 
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+import json
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.api import deps
-from app.trading.upbit.services import ApiKeyService
+from app.core.config import settings
+from app.services.auth_service import Principal
+from app.trading.upbit.services import MAX_PAGE_SIZE, AsyncApiKeyService
 from app.trading.upbit.models import ApiKey
 from app.trading.upbit.exceptions import UpbitAPIKeyError
-from app.trading.upbit.schemas import ApiKey as ApiKeySchema, ApiKeyCreate, ApiKeyUpdateStatus
+from app.trading.upbit.schemas import (
+    ApiKey as ApiKeySchema, ApiKeyBulkResponse, ApiKeyCreate, ApiKeySummary, ApiKeyUpdateStatus,
+)
 
 router = APIRouter()
 
+NDJSON = "application/x-ndjson"
+
+
+def _transport_key(value: Optional[str]) -> Optional[bytes]:
+    if value is None:
+        return None
+    from cryptography.fernet import Fernet
+
+    try:
+        Fernet(value.encode())
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="전송 키 형식이 올바르지 않습니다. (Fernet 키)")
+    return value.encode()
+
+
+async def _request_items(request: Request) -> AsyncIterator[Any]:
+    """본문 항목 (NDJSON은 줄 단위로 읽으며 바로 넘김, JSON은 배열 전체)"""
+    if request.headers.get("content-type", "").split(";")[0].strip() == NDJSON:
+        buffer = b""
+        async for chunk in request.stream():
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                if line.strip():
+                    yield line
+        if buffer.strip():
+            yield buffer
+        return
+    try:
+        items = json.loads(await request.body())
+    except ValueError:
+        raise HTTPException(status_code=400, detail="JSON 형식이 올바르지 않습니다.")
+    if not isinstance(items, list):
+        raise HTTPException(status_code=400, detail="API 키 목록(JSON 배열)이 필요합니다.")
+    for item in items:
+        yield item
+
+
+def _validation_error(error: ValidationError) -> str:
+    first = error.errors()[0]
+    location = ".".join(str(part) for part in first["loc"])
+    return f"{location}: {first['msg']}" if location else first["msg"]
+
 @router.post("/", response_model=ApiKeySchema)
-def create_api_key(
+async def create_api_key(
     api_key: ApiKeyCreate,
-    db: Session = Depends(deps.get_db)
+    db: AsyncSession = Depends(deps.get_async_db)
 ):
     """
     새로운 API 키 생성
     """
     try:
-        api_key_service = ApiKeyService(db)
-        return api_key_service.create_api_key(
+        api_key_service = AsyncApiKeyService(db)
+        return await api_key_service.create_api_key(
             api_key.exchange,
             api_key.access_key,
             api_key.secret_key
@@ -31,31 +81,111 @@ def create_api_key(
     except UpbitAPIKeyError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-@router.get("/", response_model=List[ApiKeySchema])
-def get_api_keys(
+@router.get("/", response_model=List[ApiKeySummary])
+async def get_api_keys(
+    response: Response,
     exchange: str,
-    db: Session = Depends(deps.get_db)
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[int] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+    db: AsyncSession = Depends(deps.get_async_db)
 ):
     """
-    활성화된 API 키 목록 조회
+    활성화된 API 키 목록 조회 (id 순 커서 페이지네이션)
+
+    암호화된 키는 읽지도 반환하지도 않는다. 다음 페이지가 있으면 X-Next-Cursor 헤더에 커서를 담는다.
     """
     try:
-        api_key_service = ApiKeyService(db)
-        return api_key_service.get_active_api_keys(exchange)
+        api_key_service = AsyncApiKeyService(db)
+        rows, next_cursor = await api_key_service.get_active_api_key_page(exchange, limit, cursor)
     except UpbitAPIKeyError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(next_cursor)
+    return rows
+
+@router.post("/bulk", response_model=ApiKeyBulkResponse)
+async def bulk_create_api_keys(
+    request: Request,
+    transport_key: Optional[str] = Header(None, alias="X-Transport-Key"),
+    db: AsyncSession = Depends(deps.get_async_db),
+    _: Principal = Depends(deps.get_current_admin_principal),
+):
+    """
+    API 키 일괄 등록 (JSON 배열 또는 NDJSON 스트림, 관리자 전용)
+
+    settings.API_KEY_BULK_CHUNK_SIZE개씩 병렬 암호화 후 한 번에 저장하고 항목별 결과를 반환한다.
+    X-Transport-Key가 있으면 키가 그 Fernet 키로 암호화돼 있다고 보고 복호화한다 (내보내기 결과 재등록용).
+    """
+    transport = _transport_key(transport_key)
+    api_key_service = AsyncApiKeyService(db)
+    results: List[Dict[str, Any]] = []
+    chunk: List[Tuple[int, ApiKeyCreate]] = []
+
+    async def flush() -> None:
+        try:
+            created = await api_key_service.bulk_create_api_keys(
+                [(item.exchange, item.access_key, item.secret_key) for _, item in chunk], transport
+            )
+        except UpbitAPIKeyError as e:
+            created = [str(e)] * len(chunk)
+        for (index, _), result in zip(chunk, created):
+            results.append({"index": index, "id": result} if isinstance(result, int) else {"index": index, "error": result})
+        chunk.clear()
+
+    index = 0
+    async for raw in _request_items(request):
+        try:
+            if isinstance(raw, bytes):
+                item = ApiKeyCreate.model_validate_json(raw)
+            else:
+                item = ApiKeyCreate.model_validate(raw)
+        except ValidationError as e:
+            results.append({"index": index, "error": _validation_error(e)})
+        else:
+            chunk.append((index, item))
+            if len(chunk) >= settings.API_KEY_BULK_CHUNK_SIZE:
+                await flush()
+        index += 1
+    if chunk:
+        await flush()
+    results.sort(key=lambda result: result["index"])
+    created = sum(1 for result in results if "id" in result)
+    return {"created": created, "failed": len(results) - created, "results": results}
+
+@router.get("/export")
+async def export_api_keys(
+    transport_key: str = Header(..., alias="X-Transport-Key"),
+    exchange: Optional[str] = None,
+    db: AsyncSession = Depends(deps.get_async_db),
+    _: Principal = Depends(deps.get_current_admin_principal),
+):
+    """
+    API 키 내보내기 (NDJSON 스트림, 관리자 전용)
+
+    저장된 키를 X-Transport-Key(Fernet 키)로 다시 암호화해 한 줄에 하나씩 보낸다.
+    전송 키를 정하는 쪽이 곧 평문을 얻을 수 있으므로 관리자만 호출할 수 있다.
+    결과는 같은 헤더와 함께 /bulk 에 그대로 등록할 수 있다.
+    """
+    transport = _transport_key(transport_key)
+    api_key_service = AsyncApiKeyService(db)
+
+    async def lines() -> AsyncIterator[str]:
+        async for batch in api_key_service.export_api_keys(transport, exchange):
+            yield "".join(json.dumps(item, separators=(",", ":")) + "\n" for item in batch)
+
+    return StreamingResponse(lines(), media_type=NDJSON)
 
 @router.get("/{key_id}", response_model=ApiKeySchema)
-def get_api_key(
+async def get_api_key(
     key_id: int,
-    db: Session = Depends(deps.get_db)
+    db: AsyncSession = Depends(deps.get_async_db)
 ):
     """
     특정 API 키 조회
     """
     try:
-        api_key_service = ApiKeyService(db)
-        api_key = api_key_service.get_api_key(key_id)
+        api_key_service = AsyncApiKeyService(db)
+        api_key = await api_key_service.get_api_key(key_id)
         if not api_key:
             raise HTTPException(status_code=404, detail="API 키를 찾을 수 없습니다.")
         return api_key
@@ -63,17 +193,17 @@ def get_api_key(
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.put("/{key_id}/status")
-def update_api_key_status(
+async def update_api_key_status(
     key_id: int,
     status: ApiKeyUpdateStatus,
-    db: Session = Depends(deps.get_db)
+    db: AsyncSession = Depends(deps.get_async_db)
 ):
     """
     API 키 활성화 상태 업데이트
     """
     try:
-        api_key_service = ApiKeyService(db)
-        api_key = api_key_service.update_api_key_status(key_id, status.is_active)
+        api_key_service = AsyncApiKeyService(db)
+        api_key = await api_key_service.update_api_key_status(key_id, status.is_active)
         if not api_key:
             raise HTTPException(status_code=404, detail="API 키를 찾을 수 없습니다.")
         return {"message": "API 키 상태가 업데이트되었습니다."}
@@ -81,16 +211,16 @@ def update_api_key_status(
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.delete("/{key_id}")
-def delete_api_key(
+async def delete_api_key(
     key_id: int,
-    db: Session = Depends(deps.get_db)
+    db: AsyncSession = Depends(deps.get_async_db)
 ):
     """
     API 키 삭제
     """
     try:
-        api_key_service = ApiKeyService(db)
-        if not api_key_service.delete_api_key(key_id):
+        api_key_service = AsyncApiKeyService(db)
+        if not await api_key_service.delete_api_key(key_id):
             raise HTTPException(status_code=404, detail="API 키를 찾을 수 없습니다.")
         return {"message": "API 키가 삭제되었습니다."}
     except UpbitAPIKeyError as e:
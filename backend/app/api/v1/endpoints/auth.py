@@ -0,0 +1,45 @@
+"""
+인증 엔드포인트
+"""
+
+from typing import Any, Dict
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.api import deps
+from app.core.security import create_access_token
+from app.schemas.user import Token, UserPrincipal
+from app.services.auth_service import Principal, PrincipalCache, authenticate_user
+
+router = APIRouter()
+
+@router.post("/login", response_model=Token)
+async def login(
+    form: OAuth2PasswordRequestForm = Depends(),
+    db: AsyncSession = Depends(deps.get_async_db),
+    cache: PrincipalCache = Depends(deps.get_principal_cache)
+) -> Dict[str, Any]:
+    """
+    로그인 (액세스 토큰 발급)
+
+    비밀번호 검증은 전용 스레드 풀에서 실행되어 다른 요청을 막지 않는다.
+    """
+    user = await authenticate_user(db, form.username, form.password)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="아이디 또는 비밀번호가 올바르지 않습니다.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    if not user.is_active:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="비활성화된 사용자입니다.")
+    # 곧 이어질 인증 요청이 DB를 다시 읽지 않도록 미리 채움
+    cache.put(Principal.from_user(user))
+    return {"access_token": create_access_token({"sub": str(user.id)}), "token_type": "bearer"}
+
+@router.get("/me", response_model=UserPrincipal)
+async def read_me(principal: Principal = Depends(deps.get_current_active_principal)) -> Principal:
+    """
+    현재 사용자 조회
+    """
+    return principal
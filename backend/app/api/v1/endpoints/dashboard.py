@@ -0,0 +1,62 @@
+"""
+대시보드 엔드포인트
+"""
+
+import logging
+from typing import Any, Dict, Optional, Tuple, Union
+from fastapi import APIRouter, Depends
+from app.api import deps
+from app.core.pubsub import StreamHub
+from app.schemas.portfolio import PortfolioSummary
+from app.services.auth_service import Principal
+from app.trading.portfolio import PortfolioBook
+from app.trading.streams import PRICES_TOPIC, PortfolioView
+from app.trading.upbit.async_api import AsyncUpbitAPI
+from app.trading.upbit.exceptions import UpbitAPIError
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+@router.get("/portfolio", response_model=PortfolioSummary)
+async def get_portfolio(
+    principal: Principal = Depends(deps.get_current_active_principal),
+    book: Union[PortfolioBook, PortfolioView] = Depends(deps.get_portfolio_book),
+    quotes: AsyncUpbitAPI = Depends(deps.get_quote_client)
+):
+    """
+    포트폴리오 요약 조회 (인증 사용자 본인)
+
+    장부의 포지션을 캐시된 현재가로 평가한다. 시세 조회에 실패하면 실현 손익만 반환한다.
+    API 워커(APP_ROLE=api)에서는 엔진 프로세스가 공유 메모리로 복제한 포지션 상태를 평가한다.
+    """
+    user_id = principal.id
+    symbols = sorted({
+        position.symbol for position in book.positions(user_id)
+        if position.exchange == "upbit" and position.quantity
+    })
+    prices: Dict[Tuple[str, str], float] = {}
+    if symbols:
+        try:
+            quoted = await quotes.get_current_prices(symbols)
+            prices = {("upbit", symbol): price for symbol, price in quoted.items()}
+        except UpbitAPIError as e:
+            logger.warning("포트폴리오 평가용 시세 조회 실패: %s", e)
+    return book.summary(user_id, prices)
+
+@router.get("/prices")
+async def get_prices(
+    symbols: Optional[str] = None,
+    hub: StreamHub = Depends(deps.get_stream_hub)
+) -> Dict[str, Dict[str, Any]]:
+    """
+    최신 시세 조회
+
+    거래소를 호출하지 않고 허브의 prices 토픽 상태를 반환한다.
+    API 워커(APP_ROLE=api)에서는 엔진 프로세스가 공유 메모리로 복제한 상태다.
+    """
+    prices = hub.entries(PRICES_TOPIC)
+    if symbols:
+        wanted = [symbol.strip() for symbol in symbols.split(",") if symbol.strip()]
+        return {symbol: prices[symbol] for symbol in wanted if symbol in prices}
+    return prices
@@ -0,0 +1,103 @@
+"""
+대시보드 실시간 스트림 엔드포인트 (WebSocket / SSE)
+
+연결마다 허브 구독 하나를 만들고, 먼저 현재 상태 스냅샷을 보낸 뒤
+바뀐 필드만 담은 델타 메시지 묶음(JSON 배열)을 보낸다.
+구독 대상 사용자는 인증 토큰의 사용자다 (WebSocket은 token 쿼리 파라미터, SSE는 Bearer 헤더).
+전송 중인 프레임은 연결당 하나뿐이고, 전송이 밀린 동안의 변경은 다음 묶음에
+키별로 합쳐지므로 느린 클라이언트는 중간 프레임을 건너뛴다.
+"""
+
+import asyncio
+from contextlib import suppress
+from typing import AsyncIterator, Dict, Optional, Set
+from fastapi import APIRouter, Depends, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+from app.api import deps
+from app.core.config import settings
+from app.core.pubsub import StreamHub, Subscription, encode_batch
+from app.services.auth_service import Principal
+from app.trading.streams import PRICES_TOPIC, user_topics
+
+router = APIRouter()
+
+
+def _subscribe(hub: StreamHub, user_id: int, symbols: Optional[str]) -> Subscription:
+    keys: Dict[str, Set[str]] = {}
+    if symbols:
+        keys[PRICES_TOPIC] = {symbol.strip() for symbol in symbols.split(",") if symbol.strip()}
+    return hub.subscribe(user_topics(user_id), keys)
+
+
+async def _send_updates(websocket: WebSocket, subscription: Subscription) -> None:
+    while True:
+        batch = await subscription.get()
+        if batch:
+            await websocket.send_text(encode_batch(batch))
+
+
+async def _wait_disconnect(websocket: WebSocket) -> None:
+    with suppress(WebSocketDisconnect):
+        while True:
+            await websocket.receive_text()
+
+
+@router.websocket("/ws")
+async def stream_websocket(
+    websocket: WebSocket,
+    symbols: Optional[str] = None,
+    hub: StreamHub = Depends(deps.get_stream_hub),
+    principal: Principal = Depends(deps.get_websocket_principal)
+):
+    """
+    포트폴리오 / 시세 / 주문 상태 실시간 스트림 (WebSocket)
+    """
+    await websocket.accept()
+    subscription = _subscribe(hub, principal.id, symbols)
+    sender = asyncio.create_task(_send_updates(websocket, subscription))
+    receiver = asyncio.create_task(_wait_disconnect(websocket))
+    try:
+        # 클라이언트가 끊거나 전송이 실패하면 (서버 구현마다 예외 종류가 다름) 연결 종료
+        await asyncio.wait({sender, receiver}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        subscription.close()
+        for task in (sender, receiver):
+            task.cancel()
+        await asyncio.gather(sender, receiver, return_exceptions=True)
+
+
+async def sse_events(request: Request, subscription: Subscription) -> AsyncIterator[str]:
+    """
+    SSE 이벤트 생성
+
+    Args:
+        request (Request): 요청 (연결 종료 확인용)
+        subscription (Subscription): 구독 (생성기 종료 시 해제)
+
+    Returns:
+        AsyncIterator[str]: data 이벤트 또는 keep-alive 주석
+    """
+    try:
+        while not await request.is_disconnected():
+            batch = await subscription.get(timeout=settings.STREAM_KEEPALIVE)
+            yield f"data: {encode_batch(batch)}\n\n" if batch else ": keep-alive\n\n"
+    finally:
+        subscription.close()
+
+
+@router.get("/sse")
+async def stream_sse(
+    request: Request,
+    symbols: Optional[str] = None,
+    hub: StreamHub = Depends(deps.get_stream_hub),
+    principal: Principal = Depends(deps.get_current_active_principal)
+):
+    """
+    포트폴리오 / 시세 / 주문 상태 실시간 스트림 (SSE, WebSocket을 쓸 수 없는 환경용)
+    """
+    subscription = _subscribe(hub, principal.id, symbols)
+    return StreamingResponse(
+        sse_events(request, subscription),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,107 @@
+"""
+운영 상태 엔드포인트
+"""
+
+from typing import Any, Dict, List, Literal
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import JSONResponse, PlainTextResponse
+from app.api.deps import get_current_admin_principal
+from app.core.config import settings
+from app.core.profiling import RequestProfiler, collapse, render_collapsed, request_profiler
+from app.services.rate_limiter import rate_limiter
+
+router = APIRouter()
+
+@router.get("/rate-limits", dependencies=[Depends(get_current_admin_principal)])
+async def get_rate_limits() -> Dict[str, Any]:
+    """
+    거래소 요청 쿼터 현황 조회 (관리자 전용)
+
+    버킷별 남은 토큰, 대기 요청 수, 차단 시간과 누적 대기/거절 지표를 반환한다.
+    """
+    return rate_limiter.stats()
+
+@router.get("/shared-state", dependencies=[Depends(get_current_admin_principal)])
+async def get_shared_state(request: Request) -> Dict[str, Any]:
+    """
+    프로세스 역할과 공유 상태 복제 현황 조회 (관리자 전용)
+
+    API 워커(APP_ROLE=api)는 공유 메모리 링 연결 여부, 반영/건너뜀 수, 밀린 메시지 수를 반환한다.
+    """
+    mirror = getattr(request.app.state, "shared_state", None)
+    return {"role": settings.APP_ROLE, **(mirror.stats() if mirror is not None else {})}
+
+
+def get_request_profiler() -> RequestProfiler:
+    """요청 프로파일러"""
+    return request_profiler
+
+def _profile_response(collapsed: Dict[str, int], format: str, **summary: Any) -> Response:
+    if format == "json":
+        return JSONResponse({**summary, "stacks": collapsed})
+    return PlainTextResponse(render_collapsed(collapsed))
+
+@router.get("/profiling", dependencies=[Depends(get_current_admin_principal)])
+async def get_profiling(profiler: RequestProfiler = Depends(get_request_profiler)) -> Dict[str, Any]:
+    """
+    프로파일러 상태 조회 (관리자 전용)
+
+    값은 요청을 받은 워커 프로세스의 것이다.
+    """
+    return profiler.stats()
+
+@router.put("/profiling", dependencies=[Depends(get_current_admin_principal)])
+async def update_profiling(
+    slow_threshold: float = Query(..., ge=0, description="느린 요청 기준 (초, 0이면 끔)"),
+    profiler: RequestProfiler = Depends(get_request_profiler),
+) -> Dict[str, Any]:
+    """
+    느린 요청 기록 켜기/끄기 (관리자 전용)
+
+    기준보다 오래 걸린 요청의 스택 샘플을 최근 settings.PROFILING_TRACE_BUFFER개까지 보관한다.
+    """
+    profiler.configure(slow_threshold)
+    return profiler.stats()
+
+@router.post("/profiling/profile", dependencies=[Depends(get_current_admin_principal)])
+async def profile_requests(
+    seconds: float = Query(10.0, gt=0, le=settings.PROFILING_MAX_SECONDS),
+    sample_rate: float = Query(1.0, gt=0, le=1.0, description="샘플링할 요청 비율"),
+    format: Literal["collapsed", "json"] = "collapsed",
+    profiler: RequestProfiler = Depends(get_request_profiler),
+) -> Response:
+    """
+    일정 시간 동안 요청 프로파일링 (관리자 전용)
+
+    seconds 동안 끝난 요청 중 sample_rate 비율의 스택 샘플을 합쳐, 접힌 스택(flamegraph.pl, speedscope 입력)
+    또는 JSON으로 반환한다. 응답은 프로파일링이 끝난 뒤에 온다.
+    """
+    profiler.ignore_current()
+    try:
+        session = await profiler.profile(seconds, sample_rate)
+    except RuntimeError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    return _profile_response(collapse(session.samples), format, requests=session.requests, seconds=seconds)
+
+@router.get("/profiling/traces", dependencies=[Depends(get_current_admin_principal)])
+async def get_slow_traces(profiler: RequestProfiler = Depends(get_request_profiler)) -> List[Dict[str, Any]]:
+    """느린 요청 기록 목록 조회 (관리자 전용, 최근 순)"""
+    return [trace.summary() for trace in reversed(profiler.traces)]
+
+@router.get("/profiling/traces/{trace_id}", dependencies=[Depends(get_current_admin_principal)])
+async def get_slow_trace(
+    trace_id: int,
+    format: Literal["collapsed", "json"] = "collapsed",
+    profiler: RequestProfiler = Depends(get_request_profiler),
+) -> Response:
+    """느린 요청 기록의 스택 샘플 조회 (관리자 전용)"""
+    trace = profiler.get_trace(trace_id)
+    if trace is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="느린 요청 기록을 찾을 수 없습니다.")
+    return _profile_response(trace.samples, format, **trace.summary())
+
+@router.delete("/profiling/traces", dependencies=[Depends(get_current_admin_principal)])
+async def clear_slow_traces(profiler: RequestProfiler = Depends(get_request_profiler)) -> Dict[str, str]:
+    """느린 요청 기록 삭제 (관리자 전용)"""
+    profiler.clear()
+    return {"message": "느린 요청 기록이 삭제되었습니다."}
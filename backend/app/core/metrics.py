@@ -0,0 +1,331 @@
+"""
+경량 성능 지표
+
+지표는 만들 때 프로세스 레지스트리(REGISTRY)에 등록되고, /metrics 엔드포인트가 Prometheus 텍스트
+형식으로 내보낸다. 기록은 잠금 없는 덧셈(카운터/게이지)이나 짧은 잠금(히스토그램)뿐이며, 라벨이
+있는 지표는 labels()로 라벨 값별 자식 지표를 얻어 기록한다 (반복 호출되는 곳에서는 자식을 미리 구해 둠).
+값은 프로세스 단위이므로 여러 워커로 띄우면 워커마다 따로 집계된다.
+"""
+
+import bisect
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# 초 단위 지연 구간 (100us ~ 10s)
+DEFAULT_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+    0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+# (이름 접미사, 라벨, 값)
+Sample = Tuple[str, Dict[str, str], float]
+
+
+class _Metric:
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str], register: bool):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], "_Metric"] = {}
+        self._children_lock = threading.Lock()
+        if register:
+            REGISTRY.register(self)
+
+    def _child(self) -> "_Metric":
+        raise NotImplementedError
+
+    def labels(self, *values: str) -> "_Metric":
+        """
+        라벨 값별 자식 지표 조회 (없으면 생성)
+
+        Args:
+            *values (str): labelnames 순서의 라벨 값
+
+        Returns:
+            _Metric: 같은 종류의 자식 지표
+
+        Raises:
+            ValueError: 라벨 값 수가 labelnames와 다른 경우
+        """
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} 지표의 라벨은 {self.labelnames}입니다.")
+            with self._children_lock:
+                child = self._children.get(values)
+                if child is None:
+                    child = self._children[values] = self._child()
+        return child
+
+    def _own_samples(self) -> List[Sample]:
+        raise NotImplementedError
+
+    def samples(self) -> List[Sample]:
+        """
+        내보낼 측정값 목록 (라벨이 있으면 자식별)
+
+        Returns:
+            List[Sample]: (이름 접미사, 라벨, 값) 목록
+        """
+        if not self.labelnames:
+            return self._own_samples()
+        samples: List[Sample] = []
+        for values, child in sorted(self._children.items()):
+            labels = dict(zip(self.labelnames, values))
+            for suffix, extra, value in child._own_samples():
+                samples.append((suffix, {**labels, **extra}, value))
+        return samples
+
+
+class Counter(_Metric):
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str = "", labelnames: Sequence[str] = (), register: bool = True):
+        """
+        누적 카운터 초기화
+
+        Args:
+            name (str): 지표 이름
+            documentation (str): 설명
+            labelnames (Sequence[str]): 라벨 이름 목록 (있으면 labels()로 기록)
+            register (bool): 프로세스 레지스트리 등록 여부
+        """
+        self.value = 0.0
+        super().__init__(name, documentation, labelnames, register)
+
+    def _child(self) -> "Counter":
+        return Counter(self.name, self.documentation, register=False)
+
+    def inc(self, amount: float = 1.0) -> None:
+        """카운터 증가"""
+        self.value += amount
+
+    def _own_samples(self) -> List[Sample]:
+        return [("", {}, self.value)]
+
+
+class Gauge(_Metric):
+    type = "gauge"
+
+    def __init__(self, name: str, documentation: str = "", labelnames: Sequence[str] = (), register: bool = True):
+        """
+        현재값 지표 초기화
+
+        Args:
+            name (str): 지표 이름
+            documentation (str): 설명
+            labelnames (Sequence[str]): 라벨 이름 목록 (있으면 labels()로 기록)
+            register (bool): 프로세스 레지스트리 등록 여부
+        """
+        self.value = 0.0
+        self._function: Optional[Callable[[], float]] = None
+        super().__init__(name, documentation, labelnames, register)
+
+    def _child(self) -> "Gauge":
+        return Gauge(self.name, self.documentation, register=False)
+
+    def set(self, value: float) -> None:
+        """값 설정"""
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        """값 증가"""
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        """값 감소"""
+        self.value -= amount
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """
+        내보낼 때마다 값을 읽어 올 함수 지정 (풀 크기처럼 다른 객체가 이미 들고 있는 값)
+
+        Args:
+            function (Callable[[], float]): 현재값을 반환하는 함수
+        """
+        self._function = function
+
+    def get(self) -> float:
+        """현재값 조회"""
+        return self._function() if self._function is not None else self.value
+
+    def _own_samples(self) -> List[Sample]:
+        return [("", {}, self.get())]
+
+
+class Histogram(_Metric):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str = "",
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        labelnames: Sequence[str] = (),
+        register: bool = True,
+    ):
+        """
+        구간별 분포 지표 초기화
+
+        Args:
+            name (str): 지표 이름
+            documentation (str): 설명
+            buckets (Sequence[float]): 구간 상한값 목록
+            labelnames (Sequence[str]): 라벨 이름 목록 (있으면 labels()로 기록)
+            register (bool): 프로세스 레지스트리 등록 여부
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.counts: List[int] = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self._lock = threading.Lock()
+        super().__init__(name, documentation, labelnames, register)
+
+    def _child(self) -> "Histogram":
+        return Histogram(self.name, self.documentation, self.buckets, register=False)
+
+    def observe(self, value: float) -> None:
+        """
+        측정값 기록
+
+        Args:
+            value (float): 측정값
+        """
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.sum += value
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """블록 실행 시간 기록"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def quantile(self, q: float) -> float:
+        """
+        분위수 근사값 조회 (해당 구간 상한값)
+
+        Args:
+            q (float): 분위 (0 ~ 1)
+
+        Returns:
+            float: 분위수 근사값
+        """
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        cumulative = 0
+        for upper, count in zip(self.buckets, self.counts):
+            cumulative += count
+            if cumulative >= target:
+                return upper
+        return float("inf")
+
+    def snapshot(self) -> Dict[str, float]:
+        """
+        요약 통계 조회
+
+        Returns:
+            Dict[str, float]: 건수, 평균, p50, p99
+        """
+        return {
+            "count": self.count,
+            "mean": self.sum / self.count if self.count else 0.0,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+        }
+
+    def _own_samples(self) -> List[Sample]:
+        with self._lock:
+            counts = list(self.counts)
+            total, count = self.sum, self.count
+        samples: List[Sample] = []
+        cumulative = 0
+        for upper, bucket_count in zip(self.buckets + (math.inf,), counts):
+            cumulative += bucket_count
+            samples.append(("_bucket", {"le": _format_value(upper)}, cumulative))
+        samples.append(("_sum", {}, total))
+        samples.append(("_count", {}, count))
+        return samples
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class MetricsRegistry:
+    def __init__(self):
+        """
+        지표 레지스트리 초기화
+
+        같은 이름으로 다시 등록하면 나중 지표로 바뀐다 (인스턴스마다 지표를 만드는 객체는 마지막 것을 내보냄).
+        """
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> None:
+        """지표 등록"""
+        with self._lock:
+            self._metrics[metric.name] = metric
+
+    def unregister(self, metric: _Metric) -> None:
+        """지표 등록 해제 (같은 이름의 다른 지표로 바뀌었으면 무시)"""
+        with self._lock:
+            if self._metrics.get(metric.name) is metric:
+                del self._metrics[metric.name]
+
+    def get(self, name: str) -> Optional[_Metric]:
+        """이름으로 지표 조회"""
+        return self._metrics.get(name)
+
+    def collect(self) -> List[_Metric]:
+        """
+        등록된 지표 목록 (이름순)
+
+        Returns:
+            List[_Metric]: 지표 목록
+        """
+        with self._lock:
+            return [self._metrics[name] for name in sorted(self._metrics)]
+
+    def render(self) -> str:
+        """
+        Prometheus 텍스트 형식(0.0.4)으로 직렬화
+
+        Returns:
+            str: 지표 본문
+        """
+        lines: List[str] = []
+        for metric in self.collect():
+            doc = metric.documentation.replace("\\", "\\\\").replace("\n", "\\n")
+            lines.append(f"# HELP {metric.name} {doc}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            for suffix, labels, value in metric.samples():
+                if labels:
+                    label_text = ",".join(f'{key}="{_escape_label(str(val))}"' for key, val in labels.items())
+                    lines.append(f"{metric.name}{suffix}{{{label_text}}} {_format_value(value)}")
+                else:
+                    lines.append(f"{metric.name}{suffix} {_format_value(value)}")
+        lines.append("")
+        return "\n".join(lines)
+
+
+REGISTRY = MetricsRegistry()
@@ -0,0 +1,389 @@
+"""
+요청 단위 스택 샘플링 프로파일러
+
+샘플링 스레드가 주기적으로 처리 중인 요청 태스크의 스택을 읽는다. 태스크가 이벤트 루프에서 실행 중이면
+루프 스레드의 실제 호출 스택(동기 함수 포함)을, 대기 중이면 코루틴 await 체인(어디서 기다리는지)을
+기록하므로 CPU 시간과 I/O 대기 시간이 모두 요청별로 잡힌다. 스레드 풀로 넘긴 작업은 안을 보지 않고
+그 작업을 기다리는 await 지점까지만 기록된다.
+
+결과는 flamegraph.pl / speedscope가 읽는 접힌 스택 형식("바깥;...;안쪽 샘플수")으로 낸다.
+느린 요청 기록이나 요청 프로파일링이 켜져 있지 않으면 샘플링 스레드가 돌지 않고 요청마다 플래그 확인만 한다.
+값은 프로세스 단위이므로 여러 워커로 띄우면 워커마다 따로 켜고 읽어야 한다.
+"""
+
+import asyncio
+import itertools
+import logging
+import os
+import random
+import sys
+import sysconfig
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from types import CodeType, CoroutineType, FrameType, GeneratorType
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 프레임 (코드, 실행 중인 줄) 목록, 바깥 -> 안쪽
+Stack = Tuple[Tuple[CodeType, int], ...]
+
+_STDLIB = sysconfig.get_paths()["stdlib"] + os.sep
+
+
+def _await_chain(coro: Any, root: Optional[FrameType], max_depth: int) -> Tuple[List[Tuple[CodeType, int]], Optional[FrameType]]:
+    entries: List[Tuple[CodeType, int]] = []
+    leaf: Optional[FrameType] = None
+    while coro is not None and len(entries) < max_depth:
+        if type(coro) is CoroutineType:
+            frame, awaiting = coro.cr_frame, coro.cr_await
+        elif type(coro) is GeneratorType:
+            frame, awaiting = coro.gi_frame, coro.gi_yieldfrom
+        else:
+            frame, awaiting = getattr(coro, "ag_frame", None), getattr(coro, "ag_await", None)
+        if frame is None:
+            break
+        if frame is root:
+            entries.clear()
+        entries.append((frame.f_code, frame.f_lineno))
+        leaf = frame
+        coro = awaiting
+    return entries, leaf
+
+
+def _thread_chain(leaf: FrameType, root: FrameType, max_depth: int) -> Optional[List[Tuple[CodeType, int]]]:
+    entries: List[Tuple[CodeType, int]] = []
+    frame: Optional[FrameType] = leaf
+    while frame is not None:
+        entries.append((frame.f_code, frame.f_lineno))
+        if frame is root:
+            entries.reverse()
+            return entries[:max_depth]
+        frame = frame.f_back
+    return None
+
+
+def _watch_stack(watch: "_Watch", running: bool, thread_frame: Optional[FrameType], max_depth: int) -> Optional[Stack]:
+    coro = watch.task.get_coro()
+    task_root = getattr(coro, "cr_frame", None)
+    if task_root is None:  # 태스크 종료
+        return None
+    if running and thread_frame is not None:
+        # 실행 중: 루프 스레드의 실제 호출 스택에서 기록 시작 프레임 위쪽만
+        entries = _thread_chain(thread_frame, watch.root or task_root, max_depth)
+        if entries is not None:
+            watch.leaf = None
+            return tuple(entries)
+    leaf = watch.leaf
+    if leaf is not None and leaf.f_lasti == watch.leaf_lasti:
+        # 가장 안쪽 코루틴이 같은 await 지점에 멈춰 있으면 바깥 프레임도 그대로
+        return watch.stack
+    entries, leaf = _await_chain(coro, watch.root, max_depth)
+    watch.stack = tuple(entries)
+    watch.leaf = leaf
+    watch.leaf_lasti = leaf.f_lasti if leaf is not None else -1
+    return watch.stack
+
+
+def _short_path(filename: str) -> str:
+    marker = "site-packages" + os.sep
+    if marker in filename:
+        return filename.split(marker, 1)[1]
+    for prefix in (os.getcwd() + os.sep, _STDLIB):
+        if filename.startswith(prefix):
+            return filename[len(prefix):]
+    return filename
+
+
+def collapse(samples: Dict[Stack, int]) -> Dict[str, int]:
+    """
+    스택별 샘플 수를 접힌 스택 문자열로 변환
+
+    Args:
+        samples (Dict[Stack, int]): 스택별 샘플 수
+
+    Returns:
+        Dict[str, int]: "함수 (파일:줄);..." 별 샘플 수
+    """
+    names: Dict[Tuple[CodeType, int], str] = {}
+    collapsed: Counter = Counter()
+    for stack, count in samples.items():
+        parts = []
+        for code, lineno in stack:
+            name = names.get((code, lineno))
+            if name is None:
+                name = names[(code, lineno)] = f"{code.co_name} ({_short_path(code.co_filename)}:{lineno})".replace(";", ":")
+            parts.append(name)
+        collapsed[";".join(parts)] += count
+    return dict(collapsed)
+
+
+def render_collapsed(collapsed: Dict[str, int]) -> str:
+    """접힌 스택을 flamegraph.pl 입력 형식(줄마다 "스택 샘플수")으로 직렬화"""
+    return "".join(f"{stack} {count}\n" for stack, count in sorted(collapsed.items()))
+
+
+class _Watch:
+    __slots__ = ("task", "root", "thread_id", "start", "session", "samples", "ignored", "leaf", "leaf_lasti", "stack")
+
+    def __init__(self, task: "asyncio.Task", root: Optional[FrameType], session: Optional["ProfileSession"]):
+        self.task = task
+        self.root = root
+        self.thread_id = threading.get_ident()
+        self.start = time.perf_counter()
+        self.session = session
+        self.samples: Dict[Stack, int] = {}
+        self.ignored = False
+        # 마지막 await 체인 (가장 안쪽 프레임과 멈춘 위치가 같으면 다시 읽지 않음)
+        self.leaf: Optional[FrameType] = None
+        self.leaf_lasti = -1
+        self.stack: Stack = ()
+
+
+@dataclass
+class ProfileSession:
+    """요청 프로파일링 구간 (표본 요청의 샘플 합계)"""
+    sample_rate: float
+    started_at: float = field(default_factory=time.time)
+    requests: int = 0
+    samples: Counter = field(default_factory=Counter)
+
+
+@dataclass
+class SlowTrace:
+    """느린 요청 기록"""
+    id: int
+    method: str
+    route: str
+    path: str
+    status: int
+    duration: float
+    started_at: float
+    samples: Dict[str, int]
+
+    def summary(self) -> Dict[str, Any]:
+        """스택을 뺀 요약"""
+        return {
+            "id": self.id,
+            "method": self.method,
+            "route": self.route,
+            "path": self.path,
+            "status": self.status,
+            "duration": self.duration,
+            "started_at": self.started_at,
+            "samples": sum(self.samples.values()),
+        }
+
+
+class RequestProfiler:
+    def __init__(
+        self,
+        slow_threshold: Optional[float] = None,
+        interval: Optional[float] = None,
+        buffer_size: Optional[int] = None,
+        max_depth: Optional[int] = None,
+    ):
+        """
+        요청 프로파일러 초기화
+
+        Args:
+            slow_threshold (float, optional): 느린 요청 기준 (초, 0이면 기록 안 함, 기본값: settings.PROFILING_SLOW_THRESHOLD)
+            interval (float, optional): 샘플링 주기 (초, 기본값: settings.PROFILING_INTERVAL)
+            buffer_size (int, optional): 보관할 느린 요청 수 (기본값: settings.PROFILING_TRACE_BUFFER)
+            max_depth (int, optional): 샘플당 최대 프레임 수 (기본값: settings.PROFILING_MAX_DEPTH)
+        """
+        self.slow_threshold = settings.PROFILING_SLOW_THRESHOLD if slow_threshold is None else slow_threshold
+        self.interval = interval or settings.PROFILING_INTERVAL
+        self.max_depth = max_depth or settings.PROFILING_MAX_DEPTH
+        self.traces: Deque[SlowTrace] = deque(maxlen=buffer_size or settings.PROFILING_TRACE_BUFFER)
+        self.session: Optional[ProfileSession] = None
+        self.active = self.slow_threshold > 0
+        self.ticks = 0
+        self._watches: Dict["asyncio.Task", _Watch] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._sampling = False
+
+    def _update_active(self) -> None:
+        self.active = self.slow_threshold > 0 or self.session is not None
+
+    def configure(self, slow_threshold: float) -> None:
+        """
+        느린 요청 기준 변경 (실행 중)
+
+        Args:
+            slow_threshold (float): 느린 요청 기준 (초, 0이면 기록 안 함)
+        """
+        self.slow_threshold = max(slow_threshold, 0.0)
+        self._update_active()
+
+    def _ensure_sampler(self) -> None:
+        if self._sampling:
+            return
+        with self._lock:
+            if not self._sampling:
+                self._sampling = True
+                self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        # 켜져 있는 동안만 실행 (꺼지면 다음 주기에 종료, 다시 켜지면 begin이 새로 시작)
+        try:
+            while self.active:
+                time.sleep(self.interval)
+                try:
+                    self.sample()
+                except Exception:
+                    logger.exception("스택 샘플링 실패")
+        finally:
+            with self._lock:
+                self._sampling = False
+
+    def sample(self) -> int:
+        """
+        처리 중인 요청 스택을 한 번 샘플링
+
+        Returns:
+            int: 샘플을 남긴 요청 수
+        """
+        watches = list(self._watches.values())
+        if not watches:
+            return 0
+        self.ticks += 1
+        frames = sys._current_frames()
+        current: Dict[asyncio.AbstractEventLoop, Optional[asyncio.Task]] = {}
+        sampled = 0
+        for watch in watches:
+            loop = watch.task.get_loop()
+            if loop not in current:
+                current[loop] = asyncio.current_task(loop)
+            running = current[loop] is watch.task
+            stack = _watch_stack(watch, running, frames.get(watch.thread_id) if running else None, self.max_depth)
+            if stack:
+                samples = watch.samples
+                samples[stack] = samples.get(stack, 0) + 1
+                sampled += 1
+        return sampled
+
+    def begin(self) -> Optional[_Watch]:
+        """
+        요청 시작 (요청 태스크의 미들웨어에서 호출)
+
+        Returns:
+            Optional[_Watch]: 샘플링 대상이면 기록 핸들
+        """
+        session = self.session
+        if session is not None and session.sample_rate < 1.0 and random.random() >= session.sample_rate:
+            session = None
+        if session is None and self.slow_threshold <= 0:
+            return None
+        task = asyncio.current_task()
+        if task is None:
+            return None
+        # 호출한 미들웨어 프레임부터 기록
+        watch = self._watches[task] = _Watch(task, sys._getframe(1), session)
+        self._ensure_sampler()
+        return watch
+
+    def end(self, watch: _Watch, method: str, route: str, path: str, status: int) -> Optional[SlowTrace]:
+        """
+        요청 종료 (요청 태스크에서 호출)
+
+        Args:
+            watch (_Watch): begin이 반환한 핸들
+            method (str): HTTP 메서드
+            route (str): 라우트 경로 템플릿
+            path (str): 요청 경로
+            status (int): 응답 상태 코드
+
+        Returns:
+            Optional[SlowTrace]: 느린 요청으로 기록했으면 그 기록
+        """
+        duration = time.perf_counter() - watch.start
+        self._watches.pop(watch.task, None)
+        if watch.ignored:
+            return None
+        session = watch.session
+        if session is not None and session is self.session:
+            session.requests += 1
+            session.samples.update(watch.samples)
+        if self.slow_threshold <= 0 or duration < self.slow_threshold:
+            return None
+        trace = SlowTrace(
+            id=next(self._ids),
+            method=method,
+            route=route,
+            path=path,
+            status=status,
+            duration=duration,
+            started_at=time.time() - duration,
+            samples=collapse(watch.samples),
+        )
+        self.traces.append(trace)
+        return trace
+
+    def ignore_current(self) -> None:
+        """현재 요청을 기록에서 제외 (프로파일링 요청 자신)"""
+        watch = self._watches.get(asyncio.current_task())
+        if watch is not None:
+            watch.ignored = True
+
+    async def profile(self, seconds: float, sample_rate: float = 1.0) -> ProfileSession:
+        """
+        일정 시간 동안 요청 프로파일링
+
+        Args:
+            seconds (float): 프로파일링 시간 (초)
+            sample_rate (float): 샘플링할 요청 비율 (0 ~ 1)
+
+        Returns:
+            ProfileSession: 표본 요청 수와 스택별 샘플 합계
+
+        Raises:
+            RuntimeError: 이미 프로파일링 중인 경우
+        """
+        if self.session is not None:
+            raise RuntimeError("이미 요청 프로파일링이 진행 중입니다.")
+        session = self.session = ProfileSession(sample_rate=sample_rate)
+        self._update_active()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            self.session = None
+            self._update_active()
+        return session
+
+    def get_trace(self, trace_id: int) -> Optional[SlowTrace]:
+        """느린 요청 기록 조회"""
+        return next((trace for trace in self.traces if trace.id == trace_id), None)
+
+    def clear(self) -> None:
+        """느린 요청 기록 삭제"""
+        self.traces.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        프로파일러 상태 조회
+
+        Returns:
+            Dict[str, Any]: 느린 요청 기준, 샘플링 주기, 진행 중인 프로파일링, 기록 수, 관찰 중인 요청 수
+        """
+        session = self.session
+        return {
+            "slow_threshold": self.slow_threshold,
+            "interval": self.interval,
+            "profiling": session is not None,
+            "profiling_sample_rate": session.sample_rate if session is not None else None,
+            "traces": len(self.traces),
+            "trace_buffer": self.traces.maxlen,
+            "watching": len(self._watches),
+            "ticks": self.ticks,
+        }
+
+
+request_profiler = RequestProfiler()
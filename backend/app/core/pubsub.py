@@ -0,0 +1,398 @@
+"""
+프로세스 내 발행/구독 허브
+
+토픽(예: prices, portfolio:1)과 키(예: 심볼)별 최신 상태를 필드 단위 시퀀스 번호와 함께 보관한다.
+구독자는 토픽별 커서(마지막으로 받은 시퀀스)만 들고 있고, 깨어날 때 커서 이후 바뀐
+키와 필드만 델타로 받는다. 구독자 쪽에는 대기 버퍼가 없으므로 느린 구독자는
+중간 프레임을 건너뛰고 최신 상태로 수렴하며, 메모리는 구독자 수와 무관하게 키 수에만 비례한다.
+같은 커서에서 깨어난 구독자들은 직렬화된 메시지 묶음을 공유한다.
+"""
+
+import asyncio
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Set
+
+SNAPSHOT = "snapshot"
+DELTA = "delta"
+REMOVE = "remove"
+
+_MISSING = object()
+
+# (토픽, 키, 키의 전체 상태 - 삭제면 None)
+Forwarder = Callable[[str, str, Optional[Dict[str, Any]]], None]
+
+
+class Message:
+    """허브 메시지 (직렬화 결과는 구독자 간에 공유)"""
+
+    __slots__ = ("topic", "key", "kind", "data", "_encoded")
+
+    def __init__(self, topic: str, key: str, kind: str, data: Optional[Dict[str, Any]] = None):
+        self.topic = topic
+        self.key = key
+        self.kind = kind
+        self.data = data
+        self._encoded: Optional[str] = None
+
+    def encode(self) -> str:
+        """JSON 직렬화 (최초 한 번만 수행)"""
+        if self._encoded is None:
+            self._encoded = json.dumps(
+                {"topic": self.topic, "key": self.key, "type": self.kind, "data": self.data},
+                separators=(",", ":"),
+                default=str,
+            )
+        return self._encoded
+
+
+class MessageList(list):
+    """한 토픽의 메시지 목록 (직렬화 결과 캐시)"""
+
+    __slots__ = ("_encoded",)
+
+    def __init__(self, messages: Iterable[Message] = ()):
+        super().__init__(messages)
+        self._encoded: Optional[str] = None
+
+    def encode(self) -> str:
+        """쉼표로 이은 JSON 직렬화 (최초 한 번만 수행)"""
+        if self._encoded is None:
+            self._encoded = ",".join(message.encode() for message in self)
+        return self._encoded
+
+
+class Batch(list):
+    """구독자에게 한 번에 보낼 메시지 (토픽별 MessageList 묶음)"""
+
+    __slots__ = ("chunks",)
+
+    def __init__(self):
+        super().__init__()
+        self.chunks: List[MessageList] = []
+
+    def add(self, chunk: MessageList) -> None:
+        if chunk:
+            self.extend(chunk)
+            self.chunks.append(chunk)
+
+
+def encode_batch(messages: Iterable[Message]) -> str:
+    """메시지 묶음을 JSON 배열 문자열로 직렬화 (Batch는 토픽별 직렬화 결과를 재사용)"""
+    chunks = getattr(messages, "chunks", None)
+    if chunks is not None:
+        return "[" + ",".join(chunk.encode() for chunk in chunks) + "]"
+    return "[" + ",".join(message.encode() for message in messages) + "]"
+
+
+class _Entry:
+    __slots__ = ("data", "field_seq", "created", "removed")
+
+    def __init__(self, data: Dict[str, Any], seq: int):
+        self.data = data
+        self.field_seq = dict.fromkeys(data, seq)
+        self.created = seq
+        self.removed = False
+
+
+class _Topic:
+    __slots__ = ("name", "seq", "entries", "changed", "subscribers", "_cache_seq", "_cache")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.seq = 0
+        self.entries: Dict[str, _Entry] = {}
+        self.changed: "OrderedDict[str, int]" = OrderedDict()  # 키 -> 마지막 변경 시퀀스 (변경 순)
+        self.subscribers: Set["Subscription"] = set()
+        self._cache_seq = 0
+        self._cache: Dict[int, MessageList] = {}
+
+    def touch(self, key: str) -> int:
+        self.seq += 1
+        self.changed[key] = self.seq
+        self.changed.move_to_end(key)
+        return self.seq
+
+    def changes_since(self, cursor: int) -> MessageList:
+        """커서 이후 변경분 (같은 커서끼리 결과 공유)"""
+        if cursor >= self.seq:
+            return MessageList()
+        if self._cache_seq != self.seq:
+            self._cache_seq = self.seq
+            self._cache = {}
+        messages = self._cache.get(cursor)
+        if messages is None:
+            messages = self._cache[cursor] = self._build(cursor)
+        return messages
+
+    def _build(self, cursor: int) -> MessageList:
+        messages = MessageList()
+        for key, seq in reversed(self.changed.items()):
+            if seq <= cursor:
+                break
+            entry = self.entries[key]
+            if entry.removed:
+                if entry.created <= cursor:
+                    messages.append(Message(self.name, key, REMOVE))
+            elif entry.created > cursor:
+                messages.append(Message(self.name, key, SNAPSHOT, entry.data))
+            else:
+                delta = {field: entry.data[field] for field, s in entry.field_seq.items() if s > cursor}
+                messages.append(Message(self.name, key, DELTA, delta))
+        messages.reverse()
+        return messages
+
+
+class Subscription:
+    def __init__(self, hub: "StreamHub", topics: Iterable[str], keys: Optional[Mapping[str, Set[str]]] = None):
+        """
+        구독 초기화
+
+        커서는 0에서 시작하므로 첫 묶음은 현재 상태 전체 스냅샷이다.
+
+        Args:
+            hub (StreamHub): 허브
+            topics (Iterable[str]): 구독 토픽
+            keys (Mapping[str, Set[str]], optional): 토픽별 키 필터 (없는 토픽은 전체 키)
+        """
+        self.hub = hub
+        self.topics = tuple(dict.fromkeys(topics))
+        self.keys = dict(keys or {})
+        self.cursors: Dict[str, int] = dict.fromkeys(self.topics, 0)
+        self.delivered = 0
+        self.skipped = 0
+        self.closed = False
+        self._ready = asyncio.Event()
+
+    def wake(self) -> None:
+        """새 변경 알림 (허브가 이벤트 루프에서 호출)"""
+        self._ready.set()
+
+    def drain(self) -> Batch:
+        """커서 이후 변경분을 꺼내고 커서를 전진"""
+        self._ready.clear()
+        batch = Batch()
+        for name in self.topics:
+            topic = self.hub._topics.get(name)
+            cursor = self.cursors[name]
+            if topic is None or cursor >= topic.seq:
+                continue
+            messages = topic.changes_since(cursor)
+            self.skipped += topic.seq - cursor - len(messages)
+            wanted = self.keys.get(name)
+            if wanted is not None:
+                messages = MessageList(message for message in messages if message.key in wanted)
+            batch.add(messages)
+            self.cursors[name] = topic.seq
+        self.delivered += len(batch)
+        return batch
+
+    async def get(self, timeout: Optional[float] = None) -> Batch:
+        """
+        다음 메시지 묶음 대기
+
+        Args:
+            timeout (float, optional): 최대 대기 시간 (초, 초과 시 빈 목록)
+
+        Returns:
+            Batch: 마지막 수신 이후 바뀐 키별 메시지
+        """
+        if not self._ready.is_set():
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return Batch()
+        return self.drain()
+
+    def close(self) -> None:
+        """구독 해제"""
+        if not self.closed:
+            self.closed = True
+            self.hub.unsubscribe(self)
+
+
+class StreamHub:
+    def __init__(self):
+        """
+        발행/구독 허브 초기화
+
+        publish/subscribe는 이벤트 루프 스레드에서 호출해야 한다.
+        다른 스레드에서는 publish_threadsafe를 사용한다.
+        발행은 구독자를 바로 깨우지 않고, 같은 루프 반복 안의 발행을 모아 한 번만 깨운다.
+        """
+        self.published = 0
+        self.suppressed = 0
+        self._topics: Dict[str, _Topic] = {}
+        self._dirty: Set[_Topic] = set()
+        self._wake_scheduled = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+        self._forwarders: List[Forwarder] = []
+
+    def _topic(self, name: str) -> _Topic:
+        topic = self._topics.get(name)
+        if topic is None:
+            topic = self._topics[name] = _Topic(name)
+        return topic
+
+    def subscribe(self, topics: Iterable[str], keys: Optional[Mapping[str, Set[str]]] = None) -> Subscription:
+        """
+        구독 생성
+
+        Args:
+            topics (Iterable[str]): 구독 토픽
+            keys (Mapping[str, Set[str]], optional): 토픽별 키 필터
+
+        Returns:
+            Subscription: 구독 (사용 후 close 호출)
+        """
+        self.bind_loop()
+        subscription = Subscription(self, topics, keys)
+        for name in subscription.topics:
+            topic = self._topic(name)
+            topic.subscribers.add(subscription)
+            if topic.seq:
+                subscription.wake()
+        return subscription
+
+    def bind_loop(self) -> None:
+        """
+        실행 중인 이벤트 루프에 허브를 묶음 (이벤트 루프 스레드에서 호출)
+
+        publish_threadsafe는 묶인 루프로 발행을 넘긴다. 구독하면 자동으로 묶이지만, 구독이 없는
+        프로세스(엔진)에서는 스레드풀의 발행이 전달 함수와 허브 상태를 루프와 동시에 건드리지 않도록
+        시작할 때 직접 호출해야 한다.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """구독 제거"""
+        for name in subscription.topics:
+            topic = self._topics.get(name)
+            if topic is not None:
+                topic.subscribers.discard(subscription)
+
+    def add_forwarder(self, forwarder: Forwarder) -> None:
+        """
+        변경 전달 함수 등록 (다른 프로세스로 상태를 복제할 때 사용)
+
+        발행으로 키 상태가 바뀔 때마다 (토픽, 키, 병합된 전체 상태)로, 삭제되면 상태 None으로 호출된다.
+        """
+        self._forwarders.append(forwarder)
+
+    def remove_forwarder(self, forwarder: Forwarder) -> None:
+        """변경 전달 함수 해제"""
+        if forwarder in self._forwarders:
+            self._forwarders.remove(forwarder)
+
+    def topics(self) -> List[str]:
+        """발행된 적 있는 토픽 이름"""
+        return list(self._topics)
+
+    def entries(self, topic: str) -> Dict[str, Dict[str, Any]]:
+        """토픽의 키별 현재 상태 (읽기 전용으로 사용)"""
+        state = self._topics.get(topic)
+        if state is None:
+            return {}
+        return {key: entry.data for key, entry in state.entries.items() if not entry.removed}
+
+    def subscriber_count(self, topic: Optional[str] = None) -> int:
+        """구독자 수"""
+        if topic is not None:
+            return len(self._topics[topic].subscribers) if topic in self._topics else 0
+        return len({s for t in self._topics.values() for s in t.subscribers})
+
+    def _changed(self, topic: _Topic) -> None:
+        self.published += 1
+        if not topic.subscribers:
+            return
+        self._dirty.add(topic)
+        if not self._wake_scheduled and self._loop is not None and not self._loop.is_closed():
+            self._wake_scheduled = True
+            self._loop.call_soon(self._wake)
+
+    def _wake(self) -> None:
+        self._wake_scheduled = False
+        dirty, self._dirty = self._dirty, set()
+        for topic in dirty:
+            for subscription in topic.subscribers:
+                subscription.wake()
+
+    def publish(self, topic: str, key: str, data: Mapping[str, Any]) -> bool:
+        """
+        상태 발행
+
+        data는 부분 갱신으로 취급해 기존 상태에 병합하며, 바뀐 필드만 델타로 전달된다.
+
+        Args:
+            topic (str): 토픽
+            key (str): 키
+            data (Mapping[str, Any]): 갱신할 필드
+
+        Returns:
+            bool: 바뀐 필드가 있어 발행했는지 여부
+        """
+        state = self._topic(topic)
+        entry = state.entries.get(key)
+        if entry is None or entry.removed:
+            state.entries[key] = _Entry(dict(data), state.touch(key))
+        else:
+            delta = {field: value for field, value in data.items() if entry.data.get(field, _MISSING) != value}
+            if not delta:
+                self.suppressed += 1
+                return False
+            seq = state.touch(key)
+            entry.data = {**entry.data, **delta}  # 이미 만든 메시지가 참조하는 dict는 바꾸지 않음
+            for field in delta:
+                entry.field_seq[field] = seq
+        self._changed(state)
+        for forward in self._forwarders:
+            forward(topic, key, state.entries[key].data)
+        return True
+
+    def remove(self, topic: str, key: str) -> None:
+        """키 상태 삭제 발행"""
+        state = self._topics.get(topic)
+        entry = state.entries.get(key) if state is not None else None
+        if entry is not None and not entry.removed:
+            entry.removed = True
+            entry.data = {}
+            entry.field_seq = {}
+            state.touch(key)
+            self._changed(state)
+            for forward in self._forwarders:
+                forward(topic, key, None)
+
+    def publish_threadsafe(self, topic: str, key: str, data: Mapping[str, Any]) -> None:
+        """
+        다른 스레드에서 상태 발행
+
+        구독이 생성된 이벤트 루프로 발행을 넘긴다. 루프가 없거나 닫혔으면 바로 발행한다.
+        """
+        loop = self._loop
+        if loop is not None and threading.get_ident() != self._loop_thread and not loop.is_closed():
+            try:
+                loop.call_soon_threadsafe(self.publish, topic, key, dict(data))
+                return
+            except RuntimeError:
+                pass
+        self.publish(topic, key, data)
+
+    def state(self, topic: str, key: str) -> Optional[Dict[str, Any]]:
+        """현재 상태 조회"""
+        entry = self._topics[topic].entries.get(key) if topic in self._topics else None
+        return dict(entry.data) if entry is not None and not entry.removed else None
+
+    def stats(self) -> Dict[str, int]:
+        """발행/구독 통계"""
+        return {
+            "published": self.published,
+            "suppressed": self.suppressed,
+            "subscribers": self.subscriber_count(),
+            "topics": len(self._topics),
+        }
+
+
+stream_hub = StreamHub()
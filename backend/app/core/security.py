@@ -1,22 +1,95 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
 from app.core.config import settings
-from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from app.core.metrics import Histogram
 import base64
+import hashlib
 import os
-from typing import Tuple
+import threading
+import time
+from typing import Dict, List, Sequence, Tuple
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# jose, passlib, cryptography는 처음 쓸 때 불러온다 (워커 기동과 CLI 스크립트 시작 시간 단축)
+if TYPE_CHECKING:
+    from jose.backends.base import Key
+    from passlib.context import CryptContext
+
+# 암복호화/키 파생/비밀번호 검증 시간
+CRYPTO_LATENCY = Histogram("crypto_operation_seconds", "암호화 연산 한 번에 걸린 시간", labelnames=("operation",))
+_ENCRYPT_LATENCY = CRYPTO_LATENCY.labels("encrypt")
+_DECRYPT_LATENCY = CRYPTO_LATENCY.labels("decrypt")
+_DERIVE_LATENCY = CRYPTO_LATENCY.labels("derive_key")
+_VERIFY_PASSWORD_LATENCY = CRYPTO_LATENCY.labels("verify_password")
+
+pwd_context: Optional["CryptContext"] = None  # 첫 비밀번호 검증/해시 때 생성
+
+def _get_pwd_context() -> "CryptContext":
+    global pwd_context
+    if pwd_context is None:
+        from passlib.context import CryptContext
+
+        pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    return pwd_context
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    context = _get_pwd_context()
+    start = time.perf_counter()
+    try:
+        return context.verify(plain_password, hashed_password)
+    finally:
+        _VERIFY_PASSWORD_LATENCY.observe(time.perf_counter() - start)
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return _get_pwd_context().hash(password)
+
+_password_executor: Optional[ThreadPoolExecutor] = None
+_password_executor_lock = threading.Lock()
+
+def _get_password_executor() -> ThreadPoolExecutor:
+    global _password_executor
+    if _password_executor is None:
+        with _password_executor_lock:
+            if _password_executor is None:
+                _password_executor = ThreadPoolExecutor(
+                    max_workers=settings.AUTH_PASSWORD_WORKERS, thread_name_prefix="password",
+                )
+    return _password_executor
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    비밀번호 검증 (이벤트 루프 밖에서 실행)
+
+    bcrypt 검증은 수백 ms가 걸리므로 크기가 정해진 전용 스레드 풀에서 실행한다.
+    동시 로그인이 몰려도 검증 스레드 수는 settings.AUTH_PASSWORD_WORKERS를 넘지 않는다.
+
+    Args:
+        plain_password (str): 입력한 비밀번호
+        hashed_password (str): 저장된 해시
+
+    Returns:
+        bool: 일치 여부
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_password_executor(), verify_password, plain_password, hashed_password)
+
+@lru_cache(maxsize=4)
+def get_signing_key(secret_key: str, algorithm: str) -> "Key":
+    """
+    JWT 서명 키 객체 조회 (비밀 키와 알고리즘별로 한 번만 생성)
+
+    Args:
+        secret_key (str): 서명 비밀 키
+        algorithm (str): 서명 알고리즘
+
+    Returns:
+        Key: python-jose 키 객체
+    """
+    from jose import jwk
+
+    return jwk.construct(secret_key, algorithm)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
@@ -26,39 +99,100 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    from jose import jwt
+
+    encoded_jwt = jwt.encode(to_encode, get_signing_key(settings.SECRET_KEY, settings.ALGORITHM), algorithm=settings.ALGORITHM)
     return encoded_jwt
 
 def verify_token(token: str) -> Optional[dict]:
+    from jose import JWTError, jwt
+
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = jwt.decode(token, get_signing_key(settings.SECRET_KEY, settings.ALGORITHM), algorithms=[settings.ALGORITHM])
         return payload
     except JWTError:
         return None
 
+KDF_SALT = b'coinori_salt'  # 실제 운영에서는 환경 변수로 관리
+KDF_ITERATIONS = 100000
+
+
+def get_key_id(secret_key: str) -> str:
+    """
+    비밀 키 식별자 계산
+
+    비밀 키 자체를 캐시 키나 로그에 남기지 않도록 SHA-256 지문의 앞부분을 사용
+
+    Args:
+        secret_key (str): 암호화 비밀 키
+
+    Returns:
+        str: 키 ID
+    """
+    return hashlib.sha256(secret_key.encode()).hexdigest()[:16]
+
+
+def derive_fernet_key(secret_key: str) -> bytes:
+    """
+    PBKDF2로 Fernet 키 파생 (캐시하지 않음)
+
+    Args:
+        secret_key (str): 암호화 비밀 키
+
+    Returns:
+        bytes: base64 인코딩된 Fernet 키
+    """
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+    start = time.perf_counter()
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=KDF_SALT,
+        iterations=KDF_ITERATIONS,
+    )
+    key = base64.urlsafe_b64encode(kdf.derive(secret_key.encode()))
+    _DERIVE_LATENCY.observe(time.perf_counter() - start)
+    return key
+
+
 class CryptoUtils:
-    def __init__(self, secret_key: str = None):
+    __slots__ = ("fernet", "key_id", "previous_key_ids")
+
+    def __init__(self, secret_key: str = None, previous_keys: Sequence[str] = ()):
         """
         암호화 유틸리티 초기화
         
         Args:
             secret_key (str, optional): 암호화에 사용할 비밀 키. 
                                       제공되지 않으면 환경 변수에서 가져옴
+            previous_keys (Sequence[str], optional): 복호화에만 사용할 이전 비밀 키 목록
         """
         if secret_key is None:
             secret_key = os.getenv("ENCRYPTION_KEY")
             if not secret_key:
                 raise ValueError("암호화 키가 설정되지 않았습니다.")
         
-        # PBKDF2를 사용하여 키 생성
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=b'coinori_salt',  # 실제 운영에서는 환경 변수로 관리
-            iterations=100000,
-        )
-        key = base64.urlsafe_b64encode(kdf.derive(secret_key.encode()))
-        self.fernet = Fernet(key)
+        from cryptography.fernet import Fernet, MultiFernet
+
+        # PBKDF2 파생 키는 프로세스 단위로 캐시됨
+        primary = Fernet(key_manager.derive_key(secret_key))
+        previous = [
+            key for key in dict.fromkeys(previous_keys) if key and key != secret_key
+        ]
+        if previous:
+            fernet = MultiFernet(
+                [primary] + [Fernet(key_manager.derive_key(key)) for key in previous]
+            )
+        else:
+            fernet = primary
+        object.__setattr__(self, "fernet", fernet)
+        object.__setattr__(self, "key_id", get_key_id(secret_key))
+        object.__setattr__(self, "previous_key_ids", tuple(get_key_id(key) for key in previous))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("CryptoUtils 인스턴스는 변경할 수 없습니다.")
     
     def encrypt(self, text: str) -> str:
         """
@@ -70,7 +204,10 @@ class CryptoUtils:
         Returns:
             str: 암호화된 문자열
         """
-        return self.fernet.encrypt(text.encode()).decode()
+        start = time.perf_counter()
+        token = self.fernet.encrypt(text.encode()).decode()
+        _ENCRYPT_LATENCY.observe(time.perf_counter() - start)
+        return token
     
     def decrypt(self, encrypted_text: str) -> str:
         """
@@ -82,7 +219,23 @@ class CryptoUtils:
         Returns:
             str: 복호화된 문자열
         """
-        return self.fernet.decrypt(encrypted_text.encode()).decode()
+        start = time.perf_counter()
+        try:
+            return self.fernet.decrypt(encrypted_text.encode()).decode()
+        finally:
+            _DECRYPT_LATENCY.observe(time.perf_counter() - start)
+
+    def reencrypt(self, encrypted_text: str) -> str:
+        """
+        이전 키로 암호화된 문자열을 현재 키로 다시 암호화
+
+        Args:
+            encrypted_text (str): 암호화된 문자열
+
+        Returns:
+            str: 현재 키로 암호화된 문자열
+        """
+        return self.encrypt(self.decrypt(encrypted_text))
     
     @staticmethod
     def generate_key() -> str:
@@ -92,4 +245,105 @@ class CryptoUtils:
         Returns:
             str: 생성된 암호화 키
         """
+        from cryptography.fernet import Fernet
+
         return Fernet.generate_key().decode()
+
+
+class KeyManager:
+    """
+    프로세스 단위 암호화 키 관리자
+
+    PBKDF2 파생 키를 키 ID별로 한 번만 계산해 보관하고,
+    서비스에는 공유되는 불변 CryptoUtils 핸들을 제공한다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._derived_keys: Dict[str, bytes] = {}
+        self._active_secret: Optional[str] = None
+        self._previous_secrets: List[str] = []
+        self._crypto: Optional[CryptoUtils] = None
+
+    def derive_key(self, secret_key: str) -> bytes:
+        """
+        캐시된 Fernet 키 조회 (없으면 파생 후 저장)
+
+        Args:
+            secret_key (str): 암호화 비밀 키
+
+        Returns:
+            bytes: base64 인코딩된 Fernet 키
+        """
+        key_id = get_key_id(secret_key)
+        key = self._derived_keys.get(key_id)
+        if key is None:
+            key = derive_fernet_key(secret_key)
+            self._derived_keys[key_id] = key
+        return key
+
+    def get_crypto(self) -> CryptoUtils:
+        """
+        현재 ENCRYPTION_KEY에 대한 공유 CryptoUtils 조회
+
+        환경 변수의 키가 바뀌었으면 재시작 없이 새 키로 교체하고,
+        이전 키는 기존 데이터 복호화용으로 유지한다.
+
+        Returns:
+            CryptoUtils: 공유 암호화 핸들
+        """
+        secret_key = os.getenv("ENCRYPTION_KEY")
+        crypto = self._crypto
+        if crypto is not None and secret_key == self._active_secret:
+            return crypto
+        if not secret_key:
+            raise ValueError("암호화 키가 설정되지 않았습니다.")
+        return self.rotate(secret_key)
+
+    def rotate(self, secret_key: str) -> CryptoUtils:
+        """
+        활성 암호화 키 교체
+
+        Args:
+            secret_key (str): 새 암호화 비밀 키
+
+        Returns:
+            CryptoUtils: 새 키를 기본으로 사용하는 공유 암호화 핸들
+        """
+        with self._lock:
+            if self._crypto is not None and secret_key == self._active_secret:
+                return self._crypto
+
+            previous = list(self._previous_secrets)
+            if self._active_secret:
+                previous.insert(0, self._active_secret)
+            env_previous = os.getenv("ENCRYPTION_KEY_PREVIOUS", "")
+            previous.extend(key.strip() for key in env_previous.split(",") if key.strip())
+            previous = [key for key in dict.fromkeys(previous) if key != secret_key]
+
+            crypto = CryptoUtils(secret_key, previous_keys=previous)
+            self._active_secret = secret_key
+            self._previous_secrets = previous
+            self._crypto = crypto
+            return crypto
+
+    def clear(self) -> None:
+        """캐시된 파생 키와 공유 핸들 초기화"""
+        with self._lock:
+            self._derived_keys.clear()
+            self._active_secret = None
+            self._previous_secrets = []
+            self._crypto = None
+
+
+key_manager = KeyManager()
+
+
+def get_crypto() -> CryptoUtils:
+    """
+    공유 암호화 핸들 조회
+
+    Returns:
+        CryptoUtils: 현재 ENCRYPTION_KEY 기반 암호화 핸들
+    """
+    return key_manager.get_crypto()
@@ -0,0 +1,250 @@
+"""
+프로세스 간 허브 상태 복제
+
+엔진 프로세스(APP_ROLE=engine)의 StreamHub 변경을 공유 메모리 링에 쓰고, API 워커(APP_ROLE=api)는
+링을 읽어 자기 프로세스의 StreamHub에 그대로 발행한다. 메시지는 키의 병합된 전체 상태이므로
+워커가 밀려 중간 메시지를 건너뛰어도 같은 키의 다음 메시지로 최신 상태에 수렴하고,
+엔진은 주기적으로 전체 상태를 다시 써서 그 사이 변경이 없던 키도 맞춘다. 재기록은 시작/끝 표시로
+감싸며, 밀린 적 있는 워커는 재기록에 없던 키(건너뛴 삭제)를 지운다.
+API 요청은 워커 메모리만 읽으므로 워커 수만큼 확장되고 엔진 부하와 무관하다.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from contextlib import suppress
+from typing import Any, Dict, Optional, Set, Tuple
+
+from app.core.config import settings
+from app.core.metrics import Counter
+from app.core.pubsub import StreamHub
+from app.core.shm_ring import SharedRing
+
+logger = logging.getLogger(__name__)
+
+# 재기록 시작/끝 표시 (토픽이 빈 문자열인 제어 메시지)
+RESYNC_BEGIN = "resync-begin"
+RESYNC_END = "resync-end"
+
+# 공유 상태 복제
+SHARED_STATE_WRITTEN = Counter("shared_state_written_total", "엔진이 공유 메모리에 쓴 상태 메시지 수")
+SHARED_STATE_APPLIED = Counter("shared_state_applied_total", "API 워커가 공유 메모리에서 읽어 반영한 상태 메시지 수")
+SHARED_STATE_SKIPPED = Counter("shared_state_skipped_total", "API 워커가 밀려 덮어써진 상태 메시지 수")
+
+
+def encode_state(topic: str, key: str, data: Optional[Dict[str, Any]]) -> bytes:
+    """상태 메시지 직렬화 (data가 None이면 삭제)"""
+    return json.dumps([topic, key, data], separators=(",", ":"), default=str).encode()
+
+
+class SharedStatePublisher:
+    def __init__(self, hub: StreamHub, ring: SharedRing, resync_interval: Optional[float] = None):
+        """
+        허브 변경을 링에 쓰는 발행기 초기화 (엔진 프로세스)
+
+        Args:
+            hub (StreamHub): 원본 허브
+            ring (SharedRing): 쓰기용 링 (SharedRing.create)
+            resync_interval (float, optional): 전체 상태 재기록 주기 (초, 기본값: settings.SHARED_STATE_RESYNC_INTERVAL)
+        """
+        self.hub = hub
+        self.ring = ring
+        self.resync_interval = settings.SHARED_STATE_RESYNC_INTERVAL if resync_interval is None else resync_interval
+        self.written = 0
+        self.oversized = 0
+
+    def _forward(self, topic: str, key: str, data: Optional[Dict[str, Any]]) -> None:
+        try:
+            self.ring.write(encode_state(topic, key, data))
+        except ValueError as e:
+            self.oversized += 1
+            logger.warning("공유 상태 메시지 누락 (%s %s): %s", topic, key, e)
+            return
+        self.written += 1
+        SHARED_STATE_WRITTEN.inc()
+
+    def attach(self) -> None:
+        """
+        허브에 연결하고 현재 상태 전체 기록
+
+        링은 쓰는 쪽이 하나여야 하므로, 이벤트 루프에서 호출하면 허브를 그 루프에 묶어
+        다른 스레드의 발행(publish_threadsafe)도 루프에서 링에 쓰게 한다.
+        """
+        with suppress(RuntimeError):  # 실행 중인 루프 없음 (동기 호출)
+            self.hub.bind_loop()
+        self.hub.add_forwarder(self._forward)
+        self.resync()
+
+    def detach(self) -> None:
+        """허브 연결 해제"""
+        self.hub.remove_forwarder(self._forward)
+
+    def resync(self) -> int:
+        """
+        허브의 모든 키 상태를 다시 기록 (상태가 없어도 표시는 기록하므로 워커의 생존 확인에도 쓰임)
+
+        Returns:
+            int: 기록한 상태 메시지 수
+        """
+        self._forward("", RESYNC_BEGIN, None)
+        count = 0
+        for topic in self.hub.topics():
+            for key, data in self.hub.entries(topic).items():
+                self._forward(topic, key, data)
+                count += 1
+        self._forward("", RESYNC_END, None)
+        return count
+
+    async def run(self) -> None:
+        """주기적 전체 상태 재기록 (취소될 때까지 실행)"""
+        if self.resync_interval <= 0:
+            return
+        while True:
+            await asyncio.sleep(self.resync_interval)
+            self.resync()
+
+
+class SharedStateMirror:
+    def __init__(
+        self,
+        hub: StreamHub,
+        name: Optional[str] = None,
+        poll_interval: Optional[float] = None,
+        stale_after: Optional[float] = None,
+        batch_size: int = 4096,
+    ):
+        """
+        링을 읽어 허브에 반영하는 복제기 초기화 (API 워커)
+
+        엔진이 아직 링을 만들지 않았으면 만들 때까지 기다린다. 엔진이 재시작해 링을 새로 만들면
+        (재기록 주기의 몇 배 동안 새 메시지가 없으면) 다시 연결한다.
+
+        Args:
+            hub (StreamHub): 반영할 허브 (워커 프로세스의 stream_hub)
+            name (str, optional): 공유 메모리 이름 (기본값: settings.SHARED_STATE_NAME)
+            poll_interval (float, optional): 새 메시지 확인 주기 (초, 기본값: settings.SHARED_STATE_POLL_INTERVAL)
+            stale_after (float, optional): 이 시간 동안 메시지가 없으면 다시 연결 (초, 기본값: 재기록 주기 × 3, 0이면 비활성화)
+            batch_size (int): 한 번에 읽을 최대 메시지 수
+        """
+        self.hub = hub
+        self.name = name or settings.SHARED_STATE_NAME
+        self.poll_interval = poll_interval or settings.SHARED_STATE_POLL_INTERVAL
+        self.stale_after = settings.SHARED_STATE_RESYNC_INTERVAL * 3 if stale_after is None else stale_after
+        self.batch_size = batch_size
+        self.ring: Optional[SharedRing] = None
+        self.cursor = 0
+        self.applied = 0
+        self.skipped = 0
+        self.reconnects = 0
+        self.connected = asyncio.Event()
+        self._lapped = False  # 메시지를 건너뛰어 재기록으로 맞춰야 하는 상태
+        self._seen: Optional[Set[Tuple[str, str]]] = None  # 진행 중인 재기록에서 받은 키
+
+    def _apply(self, payload: bytes) -> None:
+        topic, key, data = json.loads(payload)
+        if not topic:
+            if key == RESYNC_BEGIN:
+                self._seen = set()
+            elif key == RESYNC_END and self._seen is not None:
+                if self._lapped:
+                    self._reconcile(self._seen)
+                self._seen = None
+            return
+        if self._seen is not None:
+            self._seen.add((topic, key))
+        if data is None:
+            self.hub.remove(topic, key)
+        else:
+            self.hub.publish(topic, key, data)
+
+    def _reconcile(self, seen: Set[Tuple[str, str]]) -> None:
+        # 재기록에 없던 키는 건너뛴 사이 엔진에서 삭제된 것
+        for topic in self.hub.topics():
+            for key in [key for key in self.hub.entries(topic) if (topic, key) not in seen]:
+                self.hub.remove(topic, key)
+        self._lapped = False
+
+    def poll(self) -> int:
+        """
+        새 메시지를 읽어 허브에 반영
+
+        Returns:
+            int: 반영한 메시지 수
+        """
+        ring = self.ring
+        if ring.last_seq() < self.cursor:  # 같은 이름으로 새로 만든 링
+            self.cursor = 0
+        messages, self.cursor, skipped = ring.read(self.cursor, self.batch_size)
+        if skipped:
+            # 진행 중인 재기록도 일부를 놓쳤을 수 있으므로 다음 재기록으로 맞춤
+            self._lapped = True
+            self._seen = None
+            self.skipped += skipped
+            SHARED_STATE_SKIPPED.inc(skipped)
+        for payload in messages:
+            self._apply(payload)
+        self.applied += len(messages)
+        SHARED_STATE_APPLIED.inc(len(messages))
+        return len(messages)
+
+    async def _connect(self) -> None:
+        warned = False
+        while True:
+            try:
+                ring = SharedRing.attach(self.name)
+                break
+            except FileNotFoundError:
+                if not warned:
+                    logger.info("공유 상태 링(%s)을 기다리는 중 (엔진 프로세스 시작 전)", self.name)
+                    warned = True
+                await asyncio.sleep(max(self.poll_interval, 0.5))
+        self.ring = ring
+        # 링에 남은 가장 오래된 메시지부터 읽고, 그 전 변경은 다음 재기록으로 맞춤
+        self.cursor = max(ring.last_seq() - ring.slots, 0)
+        self._lapped = True
+        self._seen = None
+        self.connected.set()
+
+    def _disconnect(self) -> None:
+        self.connected.clear()
+        if self.ring is not None:
+            self.ring.close()
+            self.ring = None
+
+    async def run(self) -> None:
+        """복제 루프 (취소될 때까지 실행)"""
+        try:
+            await self._connect()
+            last_message = time.monotonic()
+            while True:
+                if self.poll():
+                    last_message = time.monotonic()
+                    await asyncio.sleep(0)  # 밀린 메시지가 많아도 요청 처리를 막지 않음
+                    continue
+                if self.stale_after and time.monotonic() - last_message > self.stale_after:
+                    self._disconnect()
+                    self.reconnects += 1
+                    await self._connect()
+                    last_message = time.monotonic()
+                    continue
+                await asyncio.sleep(self.poll_interval)
+        finally:
+            self._disconnect()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        복제 통계 조회
+
+        Returns:
+            Dict[str, Any]: 연결 여부, 반영/건너뜀/재연결 수, 커서와 밀린 메시지 수
+        """
+        ring = self.ring
+        return {
+            "connected": ring is not None,
+            "applied": self.applied,
+            "skipped": self.skipped,
+            "reconnects": self.reconnects,
+            "cursor": self.cursor,
+            "lag": ring.last_seq() - self.cursor if ring is not None else None,
+        }
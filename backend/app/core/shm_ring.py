@@ -0,0 +1,178 @@
+"""
+공유 메모리 링 버퍼
+
+쓰는 프로세스 하나와 읽는 프로세스 여럿이 POSIX 공유 메모리로 메시지를 주고받는다.
+슬롯 크기가 고정된 링이며, 쓰기는 잠금 없이 슬롯을 덮어쓰고 읽는 쪽은 각자 커서(마지막으로 읽은
+시퀀스)를 들고 따라온다. 읽는 쪽이 한 바퀴 이상 밀리면 덮어쓴 메시지는 건너뛰고 남은 가장 오래된
+메시지부터 다시 읽는다 (건너뛴 수는 반환값으로 알려줌).
+
+메모리 배치 (리틀 엔디언)
+- 헤더 32바이트: 매직(u32), 슬롯 수(u32), 슬롯 크기(u32), 예약(u32), 마지막 쓰기 시퀀스(u64), 예약(u64)
+- 슬롯: 시퀀스(u64), 길이(u32), 예약(u32), 본문
+쓰는 쪽은 슬롯 시퀀스를 0으로 지운 뒤 본문을 쓰고 시퀀스를 마지막에 기록한다. 읽는 쪽은 본문 복사
+전후의 시퀀스가 기대값과 같을 때만 메시지로 인정한다.
+"""
+
+import struct
+import sys
+import threading
+from multiprocessing import resource_tracker, shared_memory
+from typing import List, Optional, Tuple
+
+MAGIC = 0x43524E47  # "CRNG"
+HEADER = struct.Struct("<IIIIQQ")
+SLOT_HEADER = struct.Struct("<QII")
+_SEQ = struct.Struct("<Q")
+_WRITE_SEQ_OFFSET = 16
+_attach_lock = threading.Lock()
+
+
+class SharedRing:
+    def __init__(self, memory: shared_memory.SharedMemory, owner: bool):
+        """
+        링 버퍼 초기화 (create 또는 attach 사용)
+
+        Args:
+            memory (SharedMemory): 공유 메모리 블록
+            owner (bool): 만든 쪽 여부 (unlink 권한)
+        """
+        magic, slots, slot_size, _, _, _ = HEADER.unpack_from(memory.buf, 0)
+        if magic != MAGIC:
+            raise ValueError(f"링 버퍼 형식이 아닙니다: {memory.name}")
+        self.memory = memory
+        self.name = memory.name
+        self.owner = owner
+        self.slots = slots
+        self.slot_size = slot_size
+        self.capacity = slot_size - SLOT_HEADER.size  # 메시지 최대 바이트 수
+        self._buf = memory.buf
+        self._write_seq = self.last_seq() if owner else 0
+
+    @classmethod
+    def create(cls, name: Optional[str], slots: int, slot_size: int) -> "SharedRing":
+        """
+        링 버퍼 생성 (쓰는 쪽)
+
+        같은 이름의 블록이 남아 있으면 (이전 프로세스가 비정상 종료) 지우고 새로 만든다.
+
+        Args:
+            name (str, optional): 공유 메모리 이름 (없으면 임의 이름)
+            slots (int): 슬롯 수
+            slot_size (int): 슬롯 크기 (바이트, 헤더 포함)
+
+        Returns:
+            SharedRing: 링 버퍼
+        """
+        if slot_size <= SLOT_HEADER.size or slot_size % 8:
+            raise ValueError("슬롯 크기는 16보다 큰 8의 배수여야 합니다.")
+        size = HEADER.size + slots * slot_size
+        try:
+            memory = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            stale = shared_memory.SharedMemory(name=name)
+            stale.close()
+            stale.unlink()
+            memory = shared_memory.SharedMemory(name=name, create=True, size=size)
+        memory.buf[:size] = bytes(size)
+        HEADER.pack_into(memory.buf, 0, MAGIC, slots, slot_size, 0, 0, 0)
+        return cls(memory, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedRing":
+        """
+        기존 링 버퍼 연결 (읽는 쪽)
+
+        Args:
+            name (str): 공유 메모리 이름
+
+        Returns:
+            SharedRing: 링 버퍼
+
+        Raises:
+            FileNotFoundError: 쓰는 쪽이 아직 만들지 않은 경우
+        """
+        # 연결만 한 프로세스가 종료하면서 블록을 지우지 않도록 자원 추적에 등록하지 않음
+        if sys.version_info >= (3, 13):
+            memory = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            with _attach_lock:
+                register = resource_tracker.register
+                resource_tracker.register = lambda name, rtype: None
+                try:
+                    memory = shared_memory.SharedMemory(name=name)
+                finally:
+                    resource_tracker.register = register
+        return cls(memory, owner=False)
+
+    def last_seq(self) -> int:
+        """마지막으로 쓴 메시지 시퀀스 (0이면 아직 없음)"""
+        return _SEQ.unpack_from(self._buf, _WRITE_SEQ_OFFSET)[0]
+
+    def write(self, payload: bytes) -> int:
+        """
+        메시지 쓰기 (쓰는 쪽 한 곳에서만 호출)
+
+        Args:
+            payload (bytes): 메시지 (최대 capacity 바이트)
+
+        Returns:
+            int: 메시지 시퀀스
+
+        Raises:
+            ValueError: 메시지가 슬롯보다 큰 경우
+        """
+        length = len(payload)
+        if length > self.capacity:
+            raise ValueError(f"메시지가 슬롯보다 큽니다 ({length} > {self.capacity} 바이트)")
+        seq = self._write_seq + 1
+        offset = HEADER.size + (seq % self.slots) * self.slot_size
+        buf = self._buf
+        _SEQ.pack_into(buf, offset, 0)
+        start = offset + SLOT_HEADER.size
+        buf[start:start + length] = payload
+        SLOT_HEADER.pack_into(buf, offset, seq, length, 0)
+        _SEQ.pack_into(buf, _WRITE_SEQ_OFFSET, seq)
+        self._write_seq = seq
+        return seq
+
+    def read(self, cursor: int, limit: Optional[int] = None) -> Tuple[List[bytes], int, int]:
+        """
+        커서 이후 메시지 읽기
+
+        Args:
+            cursor (int): 마지막으로 읽은 시퀀스
+            limit (int, optional): 최대 읽을 메시지 수
+
+        Returns:
+            Tuple[List[bytes], int, int]: (메시지 목록, 새 커서, 덮어써져 건너뛴 메시지 수)
+        """
+        buf = self._buf
+        last = self.last_seq()
+        skipped = 0
+        oldest = last - self.slots + 1
+        if cursor + 1 < oldest:
+            skipped = oldest - cursor - 1
+            cursor = oldest - 1
+        end = last if limit is None else min(last, cursor + limit)
+        messages: List[bytes] = []
+        for seq in range(cursor + 1, end + 1):
+            offset = HEADER.size + (seq % self.slots) * self.slot_size
+            slot_seq, length, _ = SLOT_HEADER.unpack_from(buf, offset)
+            start = offset + SLOT_HEADER.size
+            payload = bytes(buf[start:start + length])
+            if slot_seq != seq or _SEQ.unpack_from(buf, offset)[0] != seq:
+                # 읽는 사이 쓰는 쪽이 한 바퀴 돌아 덮어씀
+                skipped += 1
+                continue
+            messages.append(payload)
+        return messages, max(cursor, end), skipped
+
+    def close(self) -> None:
+        """연결 해제 (만든 쪽이면 블록 삭제)"""
+        self._buf = None
+        self.memory.close()
+        if self.owner:
+            try:
+                self.memory.unlink()
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,43 @@
+"""Create position_snapshots table
+
+Revision ID: 07602bbe0dc1
+Revises: 412b7244689f
+Create Date: 2026-10-18 13:40:21.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '07602bbe0dc1'
+down_revision: Union[str, None] = '412b7244689f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('position_snapshots',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('exchange', sa.String(), nullable=True),
+    sa.Column('symbol', sa.String(), nullable=True),
+    sa.Column('quantity', sa.Float(), nullable=True),
+    sa.Column('avg_cost', sa.Float(), nullable=True),
+    sa.Column('realized_pnl', sa.Float(), nullable=True),
+    sa.Column('fees', sa.Float(), nullable=True),
+    sa.Column('trade_count', sa.Integer(), nullable=True),
+    sa.Column('last_trade_id', sa.Integer(), nullable=True),
+    sa.Column('taken_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_position_snapshots_id'), 'position_snapshots', ['id'], unique=False)
+    op.create_index('ix_position_snapshots_taken_at_user_id', 'position_snapshots', ['taken_at', 'user_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_position_snapshots_taken_at_user_id', table_name='position_snapshots')
+    op.drop_index(op.f('ix_position_snapshots_id'), table_name='position_snapshots')
+    op.drop_table('position_snapshots')
@@ -0,0 +1,39 @@
+"""Add order_keys table for client_order_id uniqueness
+
+Revision ID: 3d7f1b6a9c42
+Revises: 9e4a7c2d5b18
+Create Date: 2026-10-18 23:51:07.218377
+
+trades는 created_at 파티션 테이블이라 (client_order_id, created_at) 고유 인덱스로는 같은 ID의 두 번째 주문 행을
+막지 못한다. 파티션하지 않은 order_keys(client_order_id 기본 키)를 주문 행과 같은 트랜잭션에 기록해
+워커/프로세스 사이의 중복 제출을 막는다. 기존 주문 행의 키는 가장 이른 행 기준으로 채운다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3d7f1b6a9c42'
+down_revision: Union[str, None] = '9e4a7c2d5b18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'order_keys',
+        sa.Column('client_order_id', sa.String(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('client_order_id'),
+    )
+    op.execute(
+        "INSERT INTO order_keys (client_order_id, created_at) "
+        "SELECT client_order_id, MIN(created_at) FROM trades "
+        "WHERE client_order_id IS NOT NULL GROUP BY client_order_id"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('order_keys')
@@ -0,0 +1,159 @@
+"""Partition and index trades table
+
+Revision ID: 412b7244689f
+Revises: 117fc64a6e72
+Create Date: 2026-10-18 09:12:44.201734
+
+PostgreSQL: trades를 created_at 기준 월별 RANGE 파티션 테이블로 바꾸고
+(기존 행은 옮겨 담음) 사용자/심볼/상태 복합 인덱스를 만든다.
+그 외 DB: 테이블이 없으면 만들고 복합 인덱스만 추가한다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.partitions import DEFAULT_PARTITION, ensure_trade_partitions
+
+
+# revision identifiers, used by Alembic.
+revision: str = '412b7244689f'
+down_revision: Union[str, None] = '117fc64a6e72'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = (
+    ('ix_trades_user_id_created_at', ['user_id', 'created_at']),
+    ('ix_trades_user_id_symbol_created_at', ['user_id', 'symbol', 'created_at']),
+    ('ix_trades_status_created_at', ['status', 'created_at']),
+)
+
+COLUMNS = (
+    'id, user_id, exchange, symbol, trade_type, order_type, side, quantity, price, '
+    'status, order_id, profit_loss, created_at, updated_at, extra_data'
+)
+
+
+def _trades_ddl(table: str, partitioned: bool, with_fk: bool) -> str:
+    user_fk = ' REFERENCES users (id)' if with_fk else ''
+    if partitioned:
+        id_column, primary_key, suffix = 'id BIGSERIAL NOT NULL', 'PRIMARY KEY (id, created_at)', ' PARTITION BY RANGE (created_at)'
+    else:
+        id_column, primary_key, suffix = 'id SERIAL NOT NULL', 'PRIMARY KEY (id)', ''
+    return f"""
+        CREATE TABLE {table} (
+            {id_column},
+            user_id INTEGER{user_fk},
+            exchange VARCHAR,
+            symbol VARCHAR,
+            trade_type VARCHAR,
+            order_type VARCHAR,
+            side VARCHAR,
+            quantity DOUBLE PRECISION,
+            price DOUBLE PRECISION,
+            status VARCHAR,
+            order_id VARCHAR,
+            profit_loss DOUBLE PRECISION,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            updated_at TIMESTAMP WITH TIME ZONE,
+            extra_data JSON,
+            {primary_key}
+        ){suffix}
+    """
+
+
+def _rename_legacy(bind) -> None:
+    """기존 trades를 trades_legacy로 옮기고 이름이 겹치는 인덱스/시퀀스 정리"""
+    op.rename_table('trades', 'trades_legacy')
+    op.execute('ALTER TABLE trades_legacy RENAME CONSTRAINT trades_pkey TO trades_legacy_pkey')
+    op.execute('ALTER SEQUENCE IF EXISTS trades_id_seq RENAME TO trades_legacy_id_seq')
+    for index in sa.inspect(bind).get_indexes('trades_legacy'):
+        op.drop_index(index['name'], table_name='trades_legacy')
+
+
+def _copy_from_legacy(bind) -> None:
+    op.execute(
+        f'INSERT INTO trades ({COLUMNS}) '
+        f"SELECT {COLUMNS.replace('created_at', 'COALESCE(created_at, now())', 1)} FROM trades_legacy"
+    )
+    op.execute("SELECT setval(pg_get_serial_sequence('trades', 'id'), COALESCE((SELECT max(id) FROM trades), 0) + 1, false)")
+    op.drop_table('trades_legacy')
+
+
+def _upgrade_postgresql(bind) -> None:
+    inspector = sa.inspect(bind)
+    has_legacy = inspector.has_table('trades')
+    if has_legacy:
+        _rename_legacy(bind)
+
+    op.execute(_trades_ddl('trades', partitioned=True, with_fk=inspector.has_table('users')))
+    first = None
+    if has_legacy:
+        first = bind.execute(sa.text('SELECT min(created_at) FROM trades_legacy')).scalar()
+    ensure_trade_partitions(bind, start=first.date() if first else None)
+    op.execute(f'CREATE TABLE IF NOT EXISTS {DEFAULT_PARTITION} PARTITION OF trades DEFAULT')
+
+    if has_legacy:
+        _copy_from_legacy(bind)
+
+    # 적재 후 인덱스 생성 (부모 테이블 인덱스는 모든 파티션에 전파됨)
+    op.create_index('ix_trades_id', 'trades', ['id'])
+    for name, columns in INDEXES:
+        op.create_index(name, 'trades', columns)
+
+
+def _upgrade_generic(bind) -> None:
+    inspector = sa.inspect(bind)
+    if not inspector.has_table('trades'):
+        op.create_table('trades',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=True),
+        sa.Column('exchange', sa.String(), nullable=True),
+        sa.Column('symbol', sa.String(), nullable=True),
+        sa.Column('trade_type', sa.String(), nullable=True),
+        sa.Column('order_type', sa.String(), nullable=True),
+        sa.Column('side', sa.String(), nullable=True),
+        sa.Column('quantity', sa.Float(), nullable=True),
+        sa.Column('price', sa.Float(), nullable=True),
+        sa.Column('status', sa.String(), nullable=True),
+        sa.Column('order_id', sa.String(), nullable=True),
+        sa.Column('profit_loss', sa.Float(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('extra_data', sa.JSON(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index('ix_trades_id', 'trades', ['id'])
+        existing = set()
+    else:
+        existing = {index['name'] for index in inspector.get_indexes('trades')}
+    for name, columns in INDEXES:
+        if name not in existing:
+            op.create_index(name, 'trades', columns)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        _upgrade_postgresql(bind)
+    else:
+        _upgrade_generic(bind)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    for name, _ in INDEXES:
+        op.drop_index(name, table_name='trades')
+    if bind.dialect.name != 'postgresql':
+        return
+
+    # 파티션 없는 일반 테이블로 되돌림
+    op.drop_index('ix_trades_id', table_name='trades')
+    op.execute(_trades_ddl('trades_plain', partitioned=False, with_fk=sa.inspect(bind).has_table('users')))
+    op.execute(f'INSERT INTO trades_plain ({COLUMNS}) SELECT {COLUMNS} FROM trades')
+    op.execute("SELECT setval(pg_get_serial_sequence('trades_plain', 'id'), COALESCE((SELECT max(id) FROM trades_plain), 0) + 1, false)")
+    op.drop_table('trades')  # 파티션도 함께 삭제됨
+    op.rename_table('trades_plain', 'trades')
+    op.execute('ALTER TABLE trades RENAME CONSTRAINT trades_plain_pkey TO trades_pkey')
+    op.execute('ALTER SEQUENCE trades_plain_id_seq RENAME TO trades_id_seq')
+    op.create_index('ix_trades_id', 'trades', ['id'])
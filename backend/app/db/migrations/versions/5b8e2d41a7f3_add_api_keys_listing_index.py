@@ -0,0 +1,27 @@
+"""Add api_keys listing index
+
+Revision ID: 5b8e2d41a7f3
+Revises: c41f0e9a27d3
+Create Date: 2026-10-18 21:40:27.118306
+
+거래소별 활성 API 키 목록의 키셋 페이지네이션용 (exchange, is_active, id) 인덱스.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b8e2d41a7f3'
+down_revision: Union[str, None] = 'c41f0e9a27d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_api_keys_exchange_is_active_id', 'api_keys', ['exchange', 'is_active', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_api_keys_exchange_is_active_id', table_name='api_keys')
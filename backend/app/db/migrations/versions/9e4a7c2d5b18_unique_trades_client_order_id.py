@@ -0,0 +1,31 @@
+"""Make trades client_order_id unique
+
+Revision ID: 9e4a7c2d5b18
+Revises: 5b8e2d41a7f3
+Create Date: 2026-10-18 23:12:40.506913
+
+주문 행의 멱등 키를 (client_order_id, created_at) 고유 인덱스로 바꾼다. 파티션 테이블(PostgreSQL)의
+고유 인덱스는 파티션 키(created_at)를 포함해야 한다. 체결 행은 client_order_id가 NULL이라 제약을 받지 않는다.
+이미 같은 키로 중복 기록된 주문 행이 있으면 인덱스 생성이 실패하므로 먼저 정리해야 한다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e4a7c2d5b18'
+down_revision: Union[str, None] = '5b8e2d41a7f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index('ix_trades_client_order_id', table_name='trades')
+    op.create_index('ix_trades_client_order_id', 'trades', ['client_order_id', 'created_at'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_trades_client_order_id', table_name='trades')
+    op.create_index('ix_trades_client_order_id', 'trades', ['client_order_id'], unique=False)
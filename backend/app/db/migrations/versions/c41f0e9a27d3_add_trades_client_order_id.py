@@ -0,0 +1,30 @@
+"""Add client_order_id to trades
+
+Revision ID: c41f0e9a27d3
+Revises: 07602bbe0dc1
+Create Date: 2026-10-18 16:05:12.730418
+
+주문 실행 파이프라인의 멱등 키. 파티션 테이블(PostgreSQL)은 부모에 추가한 열과 인덱스가
+모든 파티션에 전파된다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41f0e9a27d3'
+down_revision: Union[str, None] = '07602bbe0dc1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('trades', sa.Column('client_order_id', sa.String(), nullable=True))
+    op.create_index('ix_trades_client_order_id', 'trades', ['client_order_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_trades_client_order_id', table_name='trades')
+    op.drop_column('trades', 'client_order_id')
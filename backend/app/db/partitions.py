@@ -0,0 +1,151 @@
+"""
+trades 테이블 월별 범위 파티션 관리 (PostgreSQL)
+
+trades는 created_at 기준 RANGE 파티션 테이블이며 파티션 이름은 trades_YYYYMM 형식이다.
+범위를 벗어난 행은 trades_default 파티션으로 들어가므로, API(APP_ROLE=all)와 엔진 프로세스가
+partition_loop()로 기동 시와 주기적으로 ensure_trade_partitions()를 호출해 다가올 달의 파티션을
+미리 만들어 둔다.
+"""
+
+import asyncio
+import logging
+from datetime import date, datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+from app.core.config import settings
+
+TRADES_TABLE = "trades"
+DEFAULT_PARTITION = "trades_default"
+
+logger = logging.getLogger(__name__)
+
+
+def month_start(value: date) -> date:
+    """해당 월의 1일"""
+    return date(value.year, value.month, 1)
+
+
+def add_months(value: date, months: int) -> date:
+    """월 단위 이동 (항상 1일 반환)"""
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """월 파티션 이름 (trades_YYYYMM)"""
+    return f"{TRADES_TABLE}_{month.year:04d}{month.month:02d}"
+
+
+def month_range(start: date, end: date) -> List[date]:
+    """
+    start가 속한 달부터 end가 속한 달까지의 월 목록
+
+    Args:
+        start (date): 시작일
+        end (date): 종료일 (포함)
+
+    Returns:
+        List[date]: 각 월의 1일
+    """
+    months = []
+    current, last = month_start(start), month_start(end)
+    while current <= last:
+        months.append(current)
+        current = add_months(current, 1)
+    return months
+
+
+def partition_ddl(month: date) -> str:
+    """
+    월 파티션 생성 DDL
+
+    Args:
+        month (date): 파티션 대상 월
+
+    Returns:
+        str: CREATE TABLE ... PARTITION OF 문
+    """
+    month = month_start(month)
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(month)} PARTITION OF {TRADES_TABLE} "
+        f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+    )
+
+
+def existing_partitions(connection: Connection) -> List[str]:
+    """trades에 연결된 파티션 이름 목록"""
+    rows = connection.execute(text(
+        "SELECT child.relname FROM pg_inherits "
+        "JOIN pg_class parent ON pg_inherits.inhparent = parent.oid "
+        "JOIN pg_class child ON pg_inherits.inhrelid = child.oid "
+        "WHERE parent.relname = :table ORDER BY child.relname"
+    ), {"table": TRADES_TABLE})
+    return [row[0] for row in rows]
+
+
+def ensure_trade_partitions(
+    connection: Connection,
+    start: Optional[date] = None,
+    months_ahead: Optional[int] = None,
+) -> Tuple[str, ...]:
+    """
+    start부터 현재 + months_ahead 달까지 월 파티션 생성
+
+    이미 있는 파티션은 건너뛴다. PostgreSQL이 아니면 아무것도 하지 않는다.
+    trades_default에 해당 월의 행이 이미 들어가 있으면 PostgreSQL이 생성을 거부하므로
+    파티션은 데이터가 들어오기 전에 미리 만들어 두어야 한다.
+
+    Args:
+        connection (Connection): 데이터베이스 연결
+        start (Optional[date]): 첫 파티션 월 (기본값: 이번 달)
+        months_ahead (Optional[int]): 이번 달 이후로 미리 만들 파티션 수
+
+    Returns:
+        Tuple[str, ...]: 새로 만든 파티션 이름
+    """
+    if connection.dialect.name != "postgresql":
+        return ()
+    if months_ahead is None:
+        months_ahead = settings.TRADE_PARTITION_MONTHS_AHEAD
+    today = datetime.utcnow().date()
+    start = start or today
+    end = add_months(month_start(today), months_ahead)
+    existing = set(existing_partitions(connection))
+    created = []
+    for month in month_range(start, end):
+        name = partition_name(month)
+        if name not in existing:
+            connection.execute(text(partition_ddl(month)))
+            created.append(name)
+    return tuple(created)
+
+
+async def partition_loop(db_engine: Engine, interval: Optional[float] = None) -> None:
+    """
+    기동 시와 주기적으로 다가올 달의 trades 파티션 생성 (취소될 때까지 실행)
+
+    PostgreSQL이 아니면 바로 끝난다.
+
+    Args:
+        db_engine (Engine): 동기 데이터베이스 엔진
+        interval (float, optional): 확인 주기 (초, 기본값: settings.TRADE_PARTITION_CHECK_INTERVAL)
+    """
+    if db_engine.dialect.name != "postgresql":
+        return
+    interval = interval or settings.TRADE_PARTITION_CHECK_INTERVAL
+
+    def run() -> Tuple[str, ...]:
+        with db_engine.begin() as connection:
+            return ensure_trade_partitions(connection)
+
+    while True:
+        try:
+            created = await asyncio.to_thread(run)
+            if created:
+                logger.info("trades 파티션 생성: %s", ", ".join(created))
+        except Exception:
+            logger.exception("trades 파티션 생성 실패")
+        await asyncio.sleep(interval)
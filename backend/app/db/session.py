@@ -1,12 +1,132 @@
-from sqlalchemy import create_engine
+import time
+from typing import Any, AsyncIterator, Dict, Union
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 from app.core.config import settings
+from app.core.metrics import Counter, Gauge, Histogram
+
+# 커넥션 풀 대기 시간
+POOL_CHECKOUT_WAIT = Histogram("db_pool_checkout_wait_seconds", "커넥션 풀에서 연결을 얻기까지 기다린 시간")
+# 커넥션 풀 현황 (수집할 때 풀에서 읽음)
+POOL_CONNECTIONS = Gauge("db_pool_connections", "커넥션 풀 연결 수", labelnames=("engine", "state"))
+# 쿼리 (operation: select/insert/update/delete/other)
+QUERY_LATENCY = Histogram("db_query_duration_seconds", "SQL 문 실행 시간", labelnames=("operation",))
+QUERY_ERRORS = Counter("db_query_errors_total", "실패한 SQL 문 수")
+
+_QUERY_OPERATIONS = ("select", "insert", "update", "delete")
+_QUERY_LATENCY_BY_OPERATION = {operation: QUERY_LATENCY.labels(operation) for operation in _QUERY_OPERATIONS + ("other",)}
+_QUERY_LATENCY_OTHER = _QUERY_LATENCY_BY_OPERATION["other"]
+_POOL_STATES = {"size": "size", "checked_out": "checkedout", "checked_in": "checkedin", "overflow": "overflow"}
+
+
+class _TimedCheckoutMixin:
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            POOL_CHECKOUT_WAIT.observe(time.perf_counter() - start)
+
+
+class TimedQueuePool(_TimedCheckoutMixin, QueuePool):
+    """체크아웃 대기 시간을 기록하는 QueuePool"""
+
+
+class TimedAsyncAdaptedQueuePool(_TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    """체크아웃 대기 시간을 기록하는 AsyncAdaptedQueuePool"""
+
+
+def get_async_database_url(url: str) -> str:
+    """
+    비동기 드라이버 URL 변환
+
+    Args:
+        url (str): 동기 데이터베이스 URL
+
+    Returns:
+        str: asyncpg / aiosqlite 드라이버 URL
+    """
+    if url.startswith(("postgresql://", "postgresql+psycopg2://")):
+        return "postgresql+asyncpg://" + url.split("://", 1)[1]
+    if url.startswith("sqlite://"):
+        return "sqlite+aiosqlite://" + url.split("://", 1)[1]
+    return url
+
+
+def _pool_options(url: str, pool_class) -> Dict[str, Any]:
+    if url.startswith("sqlite"):
+        return {}
+    return {
+        "poolclass": pool_class,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if context is not None:  # 내부 실행(시퀀스 등)은 context 없이 호출될 수 있음
+        context._metrics_query_start = time.perf_counter()
 
-engine = create_engine(settings.DATABASE_URL)
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    start = getattr(context, "_metrics_query_start", None)
+    if start is None:
+        return
+    elapsed = time.perf_counter() - start
+    # 긴 INSERT 문 전체를 복사하지 않도록 앞부분만 봄
+    operation = statement[:16].lstrip()[:6].lower()
+    _QUERY_LATENCY_BY_OPERATION.get(operation, _QUERY_LATENCY_OTHER).observe(elapsed)
+
+
+def _handle_error(exception_context) -> None:
+    QUERY_ERRORS.inc()
+
+
+def _pool_value(db_engine: Engine, state: str) -> float:
+    pool = db_engine.pool  # dispose()로 풀이 바뀔 수 있으므로 매번 읽음
+    return getattr(pool, _POOL_STATES[state])() if isinstance(pool, QueuePool) else 0
+
+
+def instrument_engine(db_engine: Union[Engine, AsyncEngine], name: str, queries: bool = True) -> None:
+    """
+    엔진 계측 (커넥션 풀 현황, 쿼리 수/시간, 실패 수)
+
+    쿼리 이벤트는 여러 번 호출해도 한 번만 등록된다.
+
+    Args:
+        db_engine (Engine | AsyncEngine): 데이터베이스 엔진
+        name (str): 풀 지표의 engine 라벨 (예: sync, async)
+        queries (bool): SQL 문 계측 여부
+    """
+    if isinstance(db_engine, AsyncEngine):
+        db_engine = db_engine.sync_engine
+    if queries and not event.contains(db_engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(db_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(db_engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(db_engine, "handle_error", _handle_error)
+    for state in _POOL_STATES:
+        POOL_CONNECTIONS.labels(name, state).set_function(lambda state=state: _pool_value(db_engine, state))
+
+
+engine = create_engine(settings.DATABASE_URL, **_pool_options(settings.DATABASE_URL, TimedQueuePool))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+ASYNC_DATABASE_URL = settings.ASYNC_DATABASE_URL or get_async_database_url(settings.DATABASE_URL)
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **_pool_options(ASYNC_DATABASE_URL, TimedAsyncAdaptedQueuePool))
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+if settings.METRICS_ENABLED:
+    instrument_engine(engine, "sync", queries=settings.METRICS_DB_QUERIES)
+    instrument_engine(async_engine, "async", queries=settings.METRICS_DB_QUERIES)
+
 # Dependency
 def get_db():
     db = SessionLocal()
@@ -16,5 +136,31 @@ def get_db():
         db.close()
 
 
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def pool_status(db_engine) -> Dict[str, Any]:
+    """
+    커넥션 풀 상태 조회
 
+    Args:
+        db_engine (Engine | AsyncEngine): 데이터베이스 엔진
 
+    Returns:
+        Dict[str, Any]: 풀 크기, 사용 중/유휴 연결 수, 초과 연결 수, 체크아웃 대기 요약
+    """
+    if isinstance(db_engine, AsyncEngine):
+        db_engine = db_engine.sync_engine
+    pool = db_engine.pool
+    status: Dict[str, Any] = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=pool.overflow(),
+        )
+    status["checkout_wait"] = POOL_CHECKOUT_WAIT.snapshot()
+    return status
@@ -0,0 +1,114 @@
+"""
+시세/엔진 전용 프로세스 (APP_ROLE=engine)
+
+업비트 시세 수신, 매매 엔진, 포트폴리오 스냅샷, 웹훅 알림을 한 프로세스에서 실행하고,
+대시보드 허브 상태를 공유 메모리 링으로 API 워커(APP_ROLE=api)에 복제한다.
+매매 엔진은 결정만 기록하고 주문은 내지 않는다 (결정에 수량이 없고 ExecutionPipeline은 계정 하나의
+거래소 커넥터로 동작하므로, 사용자별 키와 주문 수량 산정이 생기기 전까지 실행기를 연결하지 않음).
+
+실행: cd backend && APP_ROLE=engine python -m app.engine_main
+"""
+
+import asyncio
+import logging
+import signal
+from contextlib import suppress
+
+from app.core.config import settings
+from app.core.pubsub import stream_hub
+from app.core.shared_state import SharedStatePublisher
+from app.core.shm_ring import SharedRing
+from app.db.partitions import partition_loop
+from app.db.session import SessionLocal, engine as db_engine
+from app.services.notification_service import notification_dispatcher
+from app.trading.engine import TradingEngine
+from app.trading.market_data import MarketDataStore, UpbitWebSocketFeed
+from app.trading.portfolio import portfolio_book, snapshot_loop
+from app.trading.risk_management import risk_engine
+from app.trading.streams import bind_market_data, bind_portfolio
+
+logger = logging.getLogger(__name__)
+
+
+def _load_engine(engine: TradingEngine) -> int:
+    with SessionLocal() as db:
+        return engine.load_settings(db)
+
+
+def _load_notification_targets() -> int:
+    with SessionLocal() as db:
+        return notification_dispatcher.load(db)
+
+
+def _load_risk_limits() -> int:
+    with SessionLocal() as db:
+        return risk_engine.load(db)
+
+
+async def run() -> None:
+    """엔진 프로세스 실행 (SIGINT/SIGTERM까지)"""
+    stopped = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stopped.set)
+
+    ring = SharedRing.create(settings.SHARED_STATE_NAME, settings.SHARED_STATE_SLOTS, settings.SHARED_STATE_SLOT_SIZE)
+    publisher = SharedStatePublisher(stream_hub, ring)
+    publisher.attach()
+    store = MarketDataStore()
+    unbind_market_data = bind_market_data(stream_hub, store)
+    unbind_portfolio = bind_portfolio(stream_hub, portfolio_book)
+    # 시세를 위험 관리 엔진에 반영 (총액 주문 수량 추정, 손절/익절 판정)
+    unbind_risk = risk_engine.bind_market_data(store)
+    # 실행기 없음: 결정만 기록 (모듈 설명 참고)
+    engine = TradingEngine(store)
+    try:
+        await asyncio.to_thread(_load_engine, engine)
+    except Exception:
+        logger.exception("매매 설정 적재 실패")
+    try:
+        await asyncio.to_thread(_load_risk_limits)
+    except Exception:
+        logger.exception("위험 한도 적재 실패")
+        risk_engine.attach()
+    try:
+        await asyncio.to_thread(_load_notification_targets)
+    except Exception:
+        logger.exception("알림 설정 적재 실패")
+    feed = UpbitWebSocketFeed(store, list(dict.fromkeys(settings.ENGINE_MARKETS + engine.symbols)))
+
+    await notification_dispatcher.start()
+    await engine.start()
+    tasks = [
+        asyncio.create_task(feed.run()),
+        asyncio.create_task(publisher.run()),
+        asyncio.create_task(partition_loop(db_engine)),
+    ]
+    if settings.PORTFOLIO_SNAPSHOT_INTERVAL > 0:
+        tasks.append(asyncio.create_task(snapshot_loop(SessionLocal)))
+    logger.info("엔진 프로세스 시작 (공유 상태 링: %s, 마켓 %d개)", ring.name, len(feed.codes))
+    try:
+        await stopped.wait()
+    finally:
+        await feed.stop()
+        for task in tasks:
+            task.cancel()
+        with suppress(asyncio.CancelledError):
+            await asyncio.gather(*tasks, return_exceptions=True)
+        await engine.stop()
+        await notification_dispatcher.stop()
+        unbind_risk()
+        risk_engine.detach()
+        unbind_portfolio()
+        unbind_market_data()
+        publisher.detach()
+        ring.close()
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,77 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
 from app.core.config import settings
 from app.api.v1.api import api_router
+from app.api.metrics import MetricsMiddleware, router as metrics_router
+from app.api.profiling import ProfilingMiddleware
+from app.core.pubsub import stream_hub
+from app.core.shared_state import SharedStateMirror
+from app.db.partitions import partition_loop
+from app.db.session import SessionLocal, engine
+from app.services.notification_service import notification_dispatcher
+from app.trading.portfolio import portfolio_book, snapshot_loop
+from app.trading.streams import bind_portfolio
+from app.trading.upbit.async_api import close_session
+from app.trading.upbit.crypto_pool import crypto_pool
 
-app = FastAPI(title=settings.PROJECT_NAME, version=settings.VERSION)
+logger = logging.getLogger(__name__)
+
+
+def _load_notification_targets() -> int:
+    with SessionLocal() as db:
+        return notification_dispatcher.load(db)
 
-# API 라우터 등록
-app.include_router(api_router, prefix=settings.API_V1_STR)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 스레드풀의 발행(장부 복원 등)을 이벤트 루프로 넘기도록 허브를 루프에 묶음
+    stream_hub.bind_loop()
+    # 포지션 변경을 대시보드 스트림으로 발행
+    unbind_portfolio = bind_portfolio(stream_hub, portfolio_book)
+    tasks = []
+    api_worker = settings.APP_ROLE == "api"
+    if api_worker:
+        # 장부/알림은 엔진 프로세스(app.engine_main)가 맡고, 허브 상태는 공유 메모리에서 복제
+        mirror = app.state.shared_state = SharedStateMirror(stream_hub)
+        tasks.append(asyncio.create_task(mirror.run()))
+    elif settings.PORTFOLIO_SNAPSHOT_INTERVAL > 0:
+        # 포트폴리오 장부 복원 및 주기적 스냅샷
+        tasks.append(asyncio.create_task(snapshot_loop(SessionLocal)))
+    if not api_worker:
+        # 다가올 달의 trades 파티션 미리 생성
+        tasks.append(asyncio.create_task(partition_loop(engine)))
+        # 웹훅 알림 대상 적재 및 발송 시작
+        try:
+            await asyncio.to_thread(_load_notification_targets)
+        except Exception:
+            logger.exception("알림 설정 적재 실패")
+        await notification_dispatcher.start()
+    yield
+    if not api_worker:
+        await notification_dispatcher.stop()
+    for task in tasks:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    unbind_portfolio()
+    # 공유 HTTP 세션 정리
+    await close_session()
+    # API 키 일괄 암복호화 작업 프로세스 종료
+    await asyncio.to_thread(crypto_pool.shutdown)
 
 
+app = FastAPI(title=settings.PROJECT_NAME, version=settings.VERSION, lifespan=lifespan)
+
+# API 라우터 등록
+app.include_router(api_router, prefix=settings.API_V1_STR)
+
+# 요청 스택 샘플링 (관리자가 켜기 전에는 플래그 확인만 함)
+app.add_middleware(ProfilingMiddleware)
 
+# 요청 지연 계측과 Prometheus 수집 엔드포인트
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+    app.include_router(metrics_router)
@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, Float, DateTime, Text, JSON
+from sqlalchemy import Boolean, Column, ForeignKey, Index, Integer, String, Float, DateTime, Text, JSON
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -38,6 +38,14 @@ class APIKey(Base):
 
 class Trade(Base):
     __tablename__ = "trades"
+    # Postgres에서는 created_at 기준 월별 파티션 테이블 (migrations/versions/*_partition_trades.py)
+    __table_args__ = (
+        Index("ix_trades_user_id_created_at", "user_id", "created_at"),
+        Index("ix_trades_user_id_symbol_created_at", "user_id", "symbol", "created_at"),
+        Index("ix_trades_status_created_at", "status", "created_at"),
+        # 파티션 테이블의 고유 인덱스는 파티션 키를 포함해야 해서 ID만으로는 막지 못함 (고유성은 order_keys가 보장)
+        Index("ix_trades_client_order_id", "client_order_id", "created_at", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
@@ -50,8 +58,9 @@ class Trade(Base):
     price = Column(Float)
     status = Column(String)  # "open", "filled", "cancelled", etc.
     order_id = Column(String)  # Exchange order ID
+    client_order_id = Column(String, nullable=True)  # 주문 행의 멱등 키 (체결 행은 비움)
     profit_loss = Column(Float, nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)  # 파티션 키
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     extra_data = Column(JSON, nullable=True)  # For any additional data
     
@@ -59,6 +68,33 @@ class Trade(Base):
     user = relationship("User", back_populates="trades")
 
 
+class OrderKey(Base):
+    """주문 행의 멱등 키 (파티션하지 않은 테이블로 client_order_id 고유성 보장, 주문 행과 같은 트랜잭션에 기록)"""
+    __tablename__ = "order_keys"
+
+    client_order_id = Column(String, primary_key=True)
+    created_at = Column(DateTime(timezone=True), nullable=False)  # 주문 행의 created_at (파티션 조회용)
+
+
+class PositionSnapshot(Base):
+    __tablename__ = "position_snapshots"
+    __table_args__ = (
+        Index("ix_position_snapshots_taken_at_user_id", "taken_at", "user_id"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"))
+    exchange = Column(String)
+    symbol = Column(String)
+    quantity = Column(Float)  # 음수는 공매도 포지션
+    avg_cost = Column(Float)
+    realized_pnl = Column(Float)
+    fees = Column(Float)
+    trade_count = Column(Integer)
+    last_trade_id = Column(Integer)  # 스냅샷에 반영된 마지막 trades.id (복원 시 이후 체결만 재생)
+    taken_at = Column(DateTime(timezone=True), nullable=False)
+
+
 class TradingSetting(Base):
     __tablename__ = "trading_settings"
 
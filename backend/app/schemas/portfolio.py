@@ -0,0 +1,30 @@
+"""
+포트폴리오 관련 스키마
+"""
+
+from pydantic import BaseModel
+from typing import List, Optional
+
+class Position(BaseModel):
+    """포지션 평가 스키마"""
+    exchange: str
+    symbol: str
+    quantity: float
+    avg_cost: float
+    realized_pnl: float
+    fees: float
+    trade_count: int
+    cost_basis: float
+    price: Optional[float] = None
+    market_value: Optional[float] = None
+    unrealized_pnl: Optional[float] = None
+
+class PortfolioSummary(BaseModel):
+    """포트폴리오 요약 스키마"""
+    user_id: int
+    positions: List[Position]
+    realized_pnl: float
+    unrealized_pnl: float
+    total_pnl: float
+    cost_basis: float
+    market_value: float
@@ -0,0 +1,19 @@
+"""
+사용자/인증 스키마
+"""
+
+from pydantic import BaseModel, ConfigDict
+
+class Token(BaseModel):
+    """액세스 토큰 응답 스키마"""
+    access_token: str
+    token_type: str = "bearer"
+
+class UserPrincipal(BaseModel):
+    """인증된 사용자 응답 스키마"""
+    id: int
+    username: str
+    email: str
+    is_active: bool
+
+    model_config = ConfigDict(from_attributes=True)
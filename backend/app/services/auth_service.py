@@ -0,0 +1,171 @@
+"""
+인증 사용자 조회
+
+토큰의 사용자 ID를 요청마다 DB에서 다시 읽지 않도록, 인증에 필요한 최소 정보(Principal)를
+짧은 TTL 동안 프로세스 메모리에 보관한다.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.metrics import Counter
+from app.core.security import verify_password_async
+from app.models.user import User
+
+# 사용자 정보 캐시
+PRINCIPAL_CACHE_HITS = Counter("auth_principal_cache_hits_total", "캐시에서 찾은 토큰 사용자 수")
+PRINCIPAL_CACHE_MISSES = Counter("auth_principal_cache_misses_total", "DB에서 읽은 토큰 사용자 수")
+
+
+@dataclass(frozen=True)
+class Principal:
+    """인증된 사용자 (세션과 무관한 불변 값)"""
+    id: int
+    username: str
+    email: str
+    is_active: bool
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(id=user.id, username=user.username, email=user.email, is_active=bool(user.is_active))
+
+
+class PrincipalCache:
+    def __init__(
+        self,
+        ttl: Optional[float] = None,
+        max_size: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        사용자 정보 캐시 초기화
+
+        TTL이 지나거나 최대 개수를 넘으면(가장 오래 쓰지 않은 것부터) 버린다.
+        사용자 상태가 바뀌면 invalidate로 바로 지워야 하며, 다른 프로세스의 변경은 TTL 안에 반영된다.
+
+        Args:
+            ttl (float, optional): 보관 시간 (초, 기본값: settings.AUTH_PRINCIPAL_CACHE_TTL)
+            max_size (int, optional): 최대 보관 수 (기본값: settings.AUTH_PRINCIPAL_CACHE_SIZE)
+            clock (Callable[[], float]): 시간 함수
+        """
+        self.ttl = settings.AUTH_PRINCIPAL_CACHE_TTL if ttl is None else ttl
+        self.max_size = max_size or settings.AUTH_PRINCIPAL_CACHE_SIZE
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._principals: "OrderedDict[int, Tuple[Principal, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int) -> Optional[Principal]:
+        """
+        캐시된 사용자 조회
+
+        Args:
+            user_id (int): 사용자 ID
+
+        Returns:
+            Optional[Principal]: 유효한 항목이 없으면 None
+        """
+        now = self.clock()
+        with self._lock:
+            entry = self._principals.get(user_id)
+            if entry is not None and entry[1] > now:
+                self._principals.move_to_end(user_id)
+                self.hits += 1
+                PRINCIPAL_CACHE_HITS.inc()
+                return entry[0]
+            if entry is not None:
+                del self._principals[user_id]
+                self.evictions += 1
+            self.misses += 1
+        PRINCIPAL_CACHE_MISSES.inc()
+        return None
+
+    def put(self, principal: Principal) -> None:
+        """사용자 저장"""
+        with self._lock:
+            self._principals[principal.id] = (principal, self.clock() + self.ttl)
+            self._principals.move_to_end(principal.id)
+            while len(self._principals) > self.max_size:
+                self._principals.popitem(last=False)
+                self.evictions += 1
+
+    async def resolve(self, db: AsyncSession, user_id: int) -> Optional[Principal]:
+        """
+        사용자 조회 (캐시에 없으면 DB에서 읽어 저장)
+
+        Args:
+            db (AsyncSession): 캐시에 없을 때 사용할 세션
+            user_id (int): 사용자 ID
+
+        Returns:
+            Optional[Principal]: 사용자가 없으면 None
+        """
+        principal = self.get(user_id)
+        if principal is None:
+            user = await db.get(User, user_id)
+            if user is None:
+                return None
+            principal = Principal.from_user(user)
+            self.put(principal)
+        return principal
+
+    def invalidate(self, user_id: int) -> None:
+        """사용자 항목 폐기 (비활성화/권한 변경 시)"""
+        with self._lock:
+            if self._principals.pop(user_id, None) is not None:
+                self.invalidations += 1
+
+    def stats(self) -> Dict[str, int]:
+        """
+        캐시 통계 조회
+
+        Returns:
+            Dict[str, int]: 적중/미적중/만료·초과 폐기/무효화 수와 현재 크기
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "size": len(self._principals),
+        }
+
+    def clear(self) -> None:
+        """캐시와 통계 초기화"""
+        with self._lock:
+            self._principals.clear()
+            self.hits = self.misses = self.evictions = self.invalidations = 0
+
+
+async def authenticate_user(db: AsyncSession, username: str, password: str) -> Optional[User]:
+    """
+    아이디(또는 이메일)와 비밀번호로 사용자 확인
+
+    Args:
+        db (AsyncSession): 데이터베이스 세션
+        username (str): 사용자 이름 또는 이메일
+        password (str): 비밀번호
+
+    Returns:
+        Optional[User]: 일치하는 사용자 (없거나 비밀번호가 틀리면 None)
+    """
+    result = await db.execute(select(User).where(or_(User.username == username, User.email == username)))
+    user = result.scalars().first()
+    if user is None or not user.hashed_password:
+        return None
+    if not await verify_password_async(password, user.hashed_password):
+        return None
+    return user
+
+
+principal_cache = PrincipalCache()
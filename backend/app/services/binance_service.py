@@ -0,0 +1,255 @@
+"""
+바이낸스 거래소 커넥터
+"""
+
+import hashlib
+import hmac
+import json
+import time
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import urlencode
+
+import numpy as np
+
+from app.core.config import settings
+from .exchange_service import (
+    BUY, CANCELED, FILLED, LIMIT, MARKET, OPEN, PARTIALLY_FILLED, REJECTED, SELL,
+    Balance, ExchangeConnector, Order, StreamEndpoint, Ticker, candle_columns, format_number, register_connector,
+    split_symbol,
+)
+from .rate_limiter import binance_quota
+
+# 심볼 접미사로 호가 화폐를 판별할 때 쓰는 목록 (긴 이름부터 비교)
+QUOTE_ASSETS = ("FDUSD", "USDT", "USDC", "BUSD", "TUSD", "BTC", "ETH", "BNB", "EUR", "TRY", "BRL", "JPY")
+INTERVALS = {
+    "minute1": "1m",
+    "minute3": "3m",
+    "minute5": "5m",
+    "minute15": "15m",
+    "minute30": "30m",
+    "minute60": "1h",
+    "minute240": "4h",
+    "day": "1d",
+}
+ORDER_STATUSES = {
+    "NEW": OPEN,
+    "PENDING_CANCEL": OPEN,
+    "PARTIALLY_FILLED": PARTIALLY_FILLED,
+    "FILLED": FILLED,
+    "CANCELED": CANCELED,
+    "EXPIRED": CANCELED,
+    "EXPIRED_IN_MATCH": CANCELED,
+    "REJECTED": REJECTED,
+}
+MAX_CANDLES = 1000  # 캔들 조회 1회 최대 개수
+
+
+@register_connector("binance")
+class BinanceConnector(ExchangeConnector):
+    def __init__(
+        self,
+        access_key: str = "",
+        secret_key: str = "",
+        base_url: Optional[str] = None,
+        ws_url: Optional[str] = None,
+        pool_size: Optional[int] = None,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ):
+        """
+        바이낸스 커넥터 초기화
+
+        Args:
+            access_key (str): 바이낸스 API 키
+            secret_key (str): 바이낸스 시크릿 키
+            base_url (str, optional): API 주소 (기본값: settings.BINANCE_API_URL)
+            ws_url (str, optional): WebSocket 주소 (기본값: settings.BINANCE_WS_URL)
+            pool_size (int, optional): HTTP 동시 연결 수 (기본값: settings.BINANCE_HTTP_POOL_SIZE)
+            timeout (float, optional): 요청 제한 시간 (기본값: settings.BINANCE_HTTP_TIMEOUT)
+        """
+        super().__init__(
+            access_key,
+            secret_key,
+            base_url or settings.BINANCE_API_URL,
+            ws_url or settings.BINANCE_WS_URL,
+            pool_size or settings.BINANCE_HTTP_POOL_SIZE,
+            settings.BINANCE_HTTP_KEEPALIVE,
+            timeout or settings.BINANCE_HTTP_TIMEOUT,
+            **kwargs,
+        )
+        self.recv_window = settings.BINANCE_RECV_WINDOW
+        self._symbols: Dict[str, str] = {}  # 거래소 표기 -> 표준 심볼
+
+    def to_exchange_symbol(self, symbol: str) -> str:
+        quote, base = split_symbol(symbol)
+        exchange_symbol = f"{base}{quote}"
+        self._symbols[exchange_symbol] = f"{quote}-{base}"
+        return exchange_symbol
+
+    def from_exchange_symbol(self, symbol: str) -> str:
+        symbol = symbol.upper()
+        known = self._symbols.get(symbol)
+        if known is not None:
+            return known
+        for quote in QUOTE_ASSETS:
+            if symbol.endswith(quote) and len(symbol) > len(quote):
+                return self._symbols.setdefault(symbol, f"{quote}-{symbol[:-len(quote)]}")
+        raise ValueError(f"호가 화폐를 알 수 없는 심볼입니다: {symbol}")
+
+    def _signed_query(self, params: Dict[str, Any]) -> str:
+        query = urlencode({**params, "recvWindow": self.recv_window, "timestamp": int(time.time() * 1000)})
+        signature = hmac.new(self.secret_key.encode(), query.encode(), hashlib.sha256).hexdigest()
+        return f"{query}&signature={signature}"
+
+    async def _request(self, method: str, path: str, params: Optional[Dict[str, Any]] = None, signed: bool = False) -> Any:
+        params = params or {}
+        quota, priority = binance_quota(method, path, self.access_key)
+        if signed:
+            return await self._send(
+                method, path, params=lambda: self._signed_query(params), headers={"X-MBX-APIKEY": self.access_key},
+                quota=quota, priority=priority,
+            )
+        return await self._send(method, path, params=urlencode(params), quota=quota, priority=priority)
+
+    async def get_prices(self, symbols: Iterable[str]) -> Dict[str, float]:
+        markets = list(dict.fromkeys(self.to_exchange_symbol(symbol) for symbol in symbols))
+        data = await self._request("GET", "/api/v3/ticker/price", {"symbols": json.dumps(markets, separators=(",", ":"))})
+        return {self.from_exchange_symbol(item["symbol"]): float(item["price"]) for item in data}
+
+    async def get_balances(self) -> Dict[str, Balance]:
+        account = await self._request("GET", "/api/v3/account", signed=True)
+        balances = {}
+        for item in account["balances"]:
+            balance = Balance(item["asset"], float(item["free"]), float(item["locked"]))
+            if balance.total:
+                balances[balance.currency] = balance
+        return balances
+
+    def _order(self, data: Dict[str, Any]) -> Order:
+        filled = float(data.get("executedQty") or 0)
+        quote_filled = float(data.get("cummulativeQuoteQty") or 0)
+        price = float(data.get("price") or 0)
+        quantity = float(data.get("origQty") or 0)
+        return Order(
+            exchange=self.name,
+            symbol=self.from_exchange_symbol(data["symbol"]),
+            order_id=str(data["orderId"]),
+            side=data["side"].lower(),
+            order_type=data["type"].lower(),
+            status=ORDER_STATUSES.get(data.get("status"), OPEN),
+            quantity=quantity or None,
+            price=price or None,
+            filled_quantity=filled,
+            average_price=quote_filled / filled if filled else None,
+            client_order_id=data.get("clientOrderId"),
+            raw=data,
+        )
+
+    async def place_order(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str = MARKET,
+        quantity: Optional[float] = None,
+        price: Optional[float] = None,
+        amount: Optional[float] = None,
+        client_order_id: Optional[str] = None,
+    ) -> Order:
+        if side not in (BUY, SELL):
+            raise ValueError(f"지원하지 않는 주문 방향입니다: {side}")
+        params: Dict[str, Any] = {"symbol": self.to_exchange_symbol(symbol), "side": side.upper()}
+        if order_type == MARKET:
+            params["type"] = "MARKET"
+            if quantity is not None:
+                params["quantity"] = format_number(quantity)
+            elif side == BUY and amount is not None:
+                params["quoteOrderQty"] = format_number(amount)
+            else:
+                raise ValueError("시장가 주문에는 수량(quantity) 또는 매수 총액(amount)이 필요합니다")
+        elif order_type == LIMIT:
+            if quantity is None or price is None:
+                raise ValueError("지정가 주문에는 수량(quantity)과 가격(price)이 필요합니다")
+            params.update(type="LIMIT", timeInForce="GTC", quantity=format_number(quantity), price=format_number(price))
+        else:
+            raise ValueError(f"지원하지 않는 주문 유형입니다: {order_type}")
+        if client_order_id is not None:
+            params["newClientOrderId"] = client_order_id
+        params["newOrderRespType"] = "FULL"
+        return self._order(await self._request("POST", "/api/v3/order", params, signed=True))
+
+    def _reference(self, symbol: str, order_id: Optional[str], client_order_id: Optional[str]) -> Dict[str, Any]:
+        params: Dict[str, Any] = {"symbol": self.to_exchange_symbol(symbol)}
+        if order_id is not None:
+            params["orderId"] = order_id
+        elif client_order_id is not None:
+            params["origClientOrderId"] = client_order_id
+        else:
+            raise ValueError("order_id 또는 client_order_id가 필요합니다")
+        return params
+
+    async def get_order(self, symbol: str, order_id: Optional[str] = None, client_order_id: Optional[str] = None) -> Order:
+        return self._order(await self._request("GET", "/api/v3/order", self._reference(symbol, order_id, client_order_id), signed=True))
+
+    async def cancel_order(self, symbol: str, order_id: Optional[str] = None, client_order_id: Optional[str] = None) -> Order:
+        return self._order(await self._request("DELETE", "/api/v3/order", self._reference(symbol, order_id, client_order_id), signed=True))
+
+    async def get_candles(
+        self,
+        symbol: str,
+        interval: str,
+        count: int = MAX_CANDLES,
+        end_ms: Optional[int] = None,
+    ) -> Dict[str, np.ndarray]:
+        try:
+            binance_interval = INTERVALS[interval]
+        except KeyError:
+            raise ValueError(f"바이낸스에서 지원하지 않는 봉 간격입니다: {interval}")
+        params: Dict[str, Any] = {
+            "symbol": self.to_exchange_symbol(symbol),
+            "interval": binance_interval,
+            "limit": min(count, MAX_CANDLES),
+        }
+        if end_ms is not None:
+            params["endTime"] = end_ms - 1  # endTime은 시작 시각 기준 포함 조건
+        data = await self._request("GET", "/api/v3/klines", params)
+        return candle_columns(
+            (int(k[0]), float(k[1]), float(k[2]), float(k[3]), float(k[4]), float(k[5])) for k in data
+        )
+
+    def _stream_url(self, symbols: List[str]) -> str:
+        streams = "/".join(f"{self.to_exchange_symbol(symbol).lower()}@ticker" for symbol in symbols)
+        return f"{self.ws_url}/stream?streams={streams}"
+
+    def parse_ticker(self, message: Any) -> Optional[Ticker]:
+        data = message.get("data", message)
+        if data.get("e") != "24hrTicker":
+            return None
+        return Ticker(self.name, self.from_exchange_symbol(data["s"]), float(data["c"]), int(data["E"]), float(data["v"]))
+
+    async def _order_stream(self) -> StreamEndpoint:
+        # 연결할 때마다 새 listenKey 발급 (60분 뒤 만료되면 끊긴 연결을 새 키로 다시 맺음)
+        quota, priority = binance_quota("POST", "/api/v3/userDataStream", self.access_key)
+        data = await self._send(
+            "POST", "/api/v3/userDataStream", headers={"X-MBX-APIKEY": self.access_key}, quota=quota, priority=priority,
+        )
+        return f"{self.ws_url}/ws/{data['listenKey']}", None, None
+
+    def parse_order(self, message: Any) -> Optional[Order]:
+        data = message.get("data", message)
+        if data.get("e") != "executionReport":
+            return None
+        filled = float(data["z"])
+        return Order(
+            exchange=self.name,
+            symbol=self.from_exchange_symbol(data["s"]),
+            order_id=str(data["i"]),
+            side=data["S"].lower(),
+            order_type=data["o"].lower(),
+            status=ORDER_STATUSES.get(data["X"], OPEN),
+            quantity=float(data["q"]) or None,
+            price=float(data["p"]) or None,
+            filled_quantity=filled,
+            average_price=float(data["Z"]) / filled if filled else None,
+            client_order_id=data.get("C") or data.get("c"),  # 취소 이벤트는 C에 원래 주문 ID
+            raw=data,
+        )
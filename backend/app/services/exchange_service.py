@@ -0,0 +1,563 @@
+"""
+거래소 커넥터 공통 인터페이스
+
+거래소마다 시세, 잔고, 주문, 캔들, 실시간 시세/주문 스트림을 같은 비동기 메서드로 제공한다.
+심볼은 업비트 표기(호가 화폐-기준 화폐, 예: KRW-BTC, USDT-BTC)를 표준으로 쓰고
+각 커넥터가 거래소 표기(예: BTCUSDT)로 변환한다.
+커넥터는 각자 HTTP 세션(연결 풀)을 가지므로 여러 거래소를 동시에 호출해도 서로 막지 않는다.
+"""
+
+import asyncio
+import importlib
+import json
+import logging
+import time
+from abc import ABC, abstractmethod
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import (
+    Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Type, TypeVar,
+)
+
+import aiohttp
+import numpy as np
+import websockets
+from yarl import URL
+
+from app.core.config import settings
+from app.trading.candles import COLUMNS
+from app.trading.strategy import BUY, SELL
+from .rate_limiter import (
+    EXCHANGE_REQUEST_LATENCY, PRIORITY_MARKET_DATA, Quota, RateLimiter, rate_limiter as default_rate_limiter, retry_after,
+)
+
+logger = logging.getLogger(__name__)
+
+MARKET = "market"
+LIMIT = "limit"
+
+OPEN = "open"
+PARTIALLY_FILLED = "partially_filled"
+FILLED = "filled"
+CANCELED = "canceled"
+REJECTED = "rejected"
+
+T = TypeVar("T")
+StreamEndpoint = Tuple[str, Optional[Dict[str, str]], Optional[str]]  # (주소, 연결 헤더, 구독 요청)
+
+CONNECTORS: Dict[str, Type["ExchangeConnector"]] = {}
+_MODULES = {
+    "upbit": "app.services.upbit_service",
+    "binance": "app.services.binance_service",
+}
+
+
+class ExchangeError(Exception):
+    """거래소 연동 기본 예외"""
+    pass
+
+
+class ExchangeRequestError(ExchangeError):
+    """요청 전송 실패 (연결 오류, 시간 초과)"""
+    pass
+
+
+class ExchangeResponseError(ExchangeError):
+    """거래소 오류 응답"""
+
+    def __init__(self, status: int, body: str):
+        super().__init__(f"HTTP {status}: {body}")
+        self.status = status
+        self.body = body
+
+
+@dataclass
+class Ticker:
+    """실시간 시세"""
+    exchange: str
+    symbol: str
+    price: float
+    timestamp: int  # 밀리초
+    volume: Optional[float] = None
+
+
+@dataclass
+class Balance:
+    """화폐별 잔고"""
+    currency: str
+    free: float
+    locked: float = 0.0
+
+    @property
+    def total(self) -> float:
+        return self.free + self.locked
+
+
+@dataclass
+class Order:
+    """주문 상태"""
+    exchange: str
+    symbol: str
+    order_id: str
+    side: str
+    order_type: str
+    status: str
+    quantity: Optional[float] = None
+    price: Optional[float] = None
+    filled_quantity: float = 0.0
+    average_price: Optional[float] = None
+    client_order_id: Optional[str] = None
+    raw: Dict[str, Any] = field(default_factory=dict, repr=False)
+
+
+def split_symbol(symbol: str) -> Tuple[str, str]:
+    """
+    표준 심볼 분해
+
+    Args:
+        symbol (str): 표준 심볼 (예: KRW-BTC)
+
+    Returns:
+        Tuple[str, str]: (호가 화폐, 기준 화폐)
+    """
+    quote, sep, base = symbol.upper().partition("-")
+    if not sep or not quote or not base:
+        raise ValueError(f"잘못된 심볼 형식입니다: {symbol}")
+    return quote, base
+
+
+def format_number(value: float) -> str:
+    """지수 표기 없이 숫자를 문자열로 변환 (주문 수량/가격 파라미터용)"""
+    text = format(Decimal(str(value)), "f")
+    return text.rstrip("0").rstrip(".") if "." in text else text
+
+
+def candle_columns(rows: Iterable[Tuple[int, float, float, float, float, float]]) -> Dict[str, np.ndarray]:
+    """
+    캔들 행 목록을 CandleStore 열 형식으로 변환
+
+    Args:
+        rows (Iterable[Tuple]): (timestamp, open, high, low, close, volume) 행
+
+    Returns:
+        Dict[str, np.ndarray]: 열 이름별 배열 (시간순 정렬)
+    """
+    rows = sorted(rows)
+    return {
+        name: np.array([row[i] for row in rows], dtype=dtype)
+        for i, (name, dtype) in enumerate(COLUMNS.items())
+    }
+
+
+def register_connector(name: str) -> Callable[[Type["ExchangeConnector"]], Type["ExchangeConnector"]]:
+    """
+    커넥터 클래스 등록 데코레이터
+
+    Args:
+        name (str): 거래소 이름 (Trade.exchange, TradingSetting.exchange 값)
+    """
+    def decorator(cls: Type["ExchangeConnector"]) -> Type["ExchangeConnector"]:
+        cls.name = name
+        CONNECTORS[name] = cls
+        return cls
+    return decorator
+
+
+def create_connector(name: str, access_key: str = "", secret_key: str = "", **kwargs: Any) -> "ExchangeConnector":
+    """
+    거래소 이름으로 커넥터 생성
+
+    Args:
+        name (str): 거래소 이름 (예: upbit, binance)
+        access_key (str): API 액세스 키 (시세 조회만 하면 생략)
+        secret_key (str): API 시크릿 키
+        **kwargs: 커넥터 생성자 추가 인자 (base_url, ws_url 등)
+
+    Returns:
+        ExchangeConnector: 커넥터
+    """
+    if name not in CONNECTORS and name in _MODULES:
+        importlib.import_module(_MODULES[name])
+    try:
+        connector_cls = CONNECTORS[name]
+    except KeyError:
+        raise ValueError(f"지원하지 않는 거래소입니다: {name}")
+    return connector_cls(access_key, secret_key, **kwargs)
+
+
+class ExchangeConnector(ABC):
+    name: str = ""
+
+    def __init__(
+        self,
+        access_key: str,
+        secret_key: str,
+        base_url: str,
+        ws_url: str,
+        pool_size: int,
+        keepalive: float,
+        timeout: float,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        """
+        커넥터 초기화
+
+        Args:
+            access_key (str): API 액세스 키
+            secret_key (str): API 시크릿 키
+            base_url (str): REST API 주소
+            ws_url (str): WebSocket 주소
+            pool_size (int): HTTP 동시 연결 수
+            keepalive (float): 유휴 연결 유지 시간 (초)
+            timeout (float): 요청 제한 시간 (초)
+            reconnect_delay (float): 스트림 최초 재연결 대기 시간 (초)
+            max_reconnect_delay (float): 스트림 최대 재연결 대기 시간 (초)
+            rate_limiter (RateLimiter, optional): 요청 쿼터 스케줄러 (기본값: 프로세스 공유 rate_limiter)
+        """
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self.base_url = base_url.rstrip("/")
+        self.ws_url = ws_url.rstrip("/")
+        self.pool_size = pool_size
+        self.keepalive = keepalive
+        self.timeout = timeout
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.rate_limiter = rate_limiter if rate_limiter is not None else default_rate_limiter
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def __aenter__(self) -> "ExchangeConnector":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def session(self) -> aiohttp.ClientSession:
+        """
+        커넥터 전용 HTTP 세션 조회
+
+        keep-alive 연결을 재사용하도록 이벤트 루프당 하나의 세션을 유지한다.
+
+        Returns:
+            aiohttp.ClientSession: HTTP 세션
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            connector = aiohttp.TCPConnector(limit=self.pool_size, keepalive_timeout=self.keepalive, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            self._session_loop = loop
+        return self._session
+
+    async def close(self) -> None:
+        """HTTP 세션 종료"""
+        if self._session is not None and not self._session.closed and self._session_loop is asyncio.get_running_loop():
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Any] = None,
+        headers: Optional[Any] = None,
+        json_body: Optional[Dict[str, Any]] = None,
+        quota: Sequence[Quota] = (),
+        priority: int = PRIORITY_MARKET_DATA,
+    ) -> Any:
+        """
+        API 요청 전송
+
+        quota가 있으면 쿼터를 확보할 때까지 대기하고, 응답 헤더로 남은 쿼터를 보정한다.
+        429/418 응답은 Retry-After만큼 버킷을 막은 뒤 재시도한다.
+
+        Args:
+            method (str): HTTP 메서드
+            path (str): API 경로
+            params (Any, optional): 쿼리 파라미터 (딕셔너리, 인코딩된 문자열 또는 시도마다 이를 만드는 함수)
+            headers (Any, optional): 요청 헤더 (또는 시도마다 헤더를 만드는 함수)
+            json_body (Dict[str, Any], optional): JSON 본문
+            quota (Sequence[Quota]): 요청이 소비할 쿼터
+            priority (int): 쿼터 대기 우선순위
+
+        Returns:
+            Any: JSON 응답
+        """
+        session = await self.session()
+        try:
+            for attempt in range(settings.RATE_LIMIT_MAX_RETRIES + 1):
+                await self.rate_limiter.acquire_all(self.name, quota, priority)
+                # 서명(nonce, timestamp)은 시도마다 새로 만든다
+                query = params() if callable(params) else params
+                request_headers = headers() if callable(headers) else headers
+                url: Any = f"{self.base_url}{path}"
+                if isinstance(query, str):
+                    # 서명한 쿼리 문자열을 다시 인코딩하지 않고 그대로 전송
+                    url, query = URL(f"{url}?{query}" if query else url, encoded=True), None
+                start = time.perf_counter()
+                status = "error"
+                try:
+                    async with session.request(method, url, params=query, headers=request_headers, json=json_body) as response:
+                        status = str(response.status)
+                        self.rate_limiter.update(self.name, quota, response.headers)
+                        if response.status in (418, 429) and quota:
+                            delay = retry_after(response.headers)
+                            self.rate_limiter.penalize(self.name, quota, delay)
+                            if attempt < settings.RATE_LIMIT_MAX_RETRIES and delay <= settings.RATE_LIMIT_MAX_RETRY_AFTER:
+                                continue
+                        if response.status >= 400:
+                            raise ExchangeResponseError(response.status, await response.text())
+                        return await response.json(content_type=None)
+                finally:
+                    EXCHANGE_REQUEST_LATENCY.labels(self.name, path, status).observe(time.perf_counter() - start)
+        except aiohttp.ClientError as e:
+            raise ExchangeRequestError(f"{self.name} 요청 실패: {e}")
+        except asyncio.TimeoutError:
+            raise ExchangeRequestError(f"{self.name} 요청 시간 초과")
+
+    # 심볼 변환
+
+    @abstractmethod
+    def to_exchange_symbol(self, symbol: str) -> str:
+        """표준 심볼(KRW-BTC)을 거래소 표기로 변환"""
+
+    @abstractmethod
+    def from_exchange_symbol(self, symbol: str) -> str:
+        """거래소 표기를 표준 심볼로 변환"""
+
+    # REST
+
+    @abstractmethod
+    async def get_prices(self, symbols: Iterable[str]) -> Dict[str, float]:
+        """
+        현재가 일괄 조회
+
+        Args:
+            symbols (Iterable[str]): 표준 심볼 목록
+
+        Returns:
+            Dict[str, float]: 표준 심볼별 현재가
+        """
+
+    async def get_price(self, symbol: str) -> float:
+        """현재가 조회"""
+        prices = await self.get_prices([symbol])
+        try:
+            return prices[symbol]
+        except KeyError:
+            raise ExchangeError(f"{self.name} 현재가 조회 실패: {symbol}")
+
+    @abstractmethod
+    async def get_balances(self) -> Dict[str, Balance]:
+        """
+        잔고 조회 (인증 필요)
+
+        Returns:
+            Dict[str, Balance]: 화폐별 잔고 (잔고가 0인 화폐 제외)
+        """
+
+    @abstractmethod
+    async def place_order(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str = MARKET,
+        quantity: Optional[float] = None,
+        price: Optional[float] = None,
+        amount: Optional[float] = None,
+        client_order_id: Optional[str] = None,
+    ) -> Order:
+        """
+        주문 (인증 필요)
+
+        Args:
+            symbol (str): 표준 심볼
+            side (str): "buy" 또는 "sell"
+            order_type (str): "market" 또는 "limit"
+            quantity (float, optional): 주문 수량 (기준 화폐)
+            price (float, optional): 지정가
+            amount (float, optional): 시장가 매수 총액 (호가 화폐)
+            client_order_id (str, optional): 클라이언트 주문 ID
+
+        Returns:
+            Order: 접수된 주문
+        """
+
+    @abstractmethod
+    async def get_order(self, symbol: str, order_id: Optional[str] = None, client_order_id: Optional[str] = None) -> Order:
+        """주문 조회 (order_id 또는 client_order_id 중 하나 필요)"""
+
+    @abstractmethod
+    async def cancel_order(self, symbol: str, order_id: Optional[str] = None, client_order_id: Optional[str] = None) -> Order:
+        """주문 취소 (order_id 또는 client_order_id 중 하나 필요)"""
+
+    @abstractmethod
+    async def get_candles(
+        self,
+        symbol: str,
+        interval: str,
+        count: int = 200,
+        end_ms: Optional[int] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        캔들 조회
+
+        Args:
+            symbol (str): 표준 심볼
+            interval (str): 봉 간격 (CandleStore 표기, 예: minute1, day)
+            count (int): 최대 개수
+            end_ms (int, optional): 이 시각 이전 캔들만 조회 (밀리초)
+
+        Returns:
+            Dict[str, np.ndarray]: timestamp, open, high, low, close, volume 열 (시간순)
+        """
+
+    # 스트림
+
+    @abstractmethod
+    def _stream_url(self, symbols: List[str]) -> str:
+        """시세 스트림 연결 주소"""
+
+    def _subscription_message(self, symbols: List[str]) -> Optional[str]:
+        """연결 직후 보낼 구독 요청 (없으면 None)"""
+        return None
+
+    @abstractmethod
+    def parse_ticker(self, message: Any) -> Optional[Ticker]:
+        """스트림 메시지를 Ticker로 변환 (시세 메시지가 아니면 None)"""
+
+    async def _order_stream(self) -> StreamEndpoint:
+        """주문 스트림 연결 정보 (인증 필요, 연결할 때마다 호출)"""
+        raise NotImplementedError(f"{self.name} 커넥터는 주문 스트림을 지원하지 않습니다")
+
+    def parse_order(self, message: Any) -> Optional[Order]:
+        """주문 스트림 메시지를 Order로 변환 (주문 메시지가 아니면 None)"""
+        return None
+
+    async def _stream(
+        self,
+        endpoint: Callable[[], Awaitable[StreamEndpoint]],
+        parse: Callable[[Any], Optional[T]],
+        connect: Callable,
+    ) -> AsyncIterator[T]:
+        delay = self.reconnect_delay
+        while True:
+            try:
+                url, headers, subscription = await endpoint()
+                options = {"extra_headers": headers} if headers else {}
+                async with connect(url, ping_interval=60, max_queue=1024, **options) as websocket:
+                    if subscription is not None:
+                        await websocket.send(subscription)
+                    delay = self.reconnect_delay
+                    async for raw in websocket:
+                        item = parse(json.loads(raw))
+                        if item is not None:
+                            yield item
+            except (websockets.WebSocketException, OSError, ExchangeError) as e:
+                logger.warning("%s WebSocket 연결 끊김: %s", self.name, e)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    async def stream_tickers(
+        self,
+        symbols: Iterable[str],
+        connect: Callable = websockets.connect,
+    ) -> AsyncIterator[Ticker]:
+        """
+        실시간 시세 스트림
+
+        연결이 끊기면 지수 백오프로 재연결하고 다시 구독한다. 반복을 멈추면 연결을 닫는다.
+
+        Args:
+            symbols (Iterable[str]): 표준 심볼 목록
+            connect (Callable): WebSocket 연결 함수
+
+        Returns:
+            AsyncIterator[Ticker]: 시세
+        """
+        symbols = list(dict.fromkeys(symbols))
+
+        async def endpoint() -> StreamEndpoint:
+            return self._stream_url(symbols), None, self._subscription_message(symbols)
+
+        async with aclosing(self._stream(endpoint, self.parse_ticker, connect)) as stream:
+            async for ticker in stream:
+                yield ticker
+
+    async def stream_orders(self, connect: Callable = websockets.connect) -> AsyncIterator[Order]:
+        """
+        실시간 주문 상태 스트림 (인증 필요)
+
+        접수, 체결, 취소 등 계정의 주문 변경을 받는다. 재연결 방식은 stream_tickers와 같다.
+
+        Args:
+            connect (Callable): WebSocket 연결 함수
+
+        Returns:
+            AsyncIterator[Order]: 변경된 주문 상태
+
+        Raises:
+            NotImplementedError: 주문 스트림을 지원하지 않는 커넥터
+        """
+        async with aclosing(self._stream(self._order_stream, self.parse_order, connect)) as stream:
+            async for order in stream:
+                yield order
+
+
+class ExchangeRouter:
+    def __init__(self, connectors: Iterable[ExchangeConnector] = ()):
+        """
+        거래소별 커넥터 묶음 초기화
+
+        여러 거래소 호출을 동시에 보내고 결과를 거래소 이름별로 모은다.
+
+        Args:
+            connectors (Iterable[ExchangeConnector]): 커넥터 목록
+        """
+        self.connectors: Dict[str, ExchangeConnector] = {connector.name: connector for connector in connectors}
+
+    def __getitem__(self, exchange: str) -> ExchangeConnector:
+        try:
+            return self.connectors[exchange]
+        except KeyError:
+            raise ValueError(f"등록되지 않은 거래소입니다: {exchange}")
+
+    def add(self, connector: ExchangeConnector) -> None:
+        """커넥터 등록"""
+        self.connectors[connector.name] = connector
+
+    async def get_prices(self, symbols: Mapping[str, Iterable[str]]) -> Dict[str, Dict[str, float]]:
+        """
+        여러 거래소 현재가 동시 조회
+
+        Args:
+            symbols (Mapping[str, Iterable[str]]): 거래소별 표준 심볼 목록
+
+        Returns:
+            Dict[str, Dict[str, float]]: 거래소별, 심볼별 현재가
+        """
+        names = list(symbols)
+        results = await asyncio.gather(*(self[name].get_prices(symbols[name]) for name in names))
+        return dict(zip(names, results))
+
+    async def get_balances(self) -> Dict[str, Dict[str, Balance]]:
+        """
+        등록된 모든 거래소 잔고 동시 조회
+
+        Returns:
+            Dict[str, Dict[str, Balance]]: 거래소별, 화폐별 잔고
+        """
+        names = list(self.connectors)
+        results = await asyncio.gather(*(self.connectors[name].get_balances() for name in names))
+        return dict(zip(names, results))
+
+    async def close(self) -> None:
+        """모든 커넥터 세션 종료"""
+        await asyncio.gather(*(connector.close() for connector in self.connectors.values()))
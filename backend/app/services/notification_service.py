@@ -0,0 +1,413 @@
+"""
+Slack/Discord 웹훅 알림 발송
+
+알림은 웹훅별 메모리 대기열에 넣기만 하고 바로 돌아오므로 주문 경로를 막지 않는다.
+웹훅마다 백그라운드 작업이 batch_window 동안 모인 알림을 한 메시지(요약)로 묶어
+공유 aiohttp 세션으로 보낸다. 웹훅별 요청 수는 RateLimiter 토큰 버킷으로 제한하고,
+429/5xx/네트워크 오류는 Retry-After 또는 지수 백오프 후 재시도한다.
+대기열이 넘치거나 종료 시 보내지 못한 알림은 spill_path(JSON Lines)에 남겨 다음 시작 때 다시 보낸다.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import aiohttp
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.metrics import Counter, Histogram
+from app.models.user import NotificationSetting
+from .rate_limiter import RateLimiter, retry_after
+
+logger = logging.getLogger(__name__)
+
+SLACK = "slack"
+DISCORD = "discord"
+TRADE = "trade"
+ERROR = "error"
+MESSAGE_LIMITS = {SLACK: 3000, DISCORD: 2000}  # 메시지 최대 글자 수
+WEBHOOK_GROUP = "webhook"
+
+NOTIFICATIONS_SENT = Counter("notifications_sent_total", "웹훅으로 전달한 알림 수")
+NOTIFICATION_MESSAGES = Counter("notification_messages_total", "웹훅 요청 수 (묶음 메시지 단위)")
+NOTIFICATIONS_DROPPED = Counter("notifications_dropped_total", "대기열 초과나 재시도 소진으로 버린 알림 수")
+NOTIFICATION_RETRIES = Counter("notification_retries_total", "웹훅 전송 재시도 수")
+NOTIFICATION_LATENCY = Histogram("notification_delivery_seconds", "알림 발생부터 웹훅 전달까지 걸린 시간")
+
+
+@dataclass
+class Notification:
+    """사용자 알림"""
+    user_id: int
+    kind: str  # TRADE 또는 ERROR
+    title: str
+    message: str = ""
+    created_at: float = field(default_factory=time.time)
+
+    def line(self) -> str:
+        """요약 메시지의 한 줄"""
+        return f"[{self.title}] {self.message}" if self.message else f"[{self.title}]"
+
+
+@dataclass
+class _Targets:
+    webhooks: List[Tuple[str, str]]  # (서비스, URL)
+    notify_on_trade: bool = True
+    notify_on_error: bool = True
+
+
+class _Webhook:
+    """웹훅 하나의 대기열과 전송 작업"""
+    __slots__ = ("service", "url", "queue", "wakeup", "task", "batch")
+
+    def __init__(self, service: str, url: str):
+        self.service = service
+        self.url = url
+        self.queue: Deque[Notification] = deque()
+        self.wakeup = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+        self.batch: List[Notification] = []  # 전송 중인 묶음
+
+
+def format_digest(service: str, notifications: List[Notification]) -> Dict[str, str]:
+    """
+    알림 묶음을 웹훅 요청 본문으로 변환
+
+    Args:
+        service (str): SLACK 또는 DISCORD
+        notifications (List[Notification]): 묶을 알림
+
+    Returns:
+        Dict[str, str]: Slack은 {"text": ...}, Discord는 {"content": ...}
+    """
+    limit = MESSAGE_LIMITS[service]
+    if len(notifications) == 1:
+        text = notifications[0].line()[:limit]
+    else:
+        lines = [f"알림 {len(notifications)}건"]
+        length = len(lines[0])
+        for index, notification in enumerate(notifications):
+            line = notification.line()
+            rest = f"... 외 {len(notifications) - index}건"
+            if length + len(line) + len(rest) + 2 > limit:
+                lines.append(rest)
+                break
+            lines.append(line)
+            length += len(line) + 1
+        text = "\n".join(lines)
+    return {"text": text} if service == SLACK else {"content": text}
+
+
+class NotificationDispatcher:
+    def __init__(
+        self,
+        batch_window: Optional[float] = None,
+        max_batch: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        spill_path: Optional[str] = None,
+        max_retries: Optional[int] = None,
+        retry_backoff: Optional[float] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        """
+        웹훅 알림 발송기 초기화
+
+        Args:
+            batch_window (float, optional): 알림을 모으는 시간 (초, 기본값: settings.NOTIFICATION_BATCH_WINDOW)
+            max_batch (int, optional): 한 메시지에 묶을 최대 알림 수 (기본값: settings.NOTIFICATION_MAX_BATCH)
+            queue_size (int, optional): 웹훅별 메모리 대기열 크기 (기본값: settings.NOTIFICATION_QUEUE_SIZE)
+            spill_path (str, optional): 넘친/미전송 알림 파일 (기본값: settings.NOTIFICATION_SPILL_PATH, 없으면 버림)
+            max_retries (int, optional): 최대 재시도 수 (기본값: settings.NOTIFICATION_MAX_RETRIES)
+            retry_backoff (float, optional): 첫 재시도 대기 시간 (초, 기본값: settings.NOTIFICATION_RETRY_BACKOFF)
+            rate_limiter (RateLimiter, optional): 웹훅별 요청 제한 (기본값: settings.NOTIFICATION_RATE_LIMITS)
+        """
+        self.batch_window = settings.NOTIFICATION_BATCH_WINDOW if batch_window is None else batch_window
+        self.max_batch = max_batch or settings.NOTIFICATION_MAX_BATCH
+        self.queue_size = queue_size or settings.NOTIFICATION_QUEUE_SIZE
+        self.spill_path = spill_path if spill_path is not None else settings.NOTIFICATION_SPILL_PATH
+        self.max_retries = settings.NOTIFICATION_MAX_RETRIES if max_retries is None else max_retries
+        self.retry_backoff = settings.NOTIFICATION_RETRY_BACKOFF if retry_backoff is None else retry_backoff
+        self.rate_limiter = rate_limiter or RateLimiter(
+            limits={service: {WEBHOOK_GROUP: limit} for service, limit in settings.NOTIFICATION_RATE_LIMITS.items()},
+        )
+        self.queued = 0
+        self.spilled = 0
+        self._targets: Dict[int, _Targets] = {}
+        self._webhooks: Dict[str, _Webhook] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+        self._spill_lock = threading.Lock()
+
+    # 수신 대상
+
+    def set_targets(
+        self,
+        user_id: int,
+        slack_webhook_url: Optional[str] = None,
+        discord_webhook_url: Optional[str] = None,
+        notify_on_trade: bool = True,
+        notify_on_error: bool = True,
+    ) -> None:
+        """
+        사용자 웹훅 설정 (URL이 모두 없으면 해제)
+
+        Args:
+            user_id (int): 사용자 ID
+            slack_webhook_url (str, optional): Slack Incoming Webhook URL
+            discord_webhook_url (str, optional): Discord 웹훅 URL
+            notify_on_trade (bool): 체결 알림 여부
+            notify_on_error (bool): 오류 알림 여부
+        """
+        webhooks = [(service, url) for service, url in ((SLACK, slack_webhook_url), (DISCORD, discord_webhook_url)) if url]
+        if webhooks:
+            self._targets[user_id] = _Targets(webhooks, notify_on_trade, notify_on_error)
+        else:
+            self._targets.pop(user_id, None)
+
+    def load(self, db: Session) -> int:
+        """
+        NotificationSetting 전체를 메모리에 적재
+
+        Args:
+            db (Session): 데이터베이스 세션
+
+        Returns:
+            int: 웹훅이 설정된 사용자 수
+        """
+        for row in db.query(NotificationSetting):
+            self.set_targets(
+                row.user_id, row.slack_webhook_url, row.discord_webhook_url,
+                row.notify_on_trade is not False, row.notify_on_error is not False,
+            )
+        return len(self._targets)
+
+    # 알림 등록 (주문 경로에서 호출, 대기 없음)
+
+    def notify(self, user_id: int, kind: str, title: str, message: str = "") -> int:
+        """
+        알림 등록 (대기열에 넣고 바로 반환, 다른 스레드에서 호출 가능)
+
+        Args:
+            user_id (int): 사용자 ID
+            kind (str): TRADE 또는 ERROR
+            title (str): 제목
+            message (str): 내용
+
+        Returns:
+            int: 알림을 넣은 웹훅 수 (설정이 없거나 꺼져 있으면 0)
+        """
+        targets = self._targets.get(user_id)
+        if targets is None or not (targets.notify_on_trade if kind == TRADE else targets.notify_on_error):
+            return 0
+        notification = Notification(user_id, kind, title, message)
+        loop = self._loop
+        if loop is not None and threading.get_ident() != self._loop_thread and not loop.is_closed():
+            try:
+                loop.call_soon_threadsafe(self._enqueue_all, targets.webhooks, notification)
+                return len(targets.webhooks)
+            except RuntimeError:
+                pass
+        self._enqueue_all(targets.webhooks, notification)
+        return len(targets.webhooks)
+
+    def _enqueue_all(self, webhooks: List[Tuple[str, str]], notification: Notification) -> None:
+        for service, url in webhooks:
+            self._enqueue(service, url, notification)
+
+    def _webhook(self, service: str, url: str) -> _Webhook:
+        webhook = self._webhooks.get(url)
+        if webhook is None:
+            webhook = self._webhooks[url] = _Webhook(service, url)
+            if self._session is not None:
+                webhook.task = asyncio.create_task(self._run(webhook))
+        return webhook
+
+    def _enqueue(self, service: str, url: str, notification: Notification) -> None:
+        webhook = self._webhook(service, url)
+        if len(webhook.queue) >= self.queue_size:
+            self._spill([(service, url, notification)])
+            return
+        webhook.queue.append(notification)
+        self.queued += 1
+        webhook.wakeup.set()
+
+    # 디스크 보관
+
+    def _spill(self, items: List[Tuple[str, str, Notification]]) -> None:
+        if not self.spill_path:
+            NOTIFICATIONS_DROPPED.inc(len(items))
+            return
+        with self._spill_lock, open(self.spill_path, "a", encoding="utf-8") as file:
+            for service, url, notification in items:
+                file.write(json.dumps({"service": service, "url": url, **asdict(notification)}, ensure_ascii=False) + "\n")
+        self.spilled += len(items)
+
+    def _restore(self) -> int:
+        if not self.spill_path or not os.path.exists(self.spill_path):
+            return 0
+        with self._spill_lock:
+            with open(self.spill_path, encoding="utf-8") as file:
+                lines = file.readlines()
+            os.remove(self.spill_path)
+        for line in lines:
+            item = json.loads(line)
+            self._enqueue(item.pop("service"), item.pop("url"), Notification(**item))
+        return len(lines)
+
+    # 전송
+
+    async def _run(self, webhook: _Webhook) -> None:
+        while True:
+            await webhook.wakeup.wait()
+            if self.batch_window:
+                await asyncio.sleep(self.batch_window)  # 연속 알림을 한 메시지로 모음
+            while webhook.queue:
+                batch = webhook.batch = [webhook.queue.popleft() for _ in range(min(self.max_batch, len(webhook.queue)))]
+                try:
+                    await self._deliver(webhook, batch)
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    logger.exception("웹훅 전송 중 오류 (%s)", webhook.service)
+                    self._spill([(webhook.service, webhook.url, notification) for notification in batch])
+                webhook.batch = []
+                self.queued -= len(batch)
+            webhook.wakeup.clear()
+
+    async def _deliver(self, webhook: _Webhook, batch: List[Notification]) -> None:
+        body = format_digest(webhook.service, batch)
+        for attempt in range(self.max_retries + 1):
+            await self.rate_limiter.acquire(webhook.service, webhook.url, WEBHOOK_GROUP)
+            delay = self.retry_backoff * 2 ** attempt
+            try:
+                async with self._session.post(webhook.url, json=body) as response:
+                    status, headers = response.status, response.headers
+                    await response.read()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.warning("웹훅 전송 실패 (%s): %s", webhook.service, e)
+            else:
+                if status < 300:
+                    self._rate_limited(webhook, headers)
+                    now = time.time()
+                    for notification in batch:
+                        NOTIFICATION_LATENCY.observe(now - notification.created_at)
+                    NOTIFICATIONS_SENT.inc(len(batch))
+                    NOTIFICATION_MESSAGES.inc()
+                    return
+                if status == 429:
+                    delay = retry_after(headers, delay)
+                    self.rate_limiter.bucket(webhook.service, webhook.url, WEBHOOK_GROUP).block(delay, time.monotonic())
+                    delay = 0.0  # 버킷이 막혀 있으므로 acquire에서 대기
+                elif status < 500:
+                    logger.warning("웹훅이 요청을 거절했습니다 (%s, HTTP %d): 알림 %d건을 버립니다", webhook.service, status, len(batch))
+                    NOTIFICATIONS_DROPPED.inc(len(batch))
+                    return
+            if attempt < self.max_retries:
+                NOTIFICATION_RETRIES.inc()
+                await asyncio.sleep(delay)
+        logger.warning("웹훅 재시도 소진 (%s): 알림 %d건", webhook.service, len(batch))
+        self._spill([(webhook.service, webhook.url, notification) for notification in batch])
+
+    def _rate_limited(self, webhook: _Webhook, headers: Any) -> None:
+        # Discord는 남은 요청 수/초기화 시간을 헤더로 알려 줌
+        if headers.get("X-RateLimit-Remaining") == "0":
+            try:
+                reset_after = float(headers.get("X-RateLimit-Reset-After", 0))
+            except ValueError:
+                return
+            self.rate_limiter.bucket(webhook.service, webhook.url, WEBHOOK_GROUP).block(reset_after, time.monotonic())
+
+    # 수명 주기
+
+    async def start(self) -> None:
+        """HTTP 세션과 웹훅별 전송 작업 시작 (디스크에 남은 알림 복원)"""
+        if self._session is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=settings.NOTIFICATION_HTTP_TIMEOUT),
+        )
+        for webhook in self._webhooks.values():
+            webhook.task = asyncio.create_task(self._run(webhook))
+        # 복원으로 새로 생기는 웹훅의 전송 작업은 _webhook이 만든다 (웹훅당 작업 하나)
+        restored = self._restore()
+        if restored:
+            logger.info("디스크에 남은 알림 %d건 복원", restored)
+
+    async def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        대기 중인 알림 전송 완료 대기
+
+        Args:
+            timeout (float, optional): 최대 대기 시간 (초)
+
+        Returns:
+            bool: 모두 전송(또는 처리)됐으면 True
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.queued:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(0.01)
+        return True
+
+    async def stop(self, timeout: float = 5.0) -> None:
+        """
+        대기 알림을 timeout 동안 보내 보고 종료 (못 보낸 알림은 디스크에 보관)
+
+        Args:
+            timeout (float): 종료 전 전송 대기 시간 (초)
+        """
+        if self._session is None:
+            return
+        await self.flush(timeout)
+        for webhook in self._webhooks.values():
+            if webhook.task is not None:
+                webhook.task.cancel()
+        await asyncio.gather(*(w.task for w in self._webhooks.values() if w.task is not None), return_exceptions=True)
+        leftover = []
+        for webhook in self._webhooks.values():
+            for notification in [*webhook.batch, *webhook.queue]:
+                leftover.append((webhook.service, webhook.url, notification))
+            webhook.batch = []
+            webhook.queue.clear()
+            webhook.wakeup.clear()
+            webhook.task = None
+        self.queued = 0
+        if leftover:
+            self._spill(leftover)
+        await self._session.close()
+        self._session = None
+        self._loop = self._loop_thread = None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        발송 통계 조회
+
+        Returns:
+            Dict[str, Any]: 대상 사용자/웹훅 수, 대기/보관 알림 수, 전송/버림/재시도 수, 전달 지연 요약
+        """
+        return {
+            "users": len(self._targets),
+            "webhooks": len(self._webhooks),
+            "queued": self.queued,
+            "spilled": self.spilled,
+            "sent": int(NOTIFICATIONS_SENT.value),
+            "messages": int(NOTIFICATION_MESSAGES.value),
+            "dropped": int(NOTIFICATIONS_DROPPED.value),
+            "retries": int(NOTIFICATION_RETRIES.value),
+            "latency": NOTIFICATION_LATENCY.snapshot(),
+        }
+
+
+notification_dispatcher = NotificationDispatcher()
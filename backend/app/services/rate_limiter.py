@@ -0,0 +1,354 @@
+"""
+거래소 요청 쿼터 스케줄러
+
+(거래소, API 키, 요청 그룹)마다 토큰 버킷을 두고, 쿼터가 부족하면 요청을 실패시키지 않고
+우선순위 대기열에 세운다. 주문 요청이 계정 조회나 시세 조회보다 먼저 토큰을 받는다.
+거래소가 응답 헤더로 알려 주는 남은 쿼터(업비트 Remaining-Req, 바이낸스 X-MBX-USED-*)로
+버킷을 보정하고, 429/418 응답을 받으면 Retry-After 동안 버킷을 막는다.
+
+한 버킷의 대기와 해제는 같은 이벤트 루프에서 이루어진다고 가정한다.
+"""
+
+import asyncio
+import heapq
+import itertools
+import re
+import time
+from typing import Any, Callable, Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+from app.core.config import settings
+from app.core.metrics import Counter, Histogram
+
+PRIORITY_ORDER = 0
+PRIORITY_ACCOUNT = 1
+PRIORITY_MARKET_DATA = 2
+
+RATE_LIMIT_WAIT = Histogram("exchange_rate_limit_wait_seconds", "쿼터 부족으로 거래소 요청이 대기한 시간")
+RATE_LIMIT_THROTTLED = Counter("exchange_rate_limit_throttled_total", "쿼터 부족으로 대기한 거래소 요청 수")
+RATE_LIMIT_REJECTED = Counter("exchange_rate_limit_rejected_total", "거래소가 429/418로 거절한 요청 수")
+# 거래소 호출 (쿼터 대기 제외, status는 HTTP 상태 코드(pyupbit 동기 클라이언트는 ok) 또는 응답 없이 실패하면 error)
+EXCHANGE_REQUEST_LATENCY = Histogram(
+    "exchange_request_duration_seconds", "거래소 API 요청 한 번의 응답 시간",
+    labelnames=("exchange", "endpoint", "status"),
+)
+
+UPBIT_QUOTATION_GROUPS = {
+    "/v1/ticker": "ticker",
+    "/v1/orderbook": "orderbook",
+    "/v1/trades/ticks": "trades",
+    "/v1/market/all": "market",
+}
+BINANCE_WEIGHTS = {
+    ("GET", "/api/v3/ticker/price"): 4,
+    ("GET", "/api/v3/account"): 20,
+    ("GET", "/api/v3/order"): 4,
+    ("GET", "/api/v3/openOrders"): 6,
+    ("GET", "/api/v3/klines"): 2,
+    ("GET", "/api/v3/exchangeInfo"): 20,
+    ("POST", "/api/v3/userDataStream"): 2,
+}
+BINANCE_USED_HEADERS = {"X-MBX-USED-WEIGHT-1M": "weight", "X-MBX-ORDER-COUNT-10S": "orders"}
+
+_REMAINING_REQ = re.compile(r"group=([\w-]+);.*sec=(\d+)")
+
+
+class Quota(NamedTuple):
+    """요청 하나가 소비할 쿼터"""
+    key: str    # API 키 (IP 단위 쿼터는 빈 문자열)
+    group: str  # 요청 그룹
+    cost: float = 1.0
+
+
+def upbit_quota(method: str, path: str, access_key: str) -> Tuple[List[Quota], int]:
+    """
+    업비트 요청의 쿼터 그룹과 우선순위
+
+    시세(Quotation) API는 IP 단위, 거래(Exchange) API는 API 키 단위로 제한된다.
+
+    Args:
+        method (str): HTTP 메서드
+        path (str): API 경로
+        access_key (str): 액세스 키
+
+    Returns:
+        Tuple[List[Quota], int]: 소비할 쿼터, 우선순위
+    """
+    if path.startswith("/v1/candles"):
+        return [Quota("", "candles")], PRIORITY_MARKET_DATA
+    if path in UPBIT_QUOTATION_GROUPS:
+        return [Quota("", UPBIT_QUOTATION_GROUPS[path])], PRIORITY_MARKET_DATA
+    if (method, path) in (("POST", "/v1/orders"), ("DELETE", "/v1/order")):
+        return [Quota(access_key, "order")], PRIORITY_ORDER
+    return [Quota(access_key, "default")], PRIORITY_ACCOUNT
+
+
+def binance_quota(method: str, path: str, access_key: str) -> Tuple[List[Quota], int]:
+    """
+    바이낸스 요청의 쿼터 그룹과 우선순위
+
+    요청 가중치는 IP 단위, 주문 수는 계정 단위로 제한된다.
+
+    Args:
+        method (str): HTTP 메서드
+        path (str): API 경로
+        access_key (str): API 키
+
+    Returns:
+        Tuple[List[Quota], int]: 소비할 쿼터, 우선순위
+    """
+    quota = [Quota("", "weight", BINANCE_WEIGHTS.get((method, path), 1))]
+    if path == "/api/v3/order" and method == "POST":
+        return [Quota(access_key, "orders"), *quota], PRIORITY_ORDER
+    if path == "/api/v3/order" and method == "DELETE":
+        return quota, PRIORITY_ORDER
+    if path in ("/api/v3/account", "/api/v3/order", "/api/v3/openOrders", "/api/v3/userDataStream"):
+        return quota, PRIORITY_ACCOUNT
+    return quota, PRIORITY_MARKET_DATA
+
+
+def _upbit_remaining(headers: Mapping[str, str], limit: Callable[[str], float]) -> Dict[str, float]:
+    match = _REMAINING_REQ.search(headers.get("Remaining-Req", ""))
+    return {match.group(1): float(match.group(2))} if match else {}
+
+
+def _binance_remaining(headers: Mapping[str, str], limit: Callable[[str], float]) -> Dict[str, float]:
+    remaining = {}
+    for header, group in BINANCE_USED_HEADERS.items():
+        used = headers.get(header)
+        if used is not None:
+            remaining[group] = limit(group) - float(used)
+    return remaining
+
+
+QUOTA_PARSERS = {"upbit": _upbit_remaining, "binance": _binance_remaining}
+
+
+def retry_after(headers: Mapping[str, str], default: float = 1.0) -> float:
+    """Retry-After 헤더 (초, 없으면 default)"""
+    try:
+        return max(float(headers.get("Retry-After", default)), 0.0)
+    except ValueError:
+        return default
+
+
+class TokenBucket:
+    def __init__(self, limit: float, window: float):
+        """
+        토큰 버킷 초기화
+
+        Args:
+            limit (float): 구간당 허용 요청 수 (버킷 용량)
+            window (float): 쿼터 구간 (초)
+        """
+        self.limit = float(limit)
+        self.window = window
+        self.rate = self.limit / window
+        self.tokens = self.limit
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.waiters: List[list] = []  # [우선순위, 순번, 비용, Future] 힙
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+    def _refill(self, now: float) -> None:
+        if now <= self.blocked_until:
+            return
+        start = max(self.updated, self.blocked_until)
+        self.tokens = min(self.limit, self.tokens + (now - start) * self.rate)
+        self.updated = now
+
+    def try_take(self, cost: float, now: float) -> bool:
+        """토큰이 충분하면 소비"""
+        self._refill(now)
+        if now < self.blocked_until or self.tokens < cost:
+            return False
+        self.tokens -= cost
+        return True
+
+    def delay(self, cost: float, now: float) -> float:
+        """cost만큼 토큰이 찰 때까지 남은 시간 (초)"""
+        self._refill(now)
+        blocked = max(self.blocked_until - now, 0.0)
+        return blocked + max(cost - self.tokens, 0.0) / self.rate
+
+    def sync(self, remaining: float, now: float) -> None:
+        """
+        거래소가 알려 준 남은 쿼터로 보정
+
+        응답 시점 이후 보낸 요청은 거래소 집계에 아직 없으므로 토큰을 줄이는 방향으로만 맞춘다.
+        남은 쿼터가 없으면 한 구간 동안 막는다.
+        """
+        self._refill(now)
+        self.tokens = max(min(self.tokens, remaining), 0.0)
+        if remaining <= 0:
+            self.block(self.window, now)
+
+    def block(self, seconds: float, now: float) -> None:
+        """seconds 동안 토큰 지급 중지"""
+        self._refill(now)
+        self.tokens = 0.0
+        self.blocked_until = max(self.blocked_until, now + seconds)
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        limits: Optional[Mapping[str, Mapping[str, Sequence[float]]]] = None,
+        default: Optional[Sequence[float]] = None,
+    ):
+        """
+        요청 쿼터 스케줄러 초기화
+
+        Args:
+            limits (Mapping, optional): 거래소별, 그룹별 (허용 수, 구간 초) (기본값: settings.RATE_LIMITS)
+            default (Sequence[float], optional): 설정에 없는 그룹의 (허용 수, 구간 초) (기본값: settings.RATE_LIMIT_DEFAULT)
+        """
+        self.limits = limits if limits is not None else settings.RATE_LIMITS
+        self.default = tuple(default or settings.RATE_LIMIT_DEFAULT)
+        self._buckets: Dict[Tuple[str, str, str], TokenBucket] = {}
+        self._sequence = itertools.count()
+
+    def _limit(self, exchange: str, group: str) -> Tuple[float, float]:
+        limit, window = self.limits.get(exchange, {}).get(group, self.default)
+        return float(limit), float(window)
+
+    def bucket(self, exchange: str, key: str, group: str) -> TokenBucket:
+        """(거래소, API 키, 그룹) 버킷 조회 (없으면 생성)"""
+        bucket = self._buckets.get((exchange, key, group))
+        if bucket is None:
+            bucket = self._buckets[(exchange, key, group)] = TokenBucket(*self._limit(exchange, group))
+        return bucket
+
+    async def acquire(
+        self,
+        exchange: str,
+        key: str,
+        group: str,
+        cost: float = 1.0,
+        priority: int = PRIORITY_MARKET_DATA,
+    ) -> float:
+        """
+        쿼터 확보 (부족하면 우선순위 순서대로 대기)
+
+        Args:
+            exchange (str): 거래소
+            key (str): API 키 (IP 단위 쿼터는 빈 문자열)
+            group (str): 요청 그룹
+            cost (float): 소비할 토큰 수 (바이낸스 요청 가중치 등)
+            priority (int): 우선순위 (작을수록 먼저, PRIORITY_ORDER < PRIORITY_ACCOUNT < PRIORITY_MARKET_DATA)
+
+        Returns:
+            float: 대기한 시간 (초)
+        """
+        bucket = self.bucket(exchange, key, group)
+        cost = min(cost, bucket.limit)
+        start = time.monotonic()
+        if not bucket.waiters and bucket.try_take(cost, start):
+            return 0.0
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(bucket.waiters, [priority, next(self._sequence), cost, future])
+        self._schedule(bucket)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if not future.cancelled():  # 토큰을 받은 뒤 취소되면 돌려주고 다음 대기자에게 넘김
+                bucket.tokens = min(bucket.limit, bucket.tokens + cost)
+                self._schedule(bucket)
+            raise
+        waited = time.monotonic() - start
+        RATE_LIMIT_THROTTLED.inc()
+        RATE_LIMIT_WAIT.observe(waited)
+        return waited
+
+    async def acquire_all(self, exchange: str, quota: Iterable[Quota], priority: int = PRIORITY_MARKET_DATA) -> float:
+        """
+        요청 하나에 필요한 쿼터를 모두 확보
+
+        Returns:
+            float: 대기한 시간 (초)
+        """
+        waited = 0.0
+        for item in quota:
+            waited += await self.acquire(exchange, item.key, item.group, item.cost, priority)
+        return waited
+
+    def _schedule(self, bucket: TokenBucket) -> None:
+        if bucket.timer is not None:
+            bucket.timer.cancel()
+            bucket.timer = None
+        self._dispatch(bucket)
+
+    def _dispatch(self, bucket: TokenBucket) -> None:
+        bucket.timer = None
+        now = time.monotonic()
+        while bucket.waiters:
+            _, _, cost, future = bucket.waiters[0]
+            if future.done():
+                heapq.heappop(bucket.waiters)
+                continue
+            if not bucket.try_take(cost, now):
+                bucket.timer = future.get_loop().call_later(bucket.delay(cost, now), self._dispatch, bucket)
+                return
+            heapq.heappop(bucket.waiters)
+            future.set_result(None)
+
+    def update(self, exchange: str, quota: Sequence[Quota], headers: Mapping[str, str]) -> None:
+        """
+        응답 헤더의 남은 쿼터로 버킷 보정
+
+        Args:
+            exchange (str): 거래소
+            quota (Sequence[Quota]): 요청이 소비한 쿼터 (그룹별 API 키 판별용)
+            headers (Mapping[str, str]): 응답 헤더
+        """
+        parser = QUOTA_PARSERS.get(exchange)
+        if parser is None or not quota:
+            return
+        keys = {item.group: item.key for item in quota}
+        now = time.monotonic()
+        for group, remaining in parser(headers, lambda g: self._limit(exchange, g)[0]).items():
+            self.bucket(exchange, keys.get(group, quota[0].key), group).sync(remaining, now)
+
+    def penalize(self, exchange: str, quota: Iterable[Quota], seconds: float) -> None:
+        """
+        거절 응답(429/418) 반영: 요청이 쓴 버킷을 seconds 동안 막음
+
+        Args:
+            exchange (str): 거래소
+            quota (Iterable[Quota]): 요청이 소비한 쿼터
+            seconds (float): 차단 시간 (초)
+        """
+        RATE_LIMIT_REJECTED.inc()
+        now = time.monotonic()
+        for item in quota:
+            self.bucket(exchange, item.key, item.group).block(seconds, now)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        버킷별 상태와 대기 지표 조회 (API 키는 앞 4자리만 표시)
+
+        Returns:
+            Dict[str, Any]: 버킷 목록, 대기/거절 수, 대기 시간 요약
+        """
+        now = time.monotonic()
+        buckets = []
+        for (exchange, key, group), bucket in self._buckets.items():
+            bucket._refill(now)
+            buckets.append({
+                "exchange": exchange,
+                "key": f"{key[:4]}***" if key else "",
+                "group": group,
+                "limit": bucket.limit,
+                "window": bucket.window,
+                "tokens": round(bucket.tokens, 3),
+                "waiting": sum(1 for waiter in bucket.waiters if not waiter[3].done()),
+                "blocked_for": round(max(bucket.blocked_until - now, 0.0), 3),
+            })
+        return {
+            "buckets": buckets,
+            "throttled": int(RATE_LIMIT_THROTTLED.value),
+            "rejected": int(RATE_LIMIT_REJECTED.value),
+            "wait_seconds": RATE_LIMIT_WAIT.snapshot(),
+        }
+
+
+rate_limiter = RateLimiter()
@@ -0,0 +1,258 @@
+"""
+업비트 거래소 커넥터
+"""
+
+import asyncio
+import hashlib
+import json
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import urlencode
+
+import numpy as np
+from jose import jwt
+
+from app.core.config import settings
+from .exchange_service import (
+    BUY, CANCELED, FILLED, LIMIT, MARKET, OPEN, PARTIALLY_FILLED, SELL,
+    Balance, ExchangeConnector, Order, StreamEndpoint, Ticker, candle_columns, format_number, register_connector,
+    split_symbol,
+)
+from .rate_limiter import upbit_quota
+
+ORDER_STATES = {"wait": OPEN, "watch": OPEN, "trade": OPEN, "done": FILLED, "cancel": CANCELED, "prevented": CANCELED}
+MAX_CANDLES = 200  # 캔들 조회 1회 최대 개수
+
+
+def _candle_path(interval: str) -> str:
+    if interval == "day":
+        return "/v1/candles/days"
+    if interval.startswith("minute") and interval[6:].isdigit():
+        return f"/v1/candles/minutes/{interval[6:]}"
+    raise ValueError(f"업비트에서 지원하지 않는 봉 간격입니다: {interval}")
+
+
+def _float(value: Any) -> Optional[float]:
+    return float(value) if value is not None else None
+
+
+@register_connector("upbit")
+class UpbitConnector(ExchangeConnector):
+    def __init__(
+        self,
+        access_key: str = "",
+        secret_key: str = "",
+        base_url: Optional[str] = None,
+        ws_url: Optional[str] = None,
+        pool_size: Optional[int] = None,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ):
+        """
+        업비트 커넥터 초기화
+
+        Args:
+            access_key (str): 업비트 API 액세스 키
+            secret_key (str): 업비트 API 시크릿 키
+            base_url (str, optional): API 주소 (기본값: settings.UPBIT_API_URL)
+            ws_url (str, optional): WebSocket 주소 (기본값: settings.UPBIT_WS_URL)
+            pool_size (int, optional): HTTP 동시 연결 수 (기본값: settings.UPBIT_HTTP_POOL_SIZE)
+            timeout (float, optional): 요청 제한 시간 (기본값: settings.UPBIT_HTTP_TIMEOUT)
+        """
+        super().__init__(
+            access_key,
+            secret_key,
+            base_url or settings.UPBIT_API_URL,
+            ws_url or settings.UPBIT_WS_URL,
+            pool_size or settings.UPBIT_HTTP_POOL_SIZE,
+            settings.UPBIT_HTTP_KEEPALIVE,
+            timeout or settings.UPBIT_HTTP_TIMEOUT,
+            **kwargs,
+        )
+        self.chunk_size = settings.UPBIT_TICKER_CHUNK_SIZE
+
+    def to_exchange_symbol(self, symbol: str) -> str:
+        quote, base = split_symbol(symbol)
+        return f"{quote}-{base}"
+
+    def from_exchange_symbol(self, symbol: str) -> str:
+        quote, base = split_symbol(symbol)
+        return f"{quote}-{base}"
+
+    def _auth_headers(self, query: str = "") -> Dict[str, str]:
+        payload = {"access_key": self.access_key, "nonce": str(uuid.uuid4())}
+        if query:
+            payload["query_hash"] = hashlib.sha512(query.encode()).hexdigest()
+            payload["query_hash_alg"] = "SHA512"
+        token = jwt.encode(payload, self.secret_key, algorithm="HS256")
+        return {"Authorization": f"Bearer {token}"}
+
+    async def _request(self, method: str, path: str, params: Optional[Dict[str, Any]] = None, auth: bool = False) -> Any:
+        query = urlencode(params) if params else ""
+        headers = (lambda: self._auth_headers(query)) if auth else None
+        quota, priority = upbit_quota(method, path, self.access_key)
+        if method == "POST":
+            return await self._send(method, path, headers=headers, json_body=params, quota=quota, priority=priority)
+        return await self._send(method, path, params=query, headers=headers, quota=quota, priority=priority)
+
+    async def get_prices(self, symbols: Iterable[str]) -> Dict[str, float]:
+        markets = list(dict.fromkeys(self.to_exchange_symbol(symbol) for symbol in symbols))
+        chunks = [markets[i:i + self.chunk_size] for i in range(0, len(markets), self.chunk_size)]
+        responses = await asyncio.gather(
+            *(self._request("GET", "/v1/ticker", {"markets": ",".join(chunk)}) for chunk in chunks)
+        )
+        return {
+            self.from_exchange_symbol(item["market"]): float(item["trade_price"])
+            for data in responses
+            for item in data
+        }
+
+    async def get_balances(self) -> Dict[str, Balance]:
+        accounts: List[Dict[str, Any]] = await self._request("GET", "/v1/accounts", auth=True)
+        balances = {}
+        for account in accounts:
+            balance = Balance(account["currency"], float(account["balance"]), float(account.get("locked") or 0))
+            if balance.total:
+                balances[balance.currency] = balance
+        return balances
+
+    def _order(self, data: Dict[str, Any]) -> Order:
+        filled = float(data.get("executed_volume") or 0)
+        trades = data.get("trades") or []
+        traded_volume = sum(float(trade["volume"]) for trade in trades)
+        average_price = (
+            sum(float(trade["funds"]) for trade in trades) / traded_volume if traded_volume else None
+        )
+        status = ORDER_STATES.get(data.get("state"), OPEN)
+        if status == OPEN and filled > 0:
+            status = PARTIALLY_FILLED
+        return Order(
+            exchange=self.name,
+            symbol=self.from_exchange_symbol(data["market"]),
+            order_id=data["uuid"],
+            side=BUY if data["side"] == "bid" else SELL,
+            order_type=LIMIT if data.get("ord_type") == "limit" else MARKET,
+            status=status,
+            quantity=_float(data.get("volume")),
+            price=_float(data.get("price")),
+            filled_quantity=filled,
+            average_price=average_price,
+            client_order_id=data.get("identifier"),
+            raw=data,
+        )
+
+    async def place_order(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str = MARKET,
+        quantity: Optional[float] = None,
+        price: Optional[float] = None,
+        amount: Optional[float] = None,
+        client_order_id: Optional[str] = None,
+    ) -> Order:
+        if side not in (BUY, SELL):
+            raise ValueError(f"지원하지 않는 주문 방향입니다: {side}")
+        params: Dict[str, Any] = {"market": self.to_exchange_symbol(symbol), "side": "bid" if side == BUY else "ask"}
+        if order_type == MARKET and side == BUY:
+            if amount is None:
+                raise ValueError("업비트 시장가 매수에는 주문 총액(amount)이 필요합니다")
+            params.update(price=format_number(amount), ord_type="price")
+        elif order_type == MARKET:
+            if quantity is None:
+                raise ValueError("시장가 매도에는 수량(quantity)이 필요합니다")
+            params.update(volume=format_number(quantity), ord_type="market")
+        elif order_type == LIMIT:
+            if quantity is None or price is None:
+                raise ValueError("지정가 주문에는 수량(quantity)과 가격(price)이 필요합니다")
+            params.update(volume=format_number(quantity), price=format_number(price), ord_type="limit")
+        else:
+            raise ValueError(f"지원하지 않는 주문 유형입니다: {order_type}")
+        if client_order_id is not None:
+            params["identifier"] = client_order_id
+        return self._order(await self._request("POST", "/v1/orders", params, auth=True))
+
+    @staticmethod
+    def _reference(order_id: Optional[str], client_order_id: Optional[str]) -> Dict[str, str]:
+        if order_id is not None:
+            return {"uuid": order_id}
+        if client_order_id is not None:
+            return {"identifier": client_order_id}
+        raise ValueError("order_id 또는 client_order_id가 필요합니다")
+
+    async def get_order(self, symbol: str, order_id: Optional[str] = None, client_order_id: Optional[str] = None) -> Order:
+        return self._order(await self._request("GET", "/v1/order", self._reference(order_id, client_order_id), auth=True))
+
+    async def cancel_order(self, symbol: str, order_id: Optional[str] = None, client_order_id: Optional[str] = None) -> Order:
+        return self._order(await self._request("DELETE", "/v1/order", self._reference(order_id, client_order_id), auth=True))
+
+    async def get_candles(
+        self,
+        symbol: str,
+        interval: str,
+        count: int = MAX_CANDLES,
+        end_ms: Optional[int] = None,
+    ) -> Dict[str, np.ndarray]:
+        params: Dict[str, Any] = {"market": self.to_exchange_symbol(symbol), "count": min(count, MAX_CANDLES)}
+        if end_ms is not None:
+            params["to"] = datetime.fromtimestamp(end_ms / 1000, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        data = await self._request("GET", _candle_path(interval), params)
+        return candle_columns(
+            (
+                int(datetime.fromisoformat(item["candle_date_time_utc"]).replace(tzinfo=timezone.utc).timestamp() * 1000),
+                float(item["opening_price"]),
+                float(item["high_price"]),
+                float(item["low_price"]),
+                float(item["trade_price"]),
+                float(item["candle_acc_trade_volume"]),
+            )
+            for item in data
+        )
+
+    def _stream_url(self, symbols: List[str]) -> str:
+        return self.ws_url
+
+    def _subscription_message(self, symbols: List[str]) -> Optional[str]:
+        return json.dumps([
+            {"ticket": str(uuid.uuid4())},
+            {"type": "ticker", "codes": [self.to_exchange_symbol(symbol) for symbol in symbols]},
+            {"format": "DEFAULT"},
+        ])
+
+    def parse_ticker(self, message: Any) -> Optional[Ticker]:
+        if message.get("type") != "ticker":
+            return None
+        return Ticker(
+            self.name,
+            self.from_exchange_symbol(message["code"]),
+            float(message["trade_price"]),
+            int(message["timestamp"]),
+            _float(message.get("acc_trade_volume_24h")),
+        )
+
+    async def _order_stream(self) -> StreamEndpoint:
+        subscription = json.dumps([{"ticket": str(uuid.uuid4())}, {"type": "myOrder"}, {"format": "DEFAULT"}])
+        return f"{self.ws_url}/private", self._auth_headers(), subscription
+
+    def parse_order(self, message: Any) -> Optional[Order]:
+        if message.get("type") != "myOrder":
+            return None
+        filled = float(message.get("executed_volume") or 0)
+        status = ORDER_STATES.get(message.get("state"), OPEN)
+        if status == OPEN and filled > 0:
+            status = PARTIALLY_FILLED
+        return Order(
+            exchange=self.name,
+            symbol=self.from_exchange_symbol(message["code"]),
+            order_id=message["uuid"],
+            side=BUY if message["ask_bid"] == "BID" else SELL,
+            order_type=LIMIT if message.get("order_type") == "limit" else MARKET,
+            status=status,
+            quantity=_float(message.get("volume")),
+            price=_float(message.get("price")),
+            filled_quantity=filled,
+            average_price=_float(message.get("avg_price")) if filled else None,
+            client_order_id=message.get("identifier"),
+            raw=message,
+        )
@@ -0,0 +1,285 @@
+"""
+백테스트 엔진
+
+실전 엔진과 같은 전략 코드를 벡터화 모드(generate_signals)로 실행하고
+수수료/슬리피지를 반영해 체결을 시뮬레이션한다.
+결과는 Trade 모델과 같은 형태의 레코드로 반환된다.
+"""
+
+import os
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from app.core.config import settings
+from app.models.user import Trade
+from .indicators import ohlcv_columns
+from .strategy import SIGNAL_BUY, SIGNAL_SELL, Strategy, create_strategy
+
+OHLCV_COLUMNS = ("timestamp", "open", "high", "low", "close", "volume")
+
+
+def load_ohlcv(path: str) -> Dict[str, np.ndarray]:
+    """
+    로컬 파일에서 OHLCV 로드
+
+    Args:
+        path (str): CSV 또는 NPZ 파일 경로 (timestamp, open, high, low, close, volume 열)
+
+    Returns:
+        Dict[str, np.ndarray]: 열 이름별 배열 (timestamp는 밀리초 int64)
+    """
+    if path.endswith(".npz"):
+        with np.load(path) as data:
+            columns = {name: data[name] for name in OHLCV_COLUMNS}
+    else:
+        frame = pd.read_csv(path)
+        if not np.issubdtype(frame["timestamp"].dtype, np.number):
+            frame["timestamp"] = pd.to_datetime(frame["timestamp"], utc=True).astype("int64") // 1_000_000
+        columns = {name: frame[name].to_numpy() for name in OHLCV_COLUMNS}
+    columns["timestamp"] = columns["timestamp"].astype(np.int64)
+    for name in OHLCV_COLUMNS[1:]:
+        columns[name] = columns[name].astype(np.float64)
+    return columns
+
+
+@dataclass
+class BacktestConfig:
+    """백테스트 체결 조건"""
+    exchange: str = "upbit"
+    symbol: str = "KRW-BTC"
+    quantity: float = settings.DEFAULT_TRADE_AMOUNT
+    fee_rate: float = settings.BACKTEST_FEE_RATE
+    slippage: float = settings.BACKTEST_SLIPPAGE
+    stop_loss_percentage: Optional[float] = settings.DEFAULT_STOP_LOSS
+    take_profit_percentage: Optional[float] = settings.DEFAULT_TAKE_PROFIT
+
+    @classmethod
+    def from_setting(cls, setting, **overrides) -> "BacktestConfig":
+        """
+        매매 설정으로부터 체결 조건 생성
+
+        Args:
+            setting (TradingSetting): 매매 설정
+
+        Returns:
+            BacktestConfig: 체결 조건
+        """
+        values = {
+            "exchange": setting.exchange,
+            "symbol": setting.symbol,
+            "quantity": setting.max_position_size or settings.DEFAULT_TRADE_AMOUNT,
+            "stop_loss_percentage": setting.stop_loss_percentage,
+            "take_profit_percentage": setting.take_profit_percentage,
+        }
+        values.update(overrides)
+        return cls(**values)
+
+
+@dataclass
+class BacktestResult:
+    """백테스트 결과"""
+    trades: List[Dict[str, Any]] = field(default_factory=list)
+    stats: Dict[str, float] = field(default_factory=dict)
+
+    def to_models(self, user_id: Optional[int] = None) -> List[Trade]:
+        """
+        Trade 모델 인스턴스로 변환 (저장하지 않음)
+
+        Args:
+            user_id (int, optional): 사용자 ID
+
+        Returns:
+            List[Trade]: Trade 객체 목록
+        """
+        return [Trade(user_id=user_id, **record) for record in self.trades]
+
+
+def _trade_record(config: BacktestConfig, side: str, price: float, timestamp: int, number: int,
+                  profit_loss: Optional[float] = None, reason: Optional[str] = None) -> Dict[str, Any]:
+    return {
+        "exchange": config.exchange,
+        "symbol": config.symbol,
+        "trade_type": "spot",
+        "order_type": "market",
+        "side": side,
+        "quantity": config.quantity,
+        "price": price,
+        "status": "filled",
+        "order_id": f"backtest-{number}-{side}",
+        "profit_loss": profit_loss,
+        "created_at": datetime.fromtimestamp(timestamp / 1000, tz=timezone.utc),
+        "extra_data": {"backtest": True, "reason": reason} if reason else {"backtest": True},
+    }
+
+
+def simulate(signals: np.ndarray, ohlcv: Dict[str, np.ndarray], config: BacktestConfig) -> BacktestResult:
+    """
+    신호 배열로 체결 시뮬레이션 (롱 전용)
+
+    신호가 난 봉의 다음 봉 시가에 체결하고, 보유 구간의 손절/익절은
+    고가/저가로 판정한다. 같은 봉에서 둘 다 닿으면 손절로 본다.
+    반복은 봉이 아니라 거래 단위로만 일어난다.
+
+    Args:
+        signals (np.ndarray): 봉별 신호 (1: 매수, -1: 매도)
+        ohlcv (Dict[str, np.ndarray]): OHLCV 배열
+        config (BacktestConfig): 체결 조건
+
+    Returns:
+        BacktestResult: 거래 레코드와 통계
+    """
+    open_, high, low = ohlcv["open"], ohlcv["high"], ohlcv["low"]
+    close, timestamps = ohlcv["close"], ohlcv["timestamp"]
+    n = len(close)
+    # 거래 단위 반복에서는 NumPy 스칼라 대신 파이썬 값을 사용
+    buys = np.flatnonzero(signals == SIGNAL_BUY).tolist()
+    sells = np.flatnonzero(signals == SIGNAL_SELL).tolist()
+    stop_loss = (config.stop_loss_percentage or 0) / 100
+    take_profit = (config.take_profit_percentage or 0) / 100
+    slippage = config.slippage
+
+    fills = []  # (진입 봉, 진입가, 청산 봉, 청산가, 사유)
+    cursor = 0
+    while True:
+        b = bisect_left(buys, cursor)
+        if b >= len(buys) or buys[b] + 1 >= n:
+            break
+        entry = buys[b] + 1
+        entry_open = float(open_[entry])
+        entry_price = entry_open * (1 + slippage)
+
+        s = bisect_left(sells, entry)
+        signal_exit = sells[s] + 1 if s < len(sells) else n
+        last = min(signal_exit, n)  # 손절/익절 감시 구간 끝 (미포함)
+
+        exit_bar = None
+        if stop_loss or take_profit:
+            sl_price = entry_price * (1 - stop_loss) if stop_loss else -np.inf
+            tp_price = entry_price * (1 + take_profit) if take_profit else np.inf
+            hit = (low[entry:last] <= sl_price) | (high[entry:last] >= tp_price)
+            j = int(hit.argmax()) if len(hit) else 0
+            if len(hit) and hit[j]:
+                exit_bar = entry + j
+                bar_open = entry_open if j == 0 else float(open_[exit_bar])
+                if low[exit_bar] <= sl_price:
+                    exit_price, reason = min(bar_open, sl_price), "stop_loss"
+                else:
+                    exit_price, reason = max(bar_open, tp_price), "take_profit"
+        if exit_bar is None:
+            if signal_exit < n:
+                exit_bar, exit_price, reason = signal_exit, float(open_[signal_exit]), "signal"
+            else:
+                exit_bar, exit_price, reason = n - 1, float(close[n - 1]), "end"
+        fills.append((entry, entry_price, exit_bar, exit_price * (1 - slippage), reason))
+        cursor = exit_bar if reason != "end" else n
+
+    trades: List[Dict[str, Any]] = []
+    profits = np.empty(len(fills))
+    quantity, fee_rate = config.quantity, config.fee_rate
+    timestamps = timestamps.tolist()
+    for number, (entry, entry_price, exit_bar, exit_price, reason) in enumerate(fills, start=1):
+        fees = (entry_price + exit_price) * quantity * fee_rate
+        profit = (exit_price - entry_price) * quantity - fees
+        profits[number - 1] = profit
+        trades.append(_trade_record(config, "buy", entry_price, timestamps[entry], number))
+        trades.append(_trade_record(config, "sell", exit_price, timestamps[exit_bar], number, profit, reason))
+
+    return BacktestResult(trades=trades, stats=_stats(profits, n))
+
+
+def _stats(profits: np.ndarray, bars: int) -> Dict[str, float]:
+    equity = np.cumsum(profits)
+    drawdown = np.maximum.accumulate(np.concatenate(([0.0], equity)))[1:] - equity if len(equity) else equity
+    return {
+        "bars": bars,
+        "trades": int(len(profits)),
+        "total_profit": float(equity[-1]) if len(equity) else 0.0,
+        "win_rate": float((profits > 0).mean()) if len(profits) else 0.0,
+        "max_drawdown": float(drawdown.max()) if len(drawdown) else 0.0,
+    }
+
+
+def run_backtest(strategy: Strategy, ohlcv, config: Optional[BacktestConfig] = None) -> BacktestResult:
+    """
+    백테스트 실행
+
+    Args:
+        strategy (Strategy): 전략 인스턴스
+        ohlcv: OHLCV 배열 딕셔너리 또는 DataFrame
+        config (BacktestConfig, optional): 체결 조건
+
+    Returns:
+        BacktestResult: 거래 레코드와 통계
+    """
+    columns = ohlcv_columns(ohlcv)
+    config = config or BacktestConfig(symbol=strategy.symbol)
+    return simulate(strategy.generate_signals(columns), columns, config)
+
+
+def backtest_setting(setting, ohlcv, **overrides) -> BacktestResult:
+    """
+    매매 설정(TradingSetting) 백테스트
+
+    Args:
+        setting (TradingSetting): 매매 설정
+        ohlcv: OHLCV 배열 딕셔너리 또는 DataFrame
+
+    Returns:
+        BacktestResult: 거래 레코드와 통계
+    """
+    strategy = create_strategy(setting.strategy_name, setting.symbol, setting.parameters)
+    return run_backtest(strategy, ohlcv, BacktestConfig.from_setting(setting, **overrides))
+
+
+# 파라미터 탐색 (프로세스 풀)
+
+_worker_ohlcv: Optional[Dict[str, np.ndarray]] = None
+
+
+def _init_worker(path: str) -> None:
+    global _worker_ohlcv
+    _worker_ohlcv = load_ohlcv(path)
+
+
+def _run_params(args) -> Dict[str, Any]:
+    strategy_name, symbol, parameters, config = args
+    strategy = create_strategy(strategy_name, symbol, parameters)
+    result = run_backtest(strategy, _worker_ohlcv, config)
+    return {"parameters": parameters, **result.stats}
+
+
+def run_sweep(
+    strategy_name: str,
+    path: str,
+    parameter_grid: Sequence[Dict[str, Any]],
+    config: Optional[BacktestConfig] = None,
+    processes: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    파라미터 조합별 백테스트를 모든 코어에 분산 실행
+
+    각 작업 프로세스는 시작할 때 OHLCV 파일을 한 번만 읽는다.
+
+    Args:
+        strategy_name (str): 전략 이름
+        path (str): OHLCV 파일 경로
+        parameter_grid (Sequence[Dict[str, Any]]): 파라미터 조합 목록
+        config (BacktestConfig, optional): 체결 조건
+        processes (int, optional): 프로세스 수 (기본값: CPU 수)
+
+    Returns:
+        List[Dict[str, Any]]: 조합별 통계 (총손익 내림차순)
+    """
+    config = config or BacktestConfig()
+    processes = processes or os.cpu_count() or 1
+    jobs = [(strategy_name, config.symbol, parameters, config) for parameters in parameter_grid]
+    chunksize = max(1, len(jobs) // (processes * 4))
+    with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker, initargs=(path,)) as pool:
+        results = list(pool.map(_run_params, jobs, chunksize=chunksize))
+    return sorted(results, key=lambda r: r["total_profit"], reverse=True)
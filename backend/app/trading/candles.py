@@ -0,0 +1,309 @@
+"""
+로컬 열 기반 OHLCV 캔들 저장소
+
+(거래소, 심볼, 봉 간격)마다 열별 바이너리 파일과 메타데이터를 둔다.
+
+    {root}/{exchange}/{symbol}/{interval}/timestamp.i8
+                                         /open.f8 ... /volume.f8
+                                         /meta.json
+
+읽기는 np.memmap 위의 슬라이스를 반환하므로 복사가 일어나지 않는다.
+메타데이터의 행 수가 커밋 기준이라 추가 도중 중단되어도 다음 추가 때 이어서 쓸 수 있다.
+파일 전체를 다시 쓸 때는 새 버전 파일(close.3.f8 등)을 모두 쓴 뒤 메타데이터의 버전을 바꿔 한 번에 커밋한다.
+"""
+
+import json
+import os
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+from .indicators import ohlcv_columns
+
+COLUMNS = {
+    "timestamp": np.int64,
+    "open": np.float64,
+    "high": np.float64,
+    "low": np.float64,
+    "close": np.float64,
+    "volume": np.float64,
+}
+EXTENSIONS = {np.int64: "i8", np.float64: "f8"}
+
+INTERVAL_MS = {
+    "minute1": 60_000,
+    "minute3": 180_000,
+    "minute5": 300_000,
+    "minute10": 600_000,
+    "minute15": 900_000,
+    "minute30": 1_800_000,
+    "minute60": 3_600_000,
+    "minute240": 14_400_000,
+    "day": 86_400_000,
+}
+
+# fetcher(symbol, interval, start_ms, end_ms) -> [start_ms, end_ms) 구간 OHLCV
+CandleFetcher = Callable[[str, str, int, int], Dict[str, np.ndarray]]
+
+
+class CandleStore:
+    def __init__(self, root: Optional[str] = None):
+        """
+        캔들 저장소 초기화
+
+        Args:
+            root (str, optional): 저장 경로 (기본값: settings.CANDLE_STORE_PATH)
+        """
+        self.root = root or settings.CANDLE_STORE_PATH
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def _path(self, exchange: str, symbol: str, interval: str) -> str:
+        return os.path.join(self.root, exchange, symbol, interval)
+
+    def _lock(self, path: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(path, threading.Lock())
+
+    @staticmethod
+    def _column_file(path: str, name: str, version: int = 0) -> str:
+        suffix = f".{version}" if version else ""
+        return os.path.join(path, f"{name}{suffix}.{EXTENSIONS[COLUMNS[name]]}")
+
+    def _read_meta(self, path: str) -> Dict:
+        try:
+            with open(os.path.join(path, "meta.json")) as f:
+                meta = json.load(f)
+        except FileNotFoundError:
+            meta = {"rows": 0, "first": None, "last": None}
+        meta.setdefault("version", 0)  # 버전이 없으면 최초 파일 이름
+        return meta
+
+    def _remove_stale(self, path: str, versions: Tuple[int, ...]) -> None:
+        keep = {os.path.basename(self._column_file(path, name, v)) for name in COLUMNS for v in versions}
+        extensions = set(EXTENSIONS.values())
+        for entry in os.listdir(path):
+            parts = entry.split(".")
+            if parts[0] in COLUMNS and parts[-1] in extensions and entry not in keep:
+                os.remove(os.path.join(path, entry))
+
+    def _write_meta(self, path: str, meta: Dict) -> None:
+        tmp = os.path.join(path, "meta.json.tmp")
+        with open(tmp, "w") as f:
+            json.dump(meta, f)
+        os.replace(tmp, os.path.join(path, "meta.json"))
+
+    def rows(self, exchange: str, symbol: str, interval: str) -> int:
+        """저장된 행 수"""
+        return self._read_meta(self._path(exchange, symbol, interval))["rows"]
+
+    def last_timestamp(self, exchange: str, symbol: str, interval: str) -> Optional[int]:
+        """마지막 캔들 시각 (밀리초)"""
+        return self._read_meta(self._path(exchange, symbol, interval))["last"]
+
+    def append(self, exchange: str, symbol: str, interval: str, candles) -> int:
+        """
+        캔들 추가
+
+        마지막 저장 시각 이후의 캔들만 시간순으로 추가한다 (중복/과거 데이터는 무시).
+
+        Args:
+            exchange (str): 거래소
+            symbol (str): 심볼
+            interval (str): 봉 간격 (예: minute1)
+            candles: OHLCV 배열 딕셔너리 또는 DataFrame
+
+        Returns:
+            int: 추가된 행 수
+        """
+        columns = ohlcv_columns(candles)
+        timestamps = columns["timestamp"].astype(np.int64)
+        order = np.argsort(timestamps, kind="stable")
+        timestamps = timestamps[order]
+        keep = np.ones(len(timestamps), dtype=bool)
+        keep[1:] = timestamps[1:] != timestamps[:-1]
+
+        path = self._path(exchange, symbol, interval)
+        with self._lock(path):
+            os.makedirs(path, exist_ok=True)
+            meta = self._read_meta(path)
+            if meta["last"] is not None:
+                keep &= timestamps > meta["last"]
+            if not keep.any():
+                return 0
+            count = int(keep.sum())
+            for name, dtype in COLUMNS.items():
+                values = timestamps if name == "timestamp" else columns[name][order]
+                file_path = self._column_file(path, name, meta["version"])
+                with open(file_path, "ab") as f:
+                    # 커밋되지 않은 꼬리 데이터 제거 후 추가
+                    f.truncate(meta["rows"] * np.dtype(dtype).itemsize)
+                    f.write(np.ascontiguousarray(values[keep], dtype=dtype).tobytes())
+            meta = {
+                "rows": meta["rows"] + count,
+                "first": meta["first"] if meta["first"] is not None else int(timestamps[keep][0]),
+                "last": int(timestamps[keep][-1]),
+                "version": meta["version"],
+            }
+            self._write_meta(path, meta)
+            return count
+
+    def read(
+        self,
+        exchange: str,
+        symbol: str,
+        interval: str,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        시간 구간 캔들 조회 (메모리 매핑, 복사 없음)
+
+        Args:
+            exchange (str): 거래소
+            symbol (str): 심볼
+            interval (str): 봉 간격
+            start (int, optional): 시작 시각 (밀리초, 포함)
+            end (int, optional): 종료 시각 (밀리초, 미포함)
+
+        Returns:
+            Dict[str, np.ndarray]: 열 이름별 읽기 전용 배열 (backtest.simulate 입력 형식)
+        """
+        path = self._path(exchange, symbol, interval)
+        meta = self._read_meta(path)
+        rows = meta["rows"]
+        if not rows:
+            return {name: np.empty(0, dtype=dtype) for name, dtype in COLUMNS.items()}
+        columns = {
+            name: np.memmap(self._column_file(path, name, meta["version"]), dtype=dtype, mode="r", shape=(rows,))
+            for name, dtype in COLUMNS.items()
+        }
+        timestamps = columns["timestamp"]
+        lo = 0 if start is None else int(np.searchsorted(timestamps, start, side="left"))
+        hi = rows if end is None else int(np.searchsorted(timestamps, end, side="left"))
+        return {name: values[lo:hi] for name, values in columns.items()}
+
+    def find_gaps(self, exchange: str, symbol: str, interval: str) -> List[Tuple[int, int]]:
+        """
+        누락 구간 탐지
+
+        Returns:
+            List[Tuple[int, int]]: 누락된 [시작, 끝) 시각 목록 (밀리초)
+        """
+        step = INTERVAL_MS[interval]
+        timestamps = self.read(exchange, symbol, interval)["timestamp"]
+        if len(timestamps) < 2:
+            return []
+        holes = np.flatnonzero(np.diff(timestamps) > step)
+        return [(int(timestamps[i]) + step, int(timestamps[i + 1])) for i in holes]
+
+    def backfill(
+        self,
+        fetcher: CandleFetcher,
+        exchange: str,
+        symbol: str,
+        interval: str,
+        start: int,
+        end: int,
+        batch: int = 200,
+    ) -> int:
+        """
+        구간 캔들 내려받기 (이어받기 지원)
+
+        저장된 마지막 시각 이후부터 batch개 단위로 받아 매번 커밋하므로,
+        중단되면 같은 호출로 이어서 받을 수 있다.
+
+        Args:
+            fetcher (CandleFetcher): 캔들 조회 함수
+            exchange (str): 거래소
+            symbol (str): 심볼
+            interval (str): 봉 간격
+            start (int): 시작 시각 (밀리초, 포함)
+            end (int): 종료 시각 (밀리초, 미포함)
+            batch (int): 한 번에 요청할 봉 수
+
+        Returns:
+            int: 추가된 행 수
+        """
+        step = INTERVAL_MS[interval]
+        last = self.last_timestamp(exchange, symbol, interval)
+        cursor = max(start, last + step) if last is not None else start
+        added = 0
+        while cursor < end:
+            window_end = min(cursor + batch * step, end)
+            added += self.append(exchange, symbol, interval, fetcher(symbol, interval, cursor, window_end))
+            cursor = window_end
+        return added
+
+    def fill_gaps(self, fetcher: CandleFetcher, exchange: str, symbol: str, interval: str) -> int:
+        """
+        누락 구간 채우기
+
+        누락 구간을 받아 기존 데이터와 합친 뒤 다음 버전 파일로 다시 쓰고,
+        메타데이터의 버전을 바꿔 모든 열을 한 번에 커밋한다.
+        중단되면 메타데이터가 이전 버전을 그대로 가리키므로 열이 어긋나지 않는다.
+
+        Returns:
+            int: 추가된 행 수
+        """
+        gaps = self.find_gaps(exchange, symbol, interval)
+        fetched = [ohlcv_columns(fetcher(symbol, interval, lo, hi)) for lo, hi in gaps]
+        fetched = [columns for columns in fetched if len(columns["timestamp"])]
+        if not fetched:
+            return 0
+        path = self._path(exchange, symbol, interval)
+        with self._lock(path):
+            current = self.read(exchange, symbol, interval)
+            merged = {
+                name: np.concatenate([np.asarray(current[name])] + [c[name].astype(dtype) for c in fetched])
+                for name, dtype in COLUMNS.items()
+            }
+            before = len(current["timestamp"])
+            del current
+            version = self._read_meta(path)["version"]
+            order = np.argsort(merged["timestamp"], kind="stable")
+            timestamps = merged["timestamp"][order]
+            keep = np.ones(len(timestamps), dtype=bool)
+            keep[1:] = timestamps[1:] != timestamps[:-1]
+            for name, dtype in COLUMNS.items():
+                merged[name][order][keep].astype(dtype).tofile(self._column_file(path, name, version + 1))
+            rows = int(keep.sum())
+            self._write_meta(path, {
+                "rows": rows, "first": int(timestamps[0]), "last": int(timestamps[-1]), "version": version + 1,
+            })
+            # 직전 버전은 메타데이터를 먼저 읽은 조회가 열 수 있도록 남긴다
+            self._remove_stale(path, (version, version + 1))
+            return rows - before
+
+
+def upbit_fetcher(symbol: str, interval: str, start: int, end: int) -> Dict[str, np.ndarray]:
+    """
+    pyupbit 기반 캔들 조회 (종료 시각부터 과거로 페이지 단위 조회)
+
+    Args:
+        symbol (str): 심볼 (예: KRW-BTC)
+        interval (str): 봉 간격 (pyupbit 표기)
+        start (int): 시작 시각 (밀리초, 포함)
+        end (int): 종료 시각 (밀리초, 미포함)
+
+    Returns:
+        Dict[str, np.ndarray]: OHLCV 배열
+    """
+    import pandas as pd
+    import pyupbit
+
+    step = INTERVAL_MS[interval]
+    count = min(200, max(1, -(-(end - start) // step)))
+    to = pd.Timestamp(end, unit="ms")  # 업비트 to 파라미터는 UTC 기준 (미포함)
+    frame = pyupbit.get_ohlcv(symbol, interval=interval, count=count, to=to)
+    if frame is None or frame.empty:
+        return {name: np.empty(0, dtype=dtype) for name, dtype in COLUMNS.items()}
+    index = pd.DatetimeIndex(frame.index).tz_localize("Asia/Seoul").tz_convert("UTC")
+    timestamps = (index.asi8 // 1_000_000).astype(np.int64)
+    mask = (timestamps >= start) & (timestamps < end)
+    result = {"timestamp": timestamps[mask]}
+    for name in ("open", "high", "low", "close", "volume"):
+        result[name] = frame[name].to_numpy(dtype=np.float64)[mask]
+    return result
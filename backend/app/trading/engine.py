@@ -0,0 +1,237 @@
+"""
+이벤트 기반 매매 엔진
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.metrics import Counter, Histogram
+from app.models.user import TradingSetting
+from .market_data.store import MarketDataStore, TICKER_PRICE, TICKER_TIMESTAMP
+from .strategy import Strategy, create_strategy
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Decision:
+    """전략이 낸 매매 결정"""
+    setting_id: int
+    user_id: Optional[int]
+    exchange: str
+    symbol: str
+    side: str
+    price: float
+    timestamp: float
+
+
+@dataclass
+class StrategySlot:
+    """엔진에 등록된 매매 설정"""
+    setting_id: int
+    user_id: Optional[int]
+    exchange: str
+    symbol: str
+    strategy: Strategy
+
+
+OrderExecutor = Callable[[Decision], Awaitable[Any]]
+
+
+class TradingEngine:
+    def __init__(
+        self,
+        store: MarketDataStore,
+        executor: Optional[OrderExecutor] = None,
+        exchange_concurrency: Optional[Dict[str, int]] = None,
+        max_pending_orders: Optional[int] = None,
+    ):
+        """
+        매매 엔진 초기화
+
+        설정마다 폴링 루프를 두지 않고, 시세 저장소 갱신 이벤트가 오면
+        해당 심볼에 등록된 전략만 평가한다. 거래소 호출은 거래소별 세마포어로 제한한다.
+
+        Args:
+            store (MarketDataStore): 시세 저장소
+            executor (OrderExecutor, optional): 매매 결정을 실행할 코루틴 함수 (없으면 결정만 기록)
+            exchange_concurrency (Dict[str, int], optional): 거래소별 최대 동시 호출 수
+            max_pending_orders (int, optional): 대기 가능한 최대 주문 작업 수
+        """
+        self.store = store
+        self.executor = executor
+        concurrency = exchange_concurrency or settings.ENGINE_EXCHANGE_CONCURRENCY
+        self._semaphores = {name: asyncio.Semaphore(limit) for name, limit in concurrency.items()}
+        self._default_concurrency = settings.ENGINE_DEFAULT_EXCHANGE_CONCURRENCY
+        self.max_pending_orders = max_pending_orders or settings.ENGINE_MAX_PENDING_ORDERS
+        self._slots: Dict[int, StrategySlot] = {}
+        self._by_symbol: Dict[str, List[StrategySlot]] = {}
+        self._dirty: Dict[str, float] = {}
+        self._wakeup = asyncio.Event()
+        self._running = False
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._order_tasks: Set[asyncio.Task] = set()
+
+        self.tick_latency = Histogram("engine_tick_latency_seconds", "시세 갱신부터 전략 평가 완료까지 걸린 시간")
+        self.decisions = Counter("engine_decisions_total", "전략 평가 횟수")
+        self.signals = Counter("engine_signals_total", "매매 신호 수")
+        self.dropped_signals = Counter("engine_dropped_signals_total", "대기열 초과로 버린 매매 신호 수")
+        self.order_errors = Counter("engine_order_errors_total", "주문 실행 오류 수")
+
+    def add_setting(self, setting: TradingSetting) -> bool:
+        """
+        매매 설정 등록
+
+        Args:
+            setting (TradingSetting): 매매 설정
+
+        Returns:
+            bool: 등록 성공 여부
+        """
+        try:
+            strategy = create_strategy(setting.strategy_name, setting.symbol, setting.parameters)
+        except (ValueError, TypeError, KeyError) as e:
+            logger.warning("매매 설정 %s 등록 실패: %s", setting.id, e)
+            return False
+        self.remove_setting(setting.id)
+        slot = StrategySlot(setting.id, setting.user_id, setting.exchange, setting.symbol, strategy)
+        self._slots[setting.id] = slot
+        self._by_symbol.setdefault(setting.symbol, []).append(slot)
+        return True
+
+    def remove_setting(self, setting_id: int) -> None:
+        """
+        매매 설정 제거
+
+        Args:
+            setting_id (int): 매매 설정 ID
+        """
+        slot = self._slots.pop(setting_id, None)
+        if slot is None:
+            return
+        slots = self._by_symbol[slot.symbol]
+        slots.remove(slot)
+        if not slots:
+            del self._by_symbol[slot.symbol]
+
+    def load_settings(self, db: Session) -> int:
+        """
+        활성화된 매매 설정 전체 로드
+
+        Args:
+            db (Session): 데이터베이스 세션
+
+        Returns:
+            int: 등록된 설정 수
+        """
+        return self.add_settings(db.query(TradingSetting).filter(TradingSetting.is_active == True).all())
+
+    def add_settings(self, settings_: Iterable[TradingSetting]) -> int:
+        """여러 매매 설정 등록"""
+        return sum(1 for setting in settings_ if self.add_setting(setting))
+
+    @property
+    def symbols(self) -> List[str]:
+        """전략이 등록된 심볼 목록"""
+        return list(self._by_symbol)
+
+    def _on_market_data(self, kind: str, symbol: str) -> None:
+        # 같은 심볼의 연속 갱신은 하나로 합쳐 최신 가격으로 한 번만 평가
+        if kind != "ticker" or symbol not in self._by_symbol:
+            return
+        self._dirty.setdefault(symbol, time.perf_counter())
+        self._wakeup.set()
+
+    async def _dispatch(self) -> None:
+        while self._running:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            dirty, self._dirty = self._dirty, {}
+            for symbol, received_at in dirty.items():
+                self._evaluate(symbol)
+                self.tick_latency.observe(time.perf_counter() - received_at)
+            # 이벤트 폭주 시에도 다른 코루틴(수신, 주문)이 실행되도록 양보
+            await asyncio.sleep(0)
+
+    def _evaluate(self, symbol: str) -> None:
+        index = self.store.symbol_index(symbol)
+        row = self.store.tickers[index]
+        price, timestamp = float(row[TICKER_PRICE]), float(row[TICKER_TIMESTAMP])
+        for slot in self._by_symbol.get(symbol, ()):
+            self.decisions.inc()
+            try:
+                side = slot.strategy.on_tick(price, timestamp)
+            except Exception:
+                logger.exception("전략 평가 실패 (설정 %s)", slot.setting_id)
+                continue
+            if side:
+                self.signals.inc()
+                self._submit(Decision(slot.setting_id, slot.user_id, slot.exchange, symbol, side, price, timestamp))
+
+    def _submit(self, decision: Decision) -> None:
+        if self.executor is None:
+            return
+        if len(self._order_tasks) >= self.max_pending_orders:
+            self.dropped_signals.inc()
+            logger.debug("주문 대기열 초과로 신호를 버립니다 (설정 %s)", decision.setting_id)
+            return
+        task = asyncio.create_task(self._execute(decision))
+        self._order_tasks.add(task)
+        task.add_done_callback(self._order_tasks.discard)
+
+    def _semaphore(self, exchange: str) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(exchange)
+        if semaphore is None:
+            semaphore = self._semaphores[exchange] = asyncio.Semaphore(self._default_concurrency)
+        return semaphore
+
+    async def _execute(self, decision: Decision) -> None:
+        async with self._semaphore(decision.exchange):
+            try:
+                await self.executor(decision)
+            except Exception:
+                self.order_errors.inc()
+                logger.exception("주문 실행 실패 (설정 %s)", decision.setting_id)
+
+    async def start(self) -> None:
+        """엔진 시작 (시세 저장소 구독)"""
+        if self._running:
+            return
+        self._running = True
+        self.store.add_listener(self._on_market_data)
+        self._dispatcher = asyncio.create_task(self._dispatch())
+
+    async def stop(self) -> None:
+        """엔진 종료 (진행 중인 주문 작업 완료 대기)"""
+        if not self._running:
+            return
+        self._running = False
+        self.store.remove_listener(self._on_market_data)
+        self._wakeup.set()
+        await self._dispatcher
+        if self._order_tasks:
+            await asyncio.gather(*self._order_tasks, return_exceptions=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        엔진 통계 조회
+
+        Returns:
+            Dict[str, Any]: 등록 설정 수, 평가/신호 수, 틱 지연 요약
+        """
+        return {
+            "settings": len(self._slots),
+            "symbols": len(self._by_symbol),
+            "decisions": int(self.decisions.value),
+            "signals": int(self.signals.value),
+            "dropped_signals": int(self.dropped_signals.value),
+            "order_errors": int(self.order_errors.value),
+            "pending_orders": len(self._order_tasks),
+            "tick_latency": self.tick_latency.snapshot(),
+        }
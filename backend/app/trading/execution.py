@@ -0,0 +1,627 @@
+"""
+주문 실행 파이프라인
+
+주문마다 클라이언트 주문 ID(멱등 키)를 정해 대기(pending) 주문 행을 먼저 기록하고 거래소에 보낸다.
+같은 ID로 다시 제출하면 새 주문을 내지 않고 기존 주문을 돌려주며 (같은 ID의 제출이 동시에 들어오면 나중 제출은
+먼저 들어온 제출이 주문 행을 기록할 때까지 기다렸다가 그 주문을 돌려줌), 접수 응답이 유실되면
+같은 ID로 거래소 주문을 조회해 중복 주문 없이 상태를 맞춘다. 프로세스 사이의 중복 제출은 주문 행과 같은
+트랜잭션에 쓰는 order_keys 행(client_order_id 기본 키)이 막고, 늦게 기록하려던 쪽은 먼저 기록된 주문을 돌려준다.
+제출 전에 위험 관리 엔진이 메모리의 한도로 주문을 검사하고, 통과한 수량은 체결/종료 전까지 예약한다.
+체결은 거래소 주문 스트림(업비트 myOrder, 바이낸스 executionReport)으로 추적하고,
+스트림 소식이 poll_interval 넘게 없는 주문은 묶어서 조회한다.
+
+주문 행(client_order_id가 있는 trades 행)은 pending → open/partially_filled → completed/canceled/rejected로
+바뀌고, 체결은 새로 체결된 수량마다 status="filled" 행을 원장에 추가한다. 포트폴리오 장부와 스냅샷 재생은
+filled 행만 반영하므로, 스냅샷 뒤에 주문 행이 바뀌어도 체결이 빠지거나 두 번 반영되지 않는다.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.metrics import Counter, Histogram
+from app.core.pubsub import StreamHub, stream_hub
+from app.models.user import OrderKey, Trade
+from app.services.exchange_service import (
+    CANCELED, FILLED, MARKET, OPEN, PARTIALLY_FILLED, REJECTED,
+    ExchangeConnector, ExchangeRequestError, ExchangeResponseError, ExchangeRouter, Order,
+)
+from app.services.notification_service import ERROR, TRADE, NotificationDispatcher, notification_dispatcher
+from .ledger import AsyncTradeLedger
+from .portfolio import EPSILON, PortfolioBook, portfolio_book
+from .risk_management import RiskEngine, RiskLimitError, risk_engine
+from .streams import orders_topic
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+COMPLETED = "completed"
+FINAL_STATUSES = frozenset({COMPLETED, CANCELED, REJECTED})
+
+ORDER_ACK_LATENCY = Histogram("order_ack_latency_seconds", "주문 제출부터 거래소 접수 응답까지 걸린 시간")
+ORDER_FILL_LATENCY = Histogram("order_fill_latency_seconds", "주문 제출부터 전량 체결까지 걸린 시간")
+ORDER_STATUS_POLLS = Counter("order_status_polls_total", "스트림 대신 조회로 확인한 주문 수")
+
+SessionFactory = Callable[[], AsyncSession]
+
+
+class ExecutionError(Exception):
+    """주문 실행 실패 (거래소 거절, 잘못된 주문)"""
+    pass
+
+
+def new_client_order_id() -> str:
+    """클라이언트 주문 ID 생성 (업비트 identifier, 바이낸스 newClientOrderId 길이 제한 이내)"""
+    return uuid.uuid4().hex
+
+
+@dataclass
+class OrderTicket:
+    """실행 중인 주문 상태"""
+    client_order_id: str
+    user_id: int
+    exchange: str
+    symbol: str
+    side: str
+    order_type: str
+    quantity: Optional[float] = None
+    price: Optional[float] = None
+    amount: Optional[float] = None
+    status: str = PENDING
+    order_id: Optional[str] = None
+    filled_quantity: float = 0.0
+    filled_funds: float = 0.0  # 체결 금액 합계 (호가 화폐)
+    error: Optional[str] = None
+    trade_id: Optional[int] = None
+    reserved: float = field(default=0.0, repr=False)  # 위험 관리 엔진에 예약한 미체결 수량
+    created_at: Optional[datetime] = None
+    submitted_at: Optional[float] = field(default_factory=time.perf_counter, repr=False)  # 재시작 후 불러온 주문은 None
+    updated_at: float = field(default_factory=time.monotonic, repr=False)
+    in_flight: bool = field(default=False, repr=False)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False, compare=False)
+    finished: asyncio.Event = field(default_factory=asyncio.Event, repr=False, compare=False)
+
+    @property
+    def final(self) -> bool:
+        return self.status in FINAL_STATUSES
+
+    @property
+    def average_price(self) -> Optional[float]:
+        return self.filled_funds / self.filled_quantity if self.filled_quantity else None
+
+    def extra_data(self) -> Dict[str, Any]:
+        """주문 행 extra_data"""
+        return {
+            "amount": self.amount,
+            "filled_quantity": self.filled_quantity,
+            "filled_funds": self.filled_funds,
+            "error": self.error,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """orders:{user_id} 토픽 발행 내용"""
+        return {
+            "exchange": self.exchange,
+            "symbol": self.symbol,
+            "side": self.side,
+            "order_type": self.order_type,
+            "quantity": self.quantity,
+            "price": self.price,
+            "amount": self.amount,
+            "status": self.status,
+            "order_id": self.order_id,
+            "filled_quantity": self.filled_quantity,
+            "average_price": self.average_price,
+            "error": self.error,
+        }
+
+    @classmethod
+    def from_row(cls, row: Trade) -> "OrderTicket":
+        """저장된 주문 행으로 복원"""
+        extra = row.extra_data or {}
+        return cls(
+            client_order_id=row.client_order_id,
+            user_id=row.user_id,
+            exchange=row.exchange,
+            symbol=row.symbol,
+            side=row.side,
+            order_type=row.order_type,
+            quantity=row.quantity,
+            price=row.price,
+            amount=extra.get("amount"),
+            status=row.status,
+            order_id=row.order_id,
+            filled_quantity=extra.get("filled_quantity") or 0.0,
+            filled_funds=extra.get("filled_funds") or 0.0,
+            error=extra.get("error"),
+            trade_id=row.id,
+            created_at=row.created_at,
+            submitted_at=None,
+        )
+
+
+class ExecutionPipeline:
+    def __init__(
+        self,
+        router: ExchangeRouter,
+        session_factory: SessionFactory,
+        hub: Optional[StreamHub] = None,
+        book: Optional[PortfolioBook] = None,
+        poll_interval: Optional[float] = None,
+        poll_batch: Optional[int] = None,
+        risk: Optional[RiskEngine] = None,
+        notifier: Optional[NotificationDispatcher] = None,
+    ):
+        """
+        주문 실행 파이프라인 초기화
+
+        Args:
+            router (ExchangeRouter): 계정 인증 정보를 가진 거래소별 커넥터
+            session_factory (SessionFactory): 비동기 세션 생성 함수
+            hub (StreamHub, optional): 주문 상태를 발행할 허브 (기본값: stream_hub)
+            book (PortfolioBook, optional): 체결을 반영할 장부 (기본값: portfolio_book)
+            poll_interval (float, optional): 조회 확인 주기 (초, 기본값: settings.EXECUTION_POLL_INTERVAL)
+            poll_batch (int, optional): 한 번에 동시 조회할 주문 수 (기본값: settings.EXECUTION_POLL_BATCH)
+            risk (RiskEngine, optional): 사전 주문 검사에 쓸 위험 관리 엔진 (기본값: risk_engine)
+            notifier (NotificationDispatcher, optional): 체결/거절 알림 발송기 (기본값: notification_dispatcher)
+        """
+        self.router = router
+        self.session_factory = session_factory
+        self.hub = hub if hub is not None else stream_hub
+        self.book = book if book is not None else portfolio_book
+        self.risk = risk if risk is not None else risk_engine
+        self.notifier = notifier if notifier is not None else notification_dispatcher
+        self.poll_interval = poll_interval or settings.EXECUTION_POLL_INTERVAL
+        self.poll_batch = poll_batch or settings.EXECUTION_POLL_BATCH
+        self.max_recent = settings.EXECUTION_RECENT_ORDERS
+        self.streamed_updates = 0
+        self.polled_updates = 0
+        self._active: Dict[str, OrderTicket] = {}
+        self._recent: "OrderedDict[str, OrderTicket]" = OrderedDict()
+        self._by_order_id: Dict[Tuple[str, str], str] = {}
+        self._submitting: Dict[str, asyncio.Future] = {}  # 주문 행을 기록 중인 클라이언트 주문 ID
+        self._tasks: List[asyncio.Task] = []
+
+    def get(self, client_order_id: str) -> Optional[OrderTicket]:
+        """메모리에 있는 주문 조회 (진행 중 또는 최근 완료)"""
+        return self._active.get(client_order_id) or self._recent.get(client_order_id)
+
+    async def submit(
+        self,
+        user_id: int,
+        exchange: str,
+        symbol: str,
+        side: str,
+        order_type: str = MARKET,
+        quantity: Optional[float] = None,
+        price: Optional[float] = None,
+        amount: Optional[float] = None,
+        client_order_id: Optional[str] = None,
+    ) -> OrderTicket:
+        """
+        주문 제출
+
+        대기 주문 행을 기록한 뒤 거래소에 보내고 접수 응답까지 기다린다. 체결은 백그라운드에서 추적한다.
+
+        Args:
+            user_id (int): 사용자 ID
+            exchange (str): 거래소
+            symbol (str): 표준 심볼
+            side (str): "buy" 또는 "sell"
+            order_type (str): "market" 또는 "limit"
+            quantity (float, optional): 주문 수량
+            price (float, optional): 지정가
+            amount (float, optional): 시장가 매수 총액
+            client_order_id (str, optional): 멱등 키 (이미 제출된 ID면 기존 주문을 반환, 없으면 생성)
+
+        Returns:
+            OrderTicket: 주문 상태 (접수 응답이 유실돼 확인하지 못했으면 pending)
+
+        Raises:
+            ExecutionError: 위험 한도를 넘었거나 거래소가 주문을 거절했거나 주문 파라미터가 잘못된 경우
+        """
+        connector = self.router[exchange]
+        if client_order_id is None:
+            ticket = await self._open(
+                new_client_order_id(), user_id, exchange, symbol, side, order_type, quantity, price, amount,
+            )
+        else:
+            ticket = await self._existing(client_order_id)
+            if ticket is not None:
+                return ticket
+            # 첫 await 전에 등록해 같은 ID의 동시 제출이 이 제출을 기다리게 함
+            submitting = self._submitting[client_order_id] = asyncio.get_running_loop().create_future()
+            try:
+                ticket = await self._load(client_order_id)
+                if ticket is not None:
+                    return ticket
+                try:
+                    ticket = await self._open(
+                        client_order_id, user_id, exchange, symbol, side, order_type, quantity, price, amount,
+                    )
+                except IntegrityError:
+                    # 다른 워커/프로세스가 같은 ID를 먼저 기록함 (order_keys 기본 키): 그쪽이 내고 추적하는 주문을 반환
+                    ticket = await self._load(client_order_id, track=False)
+                    if ticket is None:
+                        raise
+                    return ticket
+            finally:
+                del self._submitting[client_order_id]
+                submitting.set_result(None)
+
+        ticket.in_flight = True
+        try:
+            order = await connector.place_order(
+                symbol, side, order_type, quantity=quantity, price=price, amount=amount,
+                client_order_id=ticket.client_order_id,
+            )
+        except (ExchangeResponseError, ValueError) as e:
+            await self._reject(ticket, str(e))
+            raise ExecutionError(f"주문 실패 ({ticket.client_order_id}): {e}") from e
+        except ExchangeRequestError as e:
+            logger.warning("주문 접수 응답 유실, 거래소 조회로 확인합니다 (%s): %s", ticket.client_order_id, e)
+            order = await self._reconcile(connector, ticket)
+        finally:
+            ticket.in_flight = False
+
+        if order is not None:
+            ORDER_ACK_LATENCY.observe(time.perf_counter() - ticket.submitted_at)
+            await self._apply(ticket, order)
+        return ticket
+
+    async def _existing(self, client_order_id: str) -> Optional[OrderTicket]:
+        # 같은 ID를 기록 중인 제출이 있으면 끝날 때까지 기다린 뒤 다시 확인 (실패했으면 None)
+        while True:
+            ticket = self.get(client_order_id)
+            if ticket is not None:
+                return ticket
+            submitting = self._submitting.get(client_order_id)
+            if submitting is None:
+                return None
+            await asyncio.shield(submitting)
+
+    async def _open(
+        self,
+        client_order_id: str,
+        user_id: int,
+        exchange: str,
+        symbol: str,
+        side: str,
+        order_type: str,
+        quantity: Optional[float],
+        price: Optional[float],
+        amount: Optional[float],
+    ) -> OrderTicket:
+        # 위험 한도 검사와 예약, 대기 주문 행 기록, 추적 시작
+        try:
+            reserved = self.risk.check(user_id, exchange, symbol, side, quantity=quantity, amount=amount, price=price)
+        except RiskLimitError as e:
+            raise ExecutionError(f"주문 거절: {e}") from e
+        ticket = OrderTicket(client_order_id, user_id, exchange, symbol, side, order_type, quantity, price, amount)
+        if reserved:
+            self.risk.reserve(user_id, exchange, symbol, side, reserved)
+            ticket.reserved = reserved
+        try:
+            await self._insert(ticket)
+        except Exception:
+            self._release(ticket, ticket.reserved)
+            raise
+        self._track(ticket)
+        self._publish(ticket)
+        return ticket
+
+    async def wait(self, client_order_id: str, timeout: Optional[float] = None) -> OrderTicket:
+        """
+        주문이 완료(체결 완료, 취소, 거절)될 때까지 대기
+
+        Args:
+            client_order_id (str): 클라이언트 주문 ID
+            timeout (float, optional): 최대 대기 시간 (초)
+
+        Returns:
+            OrderTicket: 완료된 주문
+        """
+        ticket = self.get(client_order_id)
+        if ticket is None:
+            raise KeyError(f"추적 중인 주문이 아닙니다: {client_order_id}")
+        await asyncio.wait_for(ticket.finished.wait(), timeout)
+        return ticket
+
+    async def _reconcile(self, connector: ExchangeConnector, ticket: OrderTicket) -> Optional[Order]:
+        try:
+            return await connector.get_order(ticket.symbol, client_order_id=ticket.client_order_id)
+        except ExchangeResponseError as e:
+            await self._reject(ticket, "거래소에 접수되지 않은 주문입니다")
+            raise ExecutionError(f"주문 실패 ({ticket.client_order_id}): 거래소에 접수되지 않았습니다") from e
+        except ExchangeRequestError:
+            return None  # 접수 여부를 아직 모름: 조회 주기에 다시 확인
+
+    # 상태 반영
+
+    def _match(self, exchange: str, order: Order) -> Optional[OrderTicket]:
+        client_order_id = order.client_order_id or self._by_order_id.get((exchange, order.order_id))
+        ticket = self._active.get(client_order_id) if client_order_id else None
+        return ticket if ticket is not None and ticket.exchange == exchange else None
+
+    def _new_fills(self, ticket: OrderTicket, order: Order) -> List[Dict[str, Any]]:
+        # 누적 체결 수량/평균가에서 직전 반영분을 빼 이번 체결분만 원장에 추가
+        if order.filled_quantity <= ticket.filled_quantity + EPSILON:
+            return []
+        quantity = order.filled_quantity - ticket.filled_quantity
+        if order.average_price is not None:
+            funds = order.filled_quantity * order.average_price
+        else:
+            funds = ticket.filled_funds + quantity * (order.price or ticket.price or 0.0)
+        price = (funds - ticket.filled_funds) / quantity
+        ticket.filled_quantity, ticket.filled_funds = order.filled_quantity, funds
+        return [{
+            "user_id": ticket.user_id,
+            "exchange": ticket.exchange,
+            "symbol": ticket.symbol,
+            "trade_type": "spot",
+            "order_type": ticket.order_type,
+            "side": ticket.side,
+            "quantity": quantity,
+            "price": price,
+            "status": FILLED,
+            "order_id": order.order_id,
+            "extra_data": {"client_order_id": ticket.client_order_id, "order_trade_id": ticket.trade_id},
+        }]
+
+    @staticmethod
+    def _status(ticket: OrderTicket, order: Order) -> str:
+        # 업비트 시장가 매수는 남은 금액이 최소 단위보다 작으면 cancel 상태로 끝남
+        if order.status == FILLED or (order.status == CANCELED and order.order_type == MARKET and ticket.filled_quantity > EPSILON):
+            return COMPLETED
+        if order.status in (CANCELED, REJECTED):
+            return order.status
+        return PARTIALLY_FILLED if ticket.filled_quantity > EPSILON else OPEN
+
+    async def _apply(self, ticket: OrderTicket, order: Order) -> bool:
+        async with ticket.lock:
+            if ticket.final:
+                return False
+            ticket.updated_at = time.monotonic()
+            if ticket.order_id is None:
+                ticket.order_id = order.order_id
+                self._by_order_id[(ticket.exchange, order.order_id)] = ticket.client_order_id
+            fills = self._new_fills(ticket, order)
+            status = self._status(ticket, order)
+            if status == ticket.status and not fills:
+                return False
+            ticket.status = status
+            await self._save(ticket, fills)
+            if fills:
+                self._release(ticket, sum(fill["quantity"] for fill in fills))
+            self._publish(ticket)
+            if ticket.final:
+                self._finish(ticket)
+            return True
+
+    async def _reject(self, ticket: OrderTicket, error: str) -> None:
+        async with ticket.lock:
+            if ticket.final:
+                return
+            ticket.status, ticket.error = REJECTED, error
+            await self._save(ticket, [])
+            self._publish(ticket)
+            self._finish(ticket)
+
+    # 저장/발행
+
+    async def _insert(self, ticket: OrderTicket) -> None:
+        ticket.created_at = datetime.now(timezone.utc)
+        async with self.session_factory() as db:
+            row = Trade(
+                user_id=ticket.user_id,
+                exchange=ticket.exchange,
+                symbol=ticket.symbol,
+                trade_type="spot",
+                order_type=ticket.order_type,
+                side=ticket.side,
+                quantity=ticket.quantity,
+                price=ticket.price,
+                status=ticket.status,
+                client_order_id=ticket.client_order_id,
+                created_at=ticket.created_at,
+                extra_data=ticket.extra_data(),
+            )
+            db.add(row)
+            if ticket.client_order_id is not None:
+                db.add(OrderKey(client_order_id=ticket.client_order_id, created_at=ticket.created_at))
+            await db.flush()
+            ticket.trade_id = row.id
+            await db.commit()
+
+    async def _save(self, ticket: OrderTicket, fills: List[Dict[str, Any]]) -> None:
+        async with self.session_factory() as db:
+            await db.execute(
+                update(Trade)
+                .where(Trade.id == ticket.trade_id, Trade.created_at == ticket.created_at)  # 파티션 프루닝
+                .values(status=ticket.status, order_id=ticket.order_id, extra_data=ticket.extra_data())
+            )
+            if fills:
+                await AsyncTradeLedger(db, self.book).record_fills(fills)  # 주문 행 갱신과 함께 커밋
+            else:
+                await db.commit()
+
+    async def _load(self, client_order_id: str, track: bool = True) -> Optional[OrderTicket]:
+        async with self.session_factory() as db:
+            row = await db.scalar(select(Trade).where(Trade.client_order_id == client_order_id).limit(1))
+        if row is None:
+            return None
+        ticket = OrderTicket.from_row(row)
+        if not track:
+            return ticket
+        if ticket.final:
+            ticket.finished.set()
+            self._remember(ticket)
+        else:
+            self._track(ticket)
+        return ticket
+
+    async def resume(self) -> int:
+        """
+        완료되지 않은 주문 행을 불러와 다시 추적 (재시작 후)
+
+        Returns:
+            int: 추적을 재개한 주문 수
+        """
+        async with self.session_factory() as db:
+            rows = await db.scalars(
+                select(Trade).where(Trade.client_order_id.is_not(None), Trade.status.in_((PENDING, OPEN, PARTIALLY_FILLED)))
+            )
+            tickets = [OrderTicket.from_row(row) for row in rows]
+        for ticket in tickets:
+            if ticket.client_order_id not in self._active:
+                ticket.updated_at -= self.poll_interval  # 다음 조회 주기에 바로 확인
+                self._track(ticket)
+        return len(tickets)
+
+    def _track(self, ticket: OrderTicket) -> None:
+        self._active[ticket.client_order_id] = ticket
+        if ticket.order_id is not None:
+            self._by_order_id[(ticket.exchange, ticket.order_id)] = ticket.client_order_id
+
+    def _remember(self, ticket: OrderTicket) -> None:
+        self._recent[ticket.client_order_id] = ticket
+        while len(self._recent) > self.max_recent:
+            self._recent.popitem(last=False)
+
+    def _release(self, ticket: OrderTicket, quantity: float) -> None:
+        quantity = min(quantity, ticket.reserved)
+        if quantity > 0:
+            ticket.reserved -= quantity
+            self.risk.release(ticket.user_id, ticket.exchange, ticket.symbol, ticket.side, quantity)
+
+    def _finish(self, ticket: OrderTicket) -> None:
+        self._release(ticket, ticket.reserved)
+        self._active.pop(ticket.client_order_id, None)
+        if ticket.order_id is not None:
+            self._by_order_id.pop((ticket.exchange, ticket.order_id), None)
+        self._remember(ticket)
+        if ticket.status == COMPLETED and ticket.submitted_at is not None:
+            ORDER_FILL_LATENCY.observe(time.perf_counter() - ticket.submitted_at)
+        ticket.finished.set()
+        self._notify(ticket)
+
+    def _notify(self, ticket: OrderTicket) -> None:
+        # 대기열에 넣기만 하므로 주문 처리를 늦추지 않음
+        order = f"{ticket.exchange} {ticket.symbol} {ticket.side}"
+        if ticket.status == COMPLETED:
+            filled = f"{ticket.filled_quantity:g}"
+            if ticket.average_price is not None:  # 체결 내역 없이 완료 보고를 받으면 평균가 없음
+                filled += f" @ {ticket.average_price:g}"
+            self.notifier.notify(ticket.user_id, TRADE, "체결", f"{order} {filled}")
+        elif ticket.status == REJECTED:
+            self.notifier.notify(ticket.user_id, ERROR, "주문 거절", f"{order}: {ticket.error}")
+
+    def _publish(self, ticket: OrderTicket) -> None:
+        self.hub.publish(orders_topic(ticket.user_id), ticket.client_order_id, ticket.to_dict())
+
+    # 체결 추적
+
+    async def _follow(self, connector: ExchangeConnector) -> None:
+        try:
+            async with aclosing(connector.stream_orders()) as stream:
+                async for order in stream:
+                    ticket = self._match(connector.name, order)
+                    if ticket is None:
+                        continue
+                    try:
+                        if await self._apply(ticket, order):
+                            self.streamed_updates += 1
+                    except Exception:
+                        logger.exception("주문 상태 반영 실패 (%s)", ticket.client_order_id)
+        except NotImplementedError:
+            logger.info("%s 주문 스트림 없이 조회로만 체결을 확인합니다", connector.name)
+
+    async def _fetch(self, ticket: OrderTicket) -> Order:
+        connector = self.router[ticket.exchange]
+        if ticket.order_id is not None:
+            return await connector.get_order(ticket.symbol, order_id=ticket.order_id)
+        return await connector.get_order(ticket.symbol, client_order_id=ticket.client_order_id)
+
+    async def poll(self) -> int:
+        """
+        스트림 소식이 poll_interval 넘게 없는 주문을 poll_batch개씩 동시에 조회해 반영
+
+        Returns:
+            int: 상태가 바뀐 주문 수
+        """
+        now = time.monotonic()
+        stale = [
+            ticket for ticket in self._active.values()
+            if not ticket.in_flight and now - ticket.updated_at >= self.poll_interval
+        ]
+        changed = 0
+        for start in range(0, len(stale), self.poll_batch):
+            batch = stale[start:start + self.poll_batch]
+            results = await asyncio.gather(*(self._fetch(ticket) for ticket in batch), return_exceptions=True)
+            ORDER_STATUS_POLLS.inc(len(batch))
+            for ticket, result in zip(batch, results):
+                try:
+                    if isinstance(result, Order):
+                        changed += await self._apply(ticket, result)
+                    elif isinstance(result, ExchangeResponseError) and ticket.order_id is None:
+                        await self._reject(ticket, "거래소에 접수되지 않은 주문입니다")
+                        changed += 1
+                    else:
+                        ticket.updated_at = time.monotonic()
+                        logger.warning("주문 상태 조회 실패 (%s): %s", ticket.client_order_id, result)
+                except Exception:
+                    logger.exception("주문 상태 반영 실패 (%s)", ticket.client_order_id)
+        self.polled_updates += changed
+        return changed
+
+    async def _poll_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                await self.poll()
+            except Exception:
+                logger.exception("주문 상태 조회 주기 실패")
+
+    async def start(self) -> None:
+        """미완료 주문 복원 후 거래소별 주문 스트림과 조회 주기 시작"""
+        if self._tasks:
+            return
+        resumed = await self.resume()
+        if resumed:
+            logger.info("미완료 주문 %d건 추적 재개", resumed)
+        self._tasks = [asyncio.create_task(self._follow(connector)) for connector in self.router.connectors.values()]
+        self._tasks.append(asyncio.create_task(self._poll_loop()))
+
+    async def stop(self) -> None:
+        """추적 작업 종료"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        실행 통계 조회
+
+        Returns:
+            Dict[str, Any]: 진행 중 주문 수, 스트림/조회 반영 수, 접수/체결 지연 요약
+        """
+        return {
+            "active_orders": len(self._active),
+            "streamed_updates": self.streamed_updates,
+            "polled_updates": self.polled_updates,
+            "status_polls": int(ORDER_STATUS_POLLS.value),
+            "ack_latency": ORDER_ACK_LATENCY.snapshot(),
+            "fill_latency": ORDER_FILL_LATENCY.snapshot(),
+        }
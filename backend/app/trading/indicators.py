@@ -0,0 +1,381 @@
+"""
+기술적 지표
+
+각 지표는 OHLCV 배열 전체를 한 번에 계산하는 벡터화 함수와
+실시간 틱마다 O(1)로 갱신하는 증분 클래스를 함께 제공한다.
+두 형태는 같은 점화식을 사용하므로 결과가 일치한다 (부동소수점 오차 범위).
+워밍업 구간 값은 NaN이다. pandas는 벡터화 함수가 처음 불릴 때 불러온다 (증분 클래스만 쓰는
+매매 엔진과 API 워커는 pandas를 불러오지 않음).
+"""
+
+import math
+import sys
+from collections import deque
+from typing import Dict, Tuple
+
+import numpy as np
+
+NAN = float("nan")
+
+
+def _as_array(values) -> np.ndarray:
+    return np.asarray(values, dtype=np.float64)
+
+
+def _ewm(values: np.ndarray, alpha: float) -> np.ndarray:
+    """y[t] = (1 - alpha) * y[t-1] + alpha * x[t], y[0] = x[0]"""
+    if not len(values):
+        return values.copy()
+    import pandas as pd
+
+    return pd.Series(values).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+
+
+# 벡터화 지표
+
+def sma(close, period: int) -> np.ndarray:
+    """
+    단순 이동평균
+
+    Args:
+        close: 종가 배열
+        period (int): 기간
+
+    Returns:
+        np.ndarray: SMA
+    """
+    import pandas as pd
+
+    return pd.Series(_as_array(close)).rolling(period).mean().to_numpy()
+
+
+def ema(close, period: int) -> np.ndarray:
+    """
+    지수 이동평균 (첫 값으로 시작, alpha = 2 / (period + 1))
+
+    Args:
+        close: 종가 배열
+        period (int): 기간
+
+    Returns:
+        np.ndarray: EMA
+    """
+    result = _ewm(_as_array(close), 2.0 / (period + 1))
+    result[:period - 1] = np.nan
+    return result
+
+
+def rsi(close, period: int = 14) -> np.ndarray:
+    """
+    상대강도지수 (Wilder 평활)
+
+    Args:
+        close: 종가 배열
+        period (int): 기간
+
+    Returns:
+        np.ndarray: RSI (0 ~ 100)
+    """
+    close = _as_array(close)
+    result = np.full(len(close), np.nan)
+    if len(close) <= period:
+        return result
+    diff = np.diff(close)
+    avg_gain = _ewm(np.clip(diff, 0, None), 1.0 / period)
+    avg_loss = _ewm(np.clip(-diff, 0, None), 1.0 / period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        values = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    values[avg_loss == 0] = 100.0
+    result[1:] = values
+    result[:period] = np.nan
+    return result
+
+
+def macd(close, fast: int = 12, slow: int = 26, signal: int = 9) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    MACD
+
+    Args:
+        close: 종가 배열
+        fast (int): 단기 EMA 기간
+        slow (int): 장기 EMA 기간
+        signal (int): 시그널 EMA 기간
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: (MACD, 시그널, 히스토그램)
+    """
+    close = _as_array(close)
+    line = _ewm(close, 2.0 / (fast + 1)) - _ewm(close, 2.0 / (slow + 1))
+    line[:slow - 1] = np.nan
+    signal_line = np.full(len(close), np.nan)
+    if len(close) >= slow:
+        signal_line[slow - 1:] = _ewm(line[slow - 1:], 2.0 / (signal + 1))
+        signal_line[:slow + signal - 2] = np.nan
+    return line, signal_line, line - signal_line
+
+
+def bollinger(close, period: int = 20, k: float = 2.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    볼린저 밴드 (모표준편차)
+
+    Args:
+        close: 종가 배열
+        period (int): 기간
+        k (float): 표준편차 배수
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: (하단, 중심, 상단)
+    """
+    import pandas as pd
+
+    rolling = pd.Series(_as_array(close)).rolling(period)
+    middle = rolling.mean().to_numpy()
+    std = rolling.std(ddof=0).to_numpy()
+    return middle - k * std, middle, middle + k * std
+
+
+def atr(high, low, close, period: int = 14) -> np.ndarray:
+    """
+    평균 실제 범위 (Wilder 평활)
+
+    Args:
+        high: 고가 배열
+        low: 저가 배열
+        close: 종가 배열
+        period (int): 기간
+
+    Returns:
+        np.ndarray: ATR
+    """
+    high, low, close = _as_array(high), _as_array(low), _as_array(close)
+    true_range = high - low
+    if len(close) > 1:
+        prev_close = close[:-1]
+        true_range[1:] = np.maximum.reduce(
+            [true_range[1:], np.abs(high[1:] - prev_close), np.abs(low[1:] - prev_close)]
+        )
+    result = _ewm(true_range, 1.0 / period)
+    result[:period - 1] = np.nan
+    return result
+
+
+def vwap(high, low, close, volume) -> np.ndarray:
+    """
+    누적 거래량 가중 평균가 (대표가 = (고가 + 저가 + 종가) / 3)
+
+    Args:
+        high: 고가 배열
+        low: 저가 배열
+        close: 종가 배열
+        volume: 거래량 배열
+
+    Returns:
+        np.ndarray: VWAP
+    """
+    typical = (_as_array(high) + _as_array(low) + _as_array(close)) / 3.0
+    volume = _as_array(volume)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.cumsum(typical * volume) / np.cumsum(volume)
+
+
+# 증분 지표
+
+class SMA:
+    def __init__(self, period: int):
+        """
+        증분 단순 이동평균
+
+        Args:
+            period (int): 기간
+        """
+        self.period = period
+        self.window = deque(maxlen=period)
+        self.total = 0.0
+        self.value = NAN
+
+    def update(self, price: float) -> float:
+        if len(self.window) == self.period:
+            self.total -= self.window[0]
+        self.window.append(price)
+        self.total += price
+        if len(self.window) == self.period:
+            self.value = self.total / self.period
+        return self.value
+
+
+class _EWM:
+    def __init__(self, alpha: float):
+        self.alpha = alpha
+        self.value = NAN
+        self.count = 0
+
+    def update(self, x: float) -> float:
+        self.count += 1
+        if self.count == 1:
+            self.value = x
+        else:
+            self.value = (1.0 - self.alpha) * self.value + self.alpha * x
+        return self.value
+
+
+class EMA:
+    def __init__(self, period: int):
+        """
+        증분 지수 이동평균
+
+        Args:
+            period (int): 기간
+        """
+        self.period = period
+        self._ewm = _EWM(2.0 / (period + 1))
+        self.value = NAN
+
+    def update(self, price: float) -> float:
+        raw = self._ewm.update(price)
+        self.value = raw if self._ewm.count >= self.period else NAN
+        return self.value
+
+
+class RSI:
+    def __init__(self, period: int = 14):
+        """
+        증분 상대강도지수
+
+        Args:
+            period (int): 기간
+        """
+        self.period = period
+        self._gain = _EWM(1.0 / period)
+        self._loss = _EWM(1.0 / period)
+        self._prev = None
+        self.count = 0
+        self.value = NAN
+
+    def update(self, price: float) -> float:
+        self.count += 1
+        if self._prev is not None:
+            diff = price - self._prev
+            gain = self._gain.update(diff if diff > 0 else 0.0)
+            loss = self._loss.update(-diff if diff < 0 else 0.0)
+            if self.count > self.period:
+                self.value = 100.0 if loss == 0 else 100.0 - 100.0 / (1.0 + gain / loss)
+        self._prev = price
+        return self.value
+
+
+class MACD:
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        """
+        증분 MACD
+
+        Args:
+            fast (int): 단기 EMA 기간
+            slow (int): 장기 EMA 기간
+            signal (int): 시그널 EMA 기간
+        """
+        self.slow = slow
+        self.signal_period = signal
+        self._fast = _EWM(2.0 / (fast + 1))
+        self._slow = _EWM(2.0 / (slow + 1))
+        self._signal = _EWM(2.0 / (signal + 1))
+        self.count = 0
+        self.value: Tuple[float, float, float] = (NAN, NAN, NAN)
+
+    def update(self, price: float) -> Tuple[float, float, float]:
+        self.count += 1
+        line = self._fast.update(price) - self._slow.update(price)
+        if self.count < self.slow:
+            return self.value
+        signal = self._signal.update(line)
+        if self.count < self.slow + self.signal_period - 1:
+            signal = NAN
+        self.value = (line, signal, line - signal)
+        return self.value
+
+
+class Bollinger:
+    def __init__(self, period: int = 20, k: float = 2.0):
+        """
+        증분 볼린저 밴드 (이동 Welford 분산)
+
+        Args:
+            period (int): 기간
+            k (float): 표준편차 배수
+        """
+        self.period = period
+        self.k = k
+        self.window = deque(maxlen=period)
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.value: Tuple[float, float, float] = (NAN, NAN, NAN)
+
+    def update(self, price: float) -> Tuple[float, float, float]:
+        if len(self.window) < self.period:
+            self.window.append(price)
+            delta = price - self.mean
+            self.mean += delta / len(self.window)
+            self.m2 += delta * (price - self.mean)
+        else:
+            old = self.window[0]
+            self.window.append(price)
+            old_mean = self.mean
+            self.mean += (price - old) / self.period
+            self.m2 += (price - old) * (price - self.mean + old - old_mean)
+        if len(self.window) == self.period:
+            std = math.sqrt(max(self.m2, 0.0) / self.period)
+            self.value = (self.mean - self.k * std, self.mean, self.mean + self.k * std)
+        return self.value
+
+
+class ATR:
+    def __init__(self, period: int = 14):
+        """
+        증분 평균 실제 범위
+
+        Args:
+            period (int): 기간
+        """
+        self.period = period
+        self._ewm = _EWM(1.0 / period)
+        self._prev_close = None
+        self.value = NAN
+
+    def update(self, high: float, low: float, close: float) -> float:
+        true_range = high - low
+        if self._prev_close is not None:
+            true_range = max(true_range, abs(high - self._prev_close), abs(low - self._prev_close))
+        self._prev_close = close
+        raw = self._ewm.update(true_range)
+        self.value = raw if self._ewm.count >= self.period else NAN
+        return self.value
+
+
+class VWAP:
+    def __init__(self):
+        """증분 누적 거래량 가중 평균가"""
+        self.price_volume = 0.0
+        self.volume = 0.0
+        self.value = NAN
+
+    def update(self, high: float, low: float, close: float, volume: float) -> float:
+        self.price_volume += (high + low + close) / 3.0 * volume
+        self.volume += volume
+        self.value = self.price_volume / self.volume if self.volume else NAN
+        return self.value
+
+
+def ohlcv_columns(ohlcv) -> Dict[str, np.ndarray]:
+    """
+    OHLCV 입력을 열 배열 딕셔너리로 변환
+
+    Args:
+        ohlcv: DataFrame 또는 {"open", "high", "low", "close", "volume"} 배열 딕셔너리
+
+    Returns:
+        Dict[str, np.ndarray]: 열 이름별 float64 배열
+    """
+    # pandas를 불러오지 않았다면 DataFrame일 수 없음
+    pd = sys.modules.get("pandas")
+    if pd is not None and isinstance(ohlcv, pd.DataFrame):
+        return {name: ohlcv[name].to_numpy(dtype=np.float64) for name in ohlcv.columns}
+    return {name: _as_array(values) for name, values in ohlcv.items()}
@@ -0,0 +1,212 @@
+"""
+체결 원장 (trades 테이블)
+
+체결 묶음을 한 번의 왕복으로 기록하는 일괄 입력 경로와 인덱스를 타는 이력 조회를 제공한다.
+PostgreSQL에서는 COPY(psycopg2: copy_expert, asyncpg: copy_records_to_table)를 쓰고,
+그 외 DB에서는 executemany로 처리한다. 커밋된 체결은 포트폴리오 장부에 바로 반영된다.
+"""
+
+import asyncio
+import csv
+import io
+import json
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.user import Trade
+from .portfolio import PortfolioBook, portfolio_book
+
+# COPY / executemany 대상 열 (id, updated_at은 DB가 채움)
+LEDGER_COLUMNS = (
+    "user_id", "exchange", "symbol", "trade_type", "order_type", "side", "quantity",
+    "price", "status", "order_id", "profit_loss", "created_at", "extra_data",
+)
+COPY_NULL = r"\N"
+
+
+def normalize_fills(fills: Iterable[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    체결 레코드를 LEDGER_COLUMNS 형태로 정리
+
+    Args:
+        fills (Iterable[Mapping[str, Any]]): Trade 열 이름을 키로 하는 체결 레코드
+
+    Returns:
+        List[Dict[str, Any]]: 빠진 열은 None, created_at은 현재 시각(UTC)으로 채운 레코드
+    """
+    now = datetime.now(timezone.utc)
+    rows = []
+    for fill in fills:
+        unknown = set(fill) - set(LEDGER_COLUMNS)
+        if unknown:
+            raise ValueError(f"알 수 없는 체결 필드입니다: {', '.join(sorted(unknown))}")
+        row = {column: fill.get(column) for column in LEDGER_COLUMNS}
+        if row["created_at"] is None:
+            row["created_at"] = now
+        rows.append(row)
+    return rows
+
+
+def _copy_buffer(rows: Sequence[Dict[str, Any]]) -> io.StringIO:
+    # None은 COPY_NULL로 기록 (빈 문자열과 구분)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([
+            COPY_NULL if value is None
+            else json.dumps(value) if column == "extra_data"
+            else value.isoformat() if isinstance(value, datetime)
+            else value
+            for column, value in row.items()
+        ])
+    buffer.seek(0)
+    return buffer
+
+
+def _history_query(
+    user_id: int,
+    symbol: Optional[str],
+    start: Optional[datetime],
+    end: Optional[datetime],
+    limit: int,
+):
+    # (user_id[, symbol], created_at) 인덱스 순서 그대로 조회, 기간 조건은 파티션 프루닝에 사용
+    query = select(Trade).where(Trade.user_id == user_id)
+    if symbol is not None:
+        query = query.where(Trade.symbol == symbol)
+    if start is not None:
+        query = query.where(Trade.created_at >= start)
+    if end is not None:
+        query = query.where(Trade.created_at < end)
+    return query.order_by(Trade.created_at.desc()).limit(limit)
+
+
+class TradeLedger:
+    def __init__(self, db: Session, book: Optional[PortfolioBook] = None):
+        self.db = db
+        self.book = book if book is not None else portfolio_book
+
+    def record_fills(self, fills: Iterable[Mapping[str, Any]]) -> int:
+        """
+        체결 묶음 일괄 기록
+
+        Args:
+            fills (Iterable[Mapping[str, Any]]): 체결 레코드
+
+        Returns:
+            int: 기록한 행 수
+        """
+        rows = normalize_fills(fills)
+        if not rows:
+            return 0
+        # 행 ID 할당(삽입)부터 커밋까지 스냅샷과 직렬화 (스냅샷의 max(id) 아래에 커밋 전 체결이 남지 않도록)
+        with self.book.commit_lock:
+            connection = self.db.connection()
+            if connection.dialect.driver == "psycopg2":
+                cursor = connection.connection.dbapi_connection.cursor()
+                try:
+                    cursor.copy_expert(
+                        f"COPY {Trade.__tablename__} ({', '.join(LEDGER_COLUMNS)}) FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')",
+                        _copy_buffer(rows),
+                    )
+                finally:
+                    cursor.close()
+            else:
+                self.db.execute(insert(Trade), rows)
+            self.db.commit()
+            self.book.apply_fills(rows)
+        return len(rows)
+
+    def history(
+        self,
+        user_id: int,
+        symbol: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: int = 100,
+    ) -> List[Trade]:
+        """
+        사용자 체결 이력 조회 (최신순)
+
+        Args:
+            user_id (int): 사용자 ID
+            symbol (Optional[str]): 심볼 필터
+            start (Optional[datetime]): 시작 시각 (포함)
+            end (Optional[datetime]): 종료 시각 (제외)
+            limit (int): 최대 행 수
+
+        Returns:
+            List[Trade]: 체결 목록
+        """
+        return list(self.db.scalars(_history_query(user_id, symbol, start, end, limit)))
+
+
+class AsyncTradeLedger:
+    def __init__(self, db: AsyncSession, book: Optional[PortfolioBook] = None):
+        self.db = db
+        self.book = book if book is not None else portfolio_book
+
+    async def record_fills(self, fills: Iterable[Mapping[str, Any]]) -> int:
+        """
+        체결 묶음 일괄 기록 (비동기)
+
+        Args:
+            fills (Iterable[Mapping[str, Any]]): 체결 레코드
+
+        Returns:
+            int: 기록한 행 수
+        """
+        rows = normalize_fills(fills)
+        if not rows:
+            return 0
+        # 삽입부터 커밋까지 스냅샷과 직렬화 (잠금 대기는 스레드에서 해 이벤트 루프를 막지 않음)
+        await asyncio.to_thread(self.book.commit_lock.acquire)
+        try:
+            connection = await self.db.connection()
+            if connection.dialect.driver == "asyncpg":
+                raw = await connection.get_raw_connection()
+                await raw.driver_connection.copy_records_to_table(
+                    Trade.__tablename__,
+                    columns=LEDGER_COLUMNS,
+                    records=[
+                        tuple(
+                            json.dumps(value) if column == "extra_data" and value is not None else value
+                            for column, value in row.items()
+                        )
+                        for row in rows
+                    ],
+                )
+            else:
+                await self.db.execute(insert(Trade), rows)
+            await self.db.commit()
+            self.book.apply_fills(rows)
+        finally:
+            self.book.commit_lock.release()
+        return len(rows)
+
+    async def history(
+        self,
+        user_id: int,
+        symbol: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: int = 100,
+    ) -> List[Trade]:
+        """
+        사용자 체결 이력 조회 (최신순, 비동기)
+
+        Args:
+            user_id (int): 사용자 ID
+            symbol (Optional[str]): 심볼 필터
+            start (Optional[datetime]): 시작 시각 (포함)
+            end (Optional[datetime]): 종료 시각 (제외)
+            limit (int): 최대 행 수
+
+        Returns:
+            List[Trade]: 체결 목록
+        """
+        return list(await self.db.scalars(_history_query(user_id, symbol, start, end, limit)))
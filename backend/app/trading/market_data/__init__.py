@@ -0,0 +1,9 @@
+"""
+실시간 시세 데이터 모듈
+"""
+
+from .store import MarketDataStore
+from .feed import UpbitWebSocketFeed
+from .replay import ReplayFeed
+
+__all__ = ['MarketDataStore', 'UpbitWebSocketFeed', 'ReplayFeed']
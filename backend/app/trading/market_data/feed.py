@@ -0,0 +1,138 @@
+"""
+업비트 WebSocket 시세 수신기
+"""
+
+import asyncio
+import json
+import logging
+import uuid
+from typing import Callable, Iterable, List, Optional, Sequence, TextIO
+
+import websockets
+
+from app.core.config import settings
+from .store import MarketDataStore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TYPES = ("ticker", "trade", "orderbook")
+
+
+class UpbitWebSocketFeed:
+    def __init__(
+        self,
+        store: MarketDataStore,
+        codes: Iterable[str],
+        types: Sequence[str] = DEFAULT_TYPES,
+        url: Optional[str] = None,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+        recorder: Optional[TextIO] = None,
+        connect: Callable = websockets.connect,
+    ):
+        """
+        업비트 WebSocket 시세 수신기 초기화
+
+        연결이 끊기면 지수 백오프로 재연결하고 현재 구독 목록을 다시 전송한다.
+        메시지 하나의 처리 실패(잘못된 프레임, 리스너 예외 등)는 기록만 하고 수신을 이어간다.
+
+        Args:
+            store (MarketDataStore): 메시지를 반영할 저장소
+            codes (Iterable[str]): 구독할 마켓 코드 (예: KRW-BTC)
+            types (Sequence[str]): 구독할 스트림 종류
+            url (str, optional): WebSocket 주소 (기본값: settings.UPBIT_WS_URL)
+            reconnect_delay (float): 최초 재연결 대기 시간 (초)
+            max_reconnect_delay (float): 최대 재연결 대기 시간 (초)
+            recorder (TextIO, optional): 수신 메시지를 NDJSON으로 기록할 파일
+            connect (Callable): WebSocket 연결 함수
+        """
+        self.store = store
+        self.codes: List[str] = list(dict.fromkeys(codes))
+        self.types = tuple(types)
+        self.url = url or settings.UPBIT_WS_URL
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.recorder = recorder
+        self._connect = connect
+        self._websocket = None
+        self._stopped = asyncio.Event()
+        self.connected = asyncio.Event()
+        self.messages_received = 0
+        self.messages_failed = 0
+        self.reconnects = 0
+
+    def subscription_message(self) -> str:
+        """
+        구독 요청 메시지 생성
+
+        Returns:
+            str: 업비트 WebSocket 구독 요청 (JSON)
+        """
+        request = [{"ticket": str(uuid.uuid4())}]
+        request.extend({"type": kind, "codes": self.codes} for kind in self.types)
+        request.append({"format": "DEFAULT"})
+        return json.dumps(request)
+
+    async def subscribe(self, codes: Iterable[str]) -> None:
+        """
+        구독 마켓 추가
+
+        업비트는 구독 변경 시 전체 목록을 다시 보내야 하므로 연결 중이면 즉시 재구독한다.
+
+        Args:
+            codes (Iterable[str]): 추가할 마켓 코드
+        """
+        added = [code for code in codes if code not in self.codes]
+        if not added:
+            return
+        self.codes.extend(added)
+        if self._websocket is not None:
+            await self._websocket.send(self.subscription_message())
+
+    def _handle(self, raw) -> None:
+        if isinstance(raw, bytes):
+            raw = raw.decode()
+        message = json.loads(raw)
+        self.messages_received += 1
+        if self.recorder is not None:
+            self.recorder.write(raw + "\n")
+        self.store.apply(message)
+
+    async def run(self) -> None:
+        """수신 루프 실행 (stop() 호출 전까지 재연결 반복)"""
+        delay = self.reconnect_delay
+        while not self._stopped.is_set():
+            try:
+                async with self._connect(self.url, ping_interval=60, max_queue=1024) as websocket:
+                    self._websocket = websocket
+                    await websocket.send(self.subscription_message())
+                    self.connected.set()
+                    delay = self.reconnect_delay
+                    async for raw in websocket:
+                        try:
+                            self._handle(raw)
+                        except Exception:
+                            self.messages_failed += 1
+                            logger.exception("업비트 시세 메시지 처리 실패")
+            except asyncio.CancelledError:
+                raise
+            except (websockets.WebSocketException, OSError) as e:
+                logger.warning("업비트 WebSocket 연결 끊김: %s", e)
+            finally:
+                self._websocket = None
+                self.connected.clear()
+
+            if self._stopped.is_set():
+                break
+            self.reconnects += 1
+            try:
+                await asyncio.wait_for(self._stopped.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    async def stop(self) -> None:
+        """수신 중지"""
+        self._stopped.set()
+        if self._websocket is not None:
+            await self._websocket.close()
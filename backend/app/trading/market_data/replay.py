@@ -0,0 +1,56 @@
+"""
+기록된 시세 피드 재생기
+"""
+
+import json
+from typing import Iterator, List, Optional
+
+from .store import MarketDataStore
+
+
+class ReplayFeed:
+    def __init__(self, path: str):
+        """
+        기록된 피드 재생기 초기화
+
+        UpbitWebSocketFeed의 recorder로 저장한 NDJSON 파일을 네트워크 없이 재생한다.
+
+        Args:
+            path (str): NDJSON 파일 경로
+        """
+        with open(path, encoding="utf-8") as f:
+            self.raw_messages: List[str] = [line.strip() for line in f if line.strip()]
+
+    def __len__(self) -> int:
+        return len(self.raw_messages)
+
+    def messages(self) -> Iterator[dict]:
+        """
+        기록된 메시지 순회
+
+        Returns:
+            Iterator[dict]: 디코딩된 메시지
+        """
+        for raw in self.raw_messages:
+            yield json.loads(raw)
+
+    def replay(self, store: MarketDataStore, loops: int = 1, limit: Optional[int] = None) -> int:
+        """
+        저장소에 메시지 재생
+
+        Args:
+            store (MarketDataStore): 메시지를 반영할 저장소
+            loops (int): 반복 횟수
+            limit (int, optional): 최대 메시지 수
+
+        Returns:
+            int: 반영한 메시지 수
+        """
+        count = 0
+        for _ in range(loops):
+            for raw in self.raw_messages:
+                if limit is not None and count >= limit:
+                    return count
+                store.apply(json.loads(raw))
+                count += 1
+        return count
@@ -0,0 +1,224 @@
+"""
+메모리 기반 시세/호가 저장소
+"""
+
+import threading
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from app.core.config import settings
+
+# 티커 필드
+TICKER_PRICE, TICKER_CHANGE_RATE, TICKER_VOLUME_24H, TICKER_TIMESTAMP = range(4)
+# 체결 필드
+TRADE_PRICE, TRADE_VOLUME, TRADE_SIDE, TRADE_TIMESTAMP = range(4)
+# 호가 필드
+ASK_PRICE, ASK_SIZE, BID_PRICE, BID_SIZE = range(4)
+
+Listener = Callable[[str, str], None]
+
+
+class MarketDataStore:
+    def __init__(self, depth: Optional[int] = None, capacity: int = 64):
+        """
+        시세 저장소 초기화
+
+        심볼별 최신 상태를 심볼 인덱스 기반 NumPy 배열에 보관한다.
+        읽기는 네트워크 I/O 없이 배열에서 바로 이루어진다.
+
+        Args:
+            depth (int, optional): 저장할 호가 단계 수 (기본값: settings.ORDERBOOK_DEPTH)
+            capacity (int): 초기 심볼 수용량
+        """
+        self.depth = depth or settings.ORDERBOOK_DEPTH
+        self._index: Dict[str, int] = {}
+        self._symbols: List[str] = []
+        self._lock = threading.Lock()
+        self._listeners: List[Listener] = []
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int) -> None:
+        self.tickers = np.full((capacity, 4), np.nan)
+        self.trades = np.full((capacity, 4), np.nan)
+        self.books = np.full((capacity, self.depth, 4), np.nan)
+        self.book_timestamps = np.zeros(capacity)
+        self.updates = np.zeros(capacity, dtype=np.int64)
+
+    def _grow(self) -> None:
+        old = (self.tickers, self.trades, self.books, self.book_timestamps, self.updates)
+        self._allocate(len(self.tickers) * 2)
+        for new, previous in zip(
+            (self.tickers, self.trades, self.books, self.book_timestamps, self.updates), old
+        ):
+            new[:len(previous)] = previous
+
+    def symbol_index(self, symbol: str) -> int:
+        """
+        심볼 인덱스 조회 (없으면 등록)
+
+        Args:
+            symbol (str): 심볼 (예: KRW-BTC)
+
+        Returns:
+            int: 배열 인덱스
+        """
+        index = self._index.get(symbol)
+        if index is None:
+            with self._lock:
+                index = self._index.get(symbol)
+                if index is None:
+                    if len(self._symbols) == len(self.tickers):
+                        self._grow()
+                    index = len(self._symbols)
+                    self._symbols.append(symbol)
+                    self._index[symbol] = index
+        return index
+
+    @property
+    def symbols(self) -> List[str]:
+        """등록된 심볼 목록"""
+        return list(self._symbols)
+
+    @property
+    def nbytes(self) -> int:
+        """배열이 차지하는 메모리 (바이트)"""
+        return sum(a.nbytes for a in (self.tickers, self.trades, self.books, self.book_timestamps, self.updates))
+
+    def add_listener(self, listener: Listener) -> None:
+        """
+        갱신 알림 등록
+
+        Args:
+            listener (Listener): (메시지 종류, 심볼)을 받는 콜백
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Listener) -> None:
+        """갱신 알림 해제"""
+        self._listeners.remove(listener)
+
+    def apply(self, message: dict) -> None:
+        """
+        업비트 WebSocket 메시지 반영
+
+        Args:
+            message (dict): ticker / trade / orderbook 메시지 (DEFAULT 포맷)
+        """
+        kind = message.get("type")
+        symbol = message.get("code")
+        if symbol is None:
+            return
+        i = self.symbol_index(symbol)
+        if kind == "ticker":
+            row = self.tickers[i]
+            row[TICKER_PRICE] = message["trade_price"]
+            row[TICKER_CHANGE_RATE] = message.get("signed_change_rate", np.nan)
+            row[TICKER_VOLUME_24H] = message.get("acc_trade_volume_24h", np.nan)
+            row[TICKER_TIMESTAMP] = message.get("timestamp", 0)
+        elif kind == "trade":
+            row = self.trades[i]
+            row[TRADE_PRICE] = message["trade_price"]
+            row[TRADE_VOLUME] = message["trade_volume"]
+            row[TRADE_SIDE] = 1.0 if message.get("ask_bid") == "BID" else -1.0
+            row[TRADE_TIMESTAMP] = message.get("trade_timestamp", message.get("timestamp", 0))
+        elif kind == "orderbook":
+            units = message["orderbook_units"][:self.depth]
+            book = self.books[i]
+            book[:] = np.nan
+            if units:
+                book[:len(units)] = [
+                    (u["ask_price"], u["ask_size"], u["bid_price"], u["bid_size"]) for u in units
+                ]
+            self.book_timestamps[i] = message.get("timestamp", 0)
+        else:
+            return
+        self.updates[i] += 1
+        for listener in self._listeners:
+            listener(kind, symbol)
+
+    def get_price(self, symbol: str) -> Optional[float]:
+        """
+        최신 현재가 조회
+
+        Args:
+            symbol (str): 심볼
+
+        Returns:
+            Optional[float]: 현재가 (수신 전이면 None)
+        """
+        index = self._index.get(symbol)
+        if index is None:
+            return None
+        price = self.tickers[index, TICKER_PRICE]
+        if np.isnan(price):
+            price = self.trades[index, TRADE_PRICE]
+        return None if np.isnan(price) else float(price)
+
+    def get_prices(self, symbols: Sequence[str]) -> np.ndarray:
+        """
+        여러 심볼의 현재가 벡터 조회
+
+        Args:
+            symbols (Sequence[str]): 심볼 목록
+
+        Returns:
+            np.ndarray: 현재가 배열 (없는 심볼은 NaN)
+        """
+        indexes = np.array([self._index.get(s, -1) for s in symbols], dtype=np.int64)
+        prices = np.full(len(symbols), np.nan)
+        known = indexes >= 0
+        prices[known] = self.tickers[indexes[known], TICKER_PRICE]
+        return prices
+
+    def get_ticker(self, symbol: str) -> Optional[Dict[str, float]]:
+        """
+        최신 티커 조회
+
+        Args:
+            symbol (str): 심볼
+
+        Returns:
+            Optional[Dict[str, float]]: 현재가, 변동률, 24시간 거래량, 타임스탬프
+        """
+        index = self._index.get(symbol)
+        if index is None or np.isnan(self.tickers[index, TICKER_PRICE]):
+            return None
+        row = self.tickers[index]
+        return {
+            "price": float(row[TICKER_PRICE]),
+            "change_rate": float(row[TICKER_CHANGE_RATE]),
+            "volume_24h": float(row[TICKER_VOLUME_24H]),
+            "timestamp": int(row[TICKER_TIMESTAMP]),
+        }
+
+    def get_orderbook(self, symbol: str) -> Optional[np.ndarray]:
+        """
+        최신 호가 조회
+
+        Args:
+            symbol (str): 심볼
+
+        Returns:
+            Optional[np.ndarray]: (단계, [매도호가, 매도잔량, 매수호가, 매수잔량]) 배열 복사본
+        """
+        index = self._index.get(symbol)
+        if index is None or not self.book_timestamps[index]:
+            return None
+        return self.books[index].copy()
+
+    def best_bid_ask(self, symbol: str) -> Optional[tuple]:
+        """
+        최우선 매수/매도 호가 조회
+
+        Args:
+            symbol (str): 심볼
+
+        Returns:
+            Optional[tuple]: (매수호가, 매도호가)
+        """
+        index = self._index.get(symbol)
+        if index is None or not self.book_timestamps[index]:
+            return None
+        top = self.books[index, 0]
+        return float(top[BID_PRICE]), float(top[ASK_PRICE])
@@ -0,0 +1,350 @@
+"""
+포트폴리오 회계
+
+사용자·거래소·심볼별 포지션(수량, 평균 단가, 실현 손익)을 체결이 기록될 때마다
+증분 갱신하고, 주기적으로 position_snapshots에 스냅샷을 저장한다.
+대시보드 조회는 메모리의 포지션을 읽고 캐시된 시세로 평가 손익만 계산한다.
+"""
+
+import asyncio
+import logging
+import threading
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.user import PositionSnapshot, Trade
+from .strategy import BUY, SELL
+
+logger = logging.getLogger(__name__)
+
+FILLED_STATUSES = frozenset({"filled", "done"})
+EPSILON = 1e-12
+
+PositionKey = Tuple[str, str]  # (exchange, symbol)
+Listener = Callable[[List["Position"]], None]
+
+
+@dataclass
+class Position:
+    """평균 단가 방식 포지션"""
+
+    user_id: int
+    exchange: str
+    symbol: str
+    quantity: float = 0.0
+    avg_cost: float = 0.0
+    realized_pnl: float = 0.0
+    fees: float = 0.0
+    trade_count: int = 0
+
+    def apply(self, side: str, quantity: float, price: float, fee: float = 0.0) -> float:
+        """
+        체결 반영
+
+        같은 방향 체결은 평균 단가를 갱신하고, 반대 방향 체결은 청산 수량만큼 손익을 실현한다.
+        보유 수량을 넘는 반대 체결은 남은 수량으로 반대 포지션을 연다.
+
+        Args:
+            side (str): "buy" 또는 "sell"
+            quantity (float): 체결 수량
+            price (float): 체결 가격
+            fee (float): 수수료
+
+        Returns:
+            float: 이번 체결의 실현 손익 (수수료 차감)
+        """
+        if side not in (BUY, SELL):
+            raise ValueError(f"지원하지 않는 주문 방향입니다: {side}")
+        signed = quantity if side == BUY else -quantity
+        realized = 0.0
+        if abs(self.quantity) < EPSILON or (self.quantity > 0) == (signed > 0):
+            total = abs(self.quantity) + quantity
+            self.avg_cost = (abs(self.quantity) * self.avg_cost + quantity * price) / total if total else 0.0
+            self.quantity += signed
+        else:
+            direction = 1.0 if self.quantity > 0 else -1.0
+            realized = (price - self.avg_cost) * min(quantity, abs(self.quantity)) * direction
+            self.quantity += signed
+            if abs(self.quantity) < EPSILON:
+                self.quantity = 0.0
+                self.avg_cost = 0.0
+            elif (self.quantity > 0) != (direction > 0):
+                self.avg_cost = price
+        realized -= fee
+        self.realized_pnl += realized
+        self.fees += fee
+        self.trade_count += 1
+        return realized
+
+    def unrealized_pnl(self, price: float) -> float:
+        """평가 손익"""
+        return (price - self.avg_cost) * self.quantity
+
+
+def _field(fill: Any, name: str) -> Any:
+    if isinstance(fill, Mapping):
+        return fill.get(name)
+    return getattr(fill, name, None)
+
+
+def _fee(fill: Any) -> float:
+    extra = _field(fill, "extra_data")
+    if isinstance(extra, Mapping) and extra.get("fee") is not None:
+        return float(extra["fee"])
+    return 0.0
+
+
+def summarize(
+    user_id: int, positions: Iterable[Position], prices: Optional[Mapping[PositionKey, float]] = None
+) -> Dict[str, Any]:
+    """
+    포지션 목록의 포트폴리오 요약
+
+    Args:
+        user_id (int): 사용자 ID
+        positions (Iterable[Position]): 사용자 포지션
+        prices (Mapping[PositionKey, float], optional): (거래소, 심볼)별 현재가 (없으면 평가하지 않음)
+
+    Returns:
+        Dict[str, Any]: 포지션별 평가 내역과 합계
+    """
+    prices = prices or {}
+    rows = []
+    realized = unrealized = cost_basis = market_value = 0.0
+    for position in positions:
+        row = asdict(position)
+        price = prices.get((position.exchange, position.symbol))
+        row["price"] = price
+        row["cost_basis"] = position.avg_cost * position.quantity
+        row["market_value"] = price * position.quantity if price is not None else None
+        row["unrealized_pnl"] = position.unrealized_pnl(price) if price is not None else None
+        realized += position.realized_pnl
+        cost_basis += row["cost_basis"]
+        if price is not None:
+            unrealized += row["unrealized_pnl"]
+            market_value += row["market_value"]
+        rows.append(row)
+    return {
+        "user_id": user_id,
+        "positions": rows,
+        "realized_pnl": realized,
+        "unrealized_pnl": unrealized,
+        "total_pnl": realized + unrealized,
+        "cost_basis": cost_basis,
+        "market_value": market_value,
+    }
+
+
+class PortfolioBook:
+    def __init__(self):
+        """
+        사용자별 포지션 장부 초기화
+
+        commit_lock은 체결 기록(삽입부터 커밋 + 장부 반영까지)과 스냅샷을 직렬화해
+        스냅샷의 last_trade_id가 장부 내용과 어긋나지 않게 한다. 행 ID는 삽입할 때 정해지므로
+        삽입 전에 잡아야 last_trade_id보다 작은 ID의 체결이 스냅샷 뒤에 커밋되지 않는다.
+        """
+        self._positions: Dict[int, Dict[PositionKey, Position]] = {}
+        self._lock = threading.Lock()
+        self.commit_lock = threading.Lock()
+        self.fills_applied = 0
+        self._listeners: List[Listener] = []
+
+    def add_listener(self, listener: Listener) -> None:
+        """
+        포지션 변경 알림 등록
+
+        Args:
+            listener (Listener): 변경된 포지션 복사본 목록을 받는 콜백 (체결 묶음당 한 번)
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Listener) -> None:
+        """포지션 변경 알림 해제"""
+        self._listeners.remove(listener)
+
+    def _apply(self, fill: Any) -> Optional[Tuple[Position, float]]:
+        status = _field(fill, "status")
+        user_id = _field(fill, "user_id")
+        if user_id is None or (status is not None and status not in FILLED_STATUSES):
+            return None
+        exchange, symbol = _field(fill, "exchange") or "", _field(fill, "symbol")
+        with self._lock:
+            positions = self._positions.setdefault(user_id, {})
+            position = positions.get((exchange, symbol))
+            if position is None:
+                position = positions[(exchange, symbol)] = Position(user_id, exchange, symbol)
+            realized = position.apply(
+                _field(fill, "side"), float(_field(fill, "quantity")), float(_field(fill, "price")), _fee(fill)
+            )
+            self.fills_applied += 1
+            return position, realized
+
+    def _notify(self, changed: Iterable[Position]) -> None:
+        if not self._listeners:
+            return
+        with self._lock:
+            snapshot = [replace(position) for position in changed]
+        for listener in self._listeners:
+            listener(snapshot)
+
+    def apply_fill(self, fill: Any) -> Optional[float]:
+        """
+        체결 하나 반영
+
+        Args:
+            fill (Any): Trade 객체 또는 Trade 열 이름을 키로 하는 매핑
+
+        Returns:
+            Optional[float]: 실현 손익 (체결 완료 상태가 아니면 None)
+        """
+        applied = self._apply(fill)
+        if applied is None:
+            return None
+        self._notify([applied[0]])
+        return applied[1]
+
+    def apply_fills(self, fills: Iterable[Any]) -> int:
+        """
+        체결 묶음 반영
+
+        Args:
+            fills (Iterable[Any]): Trade 객체 또는 매핑
+
+        Returns:
+            int: 반영한 체결 수
+        """
+        applied = 0
+        changed: Dict[int, Position] = {}
+        for fill in fills:
+            result = self._apply(fill)
+            if result is not None:
+                applied += 1
+                changed[id(result[0])] = result[0]
+        self._notify(changed.values())
+        return applied
+
+    def positions(self, user_id: int) -> List[Position]:
+        """사용자 포지션 복사본 목록"""
+        with self._lock:
+            return [replace(position) for position in self._positions.get(user_id, {}).values()]
+
+    def all_positions(self) -> List[Position]:
+        """전체 사용자 포지션 복사본 목록"""
+        with self._lock:
+            return [replace(position) for positions in self._positions.values() for position in positions.values()]
+
+    def summary(self, user_id: int, prices: Optional[Mapping[PositionKey, float]] = None) -> Dict[str, Any]:
+        """
+        사용자 포트폴리오 요약
+
+        Args:
+            user_id (int): 사용자 ID
+            prices (Mapping[PositionKey, float], optional): (거래소, 심볼)별 현재가 (없으면 평가하지 않음)
+
+        Returns:
+            Dict[str, Any]: 포지션별 평가 내역과 합계
+        """
+        return summarize(user_id, self.positions(user_id), prices)
+
+    def clear(self) -> None:
+        """장부 초기화"""
+        with self._lock:
+            self._positions.clear()
+            self.fills_applied = 0
+
+    def snapshot(self, db: Session) -> int:
+        """
+        현재 포지션을 position_snapshots에 저장
+
+        Args:
+            db (Session): 데이터베이스 세션
+
+        Returns:
+            int: 저장한 포지션 수
+        """
+        with self.commit_lock:
+            last_trade_id = db.scalar(select(func.max(Trade.id))) or 0
+            with self._lock:
+                positions = [replace(p) for user in self._positions.values() for p in user.values()]
+        taken_at = datetime.now(timezone.utc)
+        if positions:
+            db.execute(insert(PositionSnapshot), [
+                {**asdict(position), "last_trade_id": last_trade_id, "taken_at": taken_at}
+                for position in positions
+            ])
+            db.commit()
+        return len(positions)
+
+    def restore(self, db: Session, batch_size: int = 10_000) -> int:
+        """
+        최근 스냅샷과 이후 체결로 장부 복원
+
+        Args:
+            db (Session): 데이터베이스 세션
+            batch_size (int): 체결 재생 시 한 번에 읽을 행 수
+
+        Returns:
+            int: 스냅샷 이후 재생한 체결 수
+        """
+        with self.commit_lock:
+            taken_at = db.scalar(select(func.max(PositionSnapshot.taken_at)))
+            positions: Dict[int, Dict[PositionKey, Position]] = {}
+            last_trade_id = 0
+            if taken_at is not None:
+                for snapshot in db.scalars(select(PositionSnapshot).where(PositionSnapshot.taken_at == taken_at)):
+                    positions.setdefault(snapshot.user_id, {})[(snapshot.exchange, snapshot.symbol)] = Position(
+                        snapshot.user_id, snapshot.exchange, snapshot.symbol, snapshot.quantity,
+                        snapshot.avg_cost, snapshot.realized_pnl, snapshot.fees, snapshot.trade_count,
+                    )
+                    last_trade_id = snapshot.last_trade_id or 0
+            with self._lock:
+                self._positions = positions
+                self.fills_applied = 0
+
+            columns = [Trade.user_id, Trade.exchange, Trade.symbol, Trade.side, Trade.quantity,
+                       Trade.price, Trade.status, Trade.extra_data]
+            query = select(*columns).where(Trade.id > last_trade_id).order_by(Trade.id)
+            rows = db.execute(query.execution_options(yield_per=batch_size)).mappings()
+            return self.apply_fills(rows)
+
+
+async def snapshot_loop(
+    session_factory: Callable[[], Session],
+    book: Optional[PortfolioBook] = None,
+    interval: Optional[float] = None,
+) -> None:
+    """
+    장부 복원 후 주기적 스냅샷 저장 (취소될 때까지 실행)
+
+    Args:
+        session_factory (Callable[[], Session]): 동기 세션 생성 함수
+        book (PortfolioBook, optional): 대상 장부 (기본값: portfolio_book)
+        interval (float, optional): 저장 주기 (초, 기본값: settings.PORTFOLIO_SNAPSHOT_INTERVAL)
+    """
+    book = book or portfolio_book
+    interval = interval or settings.PORTFOLIO_SNAPSHOT_INTERVAL
+
+    def run(method: str) -> Any:
+        with session_factory() as db:
+            return getattr(book, method)(db)
+
+    try:
+        replayed = await asyncio.to_thread(run, "restore")
+        logger.info("포트폴리오 장부 복원 완료 (체결 %d건 재생)", replayed)
+    except Exception:
+        logger.exception("포트폴리오 장부 복원 실패")
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(run, "snapshot")
+        except Exception:
+            logger.exception("포트폴리오 스냅샷 저장 실패")
+
+
+portfolio_book = PortfolioBook()
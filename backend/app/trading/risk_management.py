@@ -0,0 +1,483 @@
+"""
+사전 주문 위험 관리
+
+사용자·거래소·심볼별 한도(최대 포지션, 손절/익절 비율)와 현재 포지션을 메모리에 올려 두고,
+주문 경로에서는 DB 조회 없이 딕셔너리 조회와 산술만으로 한도를 검사한다.
+포지션은 심볼 ID가 붙은 NumPy 배열에 보관해 시세 틱마다 해당 심볼의 손절/익절 조건을
+한 번의 벡터 연산으로 판정한다. 포지션은 PortfolioBook 변경 알림으로, 시세는 시세 저장소 갱신 알림
+(bind_market_data)으로 갱신된다. 엔진 프로세스가 시작할 때 load()로 매매 설정의 한도를 불러온다.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.metrics import Counter
+from app.models.user import TradingSetting
+from app.services.exchange_service import split_symbol
+from .portfolio import EPSILON, PortfolioBook, Position, PositionKey, portfolio_book
+from .strategy import BUY, SELL
+
+if TYPE_CHECKING:
+    from .market_data.store import MarketDataStore
+
+logger = logging.getLogger(__name__)
+
+STOP_LOSS = "stop_loss"
+TAKE_PROFIT = "take_profit"
+
+RISK_REJECTIONS = Counter("risk_rejections_total", "위험 한도로 거절한 주문 수")
+RISK_TRIGGERS = Counter("risk_triggers_total", "손절/익절 조건에 걸린 포지션 수")
+
+RiskKey = Tuple[int, str, str]  # (user_id, exchange, symbol)
+TriggerListener = Callable[[List["RiskTrigger"]], None]
+
+
+class RiskLimitError(Exception):
+    """위험 한도 초과로 주문 거절"""
+    pass
+
+
+@dataclass
+class RiskTrigger:
+    """손절/익절 조건에 걸린 포지션"""
+    user_id: int
+    exchange: str
+    symbol: str
+    kind: str  # STOP_LOSS 또는 TAKE_PROFIT
+    price: float
+    quantity: float
+    avg_cost: float
+
+
+class _Exposure:
+    """한도와 미체결 예약 수량 (배열 행 번호로 포지션과 연결)"""
+    __slots__ = ("row", "max_position", "stop_loss", "take_profit", "pending_buy", "pending_sell")
+
+    def __init__(self, row: int, stop_loss: Optional[float], take_profit: Optional[float]):
+        self.row = row
+        self.max_position: Optional[float] = None
+        self.stop_loss = stop_loss
+        self.take_profit = take_profit
+        self.pending_buy = 0.0
+        self.pending_sell = 0.0
+
+
+class RiskEngine:
+    def __init__(
+        self,
+        book: Optional[PortfolioBook] = None,
+        max_order_quantity: Optional[Mapping[str, float]] = None,
+        default_stop_loss: Optional[float] = None,
+        default_take_profit: Optional[float] = None,
+        capacity: int = 1024,
+    ):
+        """
+        위험 관리 엔진 초기화
+
+        Args:
+            book (PortfolioBook, optional): 포지션을 받아올 장부 (기본값: portfolio_book)
+            max_order_quantity (Mapping[str, float], optional): 기준 화폐별 1회 최대 주문 수량
+                (기본값: settings.RISK_MAX_ORDER_QUANTITY)
+            default_stop_loss (float, optional): 설정이 없는 포지션의 손절 비율 (%, 기본값: settings.DEFAULT_STOP_LOSS)
+            default_take_profit (float, optional): 설정이 없는 포지션의 익절 비율 (%, 기본값: settings.DEFAULT_TAKE_PROFIT)
+            capacity (int): 초기 포지션 수용량
+        """
+        self.book = book if book is not None else portfolio_book
+        self.max_order_quantity = dict(
+            settings.RISK_MAX_ORDER_QUANTITY if max_order_quantity is None else max_order_quantity
+        )
+        self.default_stop_loss = settings.DEFAULT_STOP_LOSS if default_stop_loss is None else default_stop_loss
+        self.default_take_profit = settings.DEFAULT_TAKE_PROFIT if default_take_profit is None else default_take_profit
+        self._exposures: Dict[RiskKey, _Exposure] = {}
+        self._keys: List[RiskKey] = []
+        self._symbol_ids: Dict[PositionKey, int] = {}
+        self._symbol_rows: Optional[Dict[int, np.ndarray]] = None
+        self._order_limits: Dict[str, Optional[float]] = {}
+        self._prices: Dict[PositionKey, float] = {}
+        self._listeners: List[TriggerListener] = []
+        self._lock = threading.Lock()
+        self._attached = False
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int) -> None:
+        self._quantity = np.zeros(capacity)
+        self._avg_cost = np.zeros(capacity)
+        self._sign = np.zeros(capacity)
+        self._stop = np.full(capacity, -np.inf)  # 방향을 곱한 손절가 (sign * price <= stop 이면 손절)
+        self._take = np.full(capacity, np.inf)  # 방향을 곱한 익절가 (sign * price >= take 이면 익절)
+        self._armed = np.zeros(capacity, dtype=bool)
+        self._symbol = np.zeros(capacity, dtype=np.int32)
+
+    def _grow(self) -> None:
+        old = (self._quantity, self._avg_cost, self._sign, self._stop, self._take, self._armed, self._symbol)
+        self._allocate(len(self._quantity) * 2)
+        for new, previous in zip(
+            (self._quantity, self._avg_cost, self._sign, self._stop, self._take, self._armed, self._symbol), old
+        ):
+            new[:len(previous)] = previous
+
+    def _exposure(self, user_id: int, exchange: str, symbol: str) -> _Exposure:
+        # self._lock 안에서 호출
+        key = (user_id, exchange, symbol)
+        exposure = self._exposures.get(key)
+        if exposure is None:
+            row = len(self._keys)
+            if row == len(self._quantity):
+                self._grow()
+            symbol_id = self._symbol_ids.setdefault((exchange, symbol), len(self._symbol_ids))
+            self._symbol[row] = symbol_id
+            self._keys.append(key)
+            exposure = self._exposures[key] = _Exposure(row, self.default_stop_loss, self.default_take_profit)
+            self._symbol_rows = None
+        return exposure
+
+    def _refresh(self, exposure: _Exposure) -> None:
+        # 포지션/한도가 바뀐 행의 손절/익절가를 다시 계산하고 감시 재개
+        row = exposure.row
+        quantity = self._quantity[row]
+        if abs(quantity) < EPSILON:
+            self._sign[row], self._armed[row] = 0.0, False
+            return
+        sign = 1.0 if quantity > 0 else -1.0
+        avg_cost = self._avg_cost[row]
+        self._sign[row] = sign
+        self._stop[row] = (
+            sign * avg_cost * (1 - sign * exposure.stop_loss / 100) if exposure.stop_loss else -np.inf
+        )
+        self._take[row] = (
+            sign * avg_cost * (1 + sign * exposure.take_profit / 100) if exposure.take_profit else np.inf
+        )
+        self._armed[row] = True
+
+    # 한도/포지션 적재
+
+    def set_limits(
+        self,
+        user_id: int,
+        exchange: str,
+        symbol: str,
+        max_position: Optional[float] = None,
+        stop_loss: Optional[float] = None,
+        take_profit: Optional[float] = None,
+    ) -> None:
+        """
+        사용자·거래소·심볼 한도 설정
+
+        Args:
+            user_id (int): 사용자 ID
+            exchange (str): 거래소
+            symbol (str): 심볼
+            max_position (float, optional): 최대 포지션 수량 (매수/매도 양방향, 없으면 제한 없음)
+            stop_loss (float, optional): 손절 비율 (%, 없으면 기본값)
+            take_profit (float, optional): 익절 비율 (%, 없으면 기본값)
+        """
+        with self._lock:
+            exposure = self._exposure(user_id, exchange, symbol)
+            exposure.max_position = max_position
+            exposure.stop_loss = self.default_stop_loss if stop_loss is None else stop_loss
+            exposure.take_profit = self.default_take_profit if take_profit is None else take_profit
+            self._refresh(exposure)
+
+    def update_positions(self, positions: Iterable[Position]) -> None:
+        """
+        포지션 반영 (PortfolioBook 변경 알림)
+
+        Args:
+            positions (Iterable[Position]): 변경된 포지션
+        """
+        with self._lock:
+            for position in positions:
+                exposure = self._exposure(position.user_id, position.exchange, position.symbol)
+                self._quantity[exposure.row] = position.quantity
+                self._avg_cost[exposure.row] = position.avg_cost
+                self._refresh(exposure)
+
+    def load(self, db: Session) -> int:
+        """
+        활성 매매 설정의 한도와 장부의 현재 포지션을 불러오고 장부 변경 알림 구독
+
+        같은 사용자·거래소·심볼에 설정이 여러 개면 가장 엄격한 값을 쓴다.
+
+        Args:
+            db (Session): 데이터베이스 세션
+
+        Returns:
+            int: 한도를 불러온 사용자·거래소·심볼 수
+        """
+        limits: Dict[RiskKey, List[Optional[float]]] = {}
+        for setting in db.query(TradingSetting).filter(TradingSetting.is_active == True):
+            values = (setting.max_position_size, setting.stop_loss_percentage, setting.take_profit_percentage)
+            current = limits.setdefault((setting.user_id, setting.exchange, setting.symbol), [None, None, None])
+            for index, value in enumerate(values):
+                if value is not None:
+                    current[index] = value if current[index] is None else min(current[index], value)
+        for (user_id, exchange, symbol), (max_position, stop_loss, take_profit) in limits.items():
+            self.set_limits(user_id, exchange, symbol, max_position, stop_loss, take_profit)
+        self.attach()
+        return len(limits)
+
+    def attach(self) -> None:
+        """장부의 현재 포지션을 불러오고 장부 변경 알림 구독"""
+        if not self._attached:
+            self.update_positions(self.book.all_positions())
+            self.book.add_listener(self.update_positions)
+            self._attached = True
+
+    def detach(self) -> None:
+        """장부 변경 알림 구독 해제"""
+        if self._attached:
+            self.book.remove_listener(self.update_positions)
+            self._attached = False
+
+    def bind_market_data(self, store: "MarketDataStore", exchange: str = "upbit") -> Callable[[], None]:
+        """
+        시세 저장소의 티커 갱신을 on_price로 반영
+
+        시장가 매수(총액 주문)의 수량 추정과 손절/익절 판정에 쓰는 현재가를 채운다.
+
+        Args:
+            store (MarketDataStore): 시세 저장소
+            exchange (str): 저장소 시세의 거래소
+
+        Returns:
+            Callable[[], None]: 연결 해제 함수
+        """
+        def on_update(kind: str, symbol: str) -> None:
+            if kind != "ticker":
+                return
+            price = store.get_price(symbol)
+            if price is not None:
+                self.on_price(exchange, symbol, price)
+
+        store.add_listener(on_update)
+        return lambda: store.remove_listener(on_update)
+
+    # 사전 주문 검사
+
+    def _order_limit(self, symbol: str) -> Optional[float]:
+        limit = self._order_limits.get(symbol, False)
+        if limit is False:
+            try:
+                limit = self.max_order_quantity.get(split_symbol(symbol)[1])
+            except ValueError:
+                limit = None
+            self._order_limits[symbol] = limit
+        return limit
+
+    def check(
+        self,
+        user_id: int,
+        exchange: str,
+        symbol: str,
+        side: str,
+        quantity: Optional[float] = None,
+        amount: Optional[float] = None,
+        price: Optional[float] = None,
+    ) -> Optional[float]:
+        """
+        사전 주문 한도 검사 (DB 조회 없음)
+
+        Args:
+            user_id (int): 사용자 ID
+            exchange (str): 거래소
+            symbol (str): 심볼
+            side (str): "buy" 또는 "sell"
+            quantity (float, optional): 주문 수량
+            amount (float, optional): 시장가 매수 총액 (수량이 없으면 가격으로 나눠 추정)
+            price (float, optional): 주문 가격 (없으면 마지막 시세)
+
+        Returns:
+            Optional[float]: 검사한 주문 수량 (적용할 한도가 없어 수량을 구하지 않았으면 None)
+
+        Raises:
+            RiskLimitError: 한도를 넘거나 한도 검사에 필요한 수량을 알 수 없는 경우
+        """
+        exposure = self._exposures.get((user_id, exchange, symbol))
+        max_position = exposure.max_position if exposure is not None else None
+        max_order = self._order_limit(symbol)
+        if max_order is None and max_position is None:
+            return None
+        if quantity is None:
+            price = price or self._prices.get((exchange, symbol))
+            if amount is None or not price:
+                RISK_REJECTIONS.inc()
+                raise RiskLimitError(f"주문 수량을 알 수 없어 한도를 검사할 수 없습니다 ({symbol})")
+            quantity = amount / price
+        if max_order is not None and quantity > max_order + EPSILON:
+            RISK_REJECTIONS.inc()
+            raise RiskLimitError(f"1회 최대 주문 수량을 초과했습니다 ({symbol}: {quantity:g} > {max_order:g})")
+        if max_position is not None:
+            current = float(self._quantity[exposure.row])
+            if side == BUY:
+                projected = current + exposure.pending_buy + quantity
+            elif side == SELL:
+                projected = -(current - exposure.pending_sell - quantity)
+            else:
+                raise ValueError(f"지원하지 않는 주문 방향입니다: {side}")
+            if projected > max_position + EPSILON:
+                RISK_REJECTIONS.inc()
+                raise RiskLimitError(
+                    f"최대 포지션 수량을 초과합니다 ({symbol}: {projected:g} > {max_position:g})"
+                )
+        return quantity
+
+    def reserve(self, user_id: int, exchange: str, symbol: str, side: str, quantity: float) -> None:
+        """
+        접수한 주문 수량 예약 (체결 전까지 포지션 한도 검사에 포함)
+
+        Args:
+            user_id (int): 사용자 ID
+            exchange (str): 거래소
+            symbol (str): 심볼
+            side (str): "buy" 또는 "sell"
+            quantity (float): 예약 수량
+        """
+        with self._lock:
+            exposure = self._exposure(user_id, exchange, symbol)
+            if side == BUY:
+                exposure.pending_buy += quantity
+            else:
+                exposure.pending_sell += quantity
+
+    def release(self, user_id: int, exchange: str, symbol: str, side: str, quantity: float) -> None:
+        """
+        예약 수량 해제 (체결 반영 또는 주문 종료 시)
+
+        Args:
+            user_id (int): 사용자 ID
+            exchange (str): 거래소
+            symbol (str): 심볼
+            side (str): "buy" 또는 "sell"
+            quantity (float): 해제 수량
+        """
+        with self._lock:
+            exposure = self._exposures.get((user_id, exchange, symbol))
+            if exposure is None:
+                return
+            if side == BUY:
+                exposure.pending_buy = max(exposure.pending_buy - quantity, 0.0)
+            else:
+                exposure.pending_sell = max(exposure.pending_sell - quantity, 0.0)
+
+    # 손절/익절 감시
+
+    def add_listener(self, listener: TriggerListener) -> None:
+        """
+        손절/익절 알림 등록
+
+        Args:
+            listener (TriggerListener): 조건에 걸린 포지션 목록을 받는 콜백 (틱당 한 번)
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: TriggerListener) -> None:
+        """손절/익절 알림 해제"""
+        self._listeners.remove(listener)
+
+    def _rows(self, symbol_id: int) -> np.ndarray:
+        rows = self._symbol_rows
+        if rows is None:
+            # 심볼 ID로 정렬해 심볼별 행 번호 묶음을 한 번에 만든다
+            count = len(self._keys)
+            order = np.argsort(self._symbol[:count], kind="stable")
+            ids, starts = np.unique(self._symbol[order], return_index=True)
+            rows = self._symbol_rows = dict(zip(ids.tolist(), np.split(order, starts[1:])))
+        return rows.get(symbol_id, np.empty(0, dtype=np.intp))
+
+    def _fire(self, rows: np.ndarray, prices: np.ndarray) -> List[RiskTrigger]:
+        # self._lock 안에서 호출, 걸린 행은 포지션이 바뀔 때까지 감시 중지
+        self._armed[rows] = False
+        triggers = []
+        for row, price in zip(rows.tolist(), prices.tolist()):
+            user_id, exchange, symbol = self._keys[row]
+            kind = STOP_LOSS if self._sign[row] * price <= self._stop[row] else TAKE_PROFIT
+            triggers.append(RiskTrigger(
+                user_id, exchange, symbol, kind, price, float(self._quantity[row]), float(self._avg_cost[row]),
+            ))
+        return triggers
+
+    def _notify(self, triggers: List[RiskTrigger]) -> List[RiskTrigger]:
+        if triggers:
+            RISK_TRIGGERS.inc(len(triggers))
+            for listener in self._listeners:
+                try:
+                    listener(triggers)
+                except Exception:
+                    logger.exception("손절/익절 알림 처리 실패")
+        return triggers
+
+    def on_price(self, exchange: str, symbol: str, price: float) -> List[RiskTrigger]:
+        """
+        시세 틱 반영 및 해당 심볼 포지션의 손절/익절 판정
+
+        Args:
+            exchange (str): 거래소
+            symbol (str): 심볼
+            price (float): 현재가
+
+        Returns:
+            List[RiskTrigger]: 이번 틱에 조건에 걸린 포지션
+        """
+        self._prices[(exchange, symbol)] = price
+        symbol_id = self._symbol_ids.get((exchange, symbol))
+        if symbol_id is None:
+            return []
+        with self._lock:
+            rows = self._rows(symbol_id)
+            signed = self._sign[rows] * price
+            hit = self._armed[rows] & ((signed <= self._stop[rows]) | (signed >= self._take[rows]))
+            if not hit.any():
+                return []
+            hit_rows = rows[hit]
+            triggers = self._fire(hit_rows, np.full(len(hit_rows), price))
+        return self._notify(triggers)
+
+    def scan(self, prices: Mapping[PositionKey, float]) -> List[RiskTrigger]:
+        """
+        전체 포지션의 손절/익절 일괄 판정
+
+        Args:
+            prices (Mapping[PositionKey, float]): (거래소, 심볼)별 현재가
+
+        Returns:
+            List[RiskTrigger]: 조건에 걸린 포지션
+        """
+        self._prices.update(prices)
+        with self._lock:
+            by_symbol = np.full(len(self._symbol_ids) + 1, np.nan)
+            for key, price in prices.items():
+                symbol_id = self._symbol_ids.get(key)
+                if symbol_id is not None:
+                    by_symbol[symbol_id] = price
+            count = len(self._keys)
+            current = by_symbol[self._symbol[:count]]
+            signed = self._sign[:count] * current
+            hit = self._armed[:count] & ((signed <= self._stop[:count]) | (signed >= self._take[:count]))
+            hit_rows = np.flatnonzero(hit)
+            triggers = self._fire(hit_rows, current[hit_rows]) if len(hit_rows) else []
+        return self._notify(triggers)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        위험 관리 통계 조회
+
+        Returns:
+            Dict[str, int]: 감시 중인 포지션 수, 한도 행 수, 거절/손절·익절 수
+        """
+        count = len(self._keys)
+        return {
+            "rows": count,
+            "watched_positions": int(self._armed[:count].sum()),
+            "symbols": len(self._symbol_ids),
+            "rejections": int(RISK_REJECTIONS.value),
+            "triggers": int(RISK_TRIGGERS.value),
+        }
+
+
+risk_engine = RiskEngine()
@@ -0,0 +1,262 @@
+"""
+매매 전략
+
+전략은 두 가지 방식으로 실행된다.
+- generate_signals: 전체 OHLCV 배열에서 신호 배열을 한 번에 계산 (백테스트)
+- on_tick: 실시간 가격마다 O(1)로 갱신 (매매 엔진)
+두 방식은 같은 지표 점화식을 쓰므로 같은 가격 순서에 대해 같은 신호를 낸다.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+
+import numpy as np
+
+from . import indicators
+
+BUY = "buy"
+SELL = "sell"
+
+# 신호 배열 값
+SIGNAL_BUY = 1
+SIGNAL_SELL = -1
+SIGNAL_NONE = 0
+
+STRATEGIES: Dict[str, Type["Strategy"]] = {}
+
+
+def register_strategy(name: str) -> Callable[[Type["Strategy"]], Type["Strategy"]]:
+    """
+    전략 클래스 등록 데코레이터
+
+    TradingSetting.strategy_name으로 전략을 찾을 수 있도록 등록한다.
+
+    Args:
+        name (str): 전략 이름
+    """
+    def decorator(cls: Type["Strategy"]) -> Type["Strategy"]:
+        cls.name = name
+        STRATEGIES[name] = cls
+        return cls
+    return decorator
+
+
+def create_strategy(name: str, symbol: str, parameters: Optional[Dict[str, Any]] = None) -> "Strategy":
+    """
+    전략 인스턴스 생성
+
+    Args:
+        name (str): 전략 이름
+        symbol (str): 심볼
+        parameters (Dict[str, Any], optional): 전략 파라미터
+
+    Returns:
+        Strategy: 전략 인스턴스
+    """
+    try:
+        strategy_cls = STRATEGIES[name]
+    except KeyError:
+        raise ValueError(f"알 수 없는 전략입니다: {name}")
+    return strategy_cls(symbol, parameters or {})
+
+
+def crossover(a: np.ndarray, b) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    a가 b를 상향/하향 돌파한 지점 계산
+
+    Args:
+        a (np.ndarray): 비교 대상 배열
+        b: 기준 배열 또는 상수
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (상향 돌파 여부, 하향 돌파 여부)
+    """
+    b = np.broadcast_to(np.asarray(b, dtype=np.float64), a.shape)
+    up = np.zeros(len(a), dtype=bool)
+    down = np.zeros(len(a), dtype=bool)
+    up[1:] = (a[:-1] <= b[:-1]) & (a[1:] > b[1:])
+    down[1:] = (a[:-1] >= b[:-1]) & (a[1:] < b[1:])
+    return up, down
+
+
+class Cross:
+    """crossover의 증분 버전"""
+
+    def __init__(self):
+        self.prev_a = indicators.NAN
+        self.prev_b = indicators.NAN
+
+    def update(self, a: float, b: float) -> int:
+        result = 0
+        if self.prev_a <= self.prev_b and a > b:
+            result = 1
+        elif self.prev_a >= self.prev_b and a < b:
+            result = -1
+        self.prev_a, self.prev_b = a, b
+        return result
+
+
+class Strategy(ABC):
+    name = "base"
+
+    def __init__(self, symbol: str, parameters: Dict[str, Any]):
+        """
+        전략 초기화
+
+        Args:
+            symbol (str): 심볼
+            parameters (Dict[str, Any]): 전략 파라미터 (TradingSetting.parameters)
+        """
+        self.symbol = symbol
+        self.parameters = parameters
+
+    def generate_signals(self, ohlcv) -> np.ndarray:
+        """
+        OHLCV 전체에 대한 신호 계산 (벡터화)
+
+        Args:
+            ohlcv: DataFrame 또는 열 배열 딕셔너리
+
+        Returns:
+            np.ndarray: 봉별 신호 (1: 매수, -1: 매도, 0: 없음)
+        """
+        return self.signals(indicators.ohlcv_columns(ohlcv)["close"])
+
+    @abstractmethod
+    def signals(self, close: np.ndarray) -> np.ndarray:
+        """
+        종가 배열에 대한 신호 계산
+
+        Args:
+            close (np.ndarray): 종가 배열
+
+        Returns:
+            np.ndarray: 봉별 신호
+        """
+
+    @abstractmethod
+    def update(self, price: float) -> int:
+        """
+        새 가격 반영 (증분)
+
+        Args:
+            price (float): 가격
+
+        Returns:
+            int: 신호 (1: 매수, -1: 매도, 0: 없음)
+        """
+
+    def on_tick(self, price: float, timestamp: float) -> Optional[str]:
+        """
+        실시간 가격 반영
+
+        Args:
+            price (float): 현재가
+            timestamp (float): 타임스탬프 (밀리초)
+
+        Returns:
+            Optional[str]: 매매 신호 (BUY / SELL / None)
+        """
+        signal = self.update(price)
+        if signal == SIGNAL_BUY:
+            return BUY
+        if signal == SIGNAL_SELL:
+            return SELL
+        return None
+
+
+def _to_signals(buy: np.ndarray, sell: np.ndarray) -> np.ndarray:
+    result = np.zeros(len(buy), dtype=np.int8)
+    result[buy] = SIGNAL_BUY
+    result[sell] = SIGNAL_SELL
+    return result
+
+
+@register_strategy("sma_cross")
+class SMACrossStrategy(Strategy):
+    """단기 이동평균이 장기 이동평균을 상향 돌파하면 매수, 하향 돌파하면 매도"""
+
+    def __init__(self, symbol: str, parameters: Dict[str, Any]):
+        super().__init__(symbol, parameters)
+        self.fast = int(parameters.get("fast", 10))
+        self.slow = int(parameters.get("slow", 30))
+        self._fast = indicators.SMA(self.fast)
+        self._slow = indicators.SMA(self.slow)
+        self._cross = Cross()
+
+    def signals(self, close: np.ndarray) -> np.ndarray:
+        return _to_signals(*crossover(indicators.sma(close, self.fast), indicators.sma(close, self.slow)))
+
+    def update(self, price: float) -> int:
+        return self._cross.update(self._fast.update(price), self._slow.update(price))
+
+
+@register_strategy("rsi")
+class RSIStrategy(Strategy):
+    """RSI가 과매도선을 상향 돌파하면 매수, 과매수선을 하향 돌파하면 매도"""
+
+    def __init__(self, symbol: str, parameters: Dict[str, Any]):
+        super().__init__(symbol, parameters)
+        self.period = int(parameters.get("period", 14))
+        self.oversold = float(parameters.get("oversold", 30))
+        self.overbought = float(parameters.get("overbought", 70))
+        self._rsi = indicators.RSI(self.period)
+        self._buy = Cross()
+        self._sell = Cross()
+
+    def signals(self, close: np.ndarray) -> np.ndarray:
+        values = indicators.rsi(close, self.period)
+        buy, _ = crossover(values, self.oversold)
+        _, sell = crossover(values, self.overbought)
+        return _to_signals(buy, sell)
+
+    def update(self, price: float) -> int:
+        value = self._rsi.update(price)
+        buy = self._buy.update(value, self.oversold) == 1
+        sell = self._sell.update(value, self.overbought) == -1
+        return SIGNAL_SELL if sell else SIGNAL_BUY if buy else SIGNAL_NONE
+
+
+@register_strategy("macd")
+class MACDStrategy(Strategy):
+    """MACD 히스토그램이 0을 상향 돌파하면 매수, 하향 돌파하면 매도"""
+
+    def __init__(self, symbol: str, parameters: Dict[str, Any]):
+        super().__init__(symbol, parameters)
+        self.fast = int(parameters.get("fast", 12))
+        self.slow = int(parameters.get("slow", 26))
+        self.signal_period = int(parameters.get("signal", 9))
+        self._macd = indicators.MACD(self.fast, self.slow, self.signal_period)
+        self._cross = Cross()
+
+    def signals(self, close: np.ndarray) -> np.ndarray:
+        _, _, histogram = indicators.macd(close, self.fast, self.slow, self.signal_period)
+        return _to_signals(*crossover(histogram, 0.0))
+
+    def update(self, price: float) -> int:
+        return self._cross.update(self._macd.update(price)[2], 0.0)
+
+
+@register_strategy("bollinger")
+class BollingerStrategy(Strategy):
+    """종가가 하단 밴드를 하향 이탈하면 매수, 상단 밴드를 상향 이탈하면 매도"""
+
+    def __init__(self, symbol: str, parameters: Dict[str, Any]):
+        super().__init__(symbol, parameters)
+        self.period = int(parameters.get("period", 20))
+        self.k = float(parameters.get("k", 2.0))
+        self._bands = indicators.Bollinger(self.period, self.k)
+        self._lower = Cross()
+        self._upper = Cross()
+
+    def signals(self, close: np.ndarray) -> np.ndarray:
+        lower, _, upper = indicators.bollinger(close, self.period, self.k)
+        _, buy = crossover(close, lower)
+        sell, _ = crossover(close, upper)
+        return _to_signals(buy, sell)
+
+    def update(self, price: float) -> int:
+        lower, _, upper = self._bands.update(price)
+        buy = self._lower.update(price, lower) == -1
+        sell = self._upper.update(price, upper) == 1
+        return SIGNAL_SELL if sell else SIGNAL_BUY if buy else SIGNAL_NONE
@@ -0,0 +1,99 @@
+"""
+대시보드 스트림 토픽 및 허브 연결
+
+시세 저장소와 포트폴리오 장부의 변경을 허브 토픽으로 발행한다.
+- prices: 키 = 심볼
+- portfolio:{user_id}: 키 = "{exchange}:{symbol}"
+- orders:{user_id}: 키 = 클라이언트 주문 ID (trading/execution.py)
+"""
+
+from dataclasses import asdict
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from app.core.pubsub import StreamHub
+from .market_data.store import MarketDataStore
+from .portfolio import PortfolioBook, Position, PositionKey, summarize
+
+PRICES_TOPIC = "prices"
+
+
+def portfolio_topic(user_id: int) -> str:
+    """사용자 포트폴리오 토픽"""
+    return f"portfolio:{user_id}"
+
+
+def orders_topic(user_id: int) -> str:
+    """사용자 주문 상태 토픽"""
+    return f"orders:{user_id}"
+
+
+def user_topics(user_id: int) -> List[str]:
+    """대시보드 연결이 구독하는 토픽"""
+    return [PRICES_TOPIC, portfolio_topic(user_id), orders_topic(user_id)]
+
+
+def bind_portfolio(hub: StreamHub, book: PortfolioBook) -> Callable[[], None]:
+    """
+    포지션 변경을 portfolio:{user_id} 토픽으로 발행
+
+    체결 기록은 스레드풀에서도 일어나므로 publish_threadsafe를 사용한다.
+
+    Args:
+        hub (StreamHub): 허브
+        book (PortfolioBook): 포트폴리오 장부
+
+    Returns:
+        Callable[[], None]: 연결 해제 함수
+    """
+    def on_positions(positions: List[Position]) -> None:
+        for position in positions:
+            data = asdict(position)
+            del data["user_id"]
+            hub.publish_threadsafe(portfolio_topic(position.user_id), f"{position.exchange}:{position.symbol}", data)
+
+    book.add_listener(on_positions)
+    return lambda: book.remove_listener(on_positions)
+
+
+class PortfolioView:
+    def __init__(self, hub: StreamHub):
+        """
+        portfolio:{user_id} 토픽 상태로 만든 읽기 전용 장부 초기화
+
+        API 워커(APP_ROLE=api)는 장부를 복원하지 않고, 엔진 프로세스가 공유 메모리로 복제한
+        포지션 상태를 읽는다. PortfolioBook의 조회 메서드(positions, summary)만 제공한다.
+
+        Args:
+            hub (StreamHub): 복제된 허브
+        """
+        self.hub = hub
+
+    def positions(self, user_id: int) -> List[Position]:
+        """사용자 포지션 목록"""
+        return [Position(user_id=user_id, **data) for data in self.hub.entries(portfolio_topic(user_id)).values()]
+
+    def summary(self, user_id: int, prices: Optional[Mapping[PositionKey, float]] = None) -> Dict[str, Any]:
+        """사용자 포트폴리오 요약 (PortfolioBook.summary와 같은 형식)"""
+        return summarize(user_id, self.positions(user_id), prices)
+
+
+def bind_market_data(hub: StreamHub, store: MarketDataStore) -> Callable[[], None]:
+    """
+    티커 갱신을 prices 토픽으로 발행
+
+    Args:
+        hub (StreamHub): 허브
+        store (MarketDataStore): 시세 저장소 (피드와 같은 이벤트 루프에서 갱신)
+
+    Returns:
+        Callable[[], None]: 연결 해제 함수
+    """
+    def on_update(kind: str, symbol: str) -> None:
+        if kind != "ticker":
+            return
+        ticker = store.get_ticker(symbol)
+        if ticker is not None:
+            hub.publish(PRICES_TOPIC, symbol, ticker)
+
+    store.add_listener(on_update)
+    return lambda: store.remove_listener(on_update)
@@ -3,7 +3,8 @@
 """
 
 from .api import UpbitAPI
+from .async_api import AsyncUpbitAPI
 from .models import ApiKey
 from .exceptions import UpbitAPIError
 
-__all__ = ['UpbitAPI', 'ApiKey', 'UpbitAPIError'] 
\ No newline at end of file
+__all__ = ['UpbitAPI', 'AsyncUpbitAPI', 'ApiKey', 'UpbitAPIError'] 
\ No newline at end of file
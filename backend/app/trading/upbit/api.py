@@ -1,10 +1,14 @@
 """
 업비트 API 연동 클래스
+
+pyupbit(pandas, requests 포함)는 불러오는 데 오래 걸리므로 동기 클라이언트를 처음 쓸 때 불러온다.
 """
 
-import pyupbit
-from typing import Optional, Dict, Any
+import time
+from typing import Any, Callable, Dict, List, Optional
+from app.services.rate_limiter import EXCHANGE_REQUEST_LATENCY
 from .exceptions import UpbitAPIError
+from .quote_cache import quote_cache
 
 class UpbitAPI:
     def __init__(self, access_key: str, secret_key: str):
@@ -17,7 +21,21 @@ class UpbitAPI:
         """
         self.access_key = access_key
         self.secret_key = secret_key
+        import pyupbit
+
         self.client = pyupbit.Upbit(access_key, secret_key)
+
+    @staticmethod
+    def _call(endpoint: str, function: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """pyupbit 호출 (거래소 요청 시간 기록)"""
+        start = time.perf_counter()
+        status = "error"
+        try:
+            result = function(*args, **kwargs)
+            status = "ok"
+            return result
+        finally:
+            EXCHANGE_REQUEST_LATENCY.labels("upbit", endpoint, status).observe(time.perf_counter() - start)
     
     def get_balance(self, ticker: str = "KRW") -> float:
         """
@@ -30,7 +48,7 @@ class UpbitAPI:
             float: 잔고
         """
         try:
-            return self.client.get_balance(ticker)
+            return self._call("/v1/accounts", self.client.get_balance, ticker)
         except Exception as e:
             raise UpbitAPIError(f"잔고 조회 실패: {str(e)}")
     
@@ -44,10 +62,38 @@ class UpbitAPI:
         Returns:
             float: 현재가
         """
+        import pyupbit
+
+        try:
+            return self._call("/v1/ticker", pyupbit.get_current_price, ticker)
+        except Exception as e:
+            raise UpbitAPIError(f"현재가 조회 실패: {str(e)}")
+    
+    def get_current_prices(self, tickers: List[str]) -> Dict[str, float]:
+        """
+        여러 티커 현재가 일괄 조회
+
+        티커를 묶음 단위로 조회하고 짧은 TTL 시세 캐시를 거친다.
+        
+        Args:
+            tickers (List[str]): 티커 목록 (예: ["KRW-BTC", "KRW-ETH"])
+            
+        Returns:
+            Dict[str, float]: 티커별 현재가
+        """
         try:
-            return pyupbit.get_current_price(ticker)
+            return quote_cache.get_many(tickers, self._fetch_prices)
         except Exception as e:
             raise UpbitAPIError(f"현재가 조회 실패: {str(e)}")
+
+    @staticmethod
+    def _fetch_prices(tickers: List[str]) -> Dict[str, float]:
+        import pyupbit
+
+        data = UpbitAPI._call("/v1/ticker", pyupbit.get_current_price, tickers, verbose=True)
+        if isinstance(data, dict):
+            data = [data]
+        return {item["market"]: item["trade_price"] for item in data}
     
     def place_market_order(self, ticker: str, side: str, volume: Optional[float] = None, price: Optional[float] = None) -> Dict[str, Any]:
         """
@@ -64,8 +110,8 @@ class UpbitAPI:
         """
         try:
             if side == "bid":
-                return self.client.buy_market_order(ticker, price)
+                return self._call("/v1/orders", self.client.buy_market_order, ticker, price)
             else:
-                return self.client.sell_market_order(ticker, volume)
+                return self._call("/v1/orders", self.client.sell_market_order, ticker, volume)
         except Exception as e:
             raise UpbitAPIError(f"주문 실패: {str(e)}") 
\ No newline at end of file
@@ -0,0 +1,241 @@
+"""
+업비트 비동기 API 연동 클래스
+"""
+
+import asyncio
+import hashlib
+import time
+import uuid
+from typing import Optional, Dict, Any, List
+from urllib.parse import urlencode
+
+import aiohttp
+
+from app.core.config import settings
+from app.services.rate_limiter import EXCHANGE_REQUEST_LATENCY, RateLimiter, rate_limiter as default_rate_limiter, retry_after, upbit_quota
+from .exceptions import UpbitAPIError, UpbitAPIRequestError, UpbitAPIResponseError
+from .quote_cache import quote_cache
+
+_session: Optional[aiohttp.ClientSession] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """
+    프로세스 공유 HTTP 세션 조회
+
+    keep-alive 연결을 재사용하도록 이벤트 루프당 하나의 세션을 유지한다.
+    루프가 바뀌면 이전 루프의 세션을 닫아 커넥터의 연결을 정리한 뒤 새로 만든다.
+
+    Returns:
+        aiohttp.ClientSession: 공유 HTTP 세션
+    """
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is not None and not _session.closed and _session_loop is not loop:
+        stale, stale_loop = _session, _session_loop
+        _session = None
+        if stale_loop is not None and stale_loop.is_running():
+            # 다른 스레드에서 도는 루프의 연결은 그 루프에서 닫는다
+            asyncio.run_coroutine_threadsafe(stale.close(), stale_loop)
+        else:
+            await stale.close()
+    if _session is None or _session.closed or _session_loop is not loop:
+        connector = aiohttp.TCPConnector(
+            limit=settings.UPBIT_HTTP_POOL_SIZE,
+            keepalive_timeout=settings.UPBIT_HTTP_KEEPALIVE,
+            ttl_dns_cache=300,
+        )
+        _session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=settings.UPBIT_HTTP_TIMEOUT),
+        )
+        _session_loop = loop
+    return _session
+
+
+async def close_session() -> None:
+    """프로세스 공유 HTTP 세션 종료"""
+    global _session, _session_loop
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+    _session_loop = None
+
+
+class AsyncUpbitAPI:
+    def __init__(
+        self,
+        access_key: str,
+        secret_key: str,
+        base_url: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        """
+        업비트 비동기 API 클라이언트 초기화
+        
+        Args:
+            access_key (str): 업비트 API 액세스 키
+            secret_key (str): 업비트 API 시크릿 키
+            base_url (str, optional): API 주소 (기본값: settings.UPBIT_API_URL)
+            rate_limiter (RateLimiter, optional): 요청 쿼터 스케줄러 (기본값: 프로세스 공유 rate_limiter)
+        """
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self.base_url = (base_url or settings.UPBIT_API_URL).rstrip("/")
+        self.rate_limiter = rate_limiter if rate_limiter is not None else default_rate_limiter
+
+    def _auth_headers(self, params: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
+        """
+        JWT 인증 헤더 생성
+
+        Args:
+            params (Dict[str, Any], optional): 요청 파라미터
+
+        Returns:
+            Dict[str, str]: Authorization 헤더
+        """
+        payload = {"access_key": self.access_key, "nonce": str(uuid.uuid4())}
+        if params:
+            query_hash = hashlib.sha512(urlencode(params).encode()).hexdigest()
+            payload["query_hash"] = query_hash
+            payload["query_hash_alg"] = "SHA512"
+        from jose import jwt
+
+        token = jwt.encode(payload, self.secret_key, algorithm="HS256")
+        return {"Authorization": f"Bearer {token}"}
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        auth: bool = False,
+    ) -> Any:
+        """
+        API 요청 전송
+
+        요청 그룹 쿼터를 확보할 때까지 대기하고, Remaining-Req 헤더로 남은 쿼터를 보정한다.
+        429 응답은 Retry-After만큼 기다린 뒤 재시도한다.
+
+        Args:
+            method (str): HTTP 메서드
+            path (str): API 경로 (예: /v1/ticker)
+            params (Dict[str, Any], optional): 요청 파라미터
+            auth (bool): 인증 헤더 포함 여부
+
+        Returns:
+            Any: JSON 응답
+        """
+        quota, priority = upbit_quota(method, path, self.access_key)
+        session = await get_session()
+        try:
+            for attempt in range(settings.RATE_LIMIT_MAX_RETRIES + 1):
+                await self.rate_limiter.acquire_all("upbit", quota, priority)
+                kwargs: Dict[str, Any] = {"headers": self._auth_headers(params) if auth else None}
+                if method == "GET":
+                    kwargs["params"] = params
+                else:
+                    kwargs["json"] = params
+                start = time.perf_counter()
+                status = "error"
+                try:
+                    async with session.request(method, f"{self.base_url}{path}", **kwargs) as response:
+                        status = str(response.status)
+                        self.rate_limiter.update("upbit", quota, response.headers)
+                        if response.status == 429:
+                            delay = retry_after(response.headers)
+                            self.rate_limiter.penalize("upbit", quota, delay)
+                            if attempt < settings.RATE_LIMIT_MAX_RETRIES and delay <= settings.RATE_LIMIT_MAX_RETRY_AFTER:
+                                continue
+                        if response.status >= 400:
+                            body = await response.text()
+                            raise UpbitAPIResponseError(f"HTTP {response.status}: {body}")
+                        return await response.json()
+                finally:
+                    EXCHANGE_REQUEST_LATENCY.labels("upbit", path, status).observe(time.perf_counter() - start)
+        except aiohttp.ClientError as e:
+            raise UpbitAPIRequestError(str(e))
+        except asyncio.TimeoutError:
+            raise UpbitAPIRequestError("요청 시간 초과")
+
+    async def get_balance(self, ticker: str = "KRW") -> float:
+        """
+        잔고 조회
+        
+        Args:
+            ticker (str): 화폐 종류 (기본값: KRW)
+            
+        Returns:
+            float: 잔고
+        """
+        try:
+            fiat = "KRW"
+            if "-" in ticker:
+                fiat, ticker = ticker.split("-")
+            balances: List[Dict[str, Any]] = await self._request("GET", "/v1/accounts", auth=True)
+            for balance in balances:
+                if balance["currency"] == ticker and balance.get("unit_currency", fiat) == fiat:
+                    return float(balance["balance"])
+            return 0.0
+        except UpbitAPIError as e:
+            raise UpbitAPIError(f"잔고 조회 실패: {str(e)}")
+
+    async def get_current_price(self, ticker: str) -> float:
+        """
+        현재가 조회
+        
+        Args:
+            ticker (str): 티커 (예: KRW-BTC)
+            
+        Returns:
+            float: 현재가
+        """
+        try:
+            data = await self._request("GET", "/v1/ticker", params={"markets": ticker})
+            return data[0]["trade_price"]
+        except (UpbitAPIError, LookupError) as e:
+            raise UpbitAPIError(f"현재가 조회 실패: {str(e)}")
+
+    async def get_current_prices(self, tickers: List[str]) -> Dict[str, float]:
+        """
+        여러 티커 현재가 일괄 조회
+
+        티커를 묶음 단위로 조회하고 짧은 TTL 시세 캐시를 거친다.
+        
+        Args:
+            tickers (List[str]): 티커 목록 (예: ["KRW-BTC", "KRW-ETH"])
+            
+        Returns:
+            Dict[str, float]: 티커별 현재가
+        """
+        try:
+            return await quote_cache.aget_many(tickers, self._fetch_prices)
+        except UpbitAPIError as e:
+            raise UpbitAPIError(f"현재가 조회 실패: {str(e)}")
+
+    async def _fetch_prices(self, tickers: List[str]) -> Dict[str, float]:
+        data = await self._request("GET", "/v1/ticker", params={"markets": ",".join(tickers)})
+        return {item["market"]: item["trade_price"] for item in data}
+
+    async def place_market_order(self, ticker: str, side: str, volume: Optional[float] = None, price: Optional[float] = None) -> Dict[str, Any]:
+        """
+        시장가 주문
+        
+        Args:
+            ticker (str): 티커 (예: KRW-BTC)
+            side (str): 주문 종류 (bid: 매수, ask: 매도)
+            volume (float, optional): 주문량
+            price (float, optional): 주문 가격
+            
+        Returns:
+            Dict[str, Any]: 주문 결과
+        """
+        if side == "bid":
+            params = {"market": ticker, "side": "bid", "price": str(price), "ord_type": "price"}
+        else:
+            params = {"market": ticker, "side": "ask", "volume": str(volume), "ord_type": "market"}
+        try:
+            return await self._request("POST", "/v1/orders", params=params, auth=True)
+        except UpbitAPIError as e:
+            raise UpbitAPIError(f"주문 실패: {str(e)}")
@@ -0,0 +1,165 @@
+"""
+업비트 인증 클라이언트 풀
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
+
+from app.core.config import settings
+from app.core.metrics import Gauge
+from app.core.security import CryptoUtils
+from .api import UpbitAPI
+from .exceptions import UpbitAPIKeyError
+from .models import ApiKey
+
+if TYPE_CHECKING:
+    from .services import ApiKeyService, AsyncApiKeyService
+
+ClientFactory = Callable[[str, str], Any]
+
+
+class UpbitClientPool:
+    def __init__(
+        self,
+        ttl: Optional[float] = None,
+        max_size: Optional[int] = None,
+        factory: ClientFactory = UpbitAPI,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        API 키별 인증 클라이언트 풀 초기화
+
+        복호화한 키로 만든 클라이언트를 ApiKey.id 기준으로 메모리에만 보관한다.
+        TTL이 지나거나 최대 개수를 넘으면(가장 오래 쓰지 않은 것부터) 버린다.
+        키별 세대 번호는 invalidate가 올리며, 키를 읽는 동안 세대가 바뀌면 만든 클라이언트를
+        보관하지 않는다 (무효화 전에 읽은 키로 만든 클라이언트가 다시 들어가지 않도록).
+
+        Args:
+            ttl (float, optional): 클라이언트 유효 시간 (초, 기본값: settings.UPBIT_CLIENT_POOL_TTL)
+            max_size (int, optional): 최대 보관 수 (기본값: settings.UPBIT_CLIENT_POOL_SIZE)
+            factory (ClientFactory): (액세스 키, 시크릿 키)로 클라이언트를 만드는 함수
+            clock (Callable[[], float]): 시간 함수
+        """
+        self.ttl = settings.UPBIT_CLIENT_POOL_TTL if ttl is None else ttl
+        self.max_size = max_size or settings.UPBIT_CLIENT_POOL_SIZE
+        self.factory = factory
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._clients: "OrderedDict[int, Tuple[Any, float]]" = OrderedDict()
+        self._generations: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def _lookup(self, key_id: int) -> Tuple[Optional[Any], int]:
+        now = self.clock()
+        with self._lock:
+            generation = self._generations.get(key_id, 0)
+            entry = self._clients.get(key_id)
+            if entry is not None and entry[1] > now:
+                self._clients.move_to_end(key_id)
+                self.hits += 1
+                return entry[0], generation
+            if entry is not None:
+                del self._clients[key_id]
+                self.evictions += 1
+            self.misses += 1
+        return None, generation
+
+    def _build(self, key_id: int, api_key: Optional[ApiKey], crypto: CryptoUtils, generation: int) -> Any:
+        if api_key is None:
+            raise UpbitAPIKeyError("API 키를 찾을 수 없습니다.")
+        if api_key.exchange != "upbit":
+            raise UpbitAPIKeyError(f"업비트 API 키가 아닙니다: {api_key.exchange}")
+        if not api_key.is_active:
+            raise UpbitAPIKeyError("비활성화된 API 키입니다.")
+        try:
+            access_key, secret_key = crypto.decrypt(api_key.access_key), crypto.decrypt(api_key.secret_key)
+        except Exception as e:
+            raise UpbitAPIKeyError(f"API 키 복호화 실패: {str(e)}")
+        client = self.factory(access_key, secret_key)
+        with self._lock:
+            if self._generations.get(key_id, 0) != generation:
+                return client
+            self._clients[key_id] = (client, self.clock() + self.ttl)
+            self._clients.move_to_end(key_id)
+            while len(self._clients) > self.max_size:
+                self._clients.popitem(last=False)
+                self.evictions += 1
+        return client
+
+    def get(self, service: "ApiKeyService", key_id: int) -> Any:
+        """
+        API 키의 인증 클라이언트 조회 (없으면 키를 복호화해 생성)
+
+        Args:
+            service (ApiKeyService): 키 조회에 사용할 서비스
+            key_id (int): API 키 ID
+
+        Returns:
+            Any: 인증 클라이언트 (기본값: UpbitAPI)
+
+        Raises:
+            UpbitAPIKeyError: 키가 없거나 업비트 키가 아니거나 비활성화됐거나 복호화에 실패한 경우
+        """
+        client, generation = self._lookup(key_id)
+        if client is None:
+            client = self._build(key_id, service.get_api_key(key_id), service.crypto, generation)
+        return client
+
+    async def aget(self, service: "AsyncApiKeyService", key_id: int) -> Any:
+        """
+        API 키의 인증 클라이언트 조회 (비동기 세션용)
+
+        Args:
+            service (AsyncApiKeyService): 키 조회에 사용할 서비스
+            key_id (int): API 키 ID
+
+        Returns:
+            Any: 인증 클라이언트 (기본값: UpbitAPI)
+
+        Raises:
+            UpbitAPIKeyError: 키가 없거나 업비트 키가 아니거나 비활성화됐거나 복호화에 실패한 경우
+        """
+        client, generation = self._lookup(key_id)
+        if client is None:
+            client = self._build(key_id, await service.get_api_key(key_id), service.crypto, generation)
+        return client
+
+    def invalidate(self, key_id: int) -> None:
+        """API 키의 클라이언트 폐기 (키 상태 변경/삭제 시, 진행 중인 생성 결과도 보관하지 않음)"""
+        with self._lock:
+            self._generations[key_id] = self._generations.get(key_id, 0) + 1
+            if self._clients.pop(key_id, None) is not None:
+                self.invalidations += 1
+
+    def stats(self) -> Dict[str, int]:
+        """
+        풀 통계 조회
+
+        Returns:
+            Dict[str, int]: 적중/미적중/만료·초과 폐기/무효화 수와 현재 크기
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "size": len(self._clients),
+        }
+
+    def clear(self) -> None:
+        """풀과 통계 초기화"""
+        with self._lock:
+            self._clients.clear()
+            self.hits = self.misses = self.evictions = self.invalidations = 0
+
+
+client_pool = UpbitClientPool()
+
+# 풀 현황 (수집할 때 풀에서 읽음)
+CLIENT_POOL_CLIENTS = Gauge("upbit_client_pool_clients", "보관 중인 업비트 인증 클라이언트 수")
+CLIENT_POOL_CLIENTS.set_function(lambda: client_pool.stats()["size"])
@@ -0,0 +1,156 @@
+"""
+API 키 일괄 암복호화 작업 프로세스 풀
+"""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Sequence, Tuple, Union
+
+from app.core.config import settings
+from app.core.security import CryptoUtils
+
+if TYPE_CHECKING:
+    from cryptography.fernet import Fernet, MultiFernet
+
+# 작업 프로세스의 저장용 암호화 핸들 (풀 생성 시 한 번 전달)
+_worker_fernet: Union["Fernet", "MultiFernet", None] = None
+
+# 항목별 결과: (암호화된 액세스 키, 암호화된 시크릿 키) 또는 오류 메시지
+Encrypted = Union[Tuple[str, str], str]
+
+
+def _init_worker(fernet: Union["Fernet", "MultiFernet"]) -> None:
+    global _worker_fernet
+    _worker_fernet = fernet
+
+
+def _encrypt_pairs(pairs: Sequence[Tuple[str, str]], transport_key: Optional[bytes], fernet=None) -> List[Encrypted]:
+    from cryptography.fernet import Fernet, InvalidToken
+
+    fernet = fernet or _worker_fernet
+    transport = Fernet(transport_key) if transport_key else None
+    results: List[Encrypted] = []
+    for access_key, secret_key in pairs:
+        try:
+            if transport is not None:
+                access_key = transport.decrypt(access_key.encode()).decode()
+                secret_key = transport.decrypt(secret_key.encode()).decode()
+        except (InvalidToken, ValueError):
+            results.append("전송 키로 복호화할 수 없습니다.")
+            continue
+        results.append((
+            fernet.encrypt(access_key.encode()).decode(),
+            fernet.encrypt(secret_key.encode()).decode(),
+        ))
+    return results
+
+
+def _reencrypt_pairs(pairs: Sequence[Tuple[str, str]], transport_key: bytes, fernet=None) -> List[Encrypted]:
+    from cryptography.fernet import Fernet, InvalidToken
+
+    fernet = fernet or _worker_fernet
+    transport = Fernet(transport_key)
+    results: List[Encrypted] = []
+    for access_key, secret_key in pairs:
+        try:
+            access_key = fernet.decrypt(access_key.encode())
+            secret_key = fernet.decrypt(secret_key.encode())
+        except InvalidToken:
+            results.append("저장된 키를 복호화할 수 없습니다.")
+            continue
+        results.append((transport.encrypt(access_key).decode(), transport.encrypt(secret_key).decode()))
+    return results
+
+
+class CryptoPool:
+    def __init__(self, processes: Optional[int] = None, min_parallel: int = 64):
+        """
+        일괄 암복호화 프로세스 풀 초기화
+
+        Fernet 연산은 항목마다 CPU를 쓰므로 큰 묶음은 프로세스별로 나눠 병렬 처리한다.
+        풀은 처음 쓸 때 만들고, 저장용 키가 바뀌면(키 교체) 새로 만든다.
+        작업 프로세스에는 파생된 Fernet 키만 전달되고 비밀 키 원문은 전달되지 않는다.
+
+        Args:
+            processes (int, optional): 작업 프로세스 수 (기본값: settings.API_KEY_CRYPTO_WORKERS 또는 CPU 수)
+            min_parallel (int): 이보다 적은 묶음은 풀 대신 스레드 하나에서 처리
+        """
+        self.processes = processes or settings.API_KEY_CRYPTO_WORKERS or os.cpu_count() or 1
+        self.min_parallel = min_parallel
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._key: Optional[Tuple[str, Tuple[str, ...]]] = None
+        self._lock = threading.Lock()
+
+    def _pool(self, crypto: CryptoUtils) -> ProcessPoolExecutor:
+        key = (crypto.key_id, crypto.previous_key_ids)
+        with self._lock:
+            if self._executor is None or self._key != key:
+                if self._executor is not None:
+                    self._executor.shutdown(wait=False)
+                # 스레드가 있는 서버 프로세스를 fork하지 않도록 spawn 사용
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.processes,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(crypto.fernet,),
+                )
+                self._key = key
+            return self._executor
+
+    async def _map(self, crypto: CryptoUtils, job: Callable, pairs: Sequence[Tuple[str, str]], *args: Any) -> List[Encrypted]:
+        if not pairs:
+            return []
+        if len(pairs) < self.min_parallel or self.processes == 1:
+            return await asyncio.to_thread(job, pairs, *args, fernet=crypto.fernet)
+        loop = asyncio.get_running_loop()
+        pool = self._pool(crypto)
+        size = -(-len(pairs) // self.processes)
+        parts = await asyncio.gather(*(
+            loop.run_in_executor(pool, job, pairs[start:start + size], *args)
+            for start in range(0, len(pairs), size)
+        ))
+        return [result for part in parts for result in part]
+
+    async def encrypt(
+        self, crypto: CryptoUtils, pairs: Sequence[Tuple[str, str]], transport_key: Optional[bytes] = None
+    ) -> List[Encrypted]:
+        """
+        (액세스 키, 시크릿 키) 묶음을 저장용 키로 암호화
+
+        Args:
+            crypto (CryptoUtils): 저장용 암호화 핸들
+            pairs (Sequence[Tuple[str, str]]): 평문 키 목록 (transport_key가 있으면 전송 키로 암호화된 값)
+            transport_key (bytes, optional): 전송용 Fernet 키
+
+        Returns:
+            List[Encrypted]: 입력 순서대로 암호문 쌍 또는 오류 메시지
+        """
+        return await self._map(crypto, _encrypt_pairs, pairs, transport_key)
+
+    async def reencrypt(self, crypto: CryptoUtils, pairs: Sequence[Tuple[str, str]], transport_key: bytes) -> List[Encrypted]:
+        """
+        저장된 암호문 쌍을 전송용 키로 다시 암호화
+
+        Args:
+            crypto (CryptoUtils): 저장용 암호화 핸들
+            pairs (Sequence[Tuple[str, str]]): 저장된 암호문 목록
+            transport_key (bytes): 전송용 Fernet 키
+
+        Returns:
+            List[Encrypted]: 입력 순서대로 전송용 암호문 쌍 또는 오류 메시지
+        """
+        return await self._map(crypto, _reencrypt_pairs, pairs, transport_key)
+
+    def shutdown(self) -> None:
+        """작업 프로세스 종료"""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+                self._key = None
+
+
+crypto_pool = CryptoPool()
@@ -3,11 +3,15 @@
 """
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Index
 from app.db.base_class import Base
 
 class ApiKey(Base):
     __tablename__ = "api_keys"
+    __table_args__ = (
+        # 거래소별 활성 키 목록의 키셋 페이지네이션 (id 순)
+        Index("ix_api_keys_exchange_is_active_id", "exchange", "is_active", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     exchange = Column(String, nullable=False)  # 거래소 이름 (예: upbit)
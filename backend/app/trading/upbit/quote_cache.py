@@ -0,0 +1,230 @@
+"""
+업비트 시세 캐시
+"""
+
+import asyncio
+import threading
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from app.core.config import settings
+
+SyncFetcher = Callable[[List[str]], Dict[str, float]]
+AsyncFetcher = Callable[[List[str]], Awaitable[Dict[str, float]]]
+
+
+class _PendingFetch:
+    """진행 중인 업스트림 조회 (동시 요청 병합용)"""
+
+    __slots__ = ("event", "future", "error", "abandoned")
+
+    def __init__(self, future: Optional[asyncio.Future] = None):
+        self.event = threading.Event()
+        self.future = future
+        self.error: Optional[Exception] = None
+        self.abandoned = False  # 조회 주체가 취소/중단되어 결과 없이 끝남
+
+
+class QuoteCache:
+    def __init__(
+        self,
+        ttl: Optional[float] = None,
+        chunk_size: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        짧은 TTL 시세 캐시 초기화
+
+        TTL 안의 요청은 캐시에서 응답하고, 같은 티커를 동시에 요청하면
+        하나의 업스트림 조회를 공유한다.
+
+        Args:
+            ttl (float, optional): 시세 유효 시간 (초, 기본값: settings.QUOTE_CACHE_TTL)
+            chunk_size (int, optional): 한 번에 조회할 최대 티커 수 (기본값: settings.UPBIT_TICKER_CHUNK_SIZE)
+            clock (Callable[[], float]): 시간 함수
+        """
+        self.ttl = settings.QUOTE_CACHE_TTL if ttl is None else ttl
+        self.chunk_size = chunk_size or settings.UPBIT_TICKER_CHUNK_SIZE
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.upstream_requests = 0
+        self._quotes: Dict[str, Tuple[float, float]] = {}
+        self._pending: Dict[str, _PendingFetch] = {}
+        self._lock = threading.Lock()
+
+    def _chunks(self, tickers: List[str]) -> List[List[str]]:
+        return [tickers[i:i + self.chunk_size] for i in range(0, len(tickers), self.chunk_size)]
+
+    def _plan(
+        self, tickers: Sequence[str], future_factory: Optional[Callable[[], asyncio.Future]] = None
+    ) -> Tuple[Dict[str, float], Dict[str, _PendingFetch], List[str], _PendingFetch]:
+        """
+        캐시 적중, 병합 대기, 직접 조회할 티커 분류
+
+        Returns:
+            Tuple: (적중한 시세, 대기할 조회, 직접 조회할 티커, 직접 조회 상태)
+        """
+        now = self.clock()
+        result: Dict[str, float] = {}
+        waiting: Dict[str, _PendingFetch] = {}
+        owned: List[str] = []
+        pending = _PendingFetch(future_factory() if future_factory else None)
+        with self._lock:
+            for ticker in dict.fromkeys(tickers):
+                quote = self._quotes.get(ticker)
+                if quote is not None and quote[1] > now:
+                    result[ticker] = quote[0]
+                    self.hits += 1
+                elif ticker in self._pending:
+                    waiting[ticker] = self._pending[ticker]
+                    self.coalesced += 1
+                else:
+                    owned.append(ticker)
+                    self._pending[ticker] = pending
+                    self.misses += 1
+        return result, waiting, owned, pending
+
+    def _store(self, prices: Dict[str, float]) -> None:
+        expires_at = self.clock() + self.ttl
+        with self._lock:
+            for ticker, price in prices.items():
+                self._quotes[ticker] = (price, expires_at)
+
+    def _release(
+        self, owned: List[str], pending: _PendingFetch, error: Optional[Exception], abandoned: bool
+    ) -> None:
+        pending.error = error
+        pending.abandoned = abandoned
+        with self._lock:
+            for ticker in owned:
+                if self._pending.get(ticker) is pending:
+                    del self._pending[ticker]
+        pending.event.set()
+        if pending.future is not None and not pending.future.done():
+            pending.future.set_result(None)
+
+    def _collect(
+        self, result: Dict[str, float], waiting: Dict[str, _PendingFetch]
+    ) -> Tuple[Dict[str, float], List[str]]:
+        """
+        병합 대기한 조회 결과 반영
+
+        Returns:
+            Tuple: (시세, 조회 주체가 취소되어 다시 조회할 티커)
+        """
+        retry: List[str] = []
+        with self._lock:
+            for ticker, pending in waiting.items():
+                if pending.error is not None:
+                    raise pending.error
+                if pending.abandoned:
+                    retry.append(ticker)
+                    continue
+                quote = self._quotes.get(ticker)
+                if quote is not None:
+                    result[ticker] = quote[0]
+        return result, retry
+
+    def get_many(self, tickers: Sequence[str], fetch: SyncFetcher) -> Dict[str, float]:
+        """
+        여러 티커의 시세 조회 (스레드 안전)
+
+        Args:
+            tickers (Sequence[str]): 티커 목록
+            fetch (SyncFetcher): 티커 묶음을 받아 {티커: 현재가}를 반환하는 함수
+
+        Returns:
+            Dict[str, float]: 티커별 현재가
+        """
+        result, waiting, owned, pending = self._plan(tickers)
+        error, abandoned = None, False
+        try:
+            for chunk in self._chunks(owned):
+                self.upstream_requests += 1
+                prices = fetch(chunk)
+                self._store(prices)
+                result.update((t, prices[t]) for t in chunk if t in prices)
+        except Exception as e:
+            error = e
+            raise
+        except BaseException:
+            # 취소/인터럽트는 조회 주체만의 사정이므로 대기자에게 넘기지 않고 다시 조회하게 한다
+            abandoned = True
+            raise
+        finally:
+            if owned:
+                self._release(owned, pending, error, abandoned)
+
+        for waiter in {id(p): p for p in waiting.values()}.values():
+            waiter.event.wait()
+        result, retry = self._collect(result, waiting)
+        if retry:
+            result.update(self.get_many(retry, fetch))
+        return result
+
+    async def aget_many(self, tickers: Sequence[str], fetch: AsyncFetcher) -> Dict[str, float]:
+        """
+        여러 티커의 시세 조회 (비동기)
+
+        Args:
+            tickers (Sequence[str]): 티커 목록
+            fetch (AsyncFetcher): 티커 묶음을 받아 {티커: 현재가}를 반환하는 코루틴 함수
+
+        Returns:
+            Dict[str, float]: 티커별 현재가
+        """
+        loop = asyncio.get_running_loop()
+        result, waiting, owned, pending = self._plan(tickers, loop.create_future)
+        error, abandoned = None, False
+        try:
+            chunks = self._chunks(owned)
+            self.upstream_requests += len(chunks)
+            for prices in await asyncio.gather(*(fetch(chunk) for chunk in chunks)):
+                self._store(prices)
+                result.update((t, p) for t, p in prices.items() if t in owned)
+        except Exception as e:
+            error = e
+            raise
+        except BaseException:
+            # 취소/인터럽트는 조회 주체만의 사정이므로 대기자에게 넘기지 않고 다시 조회하게 한다
+            abandoned = True
+            raise
+        finally:
+            if owned:
+                self._release(owned, pending, error, abandoned)
+
+        for waiter in {id(p): p for p in waiting.values()}.values():
+            if waiter.future is not None and waiter.future.get_loop() is loop:
+                await asyncio.shield(waiter.future)
+            else:
+                await loop.run_in_executor(None, waiter.event.wait)
+        result, retry = self._collect(result, waiting)
+        if retry:
+            result.update(await self.aget_many(retry, fetch))
+        return result
+
+    def stats(self) -> Dict[str, int]:
+        """
+        캐시 통계 조회
+
+        Returns:
+            Dict[str, int]: 적중/미적중/병합/업스트림 요청 수
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "upstream_requests": self.upstream_requests,
+            "size": len(self._quotes),
+        }
+
+    def clear(self) -> None:
+        """캐시와 통계 초기화"""
+        with self._lock:
+            self._quotes.clear()
+            self.hits = self.misses = self.coalesced = self.upstream_requests = 0
+
+
+quote_cache = QuoteCache()
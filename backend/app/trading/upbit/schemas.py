@@ -3,7 +3,7 @@ API 키 관련 스키마
 """
 
 from pydantic import BaseModel, ConfigDict
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 class ApiKeyBase(BaseModel):
@@ -31,4 +31,27 @@ class ApiKeyInDBBase(ApiKeyBase):
 
 class ApiKey(ApiKeyInDBBase):
     """API 키 응답 스키마"""
-    pass 
\ No newline at end of file
+    pass 
+
+class ApiKeySummary(BaseModel):
+    """API 키 목록 응답 스키마 (암호화된 키 제외)"""
+    id: int
+    exchange: str
+    is_active: bool
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ApiKeyBulkResult(BaseModel):
+    """API 키 일괄 등록 항목별 결과 스키마"""
+    index: int
+    id: Optional[int] = None
+    error: Optional[str] = None
+
+class ApiKeyBulkResponse(BaseModel):
+    """API 키 일괄 등록 응답 스키마"""
+    created: int
+    failed: int
+    results: List[ApiKeyBulkResult]
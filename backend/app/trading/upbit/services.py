@@ -2,22 +2,63 @@
 업비트 API 키 관리 서비스
 """
 
-from typing import Optional, List
+from typing import Any, AsyncIterator, Dict, Optional, List, Sequence, Tuple, Union
+from sqlalchemy import Row, Select, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.core.security import CryptoUtils
+from app.core.config import settings
+from app.core.security import CryptoUtils, get_crypto
+from .api import UpbitAPI
+from .client_pool import client_pool
+from .crypto_pool import crypto_pool
 from .models import ApiKey
 from .exceptions import UpbitAPIKeyError
 
+# 목록 조회에 읽는 열 (암호화된 키는 읽지 않음)
+SUMMARY_COLUMNS = (ApiKey.id, ApiKey.exchange, ApiKey.is_active, ApiKey.created_at, ApiKey.updated_at)
+MAX_PAGE_SIZE = 1000
+
+
+def active_key_page_query(exchange: str, limit: int, after_id: Optional[int] = None) -> Select:
+    """
+    활성 API 키 요약 페이지 쿼리
+
+    (exchange, is_active, id) 인덱스 범위를 id 순으로 읽으며, 다음 페이지 유무 확인을 위해 한 행 더 가져온다.
+
+    Args:
+        exchange (str): 거래소 이름
+        limit (int): 페이지 크기
+        after_id (int, optional): 이전 페이지의 마지막 ID (커서)
+
+    Returns:
+        Select: 요약 열만 선택하는 쿼리
+    """
+    if not 0 < limit <= MAX_PAGE_SIZE:
+        raise UpbitAPIKeyError(f"페이지 크기는 1~{MAX_PAGE_SIZE} 사이여야 합니다.")
+    query = select(*SUMMARY_COLUMNS).where(ApiKey.exchange == exchange, ApiKey.is_active == True)
+    if after_id is not None:
+        query = query.where(ApiKey.id > after_id)
+    return query.order_by(ApiKey.id).limit(limit + 1)
+
+
+def _split_page(rows: Sequence[Row], limit: int) -> Tuple[List[Row], Optional[int]]:
+    rows = list(rows)
+    if len(rows) > limit:
+        rows = rows[:limit]
+        return rows, rows[-1].id
+    return rows, None
+
 class ApiKeyService:
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, crypto: Optional[CryptoUtils] = None):
         """
         API 키 서비스 초기화
         
         Args:
             db (Session): 데이터베이스 세션
+            crypto (CryptoUtils, optional): 암호화 핸들. 제공되지 않으면 프로세스 공유 핸들 사용
         """
         self.db = db
-        self.crypto = CryptoUtils()
+        self.crypto = crypto or get_crypto()
     
     def create_api_key(self, exchange: str, access_key: str, secret_key: str) -> ApiKey:
         """
@@ -77,6 +118,23 @@ class ApiKeyService:
             ApiKey.exchange == exchange,
             ApiKey.is_active == True
         ).all()
+
+    def get_active_api_key_page(
+        self, exchange: str, limit: int = 100, after_id: Optional[int] = None
+    ) -> Tuple[List[Row], Optional[int]]:
+        """
+        활성화된 API 키 요약 목록 페이지 조회
+
+        Args:
+            exchange (str): 거래소 이름
+            limit (int): 페이지 크기 (최대 MAX_PAGE_SIZE)
+            after_id (int, optional): 이전 페이지의 다음 커서
+
+        Returns:
+            Tuple[List[Row], Optional[int]]: (요약 행 목록, 다음 페이지 커서 - 마지막 페이지면 None)
+        """
+        rows = self.db.execute(active_key_page_query(exchange, limit, after_id)).all()
+        return _split_page(rows, limit)
     
     def update_api_key_status(self, key_id: int, is_active: bool) -> Optional[ApiKey]:
         """
@@ -96,6 +154,7 @@ class ApiKeyService:
             
             api_key.is_active = is_active
             self.db.commit()
+            client_pool.invalidate(key_id)
             self.db.refresh(api_key)
             return api_key
         except Exception as e:
@@ -119,6 +178,7 @@ class ApiKeyService:
             
             self.db.delete(api_key)
             self.db.commit()
+            client_pool.invalidate(key_id)
             return True
         except Exception as e:
             self.db.rollback()
@@ -143,4 +203,284 @@ class ApiKeyService:
             secret_key = self.crypto.decrypt(api_key.secret_key)
             return access_key, secret_key
         except Exception as e:
-            raise UpbitAPIKeyError(f"API 키 복호화 실패: {str(e)}") 
\ No newline at end of file
+            raise UpbitAPIKeyError(f"API 키 복호화 실패: {str(e)}") 
+
+    def get_client(self, key_id: int) -> UpbitAPI:
+        """
+        API 키로 인증된 클라이언트 조회
+
+        복호화한 키와 클라이언트를 client_pool에 보관해 재사용한다.
+
+        Args:
+            key_id (int): API 키 ID
+
+        Returns:
+            UpbitAPI: 인증 클라이언트
+        """
+        return client_pool.get(self, key_id)
+
+    def reencrypt_api_keys(self) -> int:
+        """
+        저장된 API 키를 현재 암호화 키로 다시 암호화
+
+        ENCRYPTION_KEY 교체 후 이전 키로 암호화된 데이터를 옮길 때 사용
+
+        Returns:
+            int: 다시 암호화된 API 키 수
+        """
+        try:
+            count = 0
+            for api_key in self.db.query(ApiKey).all():
+                api_key.access_key = self.crypto.reencrypt(api_key.access_key)
+                api_key.secret_key = self.crypto.reencrypt(api_key.secret_key)
+                count += 1
+            self.db.commit()
+            return count
+        except Exception as e:
+            self.db.rollback()
+            raise UpbitAPIKeyError(f"API 키 재암호화 실패: {str(e)}")
+
+
+class AsyncApiKeyService:
+    def __init__(self, db: AsyncSession, crypto: Optional[CryptoUtils] = None):
+        """
+        비동기 API 키 서비스 초기화
+        
+        Args:
+            db (AsyncSession): 비동기 데이터베이스 세션
+            crypto (CryptoUtils, optional): 암호화 핸들. 제공되지 않으면 프로세스 공유 핸들 사용
+        """
+        self.db = db
+        self.crypto = crypto or get_crypto()
+    
+    async def create_api_key(self, exchange: str, access_key: str, secret_key: str) -> ApiKey:
+        """
+        새로운 API 키 생성
+        
+        Args:
+            exchange (str): 거래소 이름
+            access_key (str): 액세스 키
+            secret_key (str): 시크릿 키
+            
+        Returns:
+            ApiKey: 생성된 API 키 객체
+        """
+        try:
+            api_key = ApiKey(
+                exchange=exchange,
+                access_key=self.crypto.encrypt(access_key),
+                secret_key=self.crypto.encrypt(secret_key),
+                is_active=True
+            )
+            self.db.add(api_key)
+            await self.db.commit()
+            await self.db.refresh(api_key)
+            return api_key
+        except Exception as e:
+            await self.db.rollback()
+            raise UpbitAPIKeyError(f"API 키 생성 실패: {str(e)}")
+    
+    async def get_api_key(self, key_id: int) -> Optional[ApiKey]:
+        """
+        API 키 조회
+        
+        Args:
+            key_id (int): API 키 ID
+            
+        Returns:
+            Optional[ApiKey]: API 키 객체 또는 None
+        """
+        return await self.db.get(ApiKey, key_id)
+    
+    async def get_active_api_keys(self, exchange: str) -> List[ApiKey]:
+        """
+        활성화된 API 키 목록 조회
+        
+        Args:
+            exchange (str): 거래소 이름
+            
+        Returns:
+            List[ApiKey]: API 키 객체 목록
+        """
+        result = await self.db.execute(
+            select(ApiKey).where(ApiKey.exchange == exchange, ApiKey.is_active == True)
+        )
+        return list(result.scalars().all())
+
+    async def get_active_api_key_page(
+        self, exchange: str, limit: int = 100, after_id: Optional[int] = None
+    ) -> Tuple[List[Row], Optional[int]]:
+        """
+        활성화된 API 키 요약 목록 페이지 조회
+
+        Args:
+            exchange (str): 거래소 이름
+            limit (int): 페이지 크기 (최대 MAX_PAGE_SIZE)
+            after_id (int, optional): 이전 페이지의 다음 커서
+
+        Returns:
+            Tuple[List[Row], Optional[int]]: (요약 행 목록, 다음 페이지 커서 - 마지막 페이지면 None)
+        """
+        result = await self.db.execute(active_key_page_query(exchange, limit, after_id))
+        return _split_page(result.all(), limit)
+    
+    async def bulk_create_api_keys(
+        self, items: Sequence[Tuple[str, str, str]], transport_key: Optional[bytes] = None
+    ) -> List[Union[int, str]]:
+        """
+        API 키 일괄 생성
+
+        암호화는 crypto_pool 작업 프로세스에서 병렬로 하고, 한 묶음을 여러 행 INSERT 한 번과
+        커밋 한 번으로 저장한다. 크기는 호출 쪽에서 settings.API_KEY_BULK_CHUNK_SIZE 단위로 나눈다.
+
+        Args:
+            items (Sequence[Tuple[str, str, str]]): (거래소, 액세스 키, 시크릿 키) 목록
+            transport_key (bytes, optional): 키가 전송용 Fernet 키로 암호화돼 있으면 그 키
+
+        Returns:
+            List[Union[int, str]]: 입력 순서대로 생성된 ID 또는 오류 메시지
+        """
+        encrypted = await crypto_pool.encrypt(
+            self.crypto, [(access_key, secret_key) for _, access_key, secret_key in items], transport_key
+        )
+        results: List[Union[int, str]] = list(encrypted)
+        rows = []
+        positions = []
+        for position, ((exchange, _, _), result) in enumerate(zip(items, encrypted)):
+            if isinstance(result, tuple):
+                rows.append({"exchange": exchange, "access_key": result[0], "secret_key": result[1], "is_active": True})
+                positions.append(position)
+        if not rows:
+            return results
+        try:
+            inserted = await self.db.execute(insert(ApiKey).returning(ApiKey.id, sort_by_parameter_order=True), rows)
+            ids = inserted.scalars().all()
+            await self.db.commit()
+        except Exception as e:
+            await self.db.rollback()
+            raise UpbitAPIKeyError(f"API 키 일괄 생성 실패: {str(e)}")
+        for position, key_id in zip(positions, ids):
+            results[position] = key_id
+        return results
+
+    async def export_api_keys(
+        self, transport_key: bytes, exchange: Optional[str] = None, batch_size: Optional[int] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        API 키 내보내기 (전송용 키로 다시 암호화)
+
+        id 순으로 묶음씩 읽어 저장용 키로 복호화하고 전송용 키로 암호화한다. 서버 안에서 평문은 작업 프로세스 밖으로
+        나오지 않지만, 전송용 키를 가진 쪽은 결과를 평문으로 복호화할 수 있다 (호출 권한은 엔드포인트에서 제한).
+
+        Args:
+            transport_key (bytes): 전송용 Fernet 키
+            exchange (str, optional): 거래소 필터
+            batch_size (int, optional): 묶음 크기 (기본값: settings.API_KEY_BULK_CHUNK_SIZE)
+
+        Returns:
+            AsyncIterator[List[Dict[str, Any]]]: 묶음별 항목 (id, exchange, is_active, access_key, secret_key 또는 error)
+        """
+        batch_size = batch_size or settings.API_KEY_BULK_CHUNK_SIZE
+        columns = (ApiKey.id, ApiKey.exchange, ApiKey.is_active, ApiKey.access_key, ApiKey.secret_key)
+        after_id = 0
+        while True:
+            query = select(*columns).where(ApiKey.id > after_id)
+            if exchange is not None:
+                query = query.where(ApiKey.exchange == exchange)
+            rows = (await self.db.execute(query.order_by(ApiKey.id).limit(batch_size))).all()
+            if not rows:
+                return
+            encrypted = await crypto_pool.reencrypt(
+                self.crypto, [(row.access_key, row.secret_key) for row in rows], transport_key
+            )
+            batch = []
+            for row, result in zip(rows, encrypted):
+                item: Dict[str, Any] = {"id": row.id, "exchange": row.exchange, "is_active": row.is_active}
+                if isinstance(result, tuple):
+                    item["access_key"], item["secret_key"] = result
+                else:
+                    item["error"] = result
+                batch.append(item)
+            yield batch
+            after_id = rows[-1].id
+
+    async def update_api_key_status(self, key_id: int, is_active: bool) -> Optional[ApiKey]:
+        """
+        API 키 활성화 상태 업데이트
+        
+        Args:
+            key_id (int): API 키 ID
+            is_active (bool): 활성화 상태
+            
+        Returns:
+            Optional[ApiKey]: 업데이트된 API 키 객체 또는 None
+        """
+        try:
+            api_key = await self.get_api_key(key_id)
+            if not api_key:
+                return None
+            
+            api_key.is_active = is_active
+            await self.db.commit()
+            client_pool.invalidate(key_id)
+            await self.db.refresh(api_key)
+            return api_key
+        except Exception as e:
+            await self.db.rollback()
+            raise UpbitAPIKeyError(f"API 키 상태 업데이트 실패: {str(e)}")
+    
+    async def delete_api_key(self, key_id: int) -> bool:
+        """
+        API 키 삭제
+        
+        Args:
+            key_id (int): API 키 ID
+            
+        Returns:
+            bool: 삭제 성공 여부
+        """
+        try:
+            api_key = await self.get_api_key(key_id)
+            if not api_key:
+                return False
+            
+            await self.db.delete(api_key)
+            await self.db.commit()
+            client_pool.invalidate(key_id)
+            return True
+        except Exception as e:
+            await self.db.rollback()
+            raise UpbitAPIKeyError(f"API 키 삭제 실패: {str(e)}")
+    
+    async def get_decrypted_keys(self, key_id: int) -> tuple[str, str]:
+        """
+        복호화된 API 키 조회
+        
+        Args:
+            key_id (int): API 키 ID
+            
+        Returns:
+            tuple[str, str]: (액세스 키, 시크릿 키)
+        """
+        api_key = await self.get_api_key(key_id)
+        if not api_key:
+            raise UpbitAPIKeyError("API 키를 찾을 수 없습니다.")
+        
+        try:
+            return self.crypto.decrypt(api_key.access_key), self.crypto.decrypt(api_key.secret_key)
+        except Exception as e:
+            raise UpbitAPIKeyError(f"API 키 복호화 실패: {str(e)}")
+
+    async def get_client(self, key_id: int) -> UpbitAPI:
+        """
+        API 키로 인증된 클라이언트 조회
+
+        복호화한 키와 클라이언트를 client_pool에 보관해 재사용한다.
+
+        Args:
+            key_id (int): API 키 ID
+
+        Returns:
+            UpbitAPI: 인증 클라이언트
+        """
+        return await client_pool.aget(self, key_id)
@@ -0,0 +1,97 @@
+"""
+API 키 목록 조회 벤치마크
+
+API 키 N개(암호화된 키 크기의 더미 값)를 넣은 SQLite에서
+- before: 활성 키 전체를 ORM 객체로 읽기 (get_active_api_keys)
+- after: 요약 열만 커서 페이지로 읽기 (get_active_api_key_page) - 첫/중간/마지막 페이지
+의 지연과 파이썬 메모리 최대 사용량(tracemalloc)을 비교한다.
+
+실행: cd backend && python -m benchmarks.bench_api_key_pages --keys 100000
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Tuple
+
+os.environ.setdefault("ENCRYPTION_KEY", "benchmark-encryption-key")
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base_class import Base
+from app.trading.upbit.models import ApiKey
+from app.trading.upbit.services import ApiKeyService, active_key_page_query
+
+CIPHERTEXT = "gAAAAA" + "x" * 134  # Fernet 토큰 길이
+
+
+def _measure(run: Callable[[], object], repeat: int) -> Tuple[float, float]:
+    """(p50 ms, 최대 메모리 KiB) - 지연은 tracemalloc 없이 따로 측정"""
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        latencies.append(time.perf_counter() - start)
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return statistics.median(latencies) * 1000, peak / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--keys", type=int, default=100_000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        engine = create_engine(f"sqlite:///{tmpdir}/bench.db")
+        Base.metadata.create_all(bind=engine)
+        with engine.begin() as connection:
+            connection.execute(ApiKey.__table__.insert(), [
+                {"exchange": "upbit" if i % 10 else "binance", "access_key": CIPHERTEXT, "secret_key": CIPHERTEXT,
+                 "is_active": i % 7 != 0}
+                for i in range(args.keys)
+            ])
+            connection.execute(text("ANALYZE"))
+        db = sessionmaker(bind=engine)()
+        service = ApiKeyService(db)
+        try:
+            compiled = active_key_page_query("upbit", args.limit, 1).compile(
+                engine, compile_kwargs={"literal_binds": True})
+            plan = db.execute(text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+            print("plan:", " / ".join(row[-1] for row in plan))
+
+            cursors = []
+            after_id = None
+            while True:
+                cursors.append(after_id)
+                _, after_id = service.get_active_api_key_page("upbit", args.limit, after_id)
+                if after_id is None:
+                    break
+            print(f"{args.keys} keys, {len(cursors)} pages of {args.limit}")
+            print(f"{'scenario':<36}{'p50 ms':>10}{'peak KiB':>12}")
+
+            def load_all():
+                rows = service.get_active_api_keys("upbit")
+                db.expunge_all()
+                return rows
+
+            p50, peak = _measure(load_all, args.repeat)
+            print(f"{'all rows, full ORM (before)':<36}{p50:>10.2f}{peak:>12.0f}")
+            for name, cursor in (("first", cursors[0]), ("middle", cursors[len(cursors) // 2]), ("last", cursors[-1])):
+                p50, peak = _measure(lambda: service.get_active_api_key_page("upbit", args.limit, cursor), args.repeat * 20)
+                print(f"{f'keyset page, summary ({name})':<36}{p50:>10.2f}{peak:>12.0f}")
+        finally:
+            db.close()
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+API 키 엔드포인트 처리량 벤치마크
+
+PBKDF2 키 파생을 요청마다 수행하던 기존 방식(before)과
+프로세스 단위 키 캐시(after)의 POST /api-keys, GET /api-keys/{key_id} 처리량을 비교한다.
+
+실행: cd backend && python -m benchmarks.bench_api_keys --requests 200
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+os.environ.setdefault("ENCRYPTION_KEY", "benchmark-encryption-key")
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core import security
+from app.db.base_class import Base
+from app.db.session import get_async_db
+from app.main import app
+from app.trading.upbit import services
+
+
+def _uncached_crypto():
+    """요청마다 키를 다시 파생하는 기존 동작 재현"""
+    security.key_manager.clear()
+    return security.key_manager.get_crypto()
+
+
+def _measure(client: TestClient, requests: int) -> dict:
+    payload = {"exchange": "upbit", "access_key": "bench-access", "secret_key": "bench-secret"}
+
+    start = time.perf_counter()
+    key_ids = [client.post("/api/v1/api-keys/", json=payload).json()["id"] for _ in range(requests)]
+    post_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for key_id in key_ids:
+        client.get(f"/api/v1/api-keys/{key_id}")
+    get_elapsed = time.perf_counter() - start
+
+    return {"post": requests / post_elapsed, "get": requests / get_elapsed}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        engine = create_engine(f"sqlite:///{tmpdir}/bench.db")
+        Base.metadata.create_all(bind=engine)
+        async_engine = create_async_engine(f"sqlite+aiosqlite:///{tmpdir}/bench.db", poolclass=NullPool)
+        SessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+        async def override_get_async_db():
+            async with SessionLocal() as db:
+                yield db
+
+        app.dependency_overrides[get_async_db] = override_get_async_db
+        original_get_crypto = services.get_crypto
+        try:
+            with TestClient(app) as client:
+                services.get_crypto = _uncached_crypto
+                before = _measure(client, args.requests)
+                services.get_crypto = original_get_crypto
+                security.key_manager.clear()
+                after = _measure(client, args.requests)
+        finally:
+            services.get_crypto = original_get_crypto
+            app.dependency_overrides.clear()
+            engine.dispose()
+
+    print(f"{'endpoint':<24}{'before (req/s)':>16}{'after (req/s)':>16}{'speedup':>10}")
+    for name, label in (("post", "POST /api-keys"), ("get", "GET /api-keys/{key_id}")):
+        print(f"{label:<24}{before[name]:>16.1f}{after[name]:>16.1f}{after[name] / before[name]:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+인증 요청 처리량 벤치마크
+
+/api/v1/auth/me 를 인증 토큰과 함께 호출해 초당 처리 요청 수를 비교한다.
+- before: 요청마다 비밀 키 문자열로 JWT를 검증하고 users 테이블을 조회
+- after: 미리 만든 키 객체로 검증하고 사용자 캐시에서 조회 (get_current_active_principal)
+bcrypt가 설치되어 있으면 로그인 비밀번호 검증을 이벤트 루프에서 직접 실행할 때와
+전용 스레드 풀에서 실행할 때 다른 작업이 멈추는 시간도 비교한다.
+
+실행: cd backend && python -m benchmarks.bench_auth --requests 5000
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+os.environ.setdefault("ENCRYPTION_KEY", "benchmark-encryption-key")
+
+import httpx
+from fastapi import Depends, HTTPException
+from jose import jwt
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from app.api import deps
+from app.core import security
+from app.core.config import settings
+from app.db.base import Base
+from app.db.session import get_async_db
+from app.main import app
+from app.models.user import User
+from app.services.auth_service import Principal, principal_cache
+
+
+async def _naive_principal(token: str = Depends(deps.oauth2_scheme),
+                           db: AsyncSession = Depends(get_async_db)) -> Principal:
+    try:
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    except Exception:
+        raise HTTPException(status_code=401)
+    user = await db.get(User, int(payload["sub"]))
+    if user is None:
+        raise HTTPException(status_code=401)
+    return Principal.from_user(user)
+
+
+async def _throughput(client: httpx.AsyncClient, headers: dict, total: int, concurrency: int) -> float:
+    remaining = iter(range(total))
+
+    async def worker():
+        for _ in remaining:
+            response = await client.get("/api/v1/auth/me", headers=headers)
+            assert response.status_code == 200, response.text
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return total / (time.perf_counter() - start)
+
+
+async def _loop_stall(verify, hashed: str, logins: int) -> float:
+    """로그인 검증이 도는 동안 1ms 주기 작업이 가장 오래 밀린 시간 (ms)"""
+    worst = 0.0
+    done = asyncio.Event()
+
+    async def heartbeat():
+        nonlocal worst
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            worst = max(worst, time.perf_counter() - start - 0.001)
+
+    beat = asyncio.create_task(heartbeat())
+    await asyncio.sleep(0.01)
+    await asyncio.gather(*(verify("password", hashed) for _ in range(logins)))
+    done.set()
+    await beat
+    return worst * 1000
+
+
+async def _main(args) -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        url = f"{tmpdir}/bench.db"
+        sync_engine = create_engine(f"sqlite:///{url}")
+        Base.metadata.create_all(bind=sync_engine, tables=[User.__table__])
+        with sessionmaker(bind=sync_engine)() as db:
+            db.add(User(id=1, email="bench@example.com", username="bench", hashed_password="", is_active=True))
+            db.commit()
+        sync_engine.dispose()
+
+        async_engine = create_async_engine(f"sqlite+aiosqlite:///{url}", poolclass=NullPool)
+        sessions = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+        async def override_get_async_db():
+            async with sessions() as db:
+                yield db
+
+        app.dependency_overrides[get_async_db] = override_get_async_db
+        headers = {"Authorization": f"Bearer {security.create_access_token({'sub': '1'})}"}
+        transport = httpx.ASGITransport(app=app)
+        print(f"{'scenario':<44}{'req/s':>10}")
+        try:
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                app.dependency_overrides[deps.get_current_active_principal] = _naive_principal
+                rps = await _throughput(client, headers, args.requests, args.concurrency)
+                print(f"{'decode + users query per request (before)':<44}{rps:>10.0f}")
+                del app.dependency_overrides[deps.get_current_active_principal]
+                principal_cache.clear()
+                rps = await _throughput(client, headers, args.requests, args.concurrency)
+                print(f"{'pre-built key + principal cache (after)':<44}{rps:>10.0f}")
+                print(f"principal cache: {principal_cache.stats()}")
+        finally:
+            app.dependency_overrides.clear()
+            await async_engine.dispose()
+
+    try:
+        import bcrypt  # noqa: F401
+    except ImportError:
+        print("bcrypt 미설치: 로그인 검증 측정 생략")
+        return
+    hashed = security.get_password_hash("password")
+
+    async def inline(plain, hashed):
+        return security.verify_password(plain, hashed)
+
+    print(f"{'login verification':<44}{'max stall ms':>14}")
+    print(f"{'verify_password on event loop (before)':<44}{await _loop_stall(inline, hashed, args.logins):>14.1f}")
+    print(f"{'verify_password_async thread pool (after)':<44}"
+          f"{await _loop_stall(security.verify_password_async, hashed, args.logins):>14.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--logins", type=int, default=8)
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+API 키 일괄 등록/내보내기 벤치마크
+
+SQLite(aiosqlite)에 API 키 N개를
+- before: create_api_key 로 한 건씩 (암호화, INSERT, 커밋, 새로 읽기)
+- after: bulk_create_api_keys 로 묶음 단위 (작업 프로세스 병렬 암호화, 여러 행 INSERT, 커밋 한 번)
+등록하는 시간과, export_api_keys 로 전송용 키로 다시 암호화해 내보내는 시간을 측정한다.
+
+실행: cd backend && python -m benchmarks.bench_bulk_api_keys --keys 10000
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+os.environ.setdefault("ENCRYPTION_KEY", "benchmark-encryption-key")
+
+from cryptography.fernet import Fernet
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.db.base_class import Base
+from app.trading.upbit.crypto_pool import crypto_pool
+from app.trading.upbit.services import AsyncApiKeyService
+
+
+async def _main(args) -> None:
+    items = [("upbit", f"access-{i:06d}-" + "a" * 24, f"secret-{i:06d}-" + "s" * 24) for i in range(args.keys)]
+    print(f"cpu cores: {os.cpu_count()}, crypto workers: {crypto_pool.processes}")
+    print(f"{'scenario':<40}{'seconds':>10}{'keys/s':>10}")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmpdir}/bench.db")
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        sessions = async_sessionmaker(engine, expire_on_commit=False)
+        try:
+            single = items[:args.single]
+            async with sessions() as db:
+                service = AsyncApiKeyService(db)
+                start = time.perf_counter()
+                for exchange, access_key, secret_key in single:
+                    await service.create_api_key(exchange, access_key, secret_key)
+                elapsed = time.perf_counter() - start
+            rate = len(single) / elapsed
+            print(f"{f'create_api_key x{len(single)} (before)':<40}{elapsed:>10.2f}{rate:>10.0f}"
+                  f"  -> {args.keys} keys ~{args.keys / rate:.1f}s")
+
+            async with sessions() as db:
+                service = AsyncApiKeyService(db)
+                await service.bulk_create_api_keys(items[:args.chunk])  # 작업 프로세스 시작 비용 제외
+                start = time.perf_counter()
+                created = 0
+                for offset in range(0, args.keys, args.chunk):
+                    results = await service.bulk_create_api_keys(items[offset:offset + args.chunk])
+                    created += sum(isinstance(result, int) for result in results)
+                elapsed = time.perf_counter() - start
+            print(f"{f'bulk_create_api_keys x{created} (after)':<40}{elapsed:>10.2f}{created / elapsed:>10.0f}")
+
+            transport_key = Fernet.generate_key()
+            async with sessions() as db:
+                service = AsyncApiKeyService(db)
+                start = time.perf_counter()
+                exported = 0
+                async for batch in service.export_api_keys(transport_key, batch_size=args.chunk):
+                    exported += len(batch)
+                elapsed = time.perf_counter() - start
+            print(f"{f'export_api_keys x{exported}':<40}{elapsed:>10.2f}{exported / elapsed:>10.0f}")
+        finally:
+            await engine.dispose()
+            crypto_pool.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--keys", type=int, default=10_000)
+    parser.add_argument("--chunk", type=int, default=1000)
+    parser.add_argument("--single", type=int, default=1000, help="한 건씩 등록을 측정할 키 수 (전체는 비례 추정)")
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+캔들 저장소 구간 조회 벤치마크
+
+1천만 행 1분봉 시리즈를 만들고 하루/한 달/1년 구간의 조회 지연을 측정한다.
+조회 자체(메모리 매핑 슬라이스)와 데이터를 실제로 읽는 경우(종가 합계)를 나눠 본다.
+
+실행: cd backend && python -m benchmarks.bench_candles --rows 10000000
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+import numpy as np
+
+from app.trading.candles import CandleStore, INTERVAL_MS
+
+STEP = INTERVAL_MS["minute1"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--reads", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = CandleStore(tmpdir)
+        start = time.perf_counter()
+        chunk = 1_000_000
+        for offset in range(0, args.rows, chunk):
+            count = min(chunk, args.rows - offset)
+            close = 50_000_000 + rng.normal(0, 1e5, count)
+            store.append("upbit", "KRW-BTC", "minute1", {
+                "timestamp": (np.arange(offset, offset + count) * STEP).astype(np.int64),
+                "open": close, "high": close, "low": close, "close": close, "volume": np.ones(count),
+            })
+        write_elapsed = time.perf_counter() - start
+        size = sum(os.path.getsize(os.path.join(dp, f)) for dp, _, fs in os.walk(tmpdir) for f in fs)
+        print(f"wrote {args.rows:,} rows in {write_elapsed:.2f}s ({size / 1e6:,.0f} MB on disk)")
+
+        print(f"{'range':<10}{'rows':>10}{'slice p50':>12}{'slice p99':>12}{'scan p50':>12}")
+        for label, span in (("1 day", 1440), ("1 month", 43_200), ("1 year", 525_600)):
+            slice_times, scan_times = [], []
+            for _ in range(args.reads):
+                lo = int(rng.integers(0, args.rows - span)) * STEP
+                t0 = time.perf_counter()
+                candles = store.read("upbit", "KRW-BTC", "minute1", start=lo, end=lo + span * STEP)
+                t1 = time.perf_counter()
+                float(candles["close"].sum())
+                t2 = time.perf_counter()
+                slice_times.append(t1 - t0)
+                scan_times.append(t2 - t0)
+            slice_times.sort()
+            print(f"{label:<10}{span:>10,}{statistics.median(slice_times) * 1e3:>10.3f}ms"
+                  f"{slice_times[int(len(slice_times) * 0.99) - 1] * 1e3:>10.3f}ms"
+                  f"{statistics.median(scan_times) * 1e3:>10.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
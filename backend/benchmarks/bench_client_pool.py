@@ -0,0 +1,88 @@
+"""
+API 키별 인증 클라이언트 풀 벤치마크
+
+저장된 키로 주문할 때마다 DB 조회 + 복호화 + pyupbit 클라이언트 생성을 하던 방식(before)과
+client_pool에서 준비된 클라이언트를 꺼내는 방식(after)의
+- 클라이언트 확보 지연
+- 로컬 모의 거래소 대상 시장가 주문 지연 (p50/p99)
+을 비교한다.
+
+실행: cd backend && python -m benchmarks.bench_client_pool --orders 500
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from typing import Callable, List
+
+os.environ.setdefault("ENCRYPTION_KEY", "benchmark-encryption-key")
+
+import requests
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base_class import Base
+from app.trading.upbit.api import UpbitAPI
+from app.trading.upbit.client_pool import client_pool
+from app.trading.upbit.services import ApiKeyService
+from benchmarks.bench_upbit_client import _redirect
+from tests.fakes.upbit_exchange import MockUpbitExchange
+
+
+def _report(name: str, latencies: List[float]) -> None:
+    latencies.sort()
+    p50 = statistics.median(latencies) * 1000
+    p99 = latencies[max(int(len(latencies) * 0.99) - 1, 0)] * 1000
+    print(f"{name:<36}{p50:>10.3f}{p99:>10.3f}")
+
+
+def _measure(run: Callable[[], object], count: int) -> List[float]:
+    latencies = []
+    for _ in range(count):
+        start = time.perf_counter()
+        run()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, default=500)
+    parser.add_argument("--lookups", type=int, default=5000)
+    args = parser.parse_args()
+
+    exchange = MockUpbitExchange()
+    exchange.start_in_thread()
+    original_post = requests.post
+    requests.post = _redirect(original_post, exchange.url)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        engine = create_engine(f"sqlite:///{tmpdir}/bench.db")
+        Base.metadata.create_all(bind=engine)
+        db = sessionmaker(bind=engine)()
+        service = ApiKeyService(db)
+        key_id = service.create_api_key("upbit", exchange.access_key, exchange.secret_key).id
+
+        def uncached_client() -> UpbitAPI:
+            return UpbitAPI(*service.get_decrypted_keys(key_id))
+
+        def pooled_client() -> UpbitAPI:
+            return service.get_client(key_id)
+
+        try:
+            print(f"{'scenario':<36}{'p50 ms':>10}{'p99 ms':>10}")
+            _report("client: decrypt + new (before)", _measure(uncached_client, args.lookups))
+            _report("client: client_pool (after)", _measure(pooled_client, args.lookups))
+            for name, get_client in (("order: decrypt + new (before)", uncached_client), ("order: client_pool (after)", pooled_client)):
+                _report(name, _measure(lambda: get_client().place_market_order("KRW-BTC", "bid", price=10000), args.orders))
+            print(f"client_pool stats: {client_pool.stats()}, orders accepted: {len(exchange.orders)}")
+        finally:
+            requests.post = original_post
+            db.close()
+            engine.dispose()
+            exchange.stop_thread()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+거래소 커넥터 벤치마크
+
+기록된 응답을 재생하는 가짜 업비트/바이낸스 서버(응답 지연 주입)를 대상으로
+- 거래소를 하나씩 차례로 호출할 때와 ExchangeRouter로 동시에 호출할 때의 라운드 지연
+- 요청마다 새 세션을 여는 경우와 커넥터 전용 연결 풀을 재사용하는 경우의 처리량
+- 스트림 메시지 변환(parse_ticker) 처리량
+을 측정한다.
+
+실행: cd backend && python -m benchmarks.bench_connectors --rounds 200 --latency 0.02
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import List
+
+from app.services.binance_service import BinanceConnector
+from app.services.exchange_service import ExchangeRouter
+from app.services.rate_limiter import RateLimiter
+from app.services.upbit_service import UpbitConnector
+from tests.fakes.recorded_exchange import RecordedExchange
+
+SYMBOLS = {"upbit": ["KRW-BTC", "KRW-ETH"], "binance": ["USDT-BTC", "USDT-ETH"]}
+UNTHROTTLED = RateLimiter(limits={}, default=(1e9, 1.0))  # 커넥터 자체 비용만 측정
+
+
+def _report(name: str, elapsed: float, latencies: List[float]) -> None:
+    latencies.sort()
+    p50 = statistics.median(latencies) * 1000
+    p99 = latencies[max(int(len(latencies) * 0.99) - 1, 0)] * 1000
+    print(f"{name:<36}{len(latencies) / elapsed:>10.1f}{p50:>10.2f}{p99:>10.2f}")
+
+
+async def bench_rounds(router: ExchangeRouter, rounds: int) -> None:
+    """시세+잔고 한 라운드 (순차 vs 동시)"""
+    async def sequential():
+        for name, symbols in SYMBOLS.items():
+            await router[name].get_prices(symbols)
+            await router[name].get_balances()
+
+    async def concurrent():
+        await asyncio.gather(router.get_prices(SYMBOLS), router.get_balances())
+
+    for name, run in (("sequential (exchange by exchange)", sequential), ("concurrent (ExchangeRouter)", concurrent)):
+        latencies = []
+        start = time.perf_counter()
+        for _ in range(rounds):
+            t = time.perf_counter()
+            await run()
+            latencies.append(time.perf_counter() - t)
+        _report(name, time.perf_counter() - start, latencies)
+
+
+async def bench_pooling(exchange: RecordedExchange, requests: int, concurrency: int) -> None:
+    """요청별 새 세션 vs 커넥터 연결 풀"""
+    pooled = UpbitConnector(base_url=exchange.url, rate_limiter=UNTHROTTLED)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fresh_call():
+        connector = UpbitConnector(base_url=exchange.url, rate_limiter=UNTHROTTLED)
+        try:
+            await connector.get_prices(SYMBOLS["upbit"])
+        finally:
+            await connector.close()
+
+    async def pooled_call():
+        await pooled.get_prices(SYMBOLS["upbit"])
+
+    for name, call in (("new session per request", fresh_call), ("pooled connector session", pooled_call)):
+        async def timed():
+            async with semaphore:
+                t = time.perf_counter()
+                await call()
+                return time.perf_counter() - t
+
+        start = time.perf_counter()
+        latencies = list(await asyncio.gather(*(timed() for _ in range(requests))))
+        _report(name, time.perf_counter() - start, latencies)
+    await pooled.close()
+
+
+def bench_parse(messages: int) -> None:
+    """스트림 메시지 변환 처리량"""
+    for connector, recording in ((UpbitConnector(), "upbit_rest.json"), (BinanceConnector(), "binance_rest.json")):
+        raw = [json.dumps(message) for message in RecordedExchange(recording).stream["messages"]]
+        start = time.perf_counter()
+        for i in range(messages):
+            connector.parse_ticker(json.loads(raw[i % len(raw)]))
+        elapsed = time.perf_counter() - start
+        print(f"{connector.name + ' parse_ticker':<36}{messages / elapsed:>10,.0f} msg/s")
+
+
+async def main(args) -> None:
+    upbit = RecordedExchange("upbit_rest.json", latency=args.latency)
+    binance = RecordedExchange("binance_rest.json", latency=args.latency)
+    await upbit.start()
+    await binance.start()
+    router = ExchangeRouter([
+        UpbitConnector("access", "secret", base_url=upbit.url, rate_limiter=UNTHROTTLED),
+        BinanceConnector("access", "secret", base_url=binance.url, rate_limiter=UNTHROTTLED),
+    ])
+    try:
+        print(f"injected exchange latency: {args.latency * 1000:.0f}ms")
+        print(f"{'scenario':<36}{'ops/s':>10}{'p50 ms':>10}{'p99 ms':>10}")
+        await bench_rounds(router, args.rounds)
+        await bench_pooling(upbit, args.requests, args.concurrency)
+    finally:
+        await router.close()
+        await upbit.stop()
+        await binance.stop()
+    bench_parse(args.messages)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.02, help="가짜 거래소 응답 지연 (초)")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--messages", type=int, default=200_000)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,129 @@
+"""
+동기/비동기 DB 세션 동시성 부하 테스트
+
+같은 API 키 조회를 동기 엔드포인트(스레드풀 + Session)와
+비동기 엔드포인트(AsyncSession)로 처리하며 동시 요청 수를 늘려 처리량을 비교한다.
+SQLite 파일을 기본으로 쓰고, 네트워크 DB를 흉내 내도록 쿼리마다 지연(--db-latency)을 넣는다.
+실제 Postgres 컨테이너는 --database-url postgresql://... 로 지정한다.
+
+실행: cd backend && python -m benchmarks.bench_db_pool --db-latency 0.005
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+os.environ.setdefault("ENCRYPTION_KEY", "benchmark-encryption-key")
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.util import await_only
+
+from app.core.config import settings
+from app.db import session as db_session
+from app.db.base_class import Base
+from app.trading.upbit.models import ApiKey
+from app.trading.upbit.services import ApiKeyService, AsyncApiKeyService
+
+
+def build_app(url: str, latency: float) -> FastAPI:
+    pool_options = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+    }
+    sync_engine = create_engine(url, poolclass=db_session.TimedQueuePool, **pool_options)
+    async_engine = create_async_engine(
+        db_session.get_async_database_url(url), poolclass=db_session.TimedAsyncAdaptedQueuePool, **pool_options
+    )
+    if latency:
+        @event.listens_for(sync_engine, "before_cursor_execute")
+        def sync_latency(*args):
+            time.sleep(latency)
+
+        @event.listens_for(async_engine.sync_engine, "before_cursor_execute")
+        def async_latency(*args):
+            await_only(asyncio.sleep(latency))
+
+    Base.metadata.create_all(bind=sync_engine)
+    SyncSession = sessionmaker(bind=sync_engine)
+    AsyncSession = async_sessionmaker(async_engine, expire_on_commit=False)
+
+    def get_sync_db():
+        db = SyncSession()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def get_async_db():
+        async with AsyncSession() as db:
+            yield db
+
+    app = FastAPI()
+
+    @app.get("/sync/{key_id}")
+    def sync_endpoint(key_id: int, db: Session = Depends(get_sync_db)):
+        return {"id": ApiKeyService(db).get_api_key(key_id).id}
+
+    @app.get("/async/{key_id}")
+    async def async_endpoint(key_id: int, db=Depends(get_async_db)):
+        return {"id": (await AsyncApiKeyService(db).get_api_key(key_id)).id}
+
+    with SyncSession() as db:
+        db.add(ApiKey(exchange="upbit", access_key="a", secret_key="s", is_active=True))
+        db.commit()
+    app.state.engines = (sync_engine, async_engine)
+    return app
+
+
+async def load(app: FastAPI, path: str, concurrency: int, total: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def call():
+            async with semaphore:
+                response = await client.get(path)
+                response.raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(call() for _ in range(total)))
+        return total / (time.perf_counter() - start)
+
+
+async def run(args) -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        url = args.database_url or f"sqlite:///{tmpdir}/bench.db"
+        app = build_app(url, args.db_latency)
+        print(f"pool_size={settings.DB_POOL_SIZE} max_overflow={settings.DB_MAX_OVERFLOW} "
+              f"db_latency={args.db_latency * 1000:.1f}ms (threadpool 기본 40)")
+        print(f"{'concurrency':>12}{'sync req/s':>14}{'async req/s':>14}")
+        for concurrency in args.concurrency:
+            total = max(args.requests, concurrency * 4)
+            sync_rps = await load(app, "/sync/1", concurrency, total)
+            async_rps = await load(app, "/async/1", concurrency, total)
+            print(f"{concurrency:>12}{sync_rps:>14.1f}{async_rps:>14.1f}")
+        sync_engine, async_engine = app.state.engines
+        print("checkout wait:", db_session.POOL_CHECKOUT_WAIT.snapshot())
+        print("async pool:", db_session.pool_status(async_engine))
+        sync_engine.dispose()
+        await async_engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--db-latency", type=float, default=0.005, help="쿼리당 지연 (초)")
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[10, 40, 100, 200])
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
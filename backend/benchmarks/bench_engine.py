@@ -0,0 +1,98 @@
+"""
+매매 엔진 처리량 벤치마크
+
+N개의 가상 매매 설정을 등록하고 모의 시세 피드를 흘려
+초당 전략 평가 수(decisions/sec)와 틱 지연을 측정한다.
+
+실행: cd backend && python -m benchmarks.bench_engine --settings 5000 --symbols 100 --ticks 200
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+from app.trading.engine import TradingEngine
+from app.trading.market_data import MarketDataStore
+from app.trading.strategy import SIGNAL_BUY, SIGNAL_NONE, SIGNAL_SELL, Strategy, register_strategy
+
+
+@register_strategy("bench_breakout")
+class BreakoutStrategy(Strategy):
+    def __init__(self, symbol, parameters):
+        super().__init__(symbol, parameters)
+        self.high = float("-inf")
+        self.low = float("inf")
+
+    def signals(self, close):
+        replay = BreakoutStrategy(self.symbol, self.parameters)
+        return np.array([replay.update(price) for price in close], dtype=np.int8)
+
+    def update(self, price):
+        if self.high == float("-inf"):
+            self.high = self.low = price
+            return SIGNAL_NONE
+        signal = SIGNAL_NONE
+        if price > self.high * (1 + self.parameters["band"]):
+            signal = SIGNAL_BUY
+        elif price < self.low * (1 - self.parameters["band"]):
+            signal = SIGNAL_SELL
+        self.high = max(self.high, price)
+        self.low = min(self.low, price)
+        return signal
+
+
+async def run(settings_count: int, symbols: int, ticks: int) -> None:
+    store = MarketDataStore(capacity=symbols)
+    codes = [f"KRW-S{i:04d}" for i in range(symbols)]
+    executed = 0
+
+    async def executor(decision):
+        nonlocal executed
+        executed += 1
+
+    engine = TradingEngine(store, executor=executor)
+    engine.add_settings(
+        SimpleNamespace(
+            id=i, user_id=i, exchange="upbit", symbol=codes[i % symbols],
+            strategy_name="bench_breakout", parameters={"band": random.uniform(0.001, 0.01)},
+        )
+        for i in range(settings_count)
+    )
+    await engine.start()
+
+    rng = random.Random(1)
+    prices = [1000.0] * symbols
+    start = time.perf_counter()
+    for _ in range(ticks):
+        for i, code in enumerate(codes):
+            prices[i] *= 1 + rng.uniform(-0.002, 0.002)
+            store.apply({"type": "ticker", "code": code, "trade_price": prices[i], "timestamp": 0})
+        await asyncio.sleep(0)  # 피드 수신 간격마다 엔진에 제어권 양보
+    await engine.stop()
+    elapsed = time.perf_counter() - start
+
+    stats = engine.stats()
+    latency = stats["tick_latency"]
+    print(f"settings           {stats['settings']}")
+    print(f"decisions          {stats['decisions']}")
+    print(f"decisions/sec      {stats['decisions'] / elapsed:,.0f}")
+    print(f"orders executed    {executed}")
+    print(f"tick latency p50   {latency['p50'] * 1000:.2f} ms (구간 상한)")
+    print(f"tick latency p99   {latency['p99'] * 1000:.2f} ms (구간 상한)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--settings", type=int, default=5000)
+    parser.add_argument("--symbols", type=int, default=100)
+    parser.add_argument("--ticks", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(run(args.settings, args.symbols, args.ticks))
+
+
+if __name__ == "__main__":
+    main()
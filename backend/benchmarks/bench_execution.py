@@ -0,0 +1,96 @@
+"""
+주문 실행 파이프라인 벤치마크
+
+로컬 모의 거래소(체결 지연 fill_delay)를 대상으로 주문을 보내
+- 주문 → 접수 응답 (대기 주문 행 기록 포함)
+- 주문 → 전량 체결 (myOrder 스트림 추적 / 스트림 없이 조회 주기로 추적)
+지연의 p50/p99를 비교한다.
+
+실행: cd backend && python -m benchmarks.bench_execution --orders 200
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from typing import List
+
+os.environ.setdefault("ENCRYPTION_KEY", "benchmark-encryption-key")
+
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.pubsub import StreamHub
+from app.db.base import Base
+from app.services.exchange_service import ExchangeRouter
+from app.services.rate_limiter import RateLimiter
+from app.services.upbit_service import UpbitConnector
+from app.trading.execution import ExecutionPipeline
+from app.trading.portfolio import PortfolioBook
+from tests.fakes.upbit_exchange import MockUpbitExchange
+
+UNTHROTTLED = RateLimiter(limits={}, default=(1e9, 1.0))
+
+
+def _report(name: str, latencies: List[float]) -> None:
+    latencies.sort()
+    p50 = statistics.median(latencies) * 1000
+    p99 = latencies[max(int(len(latencies) * 0.99) - 1, 0)] * 1000
+    print(f"{name:<36}{p50:>10.3f}{p99:>10.3f}")
+
+
+async def _scenario(name: str, args, sessions, order_stream: bool) -> None:
+    exchange = MockUpbitExchange(fill_delay=args.fill_delay, order_stream=order_stream)
+    await exchange.start()
+    connector = UpbitConnector(
+        exchange.access_key, exchange.secret_key, base_url=exchange.url, ws_url=exchange.ws_url,
+        rate_limiter=UNTHROTTLED,
+    )
+    pipeline = ExecutionPipeline(
+        ExchangeRouter([connector]), sessions, hub=StreamHub(), book=PortfolioBook(), poll_interval=args.poll_interval,
+    )
+    await pipeline.start()
+    while order_stream and not exchange.order_subscribers:
+        await asyncio.sleep(0.01)
+    acks, fills = [], []
+    try:
+        for _ in range(args.orders):
+            start = time.perf_counter()
+            ticket = await pipeline.submit(1, "upbit", "KRW-BTC", "buy", amount=10000)
+            acks.append(time.perf_counter() - start)
+            await pipeline.wait(ticket.client_order_id, timeout=30)
+            fills.append(time.perf_counter() - start)
+        _report(f"ack: {name}", acks)
+        _report(f"fill: {name}", fills)
+    finally:
+        await pipeline.stop()
+        await connector.close()
+        await exchange.stop()
+
+
+async def _main(args) -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        engine = create_engine(f"sqlite:///{tmpdir}/bench.db")
+        Base.metadata.create_all(bind=engine)
+        engine.dispose()
+        async_engine = create_async_engine(f"sqlite+aiosqlite:///{tmpdir}/bench.db", poolclass=NullPool)
+        sessions = async_sessionmaker(async_engine, expire_on_commit=False)
+        print(f"{'scenario':<36}{'p50 ms':>10}{'p99 ms':>10}")
+        await _scenario("myOrder stream", args, sessions, order_stream=True)
+        await _scenario(f"polling ({args.poll_interval}s)", args, sessions, order_stream=False)
+        await async_engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, default=200)
+    parser.add_argument("--fill-delay", type=float, default=0.005)
+    parser.add_argument("--poll-interval", type=float, default=0.1)
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
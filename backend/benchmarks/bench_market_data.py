@@ -0,0 +1,59 @@
+"""
+시세 저장소 처리량/메모리 벤치마크
+
+기록된 업비트 피드를 심볼 수만큼 복제해 재생하고
+초당 처리 메시지 수와 심볼당 메모리를 측정한다.
+
+실행: cd backend && python -m benchmarks.bench_market_data --symbols 200 --loops 50
+"""
+
+import argparse
+import json
+import os
+import time
+import tracemalloc
+
+from app.trading.market_data import MarketDataStore, ReplayFeed
+
+FEED_PATH = os.path.join(os.path.dirname(__file__), "..", "tests", "fixtures", "upbit_feed.ndjson")
+
+
+def _expand(feed: ReplayFeed, symbols: int) -> list:
+    """기록된 메시지의 마켓 코드를 바꿔 심볼 수 확장"""
+    expanded = []
+    for raw in feed.raw_messages:
+        message = json.loads(raw)
+        for i in range(symbols):
+            message["code"] = f"KRW-S{i:04d}"
+            expanded.append(json.dumps(message))
+    return expanded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--symbols", type=int, default=200)
+    parser.add_argument("--loops", type=int, default=50)
+    args = parser.parse_args()
+
+    feed = ReplayFeed(FEED_PATH)
+    feed.raw_messages = _expand(feed, args.symbols)
+
+    tracemalloc.start()
+    store = MarketDataStore()
+    feed.replay(store)  # 심볼 등록 및 예열
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    count = feed.replay(store, loops=args.loops)
+    elapsed = time.perf_counter() - start
+
+    print(f"symbols            {len(store.symbols)}")
+    print(f"messages           {count}")
+    print(f"throughput         {count / elapsed:,.0f} msgs/sec")
+    print(f"array bytes/symbol {store.nbytes / len(store.symbols):,.0f}")
+    print(f"peak alloc/symbol  {peak / len(store.symbols):,.0f} (tracemalloc, 예열 포함)")
+
+
+if __name__ == "__main__":
+    main()
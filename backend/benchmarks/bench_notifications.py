@@ -0,0 +1,80 @@
+"""
+웹훅 알림 발송 벤치마크
+
+체결마다 웹훅을 바로 보내는 방식(before)과 NotificationDispatcher 대기열에 넣는 방식(after)의
+- 체결 경로가 알림 때문에 멈추는 시간 (p50/p99)
+- 웹훅 요청 수
+를 비교한다. 로컬 수신 서버는 --latency 만큼 늦게 응답한다.
+
+실행: cd backend && python -m benchmarks.bench_notifications --fills 200
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from typing import List
+
+os.environ.setdefault("ENCRYPTION_KEY", "benchmark-encryption-key")
+
+import aiohttp
+
+from app.services.notification_service import TRADE, NotificationDispatcher
+from app.services.rate_limiter import RateLimiter
+from tests.fakes.webhook_sink import WebhookSink
+
+
+def _report(name: str, latencies: List[float], requests: int) -> None:
+    latencies.sort()
+    p50 = statistics.median(latencies) * 1000
+    p99 = latencies[max(int(len(latencies) * 0.99) - 1, 0)] * 1000
+    print(f"{name:<32}{p50:>10.3f}{p99:>10.3f}{requests:>10}")
+
+
+async def _main(args) -> None:
+    sink = WebhookSink(latency=args.latency)
+    await sink.start()
+    url = f"{sink.url}/slack/bench"
+    print(f"{'scenario':<32}{'p50 ms':>10}{'p99 ms':>10}{'requests':>10}")
+    try:
+        async with aiohttp.ClientSession() as session:
+            latencies = []
+            for i in range(args.fills):
+                start = time.perf_counter()
+                async with session.post(url, json={"text": f"[체결] order {i}"}) as response:
+                    await response.read()
+                latencies.append(time.perf_counter() - start)
+            _report("inline webhook (before)", latencies, sink.attempts)
+
+        sent = sink.attempts
+        dispatcher = NotificationDispatcher(
+            batch_window=args.batch_window, spill_path="", rate_limiter=RateLimiter(limits={}, default=(1e9, 1.0)),
+        )
+        dispatcher.set_targets(1, url)
+        await dispatcher.start()
+        latencies = []
+        for i in range(args.fills):
+            start = time.perf_counter()
+            dispatcher.notify(1, TRADE, "체결", f"order {i}")
+            latencies.append(time.perf_counter() - start)
+            await asyncio.sleep(args.interval)  # 체결 간격
+        await dispatcher.flush(timeout=60)
+        await dispatcher.stop()
+        _report("NotificationDispatcher (after)", latencies, sink.attempts - sent)
+        print(f"delivery latency: {dispatcher.stats()['latency']}")
+    finally:
+        await sink.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fills", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--interval", type=float, default=0.005)
+    parser.add_argument("--batch-window", type=float, default=0.5)
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+포트폴리오 요약 조회 벤치마크
+
+체결 100만 건을 원장에 기록(장부 증분 갱신 포함)한 뒤, 대시보드 요약을
+1) 요청마다 사용자 체결 전체를 읽어 집계하는 방식과
+2) 포트폴리오 장부 조회 + 현재가 평가 방식으로 나눠 지연을 비교한다.
+
+실행: cd backend && python -m benchmarks.bench_portfolio --rows 1000000
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+os.environ.setdefault("ENCRYPTION_KEY", "benchmark-encryption-key")
+
+import numpy as np
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.models.user import Trade
+from app.trading.ledger import TradeLedger
+from app.trading.portfolio import PortfolioBook, Position
+
+SYMBOLS = ("KRW-BTC", "KRW-ETH", "KRW-XRP", "KRW-SOL", "KRW-DOGE")
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def aggregate_on_the_fly(session, user_id: int, prices):
+    """장부 없이 사용자 체결 전체를 재생해 요약"""
+    positions = {}
+    query = (
+        select(Trade.exchange, Trade.symbol, Trade.side, Trade.quantity, Trade.price)
+        .where(Trade.user_id == user_id, Trade.status == "filled")
+        .order_by(Trade.id)
+    )
+    for exchange, symbol, side, quantity, price in session.execute(query):
+        position = positions.get((exchange, symbol))
+        if position is None:
+            position = positions[(exchange, symbol)] = Position(user_id, exchange, symbol)
+        position.apply(side, quantity, price)
+    realized = sum(p.realized_pnl for p in positions.values())
+    unrealized = sum(p.unrealized_pnl(prices[key]) for key, p in positions.items() if key in prices)
+    return realized + unrealized
+
+
+def timed(func, users, rng, samples: int):
+    latencies = []
+    for _ in range(samples):
+        user_id = int(rng.integers(1, users + 1))
+        start = time.perf_counter()
+        func(user_id)
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+    return statistics.median(latencies), latencies[max(int(len(latencies) * 0.99) - 1, 0)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=1_000)
+    parser.add_argument("--batch", type=int, default=50_000)
+    parser.add_argument("--samples", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    prices = {("upbit", symbol): float(price) for symbol, price in zip(SYMBOLS, rng.uniform(100, 1000, len(SYMBOLS)))}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        engine = create_engine(f"sqlite:///{tmpdir}/portfolio.db")
+        Base.metadata.create_all(bind=engine)
+        with sessionmaker(bind=engine)() as session:
+            book = PortfolioBook()
+            ledger = TradeLedger(session, book=book)
+            step = timedelta(days=365) / args.rows
+            written = 0
+            start = time.perf_counter()
+            while written < args.rows:
+                size = min(args.batch, args.rows - written)
+                users = rng.integers(1, args.users + 1, size)
+                symbols = rng.integers(0, len(SYMBOLS), size)
+                sides = rng.random(size) < 0.55
+                fill_prices = rng.uniform(100, 1000, size)
+                written += ledger.record_fills([
+                    {
+                        "user_id": int(users[i]), "exchange": "upbit", "symbol": SYMBOLS[symbols[i]],
+                        "side": "buy" if sides[i] else "sell", "quantity": 0.1, "price": float(fill_prices[i]),
+                        "status": "filled", "created_at": START + step * (written + i),
+                    }
+                    for i in range(size)
+                ])
+            print(f"recorded {written:,} fills in {time.perf_counter() - start:.1f}s "
+                  f"(book: {book.fills_applied:,} fills applied)")
+
+            p50, p99 = timed(lambda user_id: aggregate_on_the_fly(session, user_id, prices),
+                             args.users, rng, max(args.samples // 10, 5))
+            print(f"on-the-fly aggregation: p50 {p50:.3f}ms  p99 {p99:.3f}ms")
+            p50, p99 = timed(lambda user_id: book.summary(user_id, prices), args.users, rng, args.samples)
+            print(f"portfolio book:         p50 {p50:.3f}ms  p99 {p99:.3f}ms")
+
+            start = time.perf_counter()
+            book.snapshot(session)
+            snapshot_ms = (time.perf_counter() - start) * 1000
+            start = time.perf_counter()
+            PortfolioBook().restore(session)
+            print(f"snapshot {snapshot_ms:.1f}ms, restore from snapshot {(time.perf_counter() - start) * 1000:.1f}ms")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
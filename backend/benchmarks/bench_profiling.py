@@ -0,0 +1,123 @@
+"""
+요청 프로파일러 오버헤드 벤치마크
+
+- 요청당 비용: 미들웨어 없음 / 꺼진 ProfilingMiddleware / 느린 요청 기록 켬 (기준 10초라 기록은 안 남음)
+  상태로 같은 라우트를 소켓 없이 ASGI로 직접 호출해 비교한다.
+- 샘플링 비용: 대기 중인 요청 N개가 있을 때 샘플링 한 번(sys._current_frames + 요청별 await 체인)에 드는 시간
+  (처음 읽을 때와, 같은 지점에 멈춰 있는 요청의 체인을 재사용할 때).
+  샘플링 스레드가 주기(settings.PROFILING_INTERVAL)마다 이만큼 GIL을 쓴다.
+
+실행: cd backend && python -m benchmarks.bench_profiling
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from typing import Tuple
+
+os.environ.setdefault("ENCRYPTION_KEY", "benchmark-encryption-key")
+
+from fastapi import FastAPI
+
+from app.api.profiling import ProfilingMiddleware
+from app.core.profiling import RequestProfiler
+
+
+def _asgi_app(profiler: RequestProfiler = None):
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"id": item_id}
+
+    if profiler is not None:
+        app.add_middleware(ProfilingMiddleware, profiler=profiler)
+    return app
+
+
+async def _per_call(app, number: int) -> float:
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET", "scheme": "http",
+        "path": "/items/1", "raw_path": b"/items/1", "root_path": "", "query_string": b"", "headers": [],
+        "client": ("127.0.0.1", 1), "server": ("127.0.0.1", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    start = time.perf_counter()
+    for _ in range(number):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter() - start) / number
+
+
+async def _requests(number: int, repeat: int) -> None:
+    watching = RequestProfiler(slow_threshold=10.0)
+    apps = {
+        "no middleware": _asgi_app(),
+        "profiler off": _asgi_app(RequestProfiler(slow_threshold=0)),
+        "slow capture on": _asgi_app(watching),
+    }
+    best = {name: float("inf") for name in apps}
+    for _ in range(repeat):  # 번갈아 측정
+        for name, app in apps.items():
+            best[name] = min(best[name], await _per_call(app, number))
+    watching.configure(0)
+    base = best["no middleware"]
+    print(f"{'request path':<20}{'us/request':>12}{'added us':>10}")
+    for name, value in best.items():
+        print(f"{name:<20}{value * 1e6:>12.2f}{(value - base) * 1e6:>10.2f}")
+
+
+async def _sampling(concurrency: int, repeat: int) -> Tuple[float, float, int]:
+    profiler = RequestProfiler(slow_threshold=10.0, interval=3600)  # 샘플링은 직접 호출
+    release = asyncio.Event()
+
+    async def nested(depth: int):
+        if depth:
+            return await nested(depth - 1)
+        await release.wait()
+
+    async def request():
+        watch = profiler.begin()
+        try:
+            await nested(10)
+        finally:
+            profiler.end(watch, "GET", "/x", "/x", 200)
+
+    tasks = [asyncio.create_task(request()) for _ in range(concurrency)]
+    await asyncio.sleep(0)
+    timings = []
+    for _ in range(repeat + 1):
+        start = time.perf_counter()
+        sampled = profiler.sample()
+        timings.append(time.perf_counter() - start)
+    release.set()
+    await asyncio.gather(*tasks)
+    profiler.configure(0)
+    # 첫 샘플은 await 체인을 모두 읽고, 이후는 그대로 멈춰 있는 요청의 체인을 재사용
+    return timings[0], min(timings[1:]), sampled
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 100])
+    args = parser.parse_args()
+    print(f"cpu cores: {os.cpu_count()}")
+    asyncio.run(_requests(args.number, args.repeat))
+    print()
+    print(f"{'in-flight':>10}{'first tick us':>15}{'steady tick us':>16}")
+    for concurrency in args.concurrency:
+        first, steady, sampled = asyncio.run(_sampling(concurrency, args.repeat))
+        assert sampled == concurrency
+        print(f"{concurrency:>10}{first * 1e6:>15.1f}{steady * 1e6:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
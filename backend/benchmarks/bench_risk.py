@@ -0,0 +1,117 @@
+"""
+사전 주문 위험 관리 벤치마크
+
+열린 포지션 N개(사용자 × 심볼)를 메모리에 올린 뒤
+- 사전 주문 검사(check) 1건 지연 (p50/p99)
+- 시세 틱 1건당 해당 심볼 포지션 손절/익절 판정(on_price) 지연
+- 전체 포지션 일괄 판정(scan) 지연
+을 측정한다. 비교 기준(before)은 주문마다 TradingSetting과 포지션을 DB에서 읽는 방식이다.
+
+실행: cd backend && python -m benchmarks.bench_risk --positions 100000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Callable, List
+
+os.environ.setdefault("ENCRYPTION_KEY", "benchmark-encryption-key")
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.models.user import PositionSnapshot, TradingSetting
+from app.trading.portfolio import PortfolioBook, Position
+from app.trading.risk_management import RiskEngine
+
+
+def _report(name: str, latencies: List[float]) -> None:
+    latencies.sort()
+    p50 = statistics.median(latencies) * 1e6
+    p99 = latencies[max(int(len(latencies) * 0.99) - 1, 0)] * 1e6
+    print(f"{name:<40}{p50:>12.2f}{p99:>12.2f}")
+
+
+def _measure(run: Callable[[], object], count: int) -> List[float]:
+    latencies = []
+    for _ in range(count):
+        start = time.perf_counter()
+        run()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--positions", type=int, default=100_000)
+    parser.add_argument("--symbols", type=int, default=100)
+    parser.add_argument("--checks", type=int, default=100_000)
+    parser.add_argument("--ticks", type=int, default=2000)
+    parser.add_argument("--db-checks", type=int, default=2000)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    symbols = [f"KRW-C{i:03d}" for i in range(args.symbols)]
+    users = args.positions // args.symbols
+    positions = [
+        Position(user, "upbit", symbol, quantity=rng.uniform(-1, 1), avg_cost=100.0)
+        for user in range(users) for symbol in symbols
+    ]
+    risk = RiskEngine(book=PortfolioBook(), max_order_quantity={"C000": 10.0})
+    start = time.perf_counter()
+    risk.update_positions(positions)
+    for user in range(users):
+        risk.set_limits(user, "upbit", symbols[user % args.symbols], max_position=5.0, stop_loss=3.0)
+    print(f"loaded {len(positions)} positions in {time.perf_counter() - start:.2f}s")
+
+    orders = [(rng.randrange(users), rng.choice(symbols), rng.choice(("buy", "sell"))) for _ in range(1024)]
+    cursor = iter(range(10 ** 9))
+
+    def check():
+        user, symbol, side = orders[next(cursor) & 1023]
+        risk.check(user, "upbit", symbol, side, quantity=0.5)
+
+    prices = [rng.uniform(99.0, 101.0) for _ in range(1024)]  # 손절/익절 범위 안: 모든 포지션을 감시한 채로 측정
+
+    def tick():
+        index = next(cursor)
+        risk.on_price("upbit", symbols[index % args.symbols], prices[index & 1023])
+
+    print(f"{'scenario':<40}{'p50 us':>12}{'p99 us':>12}")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        engine = create_engine(f"sqlite:///{tmpdir}/bench.db")
+        Base.metadata.create_all(bind=engine)
+        db = sessionmaker(bind=engine)()
+        db.add_all(TradingSetting(user_id=u, exchange="upbit", symbol=symbols[u % args.symbols], is_active=True,
+                                  max_position_size=5.0) for u in range(users))
+        taken_at = datetime.now(timezone.utc)
+        db.bulk_insert_mappings(PositionSnapshot, [
+            {"user_id": p.user_id, "exchange": p.exchange, "symbol": p.symbol, "quantity": p.quantity,
+             "avg_cost": p.avg_cost, "taken_at": taken_at} for p in positions[:20000]
+        ])
+        db.commit()
+
+        def db_check():
+            user, symbol, _ = orders[next(cursor) & 1023]
+            db.query(TradingSetting).filter_by(user_id=user, exchange="upbit", symbol=symbol, is_active=True).all()
+            db.query(PositionSnapshot).filter_by(user_id=user, exchange="upbit", symbol=symbol).first()
+
+        try:
+            _report("check: DB lookup per order (before)", _measure(db_check, args.db_checks))
+        finally:
+            db.close()
+            engine.dispose()
+    _report("check: in-memory RiskEngine (after)", _measure(check, args.checks))
+    _report(f"on_price: 1 symbol ({users} positions)", _measure(tick, args.ticks))
+    all_prices = {("upbit", symbol): rng.uniform(99.0, 101.0) for symbol in symbols}
+    _report(f"scan: all {len(positions)} positions", _measure(lambda: risk.scan(all_prices), 50))
+    print(f"stats: {risk.stats()}")
+
+
+if __name__ == "__main__":
+    main()
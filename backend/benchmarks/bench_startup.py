@@ -0,0 +1,103 @@
+"""
+프로세스 기동(import) 시간 벤치마크와 예산 검사
+
+API 워커(app.main), 엔진 프로세스(app.engine_main), CLI 스크립트(generate_encryption_key)의 진입
+모듈을 새 인터프리터에서 --repeat 회 불러와 중앙값 시간을 잰다. 마지막 한 번은 -X importtime으로
+실행해 모듈별 누적/자체 시간 상위 --top 개를 보여 주고, 처음 쓸 때 불러오도록 미뤄 둔 무거운
+의존성(pandas, pyupbit 등)이 기동 중에 불러와졌는지 확인한다.
+--budget-ms를 주면 중앙값이 예산을 넘거나 미뤄 둔 의존성이 불러와진 진입점이 있을 때 1로 종료한다.
+
+실행: cd backend && python -m benchmarks.bench_startup --budget-ms 3000
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+ENTRYPOINTS = {
+    "api": "app.main",
+    "engine": "app.engine_main",
+    "keygen": "app.scripts.generate_encryption_key",
+}
+
+# 기동 경로에서 불러오지 않아야 하는 모듈 (처음 쓸 때 불러옴)
+DEFERRED = ("pandas", "pyupbit", "requests", "jose", "passlib", "cryptography")
+
+# (모듈, 자체 us, 누적 us)
+ImportRow = Tuple[str, int, int]
+
+
+def _env() -> Dict[str, str]:
+    return {**os.environ, "ENCRYPTION_KEY": os.environ.get("ENCRYPTION_KEY", "benchmark-encryption-key")}
+
+
+def _cold_import(module: str) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", f"import {module}"], env=_env(), check=True)
+    return time.perf_counter() - start
+
+
+def _import_profile(module: str) -> List[ImportRow]:
+    """-X importtime 출력에서 모듈별 자체/누적 시간 읽기"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=_env(), check=True, capture_output=True, text=True,
+    )
+    rows: List[ImportRow] = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def _top_packages(rows: List[ImportRow], top: int) -> List[Tuple[str, int]]:
+    """최상위 패키지별 자체 시간 합 (큰 순)"""
+    totals: Dict[str, int] = {}
+    for name, self_us, _ in rows:
+        package = name.split(".")[0]
+        totals[package] = totals.get(package, 0) + self_us
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entrypoints", nargs="+", choices=sorted(ENTRYPOINTS), default=sorted(ENTRYPOINTS))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=None, help="진입점별 기동 시간 중앙값 상한")
+    args = parser.parse_args()
+
+    failed = False
+    # 인터프리터 자체 기동 시간 (진입점 시간에서 뺄 기준값)
+    baseline = statistics.median(_cold_import("sys") for _ in range(args.repeat))
+    print(f"interpreter startup: {baseline * 1000:.0f} ms")
+    for entrypoint in args.entrypoints:
+        module = ENTRYPOINTS[entrypoint]
+        elapsed = statistics.median(_cold_import(module) for _ in range(args.repeat))
+        rows = _import_profile(module)
+        loaded = {name.split(".")[0] for name, _, _ in rows}
+        deferred = [name for name in DEFERRED if name in loaded]
+        over = args.budget_ms is not None and elapsed * 1000 > args.budget_ms
+        failed = failed or over or (args.budget_ms is not None and bool(deferred))
+
+        print(f"\n{entrypoint} ({module}): {elapsed * 1000:.0f} ms"
+              f" (import {(elapsed - baseline) * 1000:.0f} ms){'  OVER BUDGET' if over else ''}")
+        print(f"  deferred modules loaded: {', '.join(deferred) or 'none'}")
+        print(f"  {'package':<28}{'self ms':>10}")
+        for package, self_us in _top_packages(rows, args.top):
+            print(f"  {package:<28}{self_us / 1000:>10.1f}")
+        print(f"  {'module':<44}{'cumulative ms':>14}")
+        app_rows = sorted((row for row in rows if row[0].startswith("app")), key=lambda row: row[2], reverse=True)
+        for name, _, cumulative_us in app_rows[:args.top]:
+            print(f"  {name:<44}{cumulative_us / 1000:>14.1f}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
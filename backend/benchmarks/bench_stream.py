@@ -0,0 +1,212 @@
+"""
+대시보드 스트림 부하 테스트
+
+구독자 1만 명이 시세(전체 심볼)와 자기 포트폴리오 토픽을 구독한 상태에서
+발행기가 일정 주기로 시세/포지션을 갱신할 때 팬아웃 비용과 전달 지연을 측정한다.
+구독자 일부는 느린 클라이언트로 만들어 중간 프레임을 건너뛰는지 확인한다.
+
+- hub 모드(기본): 프로세스 안에서 허브 구독 객체로 구독자를 흉내 낸다.
+- ws 모드: uvicorn 서버를 별도 프로세스로 띄우고 실제 WebSocket 연결을 맺는다.
+
+실행: cd backend && python -m benchmarks.bench_stream --subscribers 10000
+      cd backend && python -m benchmarks.bench_stream --mode ws --subscribers 10000
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import random
+import statistics
+import time
+from contextlib import asynccontextmanager
+
+os.environ.setdefault("ENCRYPTION_KEY", "benchmark-encryption-key")
+os.environ.setdefault("PORTFOLIO_SNAPSHOT_INTERVAL", "0")
+
+from app.core.pubsub import StreamHub, encode_batch, stream_hub
+from app.trading.streams import PRICES_TOPIC, portfolio_topic, user_topics
+
+
+def percentile(values, q):
+    if not values:
+        return float("nan")
+    values = sorted(values)
+    return values[min(int(len(values) * q), len(values) - 1)]
+
+
+async def publisher(hub: StreamHub, args, stop: asyncio.Event, fanout_ms=None) -> int:
+    """시세와 포지션을 주기적으로 발행"""
+    rng = random.Random(0)
+    prices = {f"KRW-S{i:03d}": 1000.0 for i in range(args.symbols)}
+    ticks = 0
+    interval = 1.0 / args.rate
+    while not stop.is_set():
+        start = time.perf_counter()
+        for symbol in rng.sample(list(prices), max(1, len(prices) // 4)):
+            prices[symbol] *= 1 + rng.uniform(-0.001, 0.001)
+            hub.publish(PRICES_TOPIC, symbol, {"price": round(prices[symbol], 2), "ts": time.time()})
+        for _ in range(args.portfolio_updates):
+            user_id = rng.randrange(args.subscribers)
+            hub.publish(portfolio_topic(user_id), "upbit:KRW-S000", {"quantity": rng.random(), "ts": time.time()})
+        if fanout_ms is not None:
+            fanout_ms.append((time.perf_counter() - start) * 1000)
+        ticks += 1
+        await asyncio.sleep(max(0.0, interval - (time.perf_counter() - start)))
+    return ticks
+
+
+def record_lag(batch, lags, now):
+    for message in batch:
+        data = message.get("data") if isinstance(message, dict) else message.data
+        if data and "ts" in data:
+            lags.append((now - data["ts"]) * 1000)
+
+
+async def run_hub(args) -> None:
+    hub = StreamHub()
+    stop = asyncio.Event()
+    lags, fanout_ms = [], []
+    frames = [0]
+
+    async def subscriber(subscription, user_id: int, slow: bool):
+        try:
+            while True:
+                batch = await subscription.get()
+                if not batch:
+                    continue
+                encode_batch(batch)
+                frames[0] += 1
+                if user_id % 50 == 0:
+                    record_lag(batch, lags, time.time())
+                if slow:
+                    await asyncio.sleep(args.slow_delay)
+        finally:
+            subscription.close()
+
+    subscriptions = [hub.subscribe(user_topics(user_id)) for user_id in range(args.subscribers)]
+    tasks = [
+        asyncio.create_task(subscriber(subscription, user_id, user_id < args.subscribers * args.slow_fraction))
+        for user_id, subscription in enumerate(subscriptions)
+    ]
+    await asyncio.sleep(0.5)
+    pub = asyncio.create_task(publisher(hub, args, stop, fanout_ms))
+    await asyncio.sleep(args.duration)
+    stop.set()
+    ticks = await pub
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    delivered = sum(s.delivered for s in subscriptions)
+    skipped = sum(s.skipped for s in subscriptions)
+    print(f"subscribers={args.subscribers} (slow {args.slow_fraction:.0%}) symbols={args.symbols} "
+          f"rate={args.rate}/s duration={args.duration}s")
+    print(f"publish ticks: {ticks}, hub messages: {hub.published}, frames sent: {frames[0]:,}")
+    print(f"messages delivered: {delivered:,}, intermediate updates skipped: {skipped:,}")
+    print(f"fan-out per tick: p50 {statistics.median(fanout_ms):.1f}ms  p99 {percentile(fanout_ms, 0.99):.1f}ms")
+    print(f"delivery lag: p50 {percentile(lags, 0.5):.1f}ms  p99 {percentile(lags, 0.99):.1f}ms")
+
+
+def serve(args, port: int) -> None:
+    """ws 모드 서버 프로세스"""
+    import uvicorn
+    from fastapi import FastAPI
+    from app.api.v1.endpoints import stream
+
+    @asynccontextmanager
+    async def lifespan(app):
+        stop = asyncio.Event()
+        task = asyncio.create_task(publisher(stream_hub, args, stop))
+        yield
+        stop.set()
+        await task
+
+    app = FastAPI(lifespan=lifespan)
+    app.include_router(stream.router, prefix="/stream")
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning", backlog=16384, timeout_keep_alive=120, ws_max_queue=4)
+
+
+async def run_ws(args) -> None:
+    import websockets
+
+    port = 8765
+    server = multiprocessing.Process(target=serve, args=(args, port), daemon=True)
+    server.start()
+    for _ in range(300):  # 서버가 포트를 열 때까지 대기
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+        except OSError:
+            await asyncio.sleep(0.1)
+            continue
+        writer.close()
+        break
+    measuring, stop = asyncio.Event(), asyncio.Event()
+    lags = []
+    frames = [0]
+    connected, failed = [0], [0]
+
+    handshakes = asyncio.Semaphore(args.connect_concurrency)
+
+    async def client(user_id: int, slow: bool):
+        url = f"ws://127.0.0.1:{port}/stream/ws?user_id={user_id}"
+        try:
+            async with handshakes:
+                websocket = await websockets.connect(url, max_queue=4, open_timeout=120)
+            connected[0] += 1
+            try:
+                while not stop.is_set():
+                    try:
+                        frame = await asyncio.wait_for(websocket.recv(), 0.5)
+                    except asyncio.TimeoutError:
+                        continue
+                    if measuring.is_set():
+                        frames[0] += 1
+                        if user_id % 50 == 0:
+                            record_lag(json.loads(frame), lags, time.time())
+                    if slow:
+                        await asyncio.sleep(args.slow_delay)
+            finally:
+                await websocket.close()
+        except (OSError, asyncio.TimeoutError, websockets.WebSocketException) as e:
+            if not stop.is_set():
+                failed[0] += 1
+                if failed[0] <= 3:
+                    print("connect failed:", repr(e))
+
+    tasks = []
+    start = time.perf_counter()
+    for user_id in range(args.subscribers):
+        tasks.append(asyncio.create_task(client(user_id, user_id < args.subscribers * args.slow_fraction)))
+    while connected[0] + failed[0] < args.subscribers and time.perf_counter() - start < 600:
+        await asyncio.sleep(0.5)
+    print(f"connected {connected[0]:,}/{args.subscribers:,} websocket clients in "
+          f"{time.perf_counter() - start:.1f}s ({failed[0]} failed, slow {args.slow_fraction:.0%})")
+
+    measuring.set()
+    await asyncio.sleep(args.duration)
+    stop.set()
+    await asyncio.gather(*tasks)
+    server.terminate()
+    print(f"frames received: {frames[0]:,} ({frames[0] / args.duration:,.0f}/s over {args.duration}s)")
+    print(f"delivery lag: p50 {percentile(lags, 0.5):.1f}ms  p99 {percentile(lags, 0.99):.1f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--mode", choices=("hub", "ws"), default="hub")
+    parser.add_argument("--subscribers", type=int, default=10_000)
+    parser.add_argument("--symbols", type=int, default=100)
+    parser.add_argument("--rate", type=float, default=10.0, help="초당 발행 틱 수")
+    parser.add_argument("--portfolio-updates", type=int, default=50, help="틱당 포지션 갱신 수")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--slow-fraction", type=float, default=0.1)
+    parser.add_argument("--slow-delay", type=float, default=0.5, help="느린 구독자의 프레임당 처리 시간 (초)")
+    parser.add_argument("--connect-concurrency", type=int, default=50, help="ws 모드 동시 핸드셰이크 수")
+    args = parser.parse_args()
+    asyncio.run(run_hub(args) if args.mode == "hub" else run_ws(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+체결 원장 적재 / 이력 조회 벤치마크
+
+trades 테이블에 체결 1천만 건을 일괄 기록(COPY 또는 executemany)하고,
+사용자별·심볼별 최근 이력 조회 지연을 복합 인덱스가 있을 때와 없을 때로 나눠 측정한다.
+기본은 임시 SQLite 파일이며, 파티션까지 보려면 마이그레이션을 적용한 Postgres를
+--database-url postgresql://... 로 지정한다.
+
+실행: cd backend && python -m benchmarks.bench_trades --rows 10000000
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+os.environ.setdefault("ENCRYPTION_KEY", "benchmark-encryption-key")
+
+import numpy as np
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.models.user import Trade
+from app.trading.ledger import TradeLedger
+
+SYMBOLS = ("KRW-BTC", "KRW-ETH", "KRW-XRP", "KRW-SOL", "KRW-DOGE")
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def make_batch(rng, offset: int, size: int, users: int, step: timedelta):
+    user_ids = rng.integers(1, users + 1, size)
+    symbols = rng.integers(0, len(SYMBOLS), size)
+    prices = rng.uniform(100, 100_000, size)
+    return [
+        {
+            "user_id": int(user_ids[i]),
+            "exchange": "upbit",
+            "symbol": SYMBOLS[symbols[i]],
+            "side": "buy" if i % 2 == 0 else "sell",
+            "order_type": "market",
+            "quantity": 0.01,
+            "price": float(prices[i]),
+            "status": "filled",
+            "created_at": START + step * (offset + i),
+        }
+        for i in range(size)
+    ]
+
+
+def measure_history(session, rng, users: int, queries: int):
+    ledger = TradeLedger(session)
+    latencies = []
+    for _ in range(queries):
+        user_id = int(rng.integers(1, users + 1))
+        symbol = SYMBOLS[int(rng.integers(0, len(SYMBOLS)))]
+        start = time.perf_counter()
+        ledger.history(user_id, symbol=symbol, limit=100)
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+    return statistics.median(latencies), latencies[int(len(latencies) * 0.99) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--batch", type=int, default=50_000)
+    parser.add_argument("--users", type=int, default=1_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--orm-sample", type=int, default=20_000, help="ORM add_all 비교용 행 수")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        url = args.database_url or f"sqlite:///{tmpdir}/trades.db"
+        engine = create_engine(url)
+        Base.metadata.create_all(bind=engine)  # Postgres는 마이그레이션으로 생성된 파티션 테이블 사용
+        Session = sessionmaker(bind=engine)
+        step = timedelta(days=365) / args.rows  # 1년에 고르게 분포
+
+        with Session() as session:
+            sample = make_batch(rng, 0, args.orm_sample, args.users, step)
+            start = time.perf_counter()
+            session.add_all(Trade(**fill) for fill in sample)
+            session.commit()
+            orm_rate = len(sample) / (time.perf_counter() - start)
+            session.execute(text("DELETE FROM trades"))
+            session.commit()
+
+            ledger = TradeLedger(session)
+            start = time.perf_counter()
+            written = 0
+            while written < args.rows:
+                size = min(args.batch, args.rows - written)
+                written += ledger.record_fills(make_batch(rng, written, size, args.users, step))
+            bulk_elapsed = time.perf_counter() - start
+            print(f"ORM add_all: {orm_rate:,.0f} rows/s")
+            print(f"bulk insert ({engine.dialect.driver}): {written:,} rows in {bulk_elapsed:.1f}s "
+                  f"({written / bulk_elapsed:,.0f} rows/s)")
+
+            p50, p99 = measure_history(session, rng, args.users, args.queries)
+            print(f"history (indexed):   p50 {p50:.2f}ms  p99 {p99:.2f}ms")
+
+            for index in Trade.__table__.indexes:
+                if index.name != "ix_trades_id":
+                    index.drop(bind=session.connection())
+            session.commit()
+            queries = max(5, args.queries // 20)
+            p50, p99 = measure_history(session, rng, args.users, queries)
+            print(f"history (no index):  p50 {p50:.2f}ms  p99 {p99:.2f}ms  ({queries} queries)")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
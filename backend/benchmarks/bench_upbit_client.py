@@ -0,0 +1,99 @@
+"""
+업비트 클라이언트 처리량/지연 벤치마크
+
+로컬 모의 거래소를 대상으로 pyupbit 기반 UpbitAPI(스레드풀)와
+공유 세션 기반 AsyncUpbitAPI의 처리량과 p50/p99 지연을 비교한다.
+
+실행: cd backend && python -m benchmarks.bench_upbit_client --requests 2000 --concurrency 32
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
+
+import requests
+
+from app.services.rate_limiter import RateLimiter
+from app.trading.upbit import async_api
+from app.trading.upbit.api import UpbitAPI
+from app.trading.upbit.async_api import AsyncUpbitAPI
+from tests.fakes.upbit_exchange import MockUpbitExchange
+
+UPBIT_URL = "https://api.upbit.com"
+UNTHROTTLED = RateLimiter(limits={}, default=(1e9, 1.0))  # 클라이언트 자체 비용만 측정
+
+
+def _redirect(func: Callable, base_url: str) -> Callable:
+    """pyupbit의 고정 URL을 모의 거래소로 우회"""
+    def wrapper(url, *args, **kwargs):
+        return func(url.replace(UPBIT_URL, base_url), *args, **kwargs)
+    return wrapper
+
+
+def _report(name: str, elapsed: float, latencies: List[float]) -> None:
+    latencies.sort()
+    p50 = statistics.median(latencies) * 1000
+    p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+    print(f"{name:<28}{len(latencies) / elapsed:>12.1f}{p50:>10.2f}{p99:>10.2f}")
+
+
+def bench_sync(exchange: MockUpbitExchange, total: int, concurrency: int) -> None:
+    client = UpbitAPI(exchange.access_key, exchange.secret_key)
+    original_get, original_post = requests.get, requests.post
+    requests.get = _redirect(original_get, exchange.url)
+    requests.post = _redirect(original_post, exchange.url)
+
+    def call(_):
+        start = time.perf_counter()
+        client.get_current_price("KRW-BTC")
+        return time.perf_counter() - start
+
+    try:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            latencies = list(pool.map(call, range(total)))
+        _report("UpbitAPI (threadpool)", time.perf_counter() - start, latencies)
+    finally:
+        requests.get, requests.post = original_get, original_post
+
+
+async def bench_async(exchange: MockUpbitExchange, total: int, concurrency: int) -> None:
+    client = AsyncUpbitAPI(exchange.access_key, exchange.secret_key, base_url=exchange.url, rate_limiter=UNTHROTTLED)
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+
+    async def call():
+        async with semaphore:
+            start = time.perf_counter()
+            await client.get_current_price("KRW-BTC")
+            latencies.append(time.perf_counter() - start)
+
+    await client.get_current_price("KRW-BTC")  # 연결 예열
+    start = time.perf_counter()
+    await asyncio.gather(*(call() for _ in range(total)))
+    _report("AsyncUpbitAPI (shared)", time.perf_counter() - start, latencies)
+    await async_api.close_session()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--latency", type=float, default=0.0, help="모의 거래소 응답 지연 (초)")
+    args = parser.parse_args()
+
+    exchange = MockUpbitExchange(latency=args.latency)
+    exchange.start_in_thread()
+    try:
+        print(f"{'client':<28}{'req/s':>12}{'p50 ms':>10}{'p99 ms':>10}")
+        bench_sync(exchange, args.requests, args.concurrency)
+        asyncio.run(bench_async(exchange, args.requests, args.concurrency))
+    finally:
+        exchange.stop_thread()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+API 워커 수별 처리량 벤치마크
+
+엔진 역할 프로세스가 심볼 N개의 시세를 초당 --rate 건 허브에 발행해 공유 메모리 링으로 복제하고,
+APP_ROLE=api 로 띄운 uvicorn 워커 1/4/8개가 각자 복제한 허브에서 /api/v1/dashboard/prices 를
+응답한다. 부하 생성 프로세스 여러 개로 --duration 초 동안 요청해 초당 처리 수와 지연을 측정한다.
+워커 수만큼 확장되려면 워커 수 이상의 CPU 코어가 필요하다.
+
+실행: cd backend && python -m benchmarks.bench_workers --workers 1 4 8
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from typing import List, Tuple
+
+os.environ.setdefault("ENCRYPTION_KEY", "benchmark-encryption-key")
+
+import aiohttp
+
+
+def _engine(name: str, symbols: int, rate: float, stop) -> None:
+    from app.core.pubsub import StreamHub
+    from app.core.shared_state import SharedStatePublisher
+    from app.core.shm_ring import SharedRing
+
+    hub = StreamHub()
+    ring = SharedRing.create(name, slots=65536, slot_size=512)
+    publisher = SharedStatePublisher(hub, ring)
+    publisher.attach()
+    codes = [f"KRW-C{i:03d}" for i in range(symbols)]
+    interval = 1.0 / rate
+    tick = 0
+    next_resync = time.monotonic() + 1.0
+    try:
+        while not stop.is_set():
+            tick += 1
+            hub.publish("prices", codes[tick % symbols], {"price": 100.0 + tick % 997, "timestamp": tick})
+            if time.monotonic() >= next_resync:
+                publisher.resync()
+                next_resync += 1.0
+            time.sleep(interval)
+    finally:
+        ring.close()
+
+
+async def _load(url: str, duration: float, concurrency: int) -> Tuple[int, List[float]]:
+    latencies: List[float] = []
+    deadline = time.monotonic() + duration
+
+    async def worker(session: aiohttp.ClientSession):
+        while time.monotonic() < deadline:
+            start = time.perf_counter()
+            async with session.get(url) as response:
+                await response.read()
+                assert response.status == 200
+            latencies.append(time.perf_counter() - start)
+
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        await asyncio.gather(*(worker(session) for _ in range(concurrency)))
+    return len(latencies), latencies
+
+
+def _client(args) -> Tuple[int, List[float]]:
+    return asyncio.run(_load(*args))
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_ready(url: str, timeout: float = 30.0) -> None:
+    async def probe():
+        deadline = time.monotonic() + timeout
+        async with aiohttp.ClientSession() as session:
+            while time.monotonic() < deadline:
+                try:
+                    async with session.get(url) as response:
+                        if response.status == 200 and await response.json():
+                            return
+                except aiohttp.ClientError:
+                    pass
+                await asyncio.sleep(0.2)
+        raise TimeoutError(f"API 워커가 준비되지 않았습니다: {url}")
+
+    asyncio.run(probe())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--clients", type=int, default=4, help="부하 생성 프로세스 수")
+    parser.add_argument("--concurrency", type=int, default=32, help="부하 생성 프로세스당 동시 요청 수")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--symbols", type=int, default=100)
+    parser.add_argument("--rate", type=float, default=2000.0, help="엔진의 초당 시세 발행 수")
+    args = parser.parse_args()
+
+    name = f"coinori-bench-{uuid.uuid4().hex[:8]}"
+    stop = multiprocessing.Event()
+    engine = multiprocessing.Process(target=_engine, args=(name, args.symbols, args.rate, stop))
+    engine.start()
+    print(f"cpu cores: {os.cpu_count()}, engine publishing {args.rate:.0f} prices/s over {args.symbols} symbols")
+    print(f"{'workers':>8}{'req/s':>12}{'p50 ms':>10}{'p99 ms':>10}")
+    try:
+        for workers in args.workers:
+            port = _free_port()
+            env = {**os.environ, "APP_ROLE": "api", "SHARED_STATE_NAME": name}
+            server = subprocess.Popen(
+                [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port),
+                 "--workers", str(workers), "--log-level", "warning", "--no-access-log"],
+                env=env,
+            )
+            url = f"http://127.0.0.1:{port}/api/v1/dashboard/prices?symbols=KRW-C000,KRW-C001,KRW-C002"
+            try:
+                _wait_ready(url)
+                time.sleep(1.0)  # 모든 워커가 복제를 따라잡도록
+                with multiprocessing.Pool(args.clients) as pool:
+                    results = pool.map(_client, [(url, args.duration, args.concurrency)] * args.clients)
+            finally:
+                server.terminate()
+                server.wait(timeout=30)
+            total = sum(count for count, _ in results)
+            latencies = sorted(latency for _, chunk in results for latency in chunk)
+            p50 = statistics.median(latencies) * 1000
+            p99 = latencies[max(int(len(latencies) * 0.99) - 1, 0)] * 1000
+            print(f"{workers:>8}{total / args.duration:>12.0f}{p50:>10.2f}{p99:>10.2f}")
+    finally:
+        stop.set()
+        engine.join(timeout=10)
+
+
+if __name__ == "__main__":
+    main()
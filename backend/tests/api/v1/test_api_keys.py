@@ -2,11 +2,19 @@
 API 키 엔드포인트 테스트
 """
 
+import json
+
 import pytest
+from cryptography.fernet import Fernet
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
+from app.core.security import get_crypto
+from app.services.auth_service import Principal
 from app.trading.upbit.models import ApiKey
 
+ADMIN = Principal(id=1, username="ops", email="ops@example.com", is_active=True)
+USER = Principal(id=2, username="trader", email="trader@example.com", is_active=True)
+
 def test_create_api_key(client: TestClient, db):
     """API 키 생성 테스트"""
     response = client.post(
@@ -117,4 +125,82 @@ def test_get_nonexistent_api_key(client: TestClient, db):
     """존재하지 않는 API 키 조회 테스트"""
     response = client.get("/api/v1/api-keys/999")
     assert response.status_code == 404
-    assert response.json()["detail"] == "API 키를 찾을 수 없습니다." 
\ No newline at end of file
+    assert response.json()["detail"] == "API 키를 찾을 수 없습니다." 
+
+def test_list_api_keys_paginated(client: TestClient, db):
+    """API 키 목록 커서 페이지네이션과 요약 응답 테스트"""
+    created = [
+        client.post(
+            "/api/v1/api-keys/",
+            json={"exchange": "paged", "access_key": f"access-{i}", "secret_key": f"secret-{i}"}
+        ).json()["id"]
+        for i in range(5)
+    ]
+    client.put(f"/api/v1/api-keys/{created[1]}/status", json={"is_active": False})
+
+    seen, cursor = [], None
+    while True:
+        params = {"exchange": "paged", "limit": 2}
+        if cursor is not None:
+            params["cursor"] = cursor
+        response = client.get("/api/v1/api-keys/", params=params)
+        assert response.status_code == 200
+        page = response.json()
+        assert all(set(item) == {"id", "exchange", "is_active", "created_at", "updated_at"} for item in page)
+        seen.extend(item["id"] for item in page)
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+    assert seen == [created[0]] + created[2:]
+    assert client.get("/api/v1/api-keys/", params={"exchange": "paged", "limit": 0}).status_code == 422
+
+def test_bulk_endpoints_require_admin(client: TestClient, db, as_principal):
+    """API 키 일괄 등록/내보내기 관리자 전용 테스트"""
+    transport_key = Fernet.generate_key().decode()
+    items = [{"exchange": "bulk-denied", "access_key": "a", "secret_key": "s"}]
+    assert client.post("/api/v1/api-keys/bulk", json=items).status_code == 401
+    assert client.get("/api/v1/api-keys/export", headers={"X-Transport-Key": transport_key}).status_code == 401
+    as_principal(USER)
+    assert client.post("/api/v1/api-keys/bulk", json=items).status_code == 403
+    assert client.get("/api/v1/api-keys/export", headers={"X-Transport-Key": transport_key}).status_code == 403
+    assert db.query(ApiKey).filter(ApiKey.exchange == "bulk-denied").count() == 0
+
+def test_bulk_import_and_export(client: TestClient, db, as_principal):
+    """API 키 일괄 등록(NDJSON)과 전송용 키 내보내기/재등록 테스트"""
+    as_principal(ADMIN)
+    lines = [
+        json.dumps({"exchange": "bulk", "access_key": f"access-{i}", "secret_key": f"secret-{i}"}) for i in range(3)
+    ]
+    lines.insert(1, json.dumps({"exchange": "bulk", "access_key": "missing secret"}))
+    lines.append("{not json")
+    response = client.post(
+        "/api/v1/api-keys/bulk",
+        content="\n".join(lines) + "\n",
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["created"] == 3 and data["failed"] == 2
+    assert [result["index"] for result in data["results"]] == [0, 1, 2, 3, 4]
+    assert data["results"][1]["error"].startswith("secret_key") and data["results"][4]["id"] is None
+
+    transport_key = Fernet.generate_key()
+    transport = Fernet(transport_key)
+    assert client.get("/api/v1/api-keys/export", params={"exchange": "bulk"},
+                      headers={"X-Transport-Key": "short"}).status_code == 400
+    exported = client.get("/api/v1/api-keys/export", params={"exchange": "bulk"},
+                          headers={"X-Transport-Key": transport_key.decode()})
+    assert exported.headers["content-type"].startswith("application/x-ndjson")
+    items = [json.loads(line) for line in exported.text.splitlines()]
+    assert [transport.decrypt(item["secret_key"].encode()).decode() for item in items] == [
+        "secret-0", "secret-1", "secret-2",
+    ]
+
+    reimported = client.post(
+        "/api/v1/api-keys/bulk",
+        json=[{**item, "exchange": "bulk-copy"} for item in items],
+        headers={"X-Transport-Key": transport_key.decode()},
+    ).json()
+    assert reimported["created"] == 3
+    copied = client.get(f"/api/v1/api-keys/{reimported['results'][0]['id']}").json()
+    assert get_crypto().decrypt(copied["access_key"]) == "access-0"
@@ -0,0 +1,80 @@
+"""
+인증 엔드포인트 테스트
+"""
+
+import asyncio
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+from passlib.context import CryptContext
+from app.core import security
+from app.db.base import Base
+from app.models.user import User
+from app.services.auth_service import principal_cache
+from tests.conftest import engine
+
+@pytest.fixture
+def user(db, monkeypatch):
+    """로그인 가능한 사용자 (테스트에서는 bcrypt 대신 가벼운 해시 사용)"""
+    monkeypatch.setattr(security, "pwd_context", CryptContext(schemes=["pbkdf2_sha256"]))
+    Base.metadata.create_all(bind=engine, tables=[User.__table__])
+    user = User(email="trader@example.com", username="trader", hashed_password=security.get_password_hash("pw"),
+                is_active=True)
+    db.add(user)
+    db.commit()
+    principal_cache.clear()
+    try:
+        yield user
+    finally:
+        principal_cache.clear()
+        db.rollback()
+        Base.metadata.drop_all(bind=engine, tables=[User.__table__])
+
+def _login(client: TestClient, username: str, password: str):
+    return client.post("/api/v1/auth/login", data={"username": username, "password": password})
+
+def test_login_and_cached_principal(client: TestClient, db, user):
+    """로그인 후 토큰 사용자를 캐시에서 찾는지 테스트"""
+    response = _login(client, "trader@example.com", "pw")
+    assert response.status_code == 200
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    for _ in range(3):
+        me = client.get("/api/v1/auth/me", headers=headers)
+        assert me.status_code == 200
+    assert me.json() == {"id": user.id, "username": "trader", "email": "trader@example.com", "is_active": True}
+    assert principal_cache.stats()["hits"] == 3 and principal_cache.stats()["misses"] == 0
+
+    # 캐시가 비면 DB에서 다시 읽고, 비활성화는 무효화 즉시 반영
+    user.is_active = False
+    db.commit()
+    assert client.get("/api/v1/auth/me", headers=headers).status_code == 200
+    principal_cache.invalidate(user.id)
+    assert client.get("/api/v1/auth/me", headers=headers).status_code == 403
+    assert principal_cache.stats()["misses"] == 1
+
+def test_rejects_bad_credentials(client: TestClient, user):
+    """잘못된 비밀번호와 토큰 거절 테스트"""
+    assert _login(client, "trader", "wrong").status_code == 401
+    assert _login(client, "nobody", "pw").status_code == 401
+    assert client.get("/api/v1/auth/me").status_code == 401
+    response = client.get("/api/v1/auth/me", headers={"Authorization": "Bearer not-a-token"})
+    assert response.status_code == 401 and response.headers["WWW-Authenticate"] == "Bearer"
+    orphan = security.create_access_token({"sub": "999"})
+    assert client.get("/api/v1/auth/me", headers={"Authorization": f"Bearer {orphan}"}).status_code == 401
+
+def test_password_verified_off_event_loop(monkeypatch):
+    """비밀번호 검증이 이벤트 루프 스레드 밖에서 실행되는지 테스트"""
+    monkeypatch.setattr(security, "pwd_context", CryptContext(schemes=["pbkdf2_sha256"]))
+    hashed = security.get_password_hash("pw")
+    threads = []
+    original = security.verify_password
+    monkeypatch.setattr(security, "verify_password",
+                        lambda plain, hashed: threads.append(threading.current_thread().name) or original(plain, hashed))
+
+    async def scenario():
+        return await asyncio.gather(*(security.verify_password_async(p, hashed) for p in ("pw", "no", "pw")))
+
+    assert asyncio.run(scenario()) == [True, False, True]
+    assert threads and all(name.startswith("password") for name in threads)
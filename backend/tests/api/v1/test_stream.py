@@ -0,0 +1,112 @@
+"""
+대시보드 스트림 엔드포인트 테스트
+"""
+
+import asyncio
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+from app.api import deps
+from app.api.v1.endpoints.stream import sse_events
+from app.core.pubsub import StreamHub
+from app.core.security import create_access_token
+from app.main import app
+from app.services.auth_service import Principal, PrincipalCache
+from app.trading.portfolio import PortfolioBook
+from app.trading.streams import bind_portfolio
+
+@pytest.fixture
+def hub():
+    """엔드포인트에 주입할 독립 허브"""
+    hub = StreamHub()
+    app.dependency_overrides[deps.get_stream_hub] = lambda: hub
+    try:
+        yield hub
+    finally:
+        app.dependency_overrides.pop(deps.get_stream_hub)
+
+@pytest.fixture
+def token():
+    """사용자 1의 접근 토큰 (사용자는 별도 캐시에 미리 넣어 둠)"""
+    cache = PrincipalCache()
+    cache.put(Principal(id=1, username="trader", email="trader@example.com", is_active=True))
+    cache.put(Principal(id=2, username="idle", email="idle@example.com", is_active=False))
+    app.dependency_overrides[deps.get_principal_cache] = lambda: cache
+    try:
+        yield create_access_token({"sub": "1"})
+    finally:
+        app.dependency_overrides.pop(deps.get_principal_cache)
+
+def test_websocket_stream(client: TestClient, hub, token):
+    """WebSocket 스냅샷 및 델타 수신 테스트"""
+    book = PortfolioBook()
+    unbind = bind_portfolio(hub, book)
+    hub.publish("prices", "KRW-BTC", {"price": 100.0})
+    hub.publish("prices", "KRW-ETH", {"price": 10.0})
+    try:
+        with client.websocket_connect(f"/api/v1/stream/ws?token={token}&symbols=KRW-BTC") as websocket:
+            snapshot = json.loads(websocket.receive_text())
+            assert snapshot == [{"topic": "prices", "key": "KRW-BTC", "type": "snapshot", "data": {"price": 100.0}}]
+
+            book.apply_fill({"user_id": 1, "exchange": "upbit", "symbol": "KRW-BTC", "side": "buy",
+                             "quantity": 2.0, "price": 100.0, "status": "filled"})
+            [position] = json.loads(websocket.receive_text())
+            assert position["topic"] == "portfolio:1" and position["key"] == "upbit:KRW-BTC"
+            assert position["data"]["quantity"] == 2.0
+
+            hub.publish_threadsafe("prices", "KRW-ETH", {"price": 11.0})  # 필터에 없는 심볼
+            hub.publish_threadsafe("prices", "KRW-BTC", {"price": 105.0})
+            [delta] = json.loads(websocket.receive_text())
+            assert delta == {"topic": "prices", "key": "KRW-BTC", "type": "delta", "data": {"price": 105.0}}
+    finally:
+        unbind()
+
+def test_stream_requires_token(client: TestClient, hub, token):
+    """토큰 없이 또는 비활성 사용자로는 스트림을 구독할 수 없는지 테스트"""
+    idle = create_access_token({"sub": "2"})
+    for query in ("", "?token=not-a-token", f"?token={idle}"):
+        with pytest.raises(WebSocketDisconnect) as exc_info:
+            with client.websocket_connect(f"/api/v1/stream/ws{query}"):
+                pass
+        assert exc_info.value.code == 1008
+    assert client.get("/api/v1/stream/sse").status_code == 401
+    assert client.get("/api/v1/stream/sse", params={"user_id": 1}).status_code == 401
+    assert hub.subscriber_count() == 0
+
+def test_sse_events():
+    """SSE 이벤트 생성 테스트"""
+    class FakeRequest:
+        checks = 0
+
+        async def is_disconnected(self):
+            FakeRequest.checks += 1
+            return FakeRequest.checks > 2
+
+    async def scenario():
+        hub = StreamHub()
+        hub.publish("orders:3", "order-1", {"state": "wait"})
+        subscription = hub.subscribe(["orders:3"])
+        events = sse_events(FakeRequest(), subscription)
+        first = await events.__anext__()
+        assert json.loads(first[len("data: "):])[0]["data"] == {"state": "wait"}
+        hub.publish("orders:3", "order-1", {"state": "done"})
+        second = await events.__anext__()
+        assert json.loads(second[len("data: "):]) == [
+            {"topic": "orders:3", "key": "order-1", "type": "delta", "data": {"state": "done"}}
+        ]
+        with pytest.raises(StopAsyncIteration):
+            await events.__anext__()
+        assert hub.subscriber_count() == 0
+
+    asyncio.run(scenario())
+
+def test_get_prices_from_hub(client: TestClient, hub):
+    """허브 시세 상태 조회 테스트"""
+    hub.publish("prices", "KRW-BTC", {"price": 100.0})
+    hub.publish("prices", "KRW-ETH", {"price": 10.0})
+    hub.remove("prices", "KRW-ETH")
+    assert client.get("/api/v1/dashboard/prices").json() == {"KRW-BTC": {"price": 100.0}}
+    response = client.get("/api/v1/dashboard/prices", params={"symbols": "KRW-BTC,KRW-XRP"})
+    assert response.json() == {"KRW-BTC": {"price": 100.0}}
@@ -0,0 +1,146 @@
+"""
+운영 상태 엔드포인트 테스트
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from app.api import deps
+from app.core.profiling import request_profiler
+from app.services.auth_service import Principal
+from app.services.rate_limiter import rate_limiter
+from app.trading.upbit.services import AsyncApiKeyService
+
+ADMIN = Principal(id=1, username="ops", email="ops@example.com", is_active=True)
+USER = Principal(id=2, username="trader", email="trader@example.com", is_active=True)
+
+
+@pytest.fixture
+def as_principal(as_principal):
+    """인증 사용자 지정 (끝나면 프로파일러 초기화)"""
+    yield as_principal
+    request_profiler.configure(0)
+    request_profiler.clear()
+
+
+@pytest.fixture
+def slow_api_key_listing(monkeypatch):
+    """API 키 목록 조회를 느리게 (I/O 대기 0.15초 + CPU 0.05초)"""
+    original = AsyncApiKeyService.get_active_api_key_page
+
+    def _busy_hashing(seconds: float) -> int:
+        deadline = time.perf_counter() + seconds
+        rounds = 0
+        while time.perf_counter() < deadline:
+            rounds += sum(range(1000)) & 1
+        return rounds
+
+    async def _slow_page(self, *args, **kwargs):
+        await asyncio.sleep(0.15)
+        _busy_hashing(0.05)
+        return await original(self, *args, **kwargs)
+
+    monkeypatch.setattr(AsyncApiKeyService, "get_active_api_key_page", _slow_page)
+
+def test_system_status_requires_admin(client: TestClient, as_principal):
+    """쿼터/복제 현황 엔드포인트 관리자 전용 테스트"""
+    for path in ("/api/v1/system/rate-limits", "/api/v1/system/shared-state"):
+        assert client.get(path).status_code == 401
+    as_principal(USER)
+    for path in ("/api/v1/system/rate-limits", "/api/v1/system/shared-state"):
+        assert client.get(path).status_code == 403
+    as_principal(ADMIN)
+    assert client.get("/api/v1/system/shared-state").json()["role"] == deps.settings.APP_ROLE
+
+def test_get_rate_limits(client: TestClient, as_principal):
+    """거래소 요청 쿼터 현황 조회 테스트"""
+    as_principal(ADMIN)
+    rate_limiter.bucket("upbit", "secret-access-key", "order")
+    response = client.get("/api/v1/system/rate-limits")
+    assert response.status_code == 200
+    data = response.json()
+    bucket = next(b for b in data["buckets"] if b["exchange"] == "upbit" and b["group"] == "order")
+    assert bucket["key"] == "secr***" and bucket["limit"] == 8.0
+    assert {"throttled", "rejected", "wait_seconds"} <= set(data)
+
+def test_get_metrics(client: TestClient, as_principal):
+    """Prometheus 지표 수집 테스트"""
+    as_principal(ADMIN)
+    client.get("/api/v1/system/rate-limits")
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert "# TYPE http_request_duration_seconds histogram" in body
+    assert 'http_request_duration_seconds_count{method="GET",route="/api/v1/system/rate-limits",status="200"}' in body
+    assert "# TYPE exchange_rate_limit_wait_seconds histogram" in body
+    assert 'db_pool_connections{engine="sync",state="size"}' in body
+    assert "upbit_client_pool_clients " in body
+
+def test_profiling_requires_admin(client: TestClient, as_principal):
+    """프로파일링 엔드포인트 관리자 전용 테스트"""
+    assert client.get("/api/v1/system/profiling").status_code == 401
+    as_principal(USER)
+    assert client.put("/api/v1/system/profiling", params={"slow_threshold": 0.1}).status_code == 403
+    assert not request_profiler.active
+    as_principal(ADMIN)
+    response = client.get("/api/v1/system/profiling")
+    assert response.status_code == 200
+    assert response.json()["slow_threshold"] == 0
+
+def test_slow_api_key_requests_captured(client: TestClient, db, as_principal, slow_api_key_listing):
+    """느린 API 키 조회 요청 스택 기록 테스트"""
+    as_principal(ADMIN)
+    response = client.put("/api/v1/system/profiling", params={"slow_threshold": 0.1})
+    assert response.json()["slow_threshold"] == 0.1
+    assert client.get("/api/v1/api-keys/", params={"exchange": "upbit"}).status_code == 200
+    assert client.get("/api/v1/api-keys/999999").status_code == 404  # 빠른 요청은 기록하지 않음
+    assert client.get("/api/v1/api-keys/", params={"exchange": "upbit"}).status_code == 200
+
+    traces = client.get("/api/v1/system/profiling/traces").json()
+    assert [trace["route"] for trace in traces] == ["/api/v1/api-keys/", "/api/v1/api-keys/"]
+    assert traces[0]["id"] > traces[1]["id"]
+    assert all(trace["duration"] >= 0.2 and trace["status"] == 200 and trace["samples"] > 0 for trace in traces)
+
+    # 접힌 스택: I/O 대기(await 체인)와 CPU 사용(루프 스레드 스택)이 모두 잡힘
+    response = client.get(f"/api/v1/system/profiling/traces/{traces[0]['id']}")
+    assert response.status_code == 200
+    lines = response.text.splitlines()
+    assert lines and all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    assert any("_slow_page" in line and "sleep" in line for line in lines)
+    assert any("_slow_page" in line and "_busy_hashing" in line for line in lines)
+    assert any(line.startswith("__call__ (app/api/profiling.py") for line in lines)
+
+    detail = client.get(f"/api/v1/system/profiling/traces/{traces[0]['id']}", params={"format": "json"}).json()
+    assert detail["path"] == "/api/v1/api-keys/" and sum(detail["stacks"].values()) == traces[0]["samples"]
+
+    assert client.get("/api/v1/system/profiling/traces/0").status_code == 404
+    client.delete("/api/v1/system/profiling/traces")
+    assert client.get("/api/v1/system/profiling/traces").json() == []
+
+def test_profile_requests_for_window(client: TestClient, db, as_principal, slow_api_key_listing):
+    """일정 시간 요청 프로파일링 테스트"""
+    as_principal(ADMIN)
+    result = {}
+
+    def profile():
+        result["response"] = client.post(
+            "/api/v1/system/profiling/profile", params={"seconds": 1.0, "format": "json"},
+        )
+
+    worker = threading.Thread(target=profile)
+    worker.start()
+    deadline = time.monotonic() + 5
+    while not request_profiler.stats()["profiling"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert client.post("/api/v1/system/profiling/profile", params={"seconds": 0.1}).status_code == 409
+    assert client.get("/api/v1/api-keys/", params={"exchange": "upbit"}).status_code == 200
+    worker.join()
+
+    data = result["response"].json()
+    assert data["requests"] >= 1  # 프로파일링 요청 자신은 제외
+    assert any("_slow_page" in stack for stack in data["stacks"])
+    assert not request_profiler.active
@@ -5,15 +5,23 @@
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 from app.db.base_class import Base
 from app.main import app
-from app.db.session import get_db
+from app.db.session import get_db, get_async_db
+from app.api import deps
+from app.services.auth_service import Principal
+from tests.fakes.upbit_exchange import MockUpbitExchange
 
 # 테스트용 SQLite 데이터베이스 설정
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
 engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# 비동기 엔드포인트용 (TestClient 이벤트 루프가 모듈마다 바뀌므로 연결을 풀에 두지 않음)
+async_engine = create_async_engine("sqlite+aiosqlite:///./test.db", poolclass=NullPool)
+TestingAsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
 
 @pytest.fixture(scope="session")
 def db():
@@ -35,7 +43,33 @@ def client(db):
         finally:
             db.close()
     
+    async def override_get_async_db():
+        async with TestingAsyncSessionLocal() as async_db:
+            yield async_db
+    
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
     with TestClient(app) as test_client:
         yield test_client
-    app.dependency_overrides.clear() 
\ No newline at end of file
+    app.dependency_overrides.clear() 
+
+@pytest.fixture
+def mock_upbit():
+    """로컬 업비트 모의 거래소"""
+    exchange = MockUpbitExchange()
+    exchange.start_in_thread()
+    try:
+        yield exchange
+    finally:
+        exchange.stop_thread()
+
+@pytest.fixture
+def as_principal(monkeypatch):
+    """인증 사용자 지정 (settings.ADMIN_USERNAMES = ["ops"])"""
+    monkeypatch.setattr(deps.settings, "ADMIN_USERNAMES", ["ops"])
+
+    def use(principal: Principal):
+        app.dependency_overrides[deps.get_current_active_principal] = lambda: principal
+
+    yield use
+    app.dependency_overrides.pop(deps.get_current_active_principal, None)
@@ -0,0 +1,65 @@
+"""
+성능 지표 / 레지스트리 테스트
+"""
+
+import pytest
+
+from app.core.metrics import Counter, Gauge, Histogram, MetricsRegistry
+
+
+def _registry(*metrics):
+    registry = MetricsRegistry()
+    for metric in metrics:
+        registry.register(metric)
+    return registry
+
+
+def test_labels_return_cached_children():
+    """라벨 값별 자식 지표 테스트"""
+    counter = Counter("requests_total", "요청 수", labelnames=("method",), register=False)
+    counter.labels("GET").inc()
+    counter.labels("GET").inc(2)
+    counter.labels("POST").inc()
+    assert counter.labels("GET") is counter.labels("GET")
+    assert counter.labels("GET").value == 3
+    with pytest.raises(ValueError):
+        counter.labels("GET", "extra")
+
+
+def test_gauge_function_read_on_collect():
+    """수집 시점 게이지 함수 테스트"""
+    size = [3]
+    gauge = Gauge("pool_size", "풀 크기", register=False)
+    gauge.set_function(lambda: size[0])
+    size[0] = 5
+    assert gauge.samples() == [("", {}, 5)]
+
+
+def test_render_prometheus_text_format():
+    """Prometheus 텍스트 형식 직렬화 테스트"""
+    counter = Counter("jobs_total", "처리한 작업 수", register=False)
+    counter.inc(2)
+    histogram = Histogram("job_seconds", "작업 시간", buckets=(0.1, 1.0), labelnames=("queue",), register=False)
+    histogram.labels('a"b').observe(0.05)
+    histogram.labels('a"b').observe(0.5)
+    histogram.labels('a"b').observe(3.0)
+    text = _registry(counter, histogram).render()
+    assert "# TYPE jobs_total counter\njobs_total 2\n" in text
+    assert "# HELP job_seconds 작업 시간\n# TYPE job_seconds histogram\n" in text
+    assert 'job_seconds_bucket{queue="a\\"b",le="0.1"} 1\n' in text
+    assert 'job_seconds_bucket{queue="a\\"b",le="1"} 2\n' in text
+    assert 'job_seconds_bucket{queue="a\\"b",le="+Inf"} 3\n' in text
+    assert 'job_seconds_sum{queue="a\\"b"} 3.55\n' in text
+    assert 'job_seconds_count{queue="a\\"b"} 3\n' in text
+
+
+def test_registry_keeps_latest_metric_with_same_name():
+    """같은 이름 재등록 테스트"""
+    first = Counter("ticks_total", register=False)
+    second = Counter("ticks_total", register=False)
+    registry = _registry(first, second)
+    assert registry.get("ticks_total") is second
+    registry.unregister(first)
+    assert registry.get("ticks_total") is second
+    registry.unregister(second)
+    assert registry.collect() == []
@@ -0,0 +1,88 @@
+"""
+요청 스택 샘플링 프로파일러 테스트
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.core.profiling import RequestProfiler, collapse, render_collapsed
+
+
+def _busy(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+async def _handler(wait: float, busy: float) -> None:
+    await asyncio.sleep(wait)
+    _busy(busy)
+
+
+async def _request(profiler: RequestProfiler, wait: float = 0.0, busy: float = 0.0, path: str = "/x"):
+    # 미들웨어 역할: begin을 부른 프레임부터 기록됨
+    watch = profiler.begin()
+    if watch is None:
+        await _handler(wait, busy)
+        return None
+    try:
+        await _handler(wait, busy)
+    finally:
+        trace = profiler.end(watch, "GET", path, path, 200)
+    return trace
+
+
+def test_disabled_profiler_does_not_watch():
+    """꺼진 프로파일러 테스트"""
+    profiler = RequestProfiler(slow_threshold=0)
+    assert not profiler.active
+    assert asyncio.run(_request(profiler, wait=0.01)) is None
+    assert profiler._thread is None and profiler.stats()["watching"] == 0
+
+
+def test_slow_request_trace_records_wait_and_cpu_stacks():
+    """느린 요청의 대기/CPU 스택 기록 테스트"""
+    profiler = RequestProfiler(slow_threshold=0.05, interval=0.002)
+    trace = asyncio.run(_request(profiler, wait=0.06, busy=0.06))
+    assert trace is not None and trace.duration >= 0.12
+    stacks = list(trace.samples)
+    assert all(stack.startswith("_request (tests/core/test_profiling.py") for stack in stacks)
+    assert any("_handler" in stack and ";sleep (asyncio/tasks.py:" in stack for stack in stacks)
+    assert any("_handler" in stack and "_busy" in stack for stack in stacks)
+    assert render_collapsed(trace.samples).count("\n") == len(stacks)
+
+
+def test_fast_requests_skipped_and_buffer_bounded():
+    """빠른 요청 제외와 기록 개수 상한 테스트"""
+    profiler = RequestProfiler(slow_threshold=0.02, interval=0.002, buffer_size=2)
+
+    async def scenario():
+        assert await _request(profiler) is None
+        for path in ("/a", "/b", "/c"):
+            await _request(profiler, wait=0.03, path=path)
+
+    asyncio.run(scenario())
+    assert [trace.path for trace in profiler.traces] == ["/b", "/c"]
+    assert profiler.get_trace(profiler.traces[-1].id).path == "/c"
+    assert profiler.get_trace(1) is None
+
+
+def test_profile_session_aggregates_requests():
+    """일정 시간 요청 프로파일링 테스트"""
+    profiler = RequestProfiler(slow_threshold=0, interval=0.002)
+
+    async def scenario():
+        session = asyncio.create_task(profiler.profile(0.2))
+        await asyncio.sleep(0)
+        with pytest.raises(RuntimeError):
+            await profiler.profile(0.1)
+        await asyncio.gather(_request(profiler, wait=0.05), _request(profiler, busy=0.05))
+        return await session
+
+    session = asyncio.run(scenario())
+    assert session.requests == 2
+    stacks = collapse(session.samples)
+    assert any("sleep" in stack for stack in stacks) and any("_busy" in stack for stack in stacks)
+    assert not profiler.active and not profiler.traces
@@ -0,0 +1,97 @@
+"""
+발행/구독 허브 테스트
+"""
+
+import asyncio
+import json
+import threading
+
+from app.core.pubsub import DELTA, REMOVE, SNAPSHOT, StreamHub, encode_batch
+
+
+def test_publish_sends_snapshot_then_deltas():
+    """최초 스냅샷 후 바뀐 필드만 델타로 전달 테스트"""
+    async def scenario():
+        hub = StreamHub()
+        hub.publish("prices", "KRW-BTC", {"price": 100.0, "volume": 1.0})
+        subscription = hub.subscribe(["prices"])
+        [first] = await subscription.get()
+        assert first.kind == SNAPSHOT and first.data == {"price": 100.0, "volume": 1.0}
+
+        assert hub.publish("prices", "KRW-BTC", {"price": 100.0}) is False
+        hub.publish("prices", "KRW-BTC", {"price": 101.0, "volume": 1.0})
+        [delta] = await subscription.get()
+        assert delta.kind == DELTA and delta.data == {"price": 101.0}
+        assert hub.state("prices", "KRW-BTC") == {"price": 101.0, "volume": 1.0}
+        assert hub.stats()["suppressed"] == 1
+
+        hub.remove("prices", "KRW-BTC")
+        [removed] = await subscription.get()
+        assert removed.kind == REMOVE
+        assert json.loads(encode_batch([removed])) == [
+            {"topic": "prices", "key": "KRW-BTC", "type": "remove", "data": None}
+        ]
+        subscription.close()
+        assert hub.subscriber_count() == 0
+
+    asyncio.run(scenario())
+
+
+def test_slow_subscriber_skips_intermediate_frames():
+    """느린 구독자는 중간 프레임 없이 최신 상태만 수신 테스트"""
+    async def scenario():
+        hub = StreamHub()
+        fast = hub.subscribe(["prices"])
+        slow = hub.subscribe(["prices"], keys={"prices": {"KRW-BTC", "KRW-ETH"}})
+        hub.publish("prices", "KRW-BTC", {"price": 1.0, "volume": 1.0})
+        await fast.get()
+        [snapshot] = await slow.get()
+        assert snapshot.data == {"price": 1.0, "volume": 1.0}
+
+        for price in range(2, 50):
+            hub.publish("prices", "KRW-BTC", {"price": float(price)})
+            assert [m.data for m in await fast.get()] == [{"price": float(price)}]
+        hub.publish("prices", "KRW-XRP", {"price": 5.0})  # 필터에 없는 키
+
+        batch = await slow.get()
+        assert [(m.kind, m.data) for m in batch] == [(DELTA, {"price": 49.0})]
+        assert slow.skipped == 47
+        assert await slow.get(timeout=0.01) == []
+
+    asyncio.run(scenario())
+
+
+def test_subscribers_at_same_cursor_share_messages():
+    """같은 커서의 구독자 메시지 공유 테스트"""
+    async def scenario():
+        hub = StreamHub()
+        subscriptions = [hub.subscribe(["prices"]) for _ in range(3)]
+        for i in range(5):
+            hub.publish("prices", f"S{i}", {"price": float(i)})
+        batches = [await subscription.get() for subscription in subscriptions]
+        assert [m.key for m in batches[0]] == [f"S{i}" for i in range(5)]
+        assert all(batch[0] is batches[0][0] for batch in batches)
+
+        # 삭제 후 다시 생긴 키는 스냅샷, 늦게 합류한 구독자는 전체 상태를 받음
+        hub.remove("prices", "S0")
+        hub.publish("prices", "S0", {"price": 7.0})
+        [again] = await subscriptions[0].get()
+        assert again.kind == SNAPSHOT and again.data == {"price": 7.0}
+        late = hub.subscribe(["prices"])
+        assert sorted(m.key for m in await late.get()) == [f"S{i}" for i in range(5)]
+
+    asyncio.run(scenario())
+
+
+def test_publish_threadsafe_from_worker_thread():
+    """다른 스레드 발행 테스트"""
+    async def scenario():
+        hub = StreamHub()
+        subscription = hub.subscribe(["portfolio:1"])
+        worker = threading.Thread(target=hub.publish_threadsafe, args=("portfolio:1", "upbit:KRW-BTC", {"quantity": 1.0}))
+        worker.start()
+        batch = await subscription.get(timeout=1.0)
+        worker.join()
+        assert [message.data for message in batch] == [{"quantity": 1.0}]
+
+    asyncio.run(scenario())
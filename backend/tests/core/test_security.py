@@ -0,0 +1,58 @@
+"""
+암호화 키 관리 테스트
+"""
+
+import pytest
+from app.core import security
+from app.core.security import CryptoUtils, KeyManager
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    """독립된 키 관리자"""
+    manager = KeyManager()
+    monkeypatch.setattr(security, "key_manager", manager)
+    monkeypatch.setenv("ENCRYPTION_KEY", "first-secret")
+    monkeypatch.delenv("ENCRYPTION_KEY_PREVIOUS", raising=False)
+    return manager
+
+def test_key_derived_once_per_process(manager, monkeypatch):
+    """PBKDF2 키 파생 캐시 테스트"""
+    calls = []
+    original = security.derive_fernet_key
+    monkeypatch.setattr(security, "derive_fernet_key", lambda key: calls.append(key) or original(key))
+
+    first = manager.get_crypto()
+    second = manager.get_crypto()
+    CryptoUtils()
+
+    assert first is second
+    assert calls == ["first-secret"]
+
+def test_crypto_handle_is_immutable(manager):
+    """공유 암호화 핸들 불변성 테스트"""
+    crypto = manager.get_crypto()
+    with pytest.raises(AttributeError):
+        crypto.fernet = None
+
+def test_rotation_keeps_previous_key_for_decrypt(manager, monkeypatch):
+    """재시작 없는 암호화 키 교체 테스트"""
+    old_crypto = manager.get_crypto()
+    token = old_crypto.encrypt("access-key")
+
+    monkeypatch.setenv("ENCRYPTION_KEY", "second-secret")
+    new_crypto = manager.get_crypto()
+
+    assert new_crypto is not old_crypto
+    assert new_crypto.key_id != old_crypto.key_id
+    assert old_crypto.key_id in new_crypto.previous_key_ids
+    assert new_crypto.decrypt(token) == "access-key"
+
+    rotated = new_crypto.reencrypt(token)
+    assert CryptoUtils("second-secret").decrypt(rotated) == "access-key"
+
+def test_missing_encryption_key(manager, monkeypatch):
+    """암호화 키 미설정 테스트"""
+    monkeypatch.delenv("ENCRYPTION_KEY")
+    with pytest.raises(ValueError):
+        manager.get_crypto()
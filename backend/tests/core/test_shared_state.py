@@ -0,0 +1,134 @@
+"""
+공유 메모리 링 버퍼 및 허브 상태 복제 테스트
+"""
+
+import asyncio
+import multiprocessing
+import threading
+import uuid
+
+import pytest
+from app.core.pubsub import StreamHub
+from app.core.shared_state import SharedStateMirror, SharedStatePublisher
+from app.core.shm_ring import SharedRing
+
+
+@pytest.fixture
+def ring_name():
+    """테스트마다 다른 공유 메모리 이름"""
+    return f"coinori-test-{uuid.uuid4().hex[:8]}"
+
+def _write_from_child(name: str, count: int) -> None:
+    ring = SharedRing.attach(name)
+    try:
+        ring._write_seq = ring.last_seq()
+        for i in range(count):
+            ring.write(f"child {i}".encode())
+    finally:
+        ring.close()
+
+def test_ring_read_write_and_lapping(ring_name):
+    """링 쓰기/읽기, 한 바퀴 이상 밀린 읽기, 다른 프로세스와 공유 테스트"""
+    ring = SharedRing.create(ring_name, slots=8, slot_size=64)
+    try:
+        assert ring.read(0) == ([], 0, 0)
+        for i in range(3):
+            ring.write(f"m{i}".encode())
+        messages, cursor, skipped = ring.read(0, limit=2)
+        assert messages == [b"m0", b"m1"] and cursor == 2 and skipped == 0
+        assert ring.read(cursor) == ([b"m2"], 3, 0)
+
+        for i in range(3, 20):
+            ring.write(f"m{i}".encode())
+        messages, cursor, skipped = ring.read(3)
+        assert messages == [f"m{i}".encode() for i in range(12, 20)] and cursor == 20 and skipped == 9
+        with pytest.raises(ValueError):
+            ring.write(b"x" * 49)
+
+        child = multiprocessing.get_context("spawn").Process(target=_write_from_child, args=(ring_name, 2))
+        child.start()
+        child.join(timeout=30)
+        assert child.exitcode == 0
+        assert ring.read(cursor) == ([b"child 0", b"child 1"], 22, 0)
+    finally:
+        ring.close()
+
+def test_mirror_converges_after_lapping(ring_name):
+    """워커 허브가 밀려 건너뛴 변경도 재기록 후 원본과 같아지는지 테스트"""
+    source, replica = StreamHub(), StreamHub()
+    ring = SharedRing.create(ring_name, slots=8, slot_size=128)
+    publisher = SharedStatePublisher(source, ring)
+    mirror = SharedStateMirror(replica, name=ring_name)
+    mirror.ring = SharedRing.attach(ring_name)
+    try:
+        publisher.attach()  # 재기록 시작/끝 표시 2건
+        source.publish("prices", "KRW-BTC", {"price": 100.0, "volume": 1.0})
+        source.publish("prices", "KRW-BTC", {"price": 101.0})
+        source.publish("portfolio:1", "upbit:KRW-BTC", {"quantity": 1.0})
+        assert mirror.poll() == 5
+        assert replica.state("prices", "KRW-BTC") == {"price": 101.0, "volume": 1.0}
+
+        source.remove("portfolio:1", "upbit:KRW-BTC")
+        for i in range(10):
+            source.publish("prices", "KRW-BTC", {"price": 200.0 + i})
+        mirror.poll()
+        assert mirror.skipped == 3 and replica.state("portfolio:1", "upbit:KRW-BTC") == {"quantity": 1.0}
+        assert replica.state("prices", "KRW-BTC") == {"price": 209.0, "volume": 1.0}
+
+        publisher.resync()
+        mirror.poll()
+        assert replica.state("portfolio:1", "upbit:KRW-BTC") is None  # 건너뛴 삭제는 재기록으로 반영
+        assert replica.entries("prices") == source.entries("prices")
+    finally:
+        mirror._disconnect()
+        ring.close()
+
+def test_mirror_waits_for_engine(ring_name):
+    """엔진이 링을 만들기 전에 시작한 워커 복제 루프 테스트"""
+    async def scenario():
+        replica = StreamHub()
+        mirror = SharedStateMirror(replica, name=ring_name, poll_interval=0.01, stale_after=0)
+        task = asyncio.create_task(mirror.run())
+        await asyncio.sleep(0.05)
+        assert not mirror.connected.is_set()
+
+        source = StreamHub()
+        ring = SharedRing.create(ring_name, slots=16, slot_size=128)
+        source.publish("prices", "KRW-BTC", {"price": 100.0})
+        SharedStatePublisher(source, ring).attach()  # 연결 시 현재 상태 기록
+        source.publish("prices", "KRW-BTC", {"price": 102.0})
+        try:
+            await asyncio.wait_for(mirror.connected.wait(), timeout=5)
+            for _ in range(100):
+                if replica.state("prices", "KRW-BTC") == {"price": 102.0}:
+                    break
+                await asyncio.sleep(0.01)
+            return replica.state("prices", "KRW-BTC"), mirror.stats()
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            ring.close()
+
+    state, stats = asyncio.run(scenario())
+    assert state == {"price": 102.0}
+    assert stats["connected"] and stats["applied"] == 4 and stats["lag"] == 0
+
+def test_publisher_marshals_thread_publishes_onto_loop(ring_name):
+    """구독이 없는 허브에서도 다른 스레드의 발행이 루프 스레드에서 링에 쓰이는지 테스트"""
+    async def scenario():
+        hub = StreamHub()
+        ring = SharedRing.create(ring_name, slots=16, slot_size=128)
+        publisher = SharedStatePublisher(hub, ring)
+        publisher.attach()  # 재기록 시작/끝 표시 2건
+        writers = []
+        hub.add_forwarder(lambda topic, key, data: writers.append(threading.get_ident()))
+        try:
+            await asyncio.to_thread(hub.publish_threadsafe, "portfolio:1", "upbit:KRW-BTC", {"quantity": 1.0})
+            await asyncio.sleep(0)
+            return writers, publisher.written
+        finally:
+            publisher.detach()
+            ring.close()
+
+    writers, written = asyncio.run(scenario())
+    assert writers == [threading.get_ident()] and written == 3
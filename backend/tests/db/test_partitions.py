@@ -0,0 +1,66 @@
+"""
+trades 파티션 주기 생성 테스트
+"""
+
+import asyncio
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+
+import app.main as main
+from app.db import partitions
+
+
+class FakePostgresEngine:
+    """dialect만 PostgreSQL로 보이는 엔진"""
+
+    dialect = SimpleNamespace(name="postgresql")
+
+    @contextmanager
+    def begin(self):
+        yield SimpleNamespace(dialect=self.dialect)
+
+
+def test_partition_loop_runs_at_start_and_periodically(monkeypatch):
+    """기동 직후와 주기마다 파티션 생성을 호출하는지 테스트"""
+    calls = []
+
+    def ensure(connection):
+        calls.append(connection)
+        if len(calls) == 2:
+            raise RuntimeError("db down")
+        return ("trades_209901",)
+
+    monkeypatch.setattr(partitions, "ensure_trade_partitions", ensure)
+
+    async def scenario():
+        task = asyncio.create_task(partitions.partition_loop(FakePostgresEngine(), interval=0.01))
+        while len(calls) < 3:
+            await asyncio.sleep(0.01)
+        task.cancel()
+
+    asyncio.run(scenario())
+    assert len(calls) >= 3
+
+
+def test_partition_loop_skips_non_postgres(tmp_path):
+    """PostgreSQL이 아니면 바로 끝나는지 테스트"""
+    engine = create_engine(f"sqlite:///{tmp_path}/partitions.db")
+    asyncio.run(asyncio.wait_for(partitions.partition_loop(engine, interval=0.01), timeout=1))
+
+
+def test_lifespan_starts_partition_loop(monkeypatch):
+    """APP_ROLE=all 기동 시 파티션 작업을 시작하는지 테스트"""
+    started = []
+
+    async def fake_loop(db_engine):
+        started.append(db_engine)
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(main, "partition_loop", fake_loop)
+    monkeypatch.setattr(main.settings, "APP_ROLE", "all")
+    with TestClient(main.app):
+        pass
+    assert started == [main.engine]
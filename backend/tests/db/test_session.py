@@ -0,0 +1,61 @@
+"""
+데이터베이스 세션 / 커넥션 풀 테스트
+"""
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from app.db.session import (
+    POOL_CHECKOUT_WAIT,
+    POOL_CONNECTIONS,
+    QUERY_ERRORS,
+    QUERY_LATENCY,
+    TimedQueuePool,
+    get_async_database_url,
+    instrument_engine,
+    pool_status,
+)
+
+
+def test_get_async_database_url():
+    """비동기 드라이버 URL 변환 테스트"""
+    assert get_async_database_url("postgresql://u:p@db/app") == "postgresql+asyncpg://u:p@db/app"
+    assert get_async_database_url("postgresql+psycopg2://u:p@db/app") == "postgresql+asyncpg://u:p@db/app"
+    assert get_async_database_url("sqlite:///./app.db") == "sqlite+aiosqlite:///./app.db"
+
+
+def test_pool_status_records_checkout_wait(tmp_path):
+    """풀 상태와 체크아웃 대기 시간 기록 테스트"""
+    engine = create_engine(f"sqlite:///{tmp_path}/pool.db", poolclass=TimedQueuePool, pool_size=2, max_overflow=0)
+    before = POOL_CHECKOUT_WAIT.snapshot()["count"]
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        status = pool_status(engine)
+        assert status["size"] == 2
+        assert status["checked_out"] == 1
+    assert POOL_CHECKOUT_WAIT.snapshot()["count"] == before + 1
+    assert pool_status(engine)["checked_out"] == 0
+    engine.dispose()
+
+
+def test_instrument_engine_records_queries_and_pool(tmp_path):
+    """쿼리 시간/실패 수와 풀 현황 지표 테스트"""
+    engine = create_engine(f"sqlite:///{tmp_path}/metrics.db", poolclass=TimedQueuePool, pool_size=2, max_overflow=0)
+    instrument_engine(engine, "test")
+    instrument_engine(engine, "test")  # 이벤트는 한 번만 등록
+    selects, inserts = QUERY_LATENCY.labels("select"), QUERY_LATENCY.labels("insert")
+    before_selects, before_inserts, before_errors = selects.count, inserts.count, QUERY_ERRORS.value
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+        conn.execute(text("INSERT INTO items (id) VALUES (1)"))
+        conn.execute(text("  select id from items"))
+        assert POOL_CONNECTIONS.labels("test", "checked_out").get() == 1
+        with pytest.raises(OperationalError):
+            conn.execute(text("SELECT * FROM missing"))
+    assert selects.count == before_selects + 1
+    assert inserts.count == before_inserts + 1
+    assert QUERY_ERRORS.value == before_errors + 1
+    assert POOL_CONNECTIONS.labels("test", "checked_out").get() == 0
+    assert POOL_CONNECTIONS.labels("test", "size").get() == 2
+    engine.dispose()
@@ -0,0 +1,3 @@
+"""
+테스트 및 벤치마크용 가짜 거래소
+"""
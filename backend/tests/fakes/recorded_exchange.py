@@ -0,0 +1,127 @@
+"""
+기록된 응답을 재생하는 가짜 거래소 서버
+
+실제 거래소에서 기록한 REST 응답과 WebSocket 메시지(JSON 파일)를 그대로 돌려준다.
+커넥터는 base_url/ws_url만 바꿔 연결하므로 서명, 연결 풀, 응답 파싱 경로를 네트워크 없이 검증할 수 있다.
+
+기록 파일 형식:
+
+    {
+      "responses": [{"method": "GET", "path": "/v1/ticker", "query": {...}, "status": 200, "body": ...}, ...],
+      "stream": {"path": "/websocket/v1", "subscribe": true, "binary": true, "messages": [...]}
+    }
+
+query가 있는 응답은 요청 쿼리에 해당 값이 모두 있을 때만 쓰이며, 같은 경로에서는 먼저 적힌 응답이 우선한다.
+stream.subscribe가 참이면 첫 메시지(구독 요청)를 받은 뒤 재생하고, stream.base_path는
+커넥터 ws_url로 넘길 경로다 (기본값: stream.path).
+"""
+
+import asyncio
+import json
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+from aiohttp import WSMsgType, web
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "fixtures")
+
+
+class RecordedExchange:
+    def __init__(self, recording: str, latency: float = 0.0, stream_interval: float = 0.0, stream_loops: int = 1):
+        """
+        가짜 거래소 초기화
+
+        Args:
+            recording (str): 기록 파일 경로 (또는 tests/fixtures 안의 파일 이름)
+            latency (float): 응답마다 추가할 지연 시간 (초)
+            stream_interval (float): WebSocket 메시지 간격 (초)
+            stream_loops (int): WebSocket 메시지 반복 횟수
+        """
+        path = recording if os.path.exists(recording) else os.path.join(FIXTURES_DIR, recording)
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        self.responses: List[Dict[str, Any]] = data.get("responses", [])
+        self.stream: Optional[Dict[str, Any]] = data.get("stream")
+        self.latency = latency
+        self.stream_interval = stream_interval
+        self.stream_loops = stream_loops
+        self.requests: List[Tuple[str, str, Dict[str, str], Dict[str, str], Optional[str]]] = []
+        self.subscriptions: List[str] = []
+        self.url: Optional[str] = None
+        self.ws_url: Optional[str] = None
+        self._runner: Optional[web.AppRunner] = None
+
+    def _app(self) -> web.Application:
+        app = web.Application()
+        if self.stream is not None:
+            app.router.add_get(self.stream["path"], self._websocket)
+        app.router.add_route("*", "/{tail:.*}", self._replay)
+        return app
+
+    def _match(self, method: str, path: str, query: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        for response in self.responses:
+            if response["method"] != method or response["path"] != path:
+                continue
+            if all(query.get(key) == str(value) for key, value in response.get("query", {}).items()):
+                return response
+        return None
+
+    async def _replay(self, request: web.Request) -> web.Response:
+        body = await request.text() if request.can_read_body else None
+        query = dict(request.query)
+        self.requests.append((request.method, request.path, query, dict(request.headers), body))
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        response = self._match(request.method, request.path, query)
+        if response is None:
+            return web.json_response({"error": {"message": "기록된 응답이 없습니다"}}, status=404)
+        return web.json_response(response["body"], status=response.get("status", 200), headers=response.get("headers"))
+
+    async def _websocket(self, request: web.Request) -> web.WebSocketResponse:
+        websocket = web.WebSocketResponse()
+        await websocket.prepare(request)
+        if self.stream.get("subscribe"):
+            message = await websocket.receive()
+            if message.type != WSMsgType.TEXT:
+                return websocket
+            self.subscriptions.append(message.data)
+        else:
+            self.subscriptions.append(request.query_string)
+        for _ in range(self.stream_loops):
+            for message in self.stream["messages"]:
+                raw = json.dumps(message)
+                if self.stream.get("binary"):
+                    await websocket.send_bytes(raw.encode())
+                else:
+                    await websocket.send_str(raw)
+                if self.stream_interval:
+                    await asyncio.sleep(self.stream_interval)
+        await websocket.close()
+        return websocket
+
+    def requests_to(self, path: str) -> List[Tuple[str, str, Dict[str, str], Dict[str, str], Optional[str]]]:
+        """경로별 수신 요청 목록"""
+        return [request for request in self.requests if request[1] == path]
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """
+        현재 이벤트 루프에서 서버 시작
+
+        Returns:
+            str: REST 주소 (WebSocket 주소는 ws_url)
+        """
+        self._runner = web.AppRunner(self._app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://{host}:{port}"
+        if self.stream is not None:
+            self.ws_url = f"ws://{host}:{port}{self.stream.get('base_path', self.stream['path'])}"
+        return self.url
+
+    async def stop(self) -> None:
+        """서버 종료"""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
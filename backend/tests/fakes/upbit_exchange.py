@@ -0,0 +1,278 @@
+"""
+로컬 업비트 모의 거래소 서버
+
+실제 네트워크 없이 AsyncUpbitAPI / UpbitAPI / UpbitConnector의 동작과 처리량을 측정하기 위한 aiohttp 서버.
+fill_delay를 지정하면 주문을 현재가로 나눠 체결하고 myOrder 스트림(/websocket/v1/private)으로 알린다.
+"""
+
+import asyncio
+import hashlib
+import json
+import threading
+import time
+import uuid
+from typing import Dict, List, Optional, Set
+from urllib.parse import urlencode
+
+from aiohttp import web
+from jose import JWTError, jwt
+
+
+class MockUpbitExchange:
+    REQUEST_GROUPS = {"/v1/ticker": "ticker", "/v1/accounts": "default", "/v1/orders": "order"}
+
+    def __init__(
+        self,
+        access_key: str = "mock-access-key",
+        secret_key: str = "mock-secret-key",
+        prices: Optional[Dict[str, float]] = None,
+        balances: Optional[Dict[str, float]] = None,
+        latency: float = 0.0,
+        limits: Optional[Dict[str, int]] = None,
+        fill_delay: Optional[float] = None,
+        fill_steps: int = 1,
+        order_stream: bool = True,
+    ):
+        """
+        모의 거래소 초기화
+
+        Args:
+            access_key (str): 허용할 액세스 키
+            secret_key (str): JWT 검증에 사용할 시크릿 키
+            prices (Dict[str, float], optional): 마켓별 현재가
+            balances (Dict[str, float], optional): 화폐별 잔고
+            latency (float): 응답마다 추가할 지연 시간 (초)
+            limits (Dict[str, int], optional): 요청 그룹별 초당 허용 수 (지정하면 초과 요청에 429 응답)
+            fill_delay (float, optional): 주문 접수 후 체결 간격 (초, 없으면 체결하지 않음)
+            fill_steps (int): 주문을 나눠 체결할 횟수
+            order_stream (bool): 체결을 myOrder 스트림으로 알릴지 여부 (False면 조회로만 확인 가능)
+        """
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self.prices = prices or {"KRW-BTC": 50000000.0, "KRW-ETH": 3000000.0}
+        self.balances = balances or {"KRW": 1000000.0, "BTC": 0.5}
+        self.latency = latency
+        self.orders: List[dict] = []
+        self.fill_delay = fill_delay
+        self.fill_steps = fill_steps
+        self.order_stream = order_stream
+        self.drop_acks = 0  # 주문은 받고 응답 대신 연결을 끊을 횟수
+        self.order_subscribers: Set[web.WebSocketResponse] = set()
+        self._fills: Set[asyncio.Task] = set()
+        self.request_counts: Dict[str, int] = {}
+        self.limits = limits or {}
+        self.rejections = 0
+        self._windows: Dict[str, List[int]] = {}  # 그룹 -> [초 단위 구간, 요청 수]
+        self.url: Optional[str] = None
+        self.ws_url: Optional[str] = None
+        self._runner: Optional[web.AppRunner] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def _app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/v1/accounts", self._accounts)
+        app.router.add_get("/v1/ticker", self._ticker)
+        app.router.add_post("/v1/orders", self._orders)
+        app.router.add_get("/v1/order", self._order)
+        app.router.add_get("/websocket/v1/private", self._private_stream)
+        return app
+
+    def _take(self, group: str) -> Optional[int]:
+        """그룹 쿼터 차감 (남은 요청 수, 초과 시 None)"""
+        limit = self.limits.get(group)
+        if limit is None:
+            return 29
+        window = int(time.monotonic())
+        count = self._windows.get(group)
+        if count is None or count[0] != window:
+            count = self._windows[group] = [window, 0]
+        if count[1] >= limit:
+            return None
+        count[1] += 1
+        return limit - count[1]
+
+    async def _respond(self, path: str, payload, status: int = 200) -> web.Response:
+        self.request_counts[path] = self.request_counts.get(path, 0) + 1
+        group = self.REQUEST_GROUPS.get(path, "default")
+        remaining = self._take(group)
+        if remaining is None:
+            self.rejections += 1
+            payload, status, remaining = {"error": {"name": "too_many_requests"}}, 429, 0
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        headers = {"Remaining-Req": f"group={group}; min=1800; sec={remaining}"}
+        return web.json_response(payload, status=status, headers=headers)
+
+    def _authorize(self, request: web.Request, params: Optional[dict] = None) -> bool:
+        header = request.headers.get("Authorization", "")
+        if not header.startswith("Bearer "):
+            return False
+        try:
+            payload = jwt.decode(header[7:], self.secret_key, algorithms=["HS256"])
+        except JWTError:
+            return False
+        if payload.get("access_key") != self.access_key:
+            return False
+        if params:
+            expected = hashlib.sha512(urlencode(params).encode()).hexdigest()
+            return payload.get("query_hash") == expected
+        return True
+
+    async def _accounts(self, request: web.Request) -> web.Response:
+        if not self._authorize(request):
+            return await self._respond("/v1/accounts", {"error": {"name": "invalid_access_key"}}, status=401)
+        accounts = [
+            {"currency": currency, "balance": str(balance), "locked": "0", "unit_currency": "KRW"}
+            for currency, balance in self.balances.items()
+        ]
+        return await self._respond("/v1/accounts", accounts)
+
+    async def _ticker(self, request: web.Request) -> web.Response:
+        markets = [m for m in request.query.get("markets", "").split(",") if m]
+        unknown = [m for m in markets if m not in self.prices]
+        if not markets or unknown:
+            return await self._respond("/v1/ticker", {"error": {"name": "404", "message": "Code not found"}}, status=404)
+        data = [{"market": m, "trade_price": self.prices[m]} for m in markets]
+        return await self._respond("/v1/ticker", data)
+
+    def _find(self, uuid_: Optional[str] = None, identifier: Optional[str] = None) -> Optional[dict]:
+        for order in self.orders:
+            if (uuid_ is not None and order["uuid"] == uuid_) or (identifier is not None and order.get("identifier") == identifier):
+                return order
+        return None
+
+    async def _orders(self, request: web.Request) -> web.Response:
+        params = await request.json()
+        if not self._authorize(request, params):
+            return await self._respond("/v1/orders", {"error": {"name": "invalid_query_payload"}}, status=401)
+        if params.get("market") not in self.prices:
+            return await self._respond("/v1/orders", {"error": {"name": "market_does_not_exist"}}, status=400)
+        if params.get("identifier") is not None and self._find(identifier=params["identifier"]) is not None:
+            return await self._respond("/v1/orders", {"error": {"name": "duplicate_identifier"}}, status=400)
+        order = {
+            "uuid": str(uuid.uuid4()), "state": "wait", "volume": None, "executed_volume": "0", "trades": [], **params,
+        }
+        response = await self._respond("/v1/orders", order, status=201)
+        if response.status == 201:
+            self.orders.append(order)
+            if self.fill_delay is not None:
+                task = asyncio.create_task(self._fill(order))
+                self._fills.add(task)
+                task.add_done_callback(self._fills.discard)
+            if self.drop_acks:
+                self.drop_acks -= 1
+                request.transport.close()
+        return response
+
+    async def _order(self, request: web.Request) -> web.Response:
+        params = dict(request.query)
+        if not self._authorize(request, params):
+            return await self._respond("/v1/order", {"error": {"name": "invalid_query_payload"}}, status=401)
+        order = self._find(params.get("uuid"), params.get("identifier"))
+        if order is None:
+            return await self._respond("/v1/order", {"error": {"name": "order_not_found"}}, status=404)
+        return await self._respond("/v1/order", order)
+
+    async def _fill(self, order: dict) -> None:
+        price = float(order["price"]) if order["ord_type"] == "limit" else self.prices[order["market"]]
+        total = float(order["price"]) / price if order["ord_type"] == "price" else float(order["volume"])
+        executed = 0.0
+        for step in range(self.fill_steps):
+            await asyncio.sleep(self.fill_delay)
+            volume = total - executed if step == self.fill_steps - 1 else total / self.fill_steps
+            executed += volume
+            order["trades"].append({"price": str(price), "volume": str(volume), "funds": str(volume * price)})
+            order["executed_volume"] = str(executed)
+            await self._emit(order, "trade")
+        order["state"] = "done"
+        await self._emit(order, "done")
+
+    async def _emit(self, order: dict, state: str) -> None:
+        if not self.order_stream:
+            return
+        executed = float(order["executed_volume"])
+        funds = sum(float(trade["funds"]) for trade in order["trades"])
+        message = json.dumps({
+            "type": "myOrder",
+            "code": order["market"],
+            "uuid": order["uuid"],
+            "ask_bid": "BID" if order["side"] == "bid" else "ASK",
+            "order_type": order["ord_type"],
+            "state": state,
+            "price": order.get("price"),
+            "avg_price": funds / executed if executed else 0,
+            "volume": order.get("volume"),
+            "executed_volume": executed,
+            "executed_funds": funds,
+            "trades_count": len(order["trades"]),
+            "identifier": order.get("identifier"),
+            "timestamp": int(time.time() * 1000),
+        })
+        for websocket in list(self.order_subscribers):
+            await websocket.send_str(message)
+
+    async def _private_stream(self, request: web.Request) -> web.StreamResponse:
+        if not self._authorize(request):
+            return web.json_response({"error": {"name": "invalid_access_key"}}, status=401)
+        websocket = web.WebSocketResponse()
+        await websocket.prepare(request)
+        await websocket.receive()  # 구독 요청
+        self.order_subscribers.add(websocket)
+        try:
+            async for _ in websocket:
+                pass
+        finally:
+            self.order_subscribers.discard(websocket)
+        return websocket
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """
+        현재 이벤트 루프에서 서버 시작
+
+        Returns:
+            str: 서버 주소
+        """
+        self._runner = web.AppRunner(self._app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        sockets = site._server.sockets
+        self.url = f"http://{host}:{sockets[0].getsockname()[1]}"
+        self.ws_url = f"ws://{host}:{sockets[0].getsockname()[1]}/websocket/v1"
+        return self.url
+
+    async def stop(self) -> None:
+        """서버 종료"""
+        for task in list(self._fills):
+            task.cancel()
+        for websocket in list(self.order_subscribers):
+            await websocket.close()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def start_in_thread(self) -> str:
+        """
+        별도 스레드의 이벤트 루프에서 서버 시작
+
+        동기 클라이언트나 다른 이벤트 루프의 클라이언트가 접근할 때 사용
+
+        Returns:
+            str: 서버 주소
+        """
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        return asyncio.run_coroutine_threadsafe(self.start(), self._loop).result()
+
+    def stop_thread(self) -> None:
+        """스레드에서 실행 중인 서버 종료"""
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.stop(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+        self._thread = None
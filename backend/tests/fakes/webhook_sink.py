@@ -0,0 +1,62 @@
+"""
+로컬 웹훅 수신 서버
+
+Slack/Discord 웹훅 대신 요청 본문을 기록하고, 지정한 상태 코드를 차례로 응답한다.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+from aiohttp import web
+
+
+class WebhookSink:
+    def __init__(self, statuses: Optional[List[int]] = None, retry_after: float = 0.05, latency: float = 0.0):
+        """
+        웹훅 수신 서버 초기화
+
+        Args:
+            statuses (List[int], optional): 앞선 요청들에 차례로 보낼 상태 코드 (소진 후 200)
+            retry_after (float): 429 응답의 Retry-After (초)
+            latency (float): 응답 지연 (초, 실제 웹훅 왕복 시간 흉내)
+        """
+        self.statuses: Deque[int] = deque(statuses or [])
+        self.retry_after = retry_after
+        self.latency = latency
+        self.received: List[Tuple[str, dict, float]] = []  # (경로, 본문, 수신 시각) - 200 응답만
+        self.attempts = 0
+        self.url: Optional[str] = None
+        self._runner: Optional[web.AppRunner] = None
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        self.attempts += 1
+        body = await request.json()
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        status = self.statuses.popleft() if self.statuses else 200
+        if status == 429:
+            return web.json_response({"retry_after": self.retry_after}, status=429,
+                                     headers={"Retry-After": str(self.retry_after)})
+        if status >= 300:
+            return web.Response(status=status, text="error")
+        self.received.append((request.path, body, time.monotonic()))
+        return web.Response(status=200, text="ok")
+
+    async def start(self, host: str = "127.0.0.1") -> str:
+        """서버 시작"""
+        app = web.Application()
+        app.router.add_post("/{path:.*}", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, 0)
+        await site.start()
+        self.url = f"http://{host}:{site._server.sockets[0].getsockname()[1]}"
+        return self.url
+
+    async def stop(self) -> None:
+        """서버 종료"""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
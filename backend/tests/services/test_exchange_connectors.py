@@ -0,0 +1,182 @@
+"""
+거래소 커넥터 테스트 (기록된 응답 재생)
+"""
+
+import asyncio
+import hashlib
+import hmac
+import json
+from urllib.parse import urlencode
+
+import pytest
+from jose import jwt
+
+from app.services.binance_service import BinanceConnector
+from app.services.exchange_service import (
+    CANCELED, FILLED, OPEN, PARTIALLY_FILLED, ExchangeResponseError, ExchangeRouter, create_connector,
+)
+from app.services.rate_limiter import RateLimiter
+from app.services.upbit_service import UpbitConnector
+from tests.fakes.recorded_exchange import RecordedExchange
+
+
+def _run(recording, scenario):
+    async def runner():
+        exchange = RecordedExchange(recording)
+        await exchange.start()
+        connector_cls = UpbitConnector if recording.startswith("upbit") else BinanceConnector
+        connector = connector_cls(
+            "access", "secret", base_url=exchange.url, ws_url=exchange.ws_url,
+            reconnect_delay=0.01, rate_limiter=RateLimiter(),
+        )
+        try:
+            return await scenario(connector, exchange)
+        finally:
+            await connector.close()
+            await exchange.stop()
+    return asyncio.run(runner())
+
+def test_symbol_normalization():
+    """표준 심볼 <-> 거래소 표기 변환 테스트"""
+    binance = BinanceConnector()
+    assert binance.to_exchange_symbol("USDT-BTC") == "BTCUSDT"
+    assert binance.from_exchange_symbol("ETHUSDT") == "USDT-ETH"
+    assert binance.from_exchange_symbol("ethbtc") == "BTC-ETH"
+    assert binance.from_exchange_symbol("BTCFDUSD") == "FDUSD-BTC"
+    with pytest.raises(ValueError):
+        binance.from_exchange_symbol("ABCXYZ")
+    upbit = UpbitConnector()
+    assert upbit.to_exchange_symbol("krw-btc") == "KRW-BTC"
+    with pytest.raises(ValueError):
+        upbit.to_exchange_symbol("BTCKRW")
+
+def test_upbit_rest():
+    """업비트 시세/잔고/주문/캔들 조회 테스트"""
+    async def scenario(upbit, exchange):
+        prices = await upbit.get_prices(["KRW-BTC", "KRW-ETH"])
+        balances = await upbit.get_balances()
+        with pytest.raises(ValueError):
+            await upbit.place_order("KRW-BTC", "buy", quantity=0.001)
+        placed = await upbit.place_order("KRW-BTC", "buy", amount=100000, client_order_id="coinori-1-1")
+        order = await upbit.get_order("KRW-BTC", client_order_id="coinori-1-1")
+        candles = await upbit.get_candles("KRW-BTC", "minute1", count=3)
+        return prices, balances, placed, order, candles, exchange
+
+    prices, balances, placed, order, candles, exchange = _run("upbit_rest.json", scenario)
+    assert prices == {"KRW-BTC": 91250000.0, "KRW-ETH": 4321000.0}
+    assert exchange.requests_to("/v1/ticker")[0][2] == {"markets": "KRW-BTC,KRW-ETH"}
+    assert set(balances) == {"KRW", "BTC"} and balances["KRW"].total == 1750000.0
+    assert (placed.status, placed.order_type, placed.client_order_id) == (OPEN, "market", "coinori-1-1")
+
+    _, _, _, headers, body = exchange.requests_to("/v1/orders")[0]
+    claims = jwt.decode(headers["Authorization"][7:], "secret", algorithms=["HS256"])
+    assert claims["query_hash"] == hashlib.sha512(urlencode(json.loads(body)).encode()).hexdigest()
+    assert json.loads(body)["ord_type"] == "price"
+
+    assert order.status == CANCELED and order.filled_quantity == pytest.approx(0.00109589)
+    assert order.average_price == pytest.approx(91250500, rel=1e-4)
+    assert list(candles["timestamp"]) == [1715990400000, 1715990460000, 1715990520000]
+    assert candles["close"][-1] == 91250000.0
+
+def test_binance_rest_signs_requests():
+    """바이낸스 서명 요청 및 응답 변환 테스트"""
+    async def scenario(binance, exchange):
+        prices = await binance.get_prices(["USDT-BTC", "USDT-ETH"])
+        balances = await binance.get_balances()
+        placed = await binance.place_order("USDT-BTC", "buy", quantity=0.0015, client_order_id="coinori-1-1")
+        order = await binance.get_order("USDT-BTC", client_order_id="coinori-1-2")
+        canceled = await binance.cancel_order("USDT-BTC", order_id="28457127")
+        candles = await binance.get_candles("USDT-BTC", "minute1", count=3, end_ms=1715990580000)
+        with pytest.raises(ExchangeResponseError) as error:
+            await binance._request("GET", "/api/v3/exchangeInfo")
+        with pytest.raises(ValueError):
+            await binance.get_candles("USDT-BTC", "minute10")
+        return prices, balances, placed, order, canceled, candles, error.value, exchange
+
+    prices, balances, placed, order, canceled, candles, error, exchange = _run("binance_rest.json", scenario)
+    assert prices == {"USDT-BTC": 67012.01, "USDT-ETH": 3115.42}
+    assert exchange.requests_to("/api/v3/ticker/price")[0][2]["symbols"] == '["BTCUSDT","ETHUSDT"]'
+    assert set(balances) == {"BTC", "USDT"} and balances["USDT"].locked == 50.0
+
+    method, _, query, headers, _ = exchange.requests_to("/api/v3/order")[0]
+    assert method == "POST" and headers["X-MBX-APIKEY"] == "access"
+    assert query["quantity"] == "0.0015" and query["newClientOrderId"] == "coinori-1-1"
+    signed = urlencode({key: value for key, value in query.items() if key != "signature"})
+    assert query["signature"] == hmac.new(b"secret", signed.encode(), hashlib.sha256).hexdigest()
+
+    assert (placed.status, placed.side, placed.symbol) == (FILLED, "buy", "USDT-BTC")
+    assert placed.average_price == pytest.approx(67012.1)
+    assert order.status == PARTIALLY_FILLED and order.filled_quantity == 0.004
+    assert canceled.status == CANCELED
+    assert exchange.requests_to("/api/v3/klines")[0][2]["endTime"] == "1715990579999"
+    assert candles["close"].tolist() == [67001.0, 67010.5, 67012.01]
+    assert error.status == 418
+
+@pytest.mark.parametrize("recording, symbols", [
+    ("upbit_rest.json", ["KRW-BTC", "KRW-ETH", "KRW-XRP"]),
+    ("binance_rest.json", ["USDT-BTC", "USDT-ETH"]),
+])
+def test_ticker_stream(recording, symbols):
+    """실시간 시세 스트림 변환 및 재연결 테스트"""
+    async def scenario(connector, exchange):
+        tickers = []
+        stream = connector.stream_tickers(symbols)
+        async for ticker in stream:
+            tickers.append(ticker)
+            if len(tickers) == len(exchange.stream["messages"]) + 1:
+                break
+        await stream.aclose()
+        return tickers, exchange
+
+    tickers, exchange = _run(recording, scenario)
+    assert {ticker.symbol for ticker in tickers} <= set(symbols)
+    assert all(ticker.price > 0 and ticker.timestamp > 1_700_000_000_000 for ticker in tickers)
+    assert len(exchange.subscriptions) == 2  # 기록이 끝나 연결이 닫히면 다시 구독
+    if recording.startswith("upbit"):
+        assert json.loads(exchange.subscriptions[0])[1] == {"type": "ticker", "codes": symbols}
+    else:
+        assert exchange.subscriptions[0] == "streams=btcusdt@ticker/ethusdt@ticker"
+
+def test_router_queries_exchanges_concurrently():
+    """거래소별 동시 조회 테스트"""
+    async def scenario():
+        upbit, binance = RecordedExchange("upbit_rest.json", latency=0.2), RecordedExchange("binance_rest.json", latency=0.2)
+        await upbit.start()
+        await binance.start()
+        router = ExchangeRouter([
+            create_connector("upbit", base_url=upbit.url, rate_limiter=RateLimiter()),
+            create_connector("binance", base_url=binance.url, rate_limiter=RateLimiter()),
+        ])
+        try:
+            start = asyncio.get_running_loop().time()
+            prices = await router.get_prices({"upbit": ["KRW-BTC", "KRW-ETH"], "binance": ["USDT-BTC", "USDT-ETH"]})
+            return prices, asyncio.get_running_loop().time() - start
+        finally:
+            await router.close()
+            await upbit.stop()
+            await binance.stop()
+
+    prices, elapsed = asyncio.run(scenario())
+    assert prices["upbit"]["KRW-BTC"] == 91250000.0 and prices["binance"]["USDT-BTC"] == 67012.01
+    assert elapsed < 0.35
+    with pytest.raises(ValueError):
+        create_connector("bithumb")
+
+def test_order_stream_messages():
+    """업비트 myOrder / 바이낸스 executionReport 주문 이벤트 변환 테스트"""
+    upbit = UpbitConnector().parse_order({
+        "type": "myOrder", "code": "KRW-BTC", "uuid": "u-1", "ask_bid": "BID", "order_type": "price",
+        "state": "trade", "price": 100000.0, "volume": None, "executed_volume": 0.001, "avg_price": 50000000.0,
+        "identifier": "coinori-1-1",
+    })
+    assert (upbit.symbol, upbit.side, upbit.status, upbit.client_order_id) == ("KRW-BTC", "buy", PARTIALLY_FILLED, "coinori-1-1")
+    assert upbit.filled_quantity == 0.001 and upbit.average_price == 50000000.0
+    assert UpbitConnector().parse_order({"type": "ticker", "code": "KRW-BTC"}) is None
+
+    binance = BinanceConnector().parse_order({
+        "e": "executionReport", "s": "BTCUSDT", "c": "web_cancel", "C": "coinori-1-2", "S": "SELL", "o": "LIMIT",
+        "q": "0.5", "p": "67000.00", "X": "CANCELED", "i": 42, "z": "0.2", "Z": "13400.0",
+    })
+    assert (binance.symbol, binance.side, binance.status, binance.order_id) == ("USDT-BTC", "sell", CANCELED, "42")
+    assert binance.client_order_id == "coinori-1-2" and binance.average_price == 67000.0
+    assert BinanceConnector().parse_order({"e": "outboundAccountPosition"}) is None
@@ -0,0 +1,137 @@
+"""
+웹훅 알림 발송 테스트 (로컬 수신 서버)
+"""
+
+import asyncio
+import json
+import time
+
+from app.services.notification_service import (
+    DISCORD, ERROR, SLACK, TRADE, Notification, NotificationDispatcher, format_digest,
+)
+from app.services.rate_limiter import RateLimiter
+from tests.fakes.webhook_sink import WebhookSink
+
+
+def _dispatcher(**kwargs):
+    kwargs.setdefault("batch_window", 0.05)
+    kwargs.setdefault("retry_backoff", 0.01)
+    kwargs.setdefault("spill_path", "")
+    kwargs.setdefault("rate_limiter", RateLimiter(limits={SLACK: {"webhook": [1, 0.1]}, DISCORD: {"webhook": [5, 1.0]}}))
+    return NotificationDispatcher(**kwargs)
+
+def _run(sink, scenario):
+    async def runner():
+        await sink.start()
+        try:
+            return await scenario()
+        finally:
+            await sink.stop()
+    return asyncio.run(runner())
+
+def test_digest_format():
+    """요약 메시지 형식과 길이 제한 테스트"""
+    one = format_digest(SLACK, [Notification(1, TRADE, "체결", "upbit KRW-BTC buy")])
+    assert one == {"text": "[체결] upbit KRW-BTC buy"}
+    many = format_digest(DISCORD, [Notification(1, TRADE, "체결", "x" * 500) for _ in range(10)])
+    assert len(many["content"]) <= 2000
+    assert many["content"].startswith("알림 10건") and many["content"].endswith("... 외 7건")
+
+def test_burst_coalesced_without_blocking():
+    """연속 알림을 웹훅별 한 메시지로 묶고 등록은 바로 반환하는지 테스트"""
+    sink = WebhookSink()
+
+    async def scenario():
+        dispatcher = _dispatcher()
+        dispatcher.set_targets(1, f"{sink.url}/slack/a", f"{sink.url}/discord/a")
+        dispatcher.set_targets(2, f"{sink.url}/slack/b", notify_on_trade=False)
+        await dispatcher.start()
+        start = time.perf_counter()
+        queued = [dispatcher.notify(1, TRADE, "체결", f"order {i}") for i in range(30)]
+        elapsed = time.perf_counter() - start
+        assert dispatcher.notify(2, TRADE, "체결") == 0 and dispatcher.notify(3, ERROR, "오류") == 0
+        dispatcher.notify(2, ERROR, "주문 거절", "잔고 부족")
+        assert await dispatcher.flush(timeout=5)
+        await dispatcher.stop()
+        return queued, elapsed, dispatcher.stats()
+
+    queued, elapsed, stats = _run(sink, scenario)
+    assert queued == [2] * 30 and elapsed < 0.05
+    by_path = {}
+    for path, body, _ in sink.received:
+        by_path.setdefault(path, []).append(body)
+    assert [body["text"].splitlines()[0] for body in by_path["/slack/a"]] == ["알림 20건", "알림 10건"]
+    assert by_path["/discord/a"][0]["content"].startswith("알림 20건")
+    assert by_path["/slack/b"] == [{"text": "[주문 거절] 잔고 부족"}]
+    assert stats["queued"] == 0 and stats["webhooks"] == 3
+
+def test_retries_respect_rate_limit_and_backoff():
+    """429/5xx 응답 재시도와 웹훅별 요청 간격 테스트"""
+    sink = WebhookSink(statuses=[429, 500], retry_after=0.2)
+
+    async def scenario():
+        dispatcher = _dispatcher(max_batch=1)
+        dispatcher.set_targets(1, f"{sink.url}/slack/a")
+        await dispatcher.start()
+        start = time.monotonic()
+        for i in range(3):
+            dispatcher.notify(1, TRADE, "체결", f"order {i}")
+        await dispatcher.flush(timeout=5)
+        await dispatcher.stop()
+        return start
+
+    start = _run(sink, scenario)
+    assert sink.attempts == 5 and [body["text"] for _, body, _ in sink.received] == [
+        "[체결] order 0", "[체결] order 1", "[체결] order 2",
+    ]
+    times = [received for _, _, received in sink.received]
+    assert times[0] - start >= 0.2  # Retry-After 동안 대기
+    assert all(later - earlier >= 0.09 for earlier, later in zip(times, times[1:]))  # 웹훅당 0.1초에 1건
+
+def test_undelivered_notifications_spill_to_disk(tmp_path):
+    """넘치거나 보내지 못한 알림을 디스크에 남기고 다음 시작 때 보내는지 테스트"""
+    spill_path = str(tmp_path / "notifications.jsonl")
+    sink = WebhookSink(statuses=[503] * 3)
+
+    async def scenario():
+        dispatcher = _dispatcher(queue_size=2, max_retries=2, spill_path=spill_path)
+        dispatcher.set_targets(1, discord_webhook_url=f"{sink.url}/discord/a")
+        for i in range(3):
+            dispatcher.notify(1, ERROR, "오류", f"error {i}")  # 시작 전: 2건은 메모리, 1건은 디스크
+        with open(spill_path) as file:
+            assert [json.loads(line)["message"] for line in file] == ["error 2"]
+        await dispatcher.start()  # 대기열이 차 있어 복원한 1건은 다시 디스크로, 전송 묶음은 재시도 소진 후 디스크로
+        await dispatcher.flush(timeout=5)
+        await dispatcher.stop()
+        spilled = open(spill_path).read().count("\n")
+
+        restarted = _dispatcher(spill_path=spill_path)
+        await restarted.start()
+        await restarted.flush(timeout=5)
+        await restarted.stop()
+        return spilled
+
+    spilled = _run(sink, scenario)
+    assert spilled == 3 and sink.attempts == 4
+    assert sink.received[0][1]["content"].splitlines() == ["알림 3건", "[오류] error 2", "[오류] error 0", "[오류] error 1"]
+
+def test_restored_webhook_gets_single_worker(tmp_path):
+    """디스크에서 복원한 웹훅의 전송 작업이 하나만 생기고 종료 시 모두 끝나는지 테스트"""
+    spill_path = str(tmp_path / "notifications.jsonl")
+    sink = WebhookSink()
+
+    def workers():
+        return [task for task in asyncio.all_tasks() if task.get_coro().__qualname__ == "NotificationDispatcher._run"]
+
+    async def scenario():
+        _dispatcher(spill_path=spill_path)._spill([(DISCORD, f"{sink.url}/discord/a", Notification(1, ERROR, "오류"))])
+        dispatcher = _dispatcher(spill_path=spill_path)
+        await dispatcher.start()
+        running = workers()
+        await dispatcher.flush(timeout=5)
+        await dispatcher.stop()
+        return running, workers()
+
+    running, leftover = _run(sink, scenario)
+    assert len(running) == 1 and leftover == []
+    assert len(sink.received) == 1
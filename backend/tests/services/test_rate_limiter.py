@@ -0,0 +1,98 @@
+"""
+거래소 요청 쿼터 스케줄러 테스트
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.services.rate_limiter import (
+    PRIORITY_MARKET_DATA, PRIORITY_ORDER, RATE_LIMIT_REJECTED, RATE_LIMIT_THROTTLED, RateLimiter, binance_quota,
+    upbit_quota,
+)
+from app.trading.upbit import async_api
+from app.trading.upbit.async_api import AsyncUpbitAPI
+from tests.fakes.upbit_exchange import MockUpbitExchange
+
+
+def test_quota_groups():
+    """요청별 쿼터 그룹/우선순위 판별 테스트"""
+    assert upbit_quota("GET", "/v1/ticker", "key") == ([("", "ticker", 1.0)], PRIORITY_MARKET_DATA)
+    assert upbit_quota("POST", "/v1/orders", "key") == ([("key", "order", 1.0)], PRIORITY_ORDER)
+    quota, priority = binance_quota("POST", "/api/v3/order", "key")
+    assert [q.group for q in quota] == ["orders", "weight"] and priority == PRIORITY_ORDER
+    assert binance_quota("GET", "/api/v3/account", "key")[0][0].cost == 20
+
+def test_orders_jump_the_market_data_queue():
+    """쿼터가 부족할 때 주문이 먼저 토큰을 받는지 테스트"""
+    limiter = RateLimiter(limits={"upbit": {"order": [1, 0.05]}})
+    served = []
+
+    async def request(name, priority):
+        await limiter.acquire("upbit", "key", "order", priority=priority)
+        served.append(name)
+
+    async def scenario():
+        await limiter.acquire("upbit", "key", "order")  # 버킷 소진
+        tasks = [asyncio.create_task(request(f"ticker-{i}", PRIORITY_MARKET_DATA)) for i in range(3)]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(request("order", PRIORITY_ORDER)))
+        await asyncio.gather(*tasks)
+
+    throttled = RATE_LIMIT_THROTTLED.value
+    asyncio.run(scenario())
+    assert served == ["order", "ticker-0", "ticker-1", "ticker-2"]
+    assert RATE_LIMIT_THROTTLED.value - throttled == 4
+
+def test_headers_and_rejections_adjust_buckets():
+    """남은 쿼터 헤더 보정과 거절 시 차단 테스트"""
+    limiter = RateLimiter(limits={"upbit": {"default": [30, 1.0]}, "binance": {"weight": [6000, 60.0]}})
+    upbit, _ = upbit_quota("GET", "/v1/accounts", "access-key")
+    limiter.update("upbit", upbit, {"Remaining-Req": "group=default; min=1800; sec=5"})
+    assert limiter.bucket("upbit", "access-key", "default").tokens == pytest.approx(5, abs=0.1)
+
+    limiter.update("upbit", upbit, {"Remaining-Req": "group=default; min=1800; sec=0"})
+    assert limiter.bucket("upbit", "access-key", "default").delay(1, time.monotonic()) > 0.9
+
+    binance, _ = binance_quota("GET", "/api/v3/klines", "access-key")
+    limiter.update("binance", binance, {"X-MBX-USED-WEIGHT-1M": "5990"})
+    assert limiter.bucket("binance", "", "weight").tokens == pytest.approx(10, abs=0.1)
+    limiter.penalize("binance", binance, 30.0)
+    assert limiter.bucket("binance", "", "weight").delay(1, time.monotonic()) > 29
+
+    stats = limiter.stats()
+    assert {bucket["key"] for bucket in stats["buckets"]} == {"acce***", ""}
+    assert next(b for b in stats["buckets"] if b["group"] == "weight")["blocked_for"] > 29
+
+def _place_orders(exchange, limiter, count):
+    async def scenario():
+        await exchange.start()
+        client = AsyncUpbitAPI(exchange.access_key, exchange.secret_key, base_url=exchange.url, rate_limiter=limiter)
+        await asyncio.sleep(1 - time.monotonic() % 1)  # 모의 거래소의 초 단위 구간 시작에 맞춤
+        try:
+            return await asyncio.gather(*(
+                client.place_market_order("KRW-BTC", "bid", price=10000) for _ in range(count)
+            ))
+        finally:
+            await async_api.close_session()
+            await exchange.stop()
+
+    return asyncio.run(scenario())
+
+def test_requests_queue_within_exchange_limit():
+    """거래소 제한에 맞춰 대기열로 흘려보내는지 테스트"""
+    exchange = MockUpbitExchange(limits={"order": 5})
+    start = time.monotonic()
+    results = _place_orders(exchange, RateLimiter(limits={"upbit": {"order": [5, 1.0]}}), 8)
+    assert all(result["state"] == "wait" for result in results)
+    assert len(exchange.orders) == 8 and exchange.rejections == 0
+    assert time.monotonic() - start > 0.5
+
+def test_rejected_requests_are_retried():
+    """쿼터를 과대 설정해 429를 받아도 실패 없이 재시도하는지 테스트"""
+    exchange = MockUpbitExchange(limits={"order": 5})
+    rejected = RATE_LIMIT_REJECTED.value
+    results = _place_orders(exchange, RateLimiter(limits={"upbit": {"order": [50, 1.0]}}), 8)
+    assert len(results) == 8 and len(exchange.orders) == 8
+    assert exchange.rejections == 3 and RATE_LIMIT_REJECTED.value - rejected == 3
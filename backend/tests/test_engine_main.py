@@ -0,0 +1,69 @@
+"""
+엔진 프로세스 실행 테스트
+"""
+
+import asyncio
+import os
+import signal
+import uuid
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app import engine_main
+from app.db.base import Base
+from app.models.user import TradingSetting
+
+
+class StubFeed:
+    """거래소에 연결하지 않는 시세 수신기"""
+    instances = []
+
+    def __init__(self, store, codes):
+        self.store = store
+        self.codes = codes
+        self.started = asyncio.Event()
+        self.stopped = False
+        StubFeed.instances.append(self)
+
+    async def run(self):
+        self.started.set()
+        await asyncio.Event().wait()
+
+    async def stop(self):
+        self.stopped = True
+
+
+def test_run_until_sigterm(tmp_path, monkeypatch):
+    """엔진 프로세스가 설정을 적재해 시세 수신을 시작하고 SIGTERM에 정리되는지 테스트"""
+    db_engine = create_engine(f"sqlite:///{tmp_path}/engine.db")
+    Base.metadata.create_all(bind=db_engine)
+    session_factory = sessionmaker(bind=db_engine)
+    with session_factory() as db:
+        db.add(TradingSetting(strategy_name="sma_cross", exchange="upbit", symbol="KRW-ETH", is_active=True,
+                              parameters={}))
+        db.commit()
+
+    monkeypatch.setattr(engine_main, "SessionLocal", session_factory)
+    monkeypatch.setattr(engine_main, "db_engine", db_engine)
+    monkeypatch.setattr(engine_main, "UpbitWebSocketFeed", StubFeed)
+    monkeypatch.setattr(engine_main.settings, "SHARED_STATE_NAME", f"coinori-test-{uuid.uuid4().hex[:8]}")
+    monkeypatch.setattr(engine_main.settings, "ENGINE_MARKETS", ["KRW-BTC"])
+    monkeypatch.setattr(engine_main.settings, "PORTFOLIO_SNAPSHOT_INTERVAL", 0)
+    StubFeed.instances.clear()
+
+    async def scenario():
+        process = asyncio.create_task(engine_main.run())
+        for _ in range(500):
+            if process.done():
+                process.result()  # 기동 중 예외를 그대로 올림
+            if StubFeed.instances and StubFeed.instances[0].started.is_set():
+                break
+            await asyncio.sleep(0.01)
+        os.kill(os.getpid(), signal.SIGTERM)
+        await asyncio.wait_for(process, timeout=5)
+
+    asyncio.run(scenario())
+    [feed] = StubFeed.instances
+    assert feed.codes == ["KRW-BTC", "KRW-ETH"] and feed.stopped
+    db_engine.dispose()
@@ -0,0 +1,45 @@
+"""
+기동 경로 지연 로딩 테스트
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ENTRYPOINTS = {
+    "api": "app.main",
+    "engine": "app.engine_main",
+    "keygen": "app.scripts.generate_encryption_key",
+}
+
+# 처음 쓸 때 불러오는 의존성
+DEFERRED = ("pandas", "pyupbit", "requests", "jose", "passlib", "cryptography")
+
+
+@pytest.mark.parametrize("entrypoint", sorted(ENTRYPOINTS))
+def test_entrypoint_defers_heavy_imports(entrypoint):
+    """진입점 import 시 무거운 의존성을 불러오지 않는지 테스트"""
+    code = (
+        f"import sys, {ENTRYPOINTS[entrypoint]}\n"
+        f"print(','.join(name for name in {DEFERRED!r} if name in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=BACKEND_DIR, capture_output=True, text=True,
+        env={**os.environ, "ENCRYPTION_KEY": "test-encryption-key"}, check=True,
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_deferred_imports_load_on_first_use():
+    """지연 로딩한 의존성이 처음 쓸 때 정상 동작하는지 테스트"""
+    from app.core.security import CryptoUtils, create_access_token, verify_token
+    from app.trading import indicators
+
+    token = create_access_token({"sub": "alice"})
+    assert verify_token(token)["sub"] == "alice"
+    assert CryptoUtils("key").decrypt(CryptoUtils("key").encrypt("value")) == "value"
+    assert indicators.sma([1.0, 2.0, 3.0], 2)[-1] == 2.5
@@ -0,0 +1,88 @@
+"""
+백테스트 엔진 테스트
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from types import SimpleNamespace
+from app.trading.backtest import BacktestConfig, backtest_setting, load_ohlcv, run_sweep, simulate
+
+
+def _ohlcv(close, high=None, low=None):
+    close = np.asarray(close, dtype=np.float64)
+    return {
+        "timestamp": np.arange(len(close), dtype=np.int64) * 60_000,
+        "open": close.copy(),
+        "high": close.copy() if high is None else np.asarray(high, dtype=np.float64),
+        "low": close.copy() if low is None else np.asarray(low, dtype=np.float64),
+        "close": close,
+        "volume": np.ones(len(close)),
+    }
+
+def test_signal_round_trip_with_fees_and_slippage():
+    """신호 기반 매수/매도 체결 테스트"""
+    ohlcv = _ohlcv([100, 100, 110, 120, 120])
+    signals = np.array([1, 0, -1, 0, 0])
+    config = BacktestConfig(quantity=2, fee_rate=0.001, slippage=0.01,
+                            stop_loss_percentage=None, take_profit_percentage=None)
+
+    result = simulate(signals, ohlcv, config)
+
+    buy, sell = result.trades
+    assert buy["side"] == "buy" and buy["price"] == pytest.approx(101.0)
+    assert sell["price"] == pytest.approx(120 * 0.99)
+    assert sell["extra_data"]["reason"] == "signal"
+    expected = (120 * 0.99 - 101.0) * 2 - (101.0 + 120 * 0.99) * 2 * 0.001
+    assert sell["profit_loss"] == pytest.approx(expected)
+    assert result.stats["trades"] == 1
+
+def test_stop_loss_triggers_before_signal_exit():
+    """손절 우선 체결 테스트"""
+    close = [100, 100, 99, 98, 97, 96]
+    low = [100, 100, 99, 90, 97, 96]
+    signals = np.array([1, 0, 0, 0, 0, -1])
+    config = BacktestConfig(fee_rate=0, slippage=0, stop_loss_percentage=5, take_profit_percentage=None)
+
+    result = simulate(signals, _ohlcv(close, low=low), config)
+
+    sell = result.trades[1]
+    assert sell["extra_data"]["reason"] == "stop_loss"
+    assert sell["price"] == pytest.approx(95.0)
+    assert sell["created_at"].timestamp() == 3 * 60
+
+def test_open_position_closed_at_end():
+    """마지막 봉 청산 테스트"""
+    result = simulate(np.array([1, 0, 0]), _ohlcv([100, 101, 105]),
+                      BacktestConfig(fee_rate=0, slippage=0, stop_loss_percentage=None, take_profit_percentage=None))
+    assert result.trades[-1]["extra_data"]["reason"] == "end"
+    assert result.stats["total_profit"] == pytest.approx(4 * result.trades[0]["quantity"])
+
+def test_backtest_setting_produces_trade_models():
+    """매매 설정 백테스트 및 Trade 변환 테스트"""
+    rng = np.random.default_rng(1)
+    close = 1000 + np.cumsum(rng.normal(0, 5, 5000))
+    setting = SimpleNamespace(
+        strategy_name="sma_cross", symbol="KRW-BTC", exchange="upbit", parameters={"fast": 5, "slow": 20},
+        max_position_size=0.01, stop_loss_percentage=2.0, take_profit_percentage=4.0,
+    )
+
+    result = backtest_setting(setting, _ohlcv(close))
+
+    assert result.stats["trades"] > 0
+    models = result.to_models(user_id=7)
+    assert models[0].user_id == 7 and models[0].symbol == "KRW-BTC" and models[0].quantity == 0.01
+
+def test_sweep_across_processes(tmp_path):
+    """파라미터 탐색 프로세스 풀 테스트"""
+    rng = np.random.default_rng(2)
+    data = _ohlcv(1000 + np.cumsum(rng.normal(0, 5, 3000)))
+    path = str(tmp_path / "candles.csv")
+    pd.DataFrame(data).to_csv(path, index=False)
+    assert load_ohlcv(path)["close"][10] == pytest.approx(data["close"][10])
+
+    grid = [{"fast": fast, "slow": slow} for fast in (5, 10) for slow in (20, 40)]
+    results = run_sweep("sma_cross", path, grid, processes=2)
+
+    assert len(results) == 4
+    assert results[0]["total_profit"] >= results[-1]["total_profit"]
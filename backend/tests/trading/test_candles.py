@@ -0,0 +1,103 @@
+"""
+캔들 저장소 테스트
+"""
+
+import numpy as np
+import pytest
+from app.trading.candles import CandleStore, INTERVAL_MS
+
+STEP = INTERVAL_MS["minute1"]
+
+
+def _candles(start_index, count):
+    timestamps = (np.arange(start_index, start_index + count) * STEP).astype(np.int64)
+    values = timestamps / STEP
+    return {"timestamp": timestamps, "open": values, "high": values + 1, "low": values - 1, "close": values, "volume": np.ones(count)}
+
+def _fetcher(calls=None, fail_after=None):
+    def fetch(symbol, interval, start, end):
+        if calls is not None:
+            calls.append((start, end))
+            if fail_after is not None and len(calls) > fail_after:
+                raise ConnectionError("rate limited")
+        return _candles(start // STEP, (end - start) // STEP)
+    return fetch
+
+@pytest.fixture
+def store(tmp_path):
+    return CandleStore(str(tmp_path))
+
+def test_append_is_incremental(store):
+    """중복 제거 증분 추가 테스트"""
+    assert store.append("upbit", "KRW-BTC", "minute1", _candles(0, 10)) == 10
+    assert store.append("upbit", "KRW-BTC", "minute1", _candles(5, 10)) == 5
+    assert store.rows("upbit", "KRW-BTC", "minute1") == 15
+    assert store.last_timestamp("upbit", "KRW-BTC", "minute1") == 14 * STEP
+
+def test_range_read_is_memory_mapped(store):
+    """메모리 매핑 구간 조회 테스트"""
+    store.append("upbit", "KRW-BTC", "minute1", _candles(0, 100))
+
+    result = store.read("upbit", "KRW-BTC", "minute1", start=10 * STEP, end=20 * STEP)
+
+    assert isinstance(result["close"], np.memmap)
+    np.testing.assert_array_equal(result["close"], np.arange(10, 20))
+    assert len(store.read("upbit", "KRW-ETH", "minute1")["close"]) == 0
+
+def test_uncommitted_tail_discarded(store, tmp_path):
+    """중단된 추가 데이터 복구 테스트"""
+    store.append("upbit", "KRW-BTC", "minute1", _candles(0, 5))
+    with open(tmp_path / "upbit" / "KRW-BTC" / "minute1" / "close.f8", "ab") as f:
+        f.write(b"\x00" * 24)  # 메타데이터 갱신 전에 중단된 쓰기
+
+    store.append("upbit", "KRW-BTC", "minute1", _candles(5, 5))
+
+    np.testing.assert_array_equal(store.read("upbit", "KRW-BTC", "minute1")["close"], np.arange(10))
+
+def test_backfill_resumes_after_failure(store):
+    """이어받기 테스트"""
+    calls = []
+    with pytest.raises(ConnectionError):
+        store.backfill(_fetcher(calls, fail_after=2), "upbit", "KRW-BTC", "minute1", 0, 1000 * STEP, batch=200)
+    assert store.rows("upbit", "KRW-BTC", "minute1") == 400
+
+    calls.clear()
+    assert store.backfill(_fetcher(calls), "upbit", "KRW-BTC", "minute1", 0, 1000 * STEP, batch=200) == 600
+    assert calls[0][0] == 400 * STEP
+
+def test_gap_detection_and_fill(store):
+    """누락 구간 탐지 및 채우기 테스트"""
+    store.append("upbit", "KRW-BTC", "minute1", _candles(0, 10))
+    store.append("upbit", "KRW-BTC", "minute1", _candles(15, 5))
+    store.append("upbit", "KRW-BTC", "minute1", _candles(30, 5))
+
+    assert store.find_gaps("upbit", "KRW-BTC", "minute1") == [(10 * STEP, 15 * STEP), (20 * STEP, 30 * STEP)]
+    assert store.fill_gaps(_fetcher(), "upbit", "KRW-BTC", "minute1") == 15
+    assert store.find_gaps("upbit", "KRW-BTC", "minute1") == []
+    np.testing.assert_array_equal(store.read("upbit", "KRW-BTC", "minute1")["close"], np.arange(35))
+
+def test_interrupted_fill_keeps_columns_aligned(store, tmp_path):
+    """다시 쓰기 도중 중단되어도 이전 버전을 그대로 읽는지 테스트"""
+    store.append("upbit", "KRW-BTC", "minute1", _candles(0, 10))
+    store.append("upbit", "KRW-BTC", "minute1", _candles(15, 5))
+    column_file = store._column_file
+
+    def crash_on_high(path, name, version=0):
+        if name == "high" and version:
+            raise OSError("disk full")  # open 열만 새 버전으로 쓴 상태에서 중단
+        return column_file(path, name, version)
+
+    store._column_file = crash_on_high
+    with pytest.raises(OSError):
+        store.fill_gaps(_fetcher(), "upbit", "KRW-BTC", "minute1")
+    del store._column_file
+
+    result = store.read("upbit", "KRW-BTC", "minute1")
+    expected = np.concatenate([np.arange(10), np.arange(15, 20)])
+    np.testing.assert_array_equal(result["open"], expected)
+    np.testing.assert_array_equal(result["high"], expected + 1)
+
+    assert store.fill_gaps(_fetcher(), "upbit", "KRW-BTC", "minute1") == 5
+    assert store.fill_gaps(_fetcher(), "upbit", "KRW-BTC", "minute1") == 0
+    store.append("upbit", "KRW-BTC", "minute1", _candles(20, 5))
+    np.testing.assert_array_equal(store.read("upbit", "KRW-BTC", "minute1")["high"], np.arange(25) + 1)
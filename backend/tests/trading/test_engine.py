@@ -0,0 +1,122 @@
+"""
+매매 엔진 테스트
+"""
+
+import asyncio
+from types import SimpleNamespace
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.db.base import Base
+from app.models.user import TradingSetting
+from app.trading.engine import TradingEngine
+from app.trading.market_data import MarketDataStore
+from app.trading.strategy import SIGNAL_BUY, SIGNAL_NONE, STRATEGIES, Strategy, register_strategy
+
+
+class ThresholdStrategy(Strategy):
+    def signals(self, close):
+        return np.where(close >= self.parameters["buy_above"], SIGNAL_BUY, SIGNAL_NONE).astype(np.int8)
+
+    def update(self, price):
+        return SIGNAL_BUY if price >= self.parameters["buy_above"] else SIGNAL_NONE
+
+
+@pytest.fixture(autouse=True)
+def threshold_strategy():
+    """테스트 전략 등록 (끝나면 전역 STRATEGIES에서 제거)"""
+    register_strategy("test_threshold")(ThresholdStrategy)
+    try:
+        yield ThresholdStrategy
+    finally:
+        STRATEGIES.pop("test_threshold", None)
+
+
+def _setting(setting_id, symbol="KRW-BTC", strategy_name="test_threshold", exchange="upbit", buy_above=100.0):
+    return SimpleNamespace(
+        id=setting_id, user_id=1, exchange=exchange, symbol=symbol,
+        strategy_name=strategy_name, parameters={"buy_above": buy_above},
+    )
+
+def _tick(store, symbol, price):
+    store.apply({"type": "ticker", "code": symbol, "trade_price": price, "timestamp": 1})
+
+def test_engine_routes_ticks_to_symbol_strategies():
+    """심볼별 전략 평가 및 주문 실행 테스트"""
+    store = MarketDataStore()
+    executed = []
+
+    async def executor(decision):
+        executed.append(decision)
+
+    async def scenario():
+        engine = TradingEngine(store, executor=executor)
+        assert engine.add_settings([_setting(1), _setting(2, buy_above=1000.0), _setting(3, symbol="KRW-ETH")]) == 3
+        assert not engine.add_setting(_setting(4, strategy_name="unknown"))
+        await engine.start()
+        _tick(store, "KRW-BTC", 150.0)
+        _tick(store, "KRW-XRP", 150.0)
+        await asyncio.sleep(0.01)
+        await engine.stop()
+        return engine
+
+    engine = asyncio.run(scenario())
+    assert [d.setting_id for d in executed] == [1]
+    assert engine.stats()["decisions"] == 2
+    assert engine.stats()["tick_latency"]["count"] == 1
+
+def test_burst_updates_coalesced_per_symbol():
+    """동일 심볼 연속 갱신 병합 테스트"""
+    store = MarketDataStore()
+
+    async def scenario():
+        engine = TradingEngine(store)
+        engine.add_setting(_setting(1))
+        await engine.start()
+        for price in range(10):
+            _tick(store, "KRW-BTC", float(price))
+        await asyncio.sleep(0.01)
+        await engine.stop()
+        return engine
+
+    assert asyncio.run(scenario()).stats()["decisions"] == 1
+
+def test_exchange_concurrency_capped():
+    """거래소별 동시 호출 제한 테스트"""
+    store = MarketDataStore()
+    active, peak = 0, 0
+
+    async def executor(decision):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+
+    async def scenario():
+        engine = TradingEngine(store, executor=executor, exchange_concurrency={"upbit": 2})
+        engine.add_settings(_setting(i) for i in range(10))
+        await engine.start()
+        _tick(store, "KRW-BTC", 150.0)
+        await asyncio.sleep(0)
+        await engine.stop()
+
+    asyncio.run(scenario())
+    assert peak == 2
+
+def test_load_active_settings():
+    """활성화된 매매 설정 로드 테스트"""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    db.add_all([
+        TradingSetting(strategy_name="test_threshold", exchange="upbit", symbol="KRW-BTC", is_active=True, parameters={"buy_above": 1}),
+        TradingSetting(strategy_name="test_threshold", exchange="upbit", symbol="KRW-ETH", is_active=False, parameters={"buy_above": 1}),
+    ])
+    db.commit()
+
+    trading_engine = TradingEngine(MarketDataStore())
+    assert trading_engine.load_settings(db) == 1
+    assert trading_engine.symbols == ["KRW-BTC"]
+    db.close()
@@ -0,0 +1,231 @@
+"""
+주문 실행 파이프라인 테스트 (로컬 모의 거래소)
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.pubsub import StreamHub
+from app.db.base import Base
+from app.models.user import Trade
+from app.services.exchange_service import ExchangeRouter
+from app.services.notification_service import NotificationDispatcher
+from app.services.rate_limiter import RateLimiter
+from app.services.upbit_service import UpbitConnector
+from app.trading.execution import (
+    COMPLETED, ORDER_ACK_LATENCY, ORDER_FILL_LATENCY, ORDER_STATUS_POLLS, ExecutionError, ExecutionPipeline,
+    OrderTicket,
+)
+from app.trading.market_data import MarketDataStore
+from app.trading.portfolio import PortfolioBook
+from app.trading.risk_management import RiskEngine
+from app.trading.streams import orders_topic
+from tests.fakes.upbit_exchange import MockUpbitExchange
+
+
+@pytest.fixture
+def sessions(tmp_path):
+    """임시 SQLite 원장의 비동기 세션 생성 함수"""
+    engine = create_engine(f"sqlite:///{tmp_path}/execution.db")
+    Base.metadata.create_all(bind=engine)
+    engine.dispose()
+    return async_sessionmaker(
+        create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/execution.db", poolclass=NullPool),
+        expire_on_commit=False,
+    )
+
+
+def _run(exchange, sessions, scenario, poll_interval=5.0, risk_limits=None):
+    async def runner():
+        await exchange.start()
+        connector = UpbitConnector(
+            exchange.access_key, exchange.secret_key, base_url=exchange.url, ws_url=exchange.ws_url,
+            reconnect_delay=0.01, rate_limiter=RateLimiter(),
+        )
+        book, hub = PortfolioBook(), StreamHub()
+        # 기본 한도(settings.RISK_MAX_ORDER_QUANTITY)로 검사, 총액 주문 수량은 시세 저장소 시세로 추정
+        risk, store = RiskEngine(book=book), MarketDataStore()
+        risk.attach()
+        risk.bind_market_data(store)
+        for code, price in exchange.prices.items():
+            store.apply({"type": "ticker", "code": code, "trade_price": price})
+        for key, max_position in (risk_limits or {}).items():
+            risk.set_limits(*key, max_position=max_position)
+        pipeline = ExecutionPipeline(
+            ExchangeRouter([connector]), sessions, hub=hub, book=book, poll_interval=poll_interval, risk=risk,
+            notifier=NotificationDispatcher(spill_path=""),
+        )
+        await pipeline.start()
+        try:
+            return await scenario(pipeline, book, hub)
+        finally:
+            await pipeline.stop()
+            await connector.close()
+            await exchange.stop()
+    return asyncio.run(runner())
+
+async def _rows(sessions, client_order_id):
+    async with sessions() as db:
+        order = await db.scalar(select(Trade).where(Trade.client_order_id == client_order_id))
+        fills = (await db.scalars(
+            select(Trade).where(Trade.order_id == order.order_id, Trade.status == "filled").order_by(Trade.id)
+        )).all()
+    return order, fills
+
+async def _subscribed(exchange):
+    while not exchange.order_subscribers:
+        await asyncio.sleep(0.01)
+
+def test_fills_tracked_from_order_stream(sessions):
+    """주문 스트림으로 분할 체결을 추적하는지 테스트"""
+    exchange = MockUpbitExchange(fill_delay=0.02, fill_steps=2)
+    acks, fills, polls = ORDER_ACK_LATENCY.count, ORDER_FILL_LATENCY.count, ORDER_STATUS_POLLS.value
+
+    async def scenario(pipeline, book, hub):
+        await _subscribed(exchange)
+        ticket = await pipeline.submit(9101, "upbit", "KRW-BTC", "buy", amount=100000, client_order_id="stream-1")
+        assert ticket.order_id == exchange.orders[0]["uuid"]
+        await pipeline.wait("stream-1", timeout=5)
+        return ticket, book.positions(9101), hub.state(orders_topic(9101), "stream-1"), await _rows(sessions, "stream-1")
+
+    ticket, positions, published, (order, fill_rows) = _run(exchange, sessions, scenario)
+    assert ticket.status == COMPLETED and ticket.filled_quantity == pytest.approx(0.002)
+    assert ticket.average_price == pytest.approx(50000000.0)
+    assert order.status == COMPLETED and order.extra_data["filled_quantity"] == pytest.approx(0.002)
+    assert [row.quantity for row in fill_rows] == pytest.approx([0.001, 0.001])
+    assert positions[0].quantity == pytest.approx(0.002)
+    assert published["status"] == COMPLETED
+    assert ORDER_ACK_LATENCY.count - acks == 1 and ORDER_FILL_LATENCY.count - fills == 1
+    assert ORDER_STATUS_POLLS.value == polls
+
+def test_fills_tracked_by_polling_without_stream(sessions):
+    """주문 스트림이 없으면 조회 주기로 체결을 확인하는지 테스트"""
+    exchange = MockUpbitExchange(fill_delay=0.01, order_stream=False)
+
+    async def scenario(pipeline, book, hub):
+        await pipeline.submit(9102, "upbit", "KRW-ETH", "buy", amount=300000, client_order_id="poll-1")
+        ticket = await pipeline.wait("poll-1", timeout=5)
+        return ticket, pipeline.stats()
+
+    ticket, stats = _run(exchange, sessions, scenario, poll_interval=0.05)
+    assert ticket.status == COMPLETED and ticket.filled_quantity == pytest.approx(0.1)
+    assert stats["polled_updates"] >= 1 and stats["active_orders"] == 0
+
+def test_resubmit_and_lost_ack_are_idempotent(sessions):
+    """같은 클라이언트 주문 ID 재제출과 접수 응답 유실 시 중복 주문이 없는지 테스트"""
+    exchange = MockUpbitExchange(fill_delay=0.02)
+    exchange.drop_acks = 1
+
+    async def scenario(pipeline, book, hub):
+        await _subscribed(exchange)
+        first = await pipeline.submit(9103, "upbit", "KRW-BTC", "buy", amount=50000, client_order_id="lost-ack-1")
+        again = await pipeline.submit(9103, "upbit", "KRW-BTC", "buy", amount=50000, client_order_id="lost-ack-1")
+        await pipeline.wait("lost-ack-1", timeout=5)
+        restarted = ExecutionPipeline(pipeline.router, sessions, hub=hub, book=book)
+        loaded = await restarted.submit(9103, "upbit", "KRW-BTC", "buy", amount=50000, client_order_id="lost-ack-1")
+        return first, again, loaded, book.positions(9103)
+
+    first, again, loaded, positions = _run(exchange, sessions, scenario)
+    assert again is first and first.order_id == exchange.orders[0]["uuid"]
+    assert len(exchange.orders) == 1
+    assert loaded is not first and loaded.status == COMPLETED and loaded.order_id == first.order_id
+    assert positions[0].quantity == pytest.approx(0.001)
+
+def test_concurrent_resubmit_waits_for_first_submit(sessions):
+    """같은 클라이언트 주문 ID를 동시에 제출해도 주문 행과 거래소 주문이 하나인지 테스트"""
+    exchange = MockUpbitExchange(fill_delay=0.05)
+
+    async def scenario(pipeline, book, hub):
+        await _subscribed(exchange)
+        first, again = await asyncio.gather(*(
+            pipeline.submit(9107, "upbit", "KRW-BTC", "buy", amount=50000, client_order_id="dup")
+            for _ in range(2)
+        ))
+        ticket = await pipeline.wait("dup", timeout=5)
+        async with sessions() as db:
+            rows = (await db.scalars(select(Trade).where(Trade.client_order_id == "dup"))).all()
+        return first, again, ticket, rows, book.positions(9107)
+
+    first, again, ticket, rows, positions = _run(exchange, sessions, scenario)
+    assert again is first and ticket is first
+    assert len(exchange.orders) == 1
+    assert [row.status for row in rows] == [COMPLETED]
+    assert positions[0].quantity == pytest.approx(0.001)
+
+def test_resubmit_from_another_process_rejected_by_order_keys(sessions):
+    """다른 프로세스(메모리를 공유하지 않는 파이프라인)가 같은 ID로 제출해도 주문 행과 거래소 주문이 하나인지 테스트"""
+    exchange = MockUpbitExchange(fill_delay=0.05)
+
+    async def scenario(pipeline, book, hub):
+        await _subscribed(exchange)
+        other = ExecutionPipeline(pipeline.router, sessions, hub=StreamHub(), book=PortfolioBook(),
+                                  risk=pipeline.risk, notifier=pipeline.notifier)
+        first = await pipeline.submit(9108, "upbit", "KRW-BTC", "buy", amount=50000, client_order_id="dup-x")
+        original_load = other._load
+
+        async def load_before_commit(client_order_id, track=True):
+            # 앞의 제출이 기록하기 전에 조회한 것처럼 (조회와 기록 사이의 경합)
+            return await original_load(client_order_id, track) if not track else None
+
+        other._load = load_before_commit
+        again = await other.submit(9108, "upbit", "KRW-BTC", "buy", amount=50000, client_order_id="dup-x")
+        await pipeline.wait("dup-x", timeout=5)
+        async with sessions() as db:
+            rows = (await db.scalars(select(Trade).where(Trade.client_order_id == "dup-x"))).all()
+        return first, again, rows, other.get("dup-x")
+
+    first, again, rows, tracked = _run(exchange, sessions, scenario)
+    assert again.client_order_id == first.client_order_id and again.trade_id == first.trade_id
+    assert len(exchange.orders) == 1 and len(rows) == 1
+    assert tracked is None  # 먼저 기록한 프로세스가 추적
+
+def test_rejected_order_recorded(sessions):
+    """거래소가 거절한 주문이 rejected로 남는지 테스트"""
+    exchange = MockUpbitExchange()
+
+    async def scenario(pipeline, book, hub):
+        pipeline.notifier.set_targets(9104, "http://127.0.0.1:9/slack")  # 발송기를 시작하지 않아 대기열에 남음
+        with pytest.raises(ExecutionError):
+            await pipeline.submit(9104, "upbit", "KRW-XRP", "buy", amount=10000, client_order_id="rejected-1")
+        async with sessions() as session:
+            return pipeline.get("rejected-1"), await session.scalar(
+                select(Trade).where(Trade.client_order_id == "rejected-1")
+            ), pipeline.notifier.queued
+
+    ticket, row, notifications = _run(exchange, sessions, scenario)
+    assert ticket.status == "rejected" and ticket.finished.is_set()
+    assert row.status == "rejected" and row.extra_data["error"]
+    assert exchange.orders == [] and notifications == 1
+
+def test_completed_without_fills_notifies(sessions):
+    """체결 내역 없이 완료된 주문도 알림을 만드는지 테스트 (평균가 없음)"""
+    notifier = NotificationDispatcher(spill_path="")
+    notifier.set_targets(9109, "http://127.0.0.1:9/slack")
+    pipeline = ExecutionPipeline(ExchangeRouter([]), sessions, hub=StreamHub(), book=PortfolioBook(), notifier=notifier)
+    ticket = OrderTicket("done-1", 9109, "upbit", "KRW-BTC", "buy", "market", amount=50000, status=COMPLETED)
+
+    pipeline._notify(ticket)
+    [webhook] = notifier._webhooks.values()
+    assert webhook.queue[0].message == "upbit KRW-BTC buy 0"
+
+def test_risk_limit_rejects_before_exchange(sessions):
+    """위험 한도를 넘는 주문은 기록/전송 없이 거절하고 체결 후 예약을 해제하는지 테스트"""
+    exchange = MockUpbitExchange(fill_delay=0.01)
+
+    async def scenario(pipeline, book, hub):
+        await _subscribed(exchange)
+        await pipeline.submit(9105, "upbit", "KRW-ETH", "sell", quantity=0.4, client_order_id="risk-1")
+        with pytest.raises(ExecutionError):
+            await pipeline.submit(9105, "upbit", "KRW-ETH", "sell", quantity=0.2, client_order_id="risk-2")
+        await pipeline.wait("risk-1", timeout=5)
+        async with sessions() as session:
+            rows = (await session.scalars(select(Trade.client_order_id).where(Trade.user_id == 9105))).all()
+        return pipeline.risk.check(9105, "upbit", "KRW-ETH", "sell", quantity=0.1), rows
+
+    checked, rows = _run(exchange, sessions, scenario, risk_limits={(9105, "upbit", "KRW-ETH"): 0.5})
+    assert checked == 0.1  # 체결된 0.4는 예약에서 빠지고 포지션(-0.4)으로만 계산
+    assert len(exchange.orders) == 1 and "risk-2" not in rows
@@ -0,0 +1,69 @@
+"""
+기술적 지표 및 전략 테스트
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from app.trading import indicators
+from app.trading.strategy import STRATEGIES, Strategy, create_strategy
+
+
+@pytest.fixture(scope="module")
+def ohlcv():
+    """랜덤워크 OHLCV"""
+    rng = np.random.default_rng(42)
+    n = 2000
+    close = 50_000_000 + np.cumsum(rng.normal(0, 20000, n))
+    return {
+        "open": close,
+        "high": close + rng.uniform(0, 10000, n),
+        "low": close - rng.uniform(0, 10000, n),
+        "close": close,
+        "volume": rng.uniform(0.1, 3, n),
+    }
+
+def _incremental(indicator, *columns):
+    return np.array([indicator.update(*values) for values in zip(*columns)])
+
+@pytest.mark.parametrize("vectorized, incremental, columns", [
+    (lambda d: indicators.sma(d["close"], 20), indicators.SMA(20), ("close",)),
+    (lambda d: indicators.ema(d["close"], 20), indicators.EMA(20), ("close",)),
+    (lambda d: indicators.rsi(d["close"], 14), indicators.RSI(14), ("close",)),
+    (lambda d: np.column_stack(indicators.macd(d["close"])), indicators.MACD(), ("close",)),
+    (lambda d: np.column_stack(indicators.bollinger(d["close"])), indicators.Bollinger(), ("close",)),
+    (lambda d: indicators.atr(d["high"], d["low"], d["close"]), indicators.ATR(), ("high", "low", "close")),
+    (lambda d: indicators.vwap(d["high"], d["low"], d["close"], d["volume"]), indicators.VWAP(), ("high", "low", "close", "volume")),
+])
+def test_incremental_matches_vectorized(ohlcv, vectorized, incremental, columns):
+    """벡터화/증분 지표 일치 테스트"""
+    expected = vectorized(ohlcv)
+    actual = _incremental(incremental, *(ohlcv[c] for c in columns))
+    np.testing.assert_array_equal(np.isnan(expected), np.isnan(actual))
+    np.testing.assert_allclose(actual, expected, rtol=1e-9)
+
+def test_sma_and_rsi_reference_values():
+    """지표 기준값 테스트"""
+    close = np.arange(1.0, 21.0)
+    np.testing.assert_allclose(indicators.sma(close, 5)[4:], np.arange(3.0, 19.0))
+    assert np.isnan(indicators.rsi(close, 14)[13])
+    assert indicators.rsi(close, 14)[-1] == 100.0
+
+@pytest.mark.parametrize("name", sorted(STRATEGIES))
+def test_strategy_live_signals_match_vectorized(ohlcv, name):
+    """전략 실시간/벡터화 신호 일치 테스트"""
+    vectorized = create_strategy(name, "KRW-BTC").generate_signals(pd.DataFrame(ohlcv))
+    live = create_strategy(name, "KRW-BTC")
+    incremental = np.array([live.update(price) for price in ohlcv["close"]])
+
+    np.testing.assert_array_equal(vectorized, incremental)
+    assert np.count_nonzero(vectorized) > 0
+
+def test_incomplete_strategy_rejected_at_construction():
+    """update/signals 미구현 전략 생성 거부 테스트"""
+    class TickOnlyStrategy(Strategy):
+        def update(self, price):
+            return 0
+
+    with pytest.raises(TypeError, match="signals"):
+        TickOnlyStrategy("KRW-BTC", {})
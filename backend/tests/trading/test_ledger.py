@@ -0,0 +1,122 @@
+"""
+체결 원장 / trades 파티션 테스트
+"""
+
+import asyncio
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.db.partitions import month_range, partition_ddl, partition_name
+from app.trading.ledger import AsyncTradeLedger, TradeLedger, normalize_fills
+from app.trading.portfolio import PortfolioBook
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    """임시 SQLite 원장"""
+    engine = create_engine(f"sqlite:///{tmp_path}/ledger.db")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield TradeLedger(session)
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def _fills(count, user_id=1, symbol="KRW-BTC", start=None):
+    start = start or datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return [
+        {
+            "user_id": user_id,
+            "exchange": "upbit",
+            "symbol": symbol,
+            "side": "buy" if i % 2 == 0 else "sell",
+            "quantity": 0.01,
+            "price": 1000.0 + i,
+            "status": "filled",
+            "created_at": start + timedelta(minutes=i),
+            "extra_data": {"seq": i},
+        }
+        for i in range(count)
+    ]
+
+
+def test_trade_indexes_declared(ledger):
+    """복합 인덱스 생성 테스트"""
+    names = {index["name"] for index in inspect(ledger.db.get_bind()).get_indexes("trades")}
+    assert {
+        "ix_trades_user_id_created_at",
+        "ix_trades_user_id_symbol_created_at",
+        "ix_trades_status_created_at",
+    } <= names
+
+
+def test_record_fills_and_history(ledger):
+    """일괄 기록 및 이력 조회 테스트"""
+    assert ledger.record_fills(_fills(50) + _fills(5, symbol="KRW-ETH") + _fills(3, user_id=2)) == 58
+    assert ledger.record_fills([]) == 0
+
+    history = ledger.history(1, limit=10)
+    assert len(history) == 10
+    assert [trade.created_at for trade in history] == sorted((t.created_at for t in history), reverse=True)
+
+    eth = ledger.history(1, symbol="KRW-ETH")
+    assert len(eth) == 5 and {trade.symbol for trade in eth} == {"KRW-ETH"}
+    assert eth[0].extra_data == {"seq": 4}
+
+    start = datetime(2026, 1, 1, 0, 10, tzinfo=timezone.utc)
+    window = ledger.history(1, symbol="KRW-BTC", start=start, end=start + timedelta(minutes=5))
+    assert [trade.price for trade in window] == [1014.0, 1013.0, 1012.0, 1011.0, 1010.0]
+
+
+def test_fills_inserted_under_commit_lock(tmp_path):
+    """체결 행 삽입(ID 할당)부터 커밋까지 스냅샷 잠금을 잡는지 테스트"""
+    book = PortfolioBook()
+    engine = create_engine(f"sqlite:///{tmp_path}/ledger.db")
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/ledger.db")
+    Base.metadata.create_all(bind=engine)
+    locked = []
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO trades"):
+            locked.append(book.commit_lock.locked())
+
+    for bind in (engine, async_engine.sync_engine):
+        event.listen(bind, "before_cursor_execute", on_execute)
+    with sessionmaker(bind=engine)() as session:
+        TradeLedger(session, book).record_fills(_fills(2))
+
+    async def record_async():
+        async with AsyncSession(async_engine) as session:
+            await AsyncTradeLedger(session, book).record_fills(_fills(2, user_id=2))
+        await async_engine.dispose()
+
+    asyncio.run(record_async())
+    engine.dispose()
+    assert locked == [True, True] and book.fills_applied == 4
+
+
+def test_normalize_fills():
+    """체결 레코드 정리 테스트"""
+    row = normalize_fills([{"symbol": "KRW-BTC"}])[0]
+    assert row["created_at"] is not None and row["user_id"] is None
+    with pytest.raises(ValueError):
+        normalize_fills([{"symbol": "KRW-BTC", "unknown": 1}])
+
+
+def test_month_partitions():
+    """월 파티션 범위/DDL 테스트"""
+    months = month_range(date(2025, 11, 20), date(2026, 2, 1))
+    assert [partition_name(month) for month in months] == [
+        "trades_202511", "trades_202512", "trades_202601", "trades_202602",
+    ]
+    assert partition_ddl(date(2025, 12, 15)) == (
+        "CREATE TABLE IF NOT EXISTS trades_202512 PARTITION OF trades "
+        "FOR VALUES FROM ('2025-12-01') TO ('2026-01-01')"
+    )
@@ -0,0 +1,109 @@
+"""
+실시간 시세 저장소/수신기 테스트
+"""
+
+import asyncio
+import json
+import os
+import websockets
+from app.trading.market_data import MarketDataStore, ReplayFeed, UpbitWebSocketFeed
+
+FEED_PATH = os.path.join(os.path.dirname(__file__), "..", "fixtures", "upbit_feed.ndjson")
+
+
+def test_replay_populates_store():
+    """기록된 피드 재생 테스트"""
+    feed = ReplayFeed(FEED_PATH)
+    store = MarketDataStore(capacity=2)
+    updates = []
+    store.add_listener(lambda kind, symbol: updates.append(kind))
+
+    assert feed.replay(store) == len(feed)
+    assert sorted(store.symbols) == ["KRW-BTC", "KRW-ETH", "KRW-XRP"]
+    assert len(updates) == len(feed)
+
+    last_ticker = [m for m in feed.messages() if m["type"] == "ticker" and m["code"] == "KRW-BTC"][-1]
+    assert store.get_ticker("KRW-BTC")["price"] == last_ticker["trade_price"]
+
+    last_book = [m for m in feed.messages() if m["type"] == "orderbook" and m["code"] == "KRW-ETH"][-1]
+    bid, ask = store.best_bid_ask("KRW-ETH")
+    assert bid == last_book["orderbook_units"][0]["bid_price"]
+    assert ask == last_book["orderbook_units"][0]["ask_price"]
+    assert store.get_orderbook("KRW-ETH").shape == (store.depth, 4)
+
+def test_unknown_symbol_reads():
+    """수신 전 심볼 조회 테스트"""
+    store = MarketDataStore()
+    assert store.get_price("KRW-BTC") is None
+    assert store.get_orderbook("KRW-BTC") is None
+
+def test_feed_reconnects_and_resubscribes():
+    """WebSocket 재연결 및 재구독 테스트"""
+    feed_messages = ReplayFeed(FEED_PATH).raw_messages
+    subscriptions = []
+
+    async def handler(websocket):
+        subscriptions.append(json.loads(await websocket.recv()))
+        await websocket.send(feed_messages[len(subscriptions) - 1].encode())
+        if len(subscriptions) == 1:
+            await websocket.close()  # 첫 연결은 강제로 끊음
+            return
+        await websocket.wait_closed()
+
+    async def scenario():
+        store = MarketDataStore()
+        async with websockets.serve(handler, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            feed = UpbitWebSocketFeed(store, ["KRW-BTC"], url=f"ws://127.0.0.1:{port}", reconnect_delay=0.01)
+            task = asyncio.create_task(feed.run())
+            while feed.messages_received < 2:
+                await asyncio.sleep(0.01)
+            await feed.stop()
+            await asyncio.wait_for(task, 1)
+        return feed
+
+    feed = asyncio.run(scenario())
+    assert feed.reconnects == 1
+    assert len(subscriptions) == 2
+    assert subscriptions[1][1] == {"type": "ticker", "codes": ["KRW-BTC"]}
+
+def test_feed_survives_bad_messages():
+    """잘못된 프레임과 리스너 예외 후에도 수신을 이어가는지 테스트"""
+    feed_messages = ReplayFeed(FEED_PATH).raw_messages
+    connections = []
+
+    async def handler(websocket):
+        connections.append(await websocket.recv())
+        await websocket.send(b"not json")
+        await websocket.send(json.dumps({"type": "ticker", "code": "KRW-BTC"}))  # trade_price 누락
+        for raw in feed_messages[:3]:
+            await websocket.send(raw.encode())
+        await websocket.wait_closed()
+
+    def flaky_listener(kind, symbol):
+        if not listened:
+            listened.append(kind)
+            raise RuntimeError("listener failed")
+        listened.append(kind)
+
+    listened = []
+
+    async def scenario():
+        store = MarketDataStore()
+        store.add_listener(flaky_listener)
+        async with websockets.serve(handler, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            feed = UpbitWebSocketFeed(store, ["KRW-BTC"], url=f"ws://127.0.0.1:{port}", reconnect_delay=0.01)
+            task = asyncio.create_task(feed.run())
+            for _ in range(200):
+                if feed.messages_received + feed.messages_failed >= 5 or task.done():
+                    break
+                await asyncio.sleep(0.01)
+            await feed.stop()
+            await asyncio.wait_for(task, 1)
+        return feed
+
+    feed = asyncio.run(scenario())
+    assert len(connections) == 1 and feed.reconnects == 0
+    assert feed.messages_failed == 3
+    assert len(listened) == 3
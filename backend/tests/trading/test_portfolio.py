@@ -0,0 +1,164 @@
+"""
+포트폴리오 회계 테스트
+"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.api import deps
+from app.core.pubsub import StreamHub
+from app.db.base import Base
+from app.main import app
+from app.services.auth_service import Principal
+from app.trading.ledger import TradeLedger
+from app.trading.portfolio import PortfolioBook, Position
+from app.trading.streams import bind_portfolio
+
+
+@pytest.fixture
+def session(tmp_path):
+    """임시 SQLite 세션"""
+    engine = create_engine(f"sqlite:///{tmp_path}/portfolio.db")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def _fill(side, quantity, price, symbol="KRW-BTC", user_id=1, **extra):
+    return {"user_id": user_id, "exchange": "upbit", "symbol": symbol, "side": side,
+            "quantity": quantity, "price": price, "status": "filled", **extra}
+
+
+def test_position_average_cost_and_realized_pnl():
+    """평균 단가 / 실현 손익 계산 테스트"""
+    position = Position(1, "upbit", "KRW-BTC")
+    position.apply("buy", 1.0, 100.0)
+    position.apply("buy", 3.0, 200.0)
+    assert position.quantity == 4.0 and position.avg_cost == pytest.approx(175.0)
+
+    assert position.apply("sell", 1.0, 215.0, fee=1.0) == pytest.approx(39.0)
+    assert position.avg_cost == pytest.approx(175.0)
+    assert position.unrealized_pnl(180.0) == pytest.approx(15.0)
+
+    # 보유 수량을 넘는 매도는 남은 수량으로 공매도 포지션을 연다
+    assert position.apply("sell", 5.0, 150.0) == pytest.approx(-75.0)
+    assert position.quantity == pytest.approx(-2.0) and position.avg_cost == 150.0
+    assert position.unrealized_pnl(140.0) == pytest.approx(20.0)
+    assert position.apply("buy", 2.0, 140.0) == pytest.approx(20.0)
+    assert position.quantity == 0.0 and position.avg_cost == 0.0
+    assert position.realized_pnl == pytest.approx(-16.0) and position.fees == 1.0
+    with pytest.raises(ValueError):
+        position.apply("hold", 1.0, 1.0)
+
+
+def test_ledger_updates_book_incrementally(session):
+    """체결 기록 시 장부 증분 갱신 테스트"""
+    book = PortfolioBook()
+    ledger = TradeLedger(session, book=book)
+    ledger.record_fills([_fill("buy", 2.0, 100.0), _fill("buy", 1.0, 50.0, symbol="KRW-ETH")])
+    ledger.record_fills([_fill("sell", 1.0, 130.0, extra_data={"fee": 0.5}), _fill("buy", 9.0, 1.0, status="cancelled")])
+
+    summary = book.summary(1, {("upbit", "KRW-BTC"): 120.0})
+    positions = {row["symbol"]: row for row in summary["positions"]}
+    assert positions["KRW-BTC"]["quantity"] == 1.0
+    assert positions["KRW-BTC"]["unrealized_pnl"] == pytest.approx(20.0)
+    assert positions["KRW-ETH"]["unrealized_pnl"] is None
+    assert summary["realized_pnl"] == pytest.approx(29.5)
+    assert summary["total_pnl"] == pytest.approx(49.5)
+    assert book.fills_applied == 3
+
+
+def test_snapshot_and_restore(session):
+    """스냅샷 저장 후 이후 체결 재생으로 복원 테스트"""
+    book = PortfolioBook()
+    ledger = TradeLedger(session, book=book)
+    ledger.record_fills([_fill("buy", 2.0, 100.0), _fill("buy", 1.0, 10.0, user_id=2)])
+    assert book.snapshot(session) == 2
+    ledger.record_fills([_fill("sell", 1.0, 150.0), _fill("buy", 1.0, 20.0, user_id=2)])
+
+    restored = PortfolioBook()
+    assert restored.restore(session) == 2
+    for user_id in (1, 2):
+        assert restored.summary(user_id) == book.summary(user_id)
+
+    # 스냅샷이 없으면 전체 체결을 재생
+    empty = PortfolioBook()
+    session.query(Base.metadata.tables["position_snapshots"]).delete()
+    session.commit()
+    assert empty.restore(session) == 4
+    assert empty.summary(1) == book.summary(1)
+
+
+def _principal(user_id):
+    return Principal(id=user_id, username=f"user{user_id}", email=f"user{user_id}@example.com", is_active=True)
+
+
+def test_dashboard_portfolio_endpoint(client, as_principal):
+    """대시보드 포트폴리오 조회 테스트 (토큰 사용자 본인의 포지션만)"""
+    book = PortfolioBook()
+    book.apply_fills([
+        _fill("buy", 2.0, 100.0, user_id=7),
+        {**_fill("buy", 1.0, 5.0, symbol="BTCUSDT", user_id=7), "exchange": "binance"},
+    ])
+
+    class FakeQuotes:
+        requested = None
+
+        async def get_current_prices(self, tickers):
+            FakeQuotes.requested = tickers
+            return {ticker: 110.0 for ticker in tickers}
+
+    app.dependency_overrides[deps.get_portfolio_book] = lambda: book
+    app.dependency_overrides[deps.get_quote_client] = FakeQuotes
+    try:
+        assert client.get("/api/v1/dashboard/portfolio").status_code == 401
+        as_principal(_principal(8))
+        assert client.get("/api/v1/dashboard/portfolio").json()["positions"] == []
+        as_principal(_principal(7))
+        response = client.get("/api/v1/dashboard/portfolio")
+    finally:
+        app.dependency_overrides.pop(deps.get_portfolio_book)
+        app.dependency_overrides.pop(deps.get_quote_client)
+    assert response.status_code == 200
+    data = response.json()
+    assert FakeQuotes.requested == ["KRW-BTC"]
+    assert data["unrealized_pnl"] == pytest.approx(20.0)
+    assert data["market_value"] == pytest.approx(220.0)
+    binance = next(row for row in data["positions"] if row["exchange"] == "binance")
+    assert binance["price"] is None and binance["cost_basis"] == 5.0
+
+
+def test_dashboard_portfolio_from_replicated_state(client, monkeypatch, as_principal):
+    """API 워커(APP_ROLE=api)가 복제된 portfolio 토픽 상태로 포트폴리오를 조회하는지 테스트"""
+    engine_book, hub = PortfolioBook(), StreamHub()
+    unbind = bind_portfolio(hub, engine_book)  # 엔진 프로세스 장부 → 허브 (워커에는 복제된 같은 상태)
+    engine_book.apply_fills([_fill("buy", 2.0, 100.0, user_id=8), _fill("sell", 1.0, 120.0, user_id=8)])
+    unbind()
+
+    class FakeQuotes:
+        async def get_current_prices(self, tickers):
+            return {ticker: 110.0 for ticker in tickers}
+
+    monkeypatch.setattr(deps.settings, "APP_ROLE", "api")
+    app.dependency_overrides[deps.get_stream_hub] = lambda: hub
+    app.dependency_overrides[deps.get_quote_client] = FakeQuotes
+    as_principal(_principal(8))
+    try:
+        response = client.get("/api/v1/dashboard/portfolio")
+    finally:
+        app.dependency_overrides.pop(deps.get_stream_hub)
+        app.dependency_overrides.pop(deps.get_quote_client)
+    assert response.status_code == 200
+    data = response.json()
+    expected = engine_book.summary(8, {("upbit", "KRW-BTC"): 110.0})
+    assert {key: data[key] for key in ("realized_pnl", "unrealized_pnl", "cost_basis", "market_value")} == {
+        key: expected[key] for key in ("realized_pnl", "unrealized_pnl", "cost_basis", "market_value")
+    }
+    [position] = data["positions"]
+    assert position["symbol"] == "KRW-BTC" and position["quantity"] == 1.0 and position["unrealized_pnl"] == 10.0
+    assert data["realized_pnl"] == pytest.approx(20.0)
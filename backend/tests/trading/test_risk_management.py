@@ -0,0 +1,124 @@
+"""
+사전 주문 위험 관리 테스트
+"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.db.base import Base
+from app.models.user import TradingSetting
+from app.trading.market_data import MarketDataStore
+from app.trading.portfolio import PortfolioBook, Position
+from app.trading.risk_management import STOP_LOSS, TAKE_PROFIT, RiskEngine, RiskLimitError
+
+
+def _fill(side, quantity, price, symbol="KRW-BTC", user_id=1):
+    return {"user_id": user_id, "exchange": "upbit", "symbol": symbol, "side": side,
+            "quantity": quantity, "price": price, "status": "filled"}
+
+
+def test_order_limits_and_reservations():
+    """1회 주문 수량/최대 포지션/예약 수량 검사 테스트"""
+    book = PortfolioBook()
+    risk = RiskEngine(book=book, max_order_quantity={"BTC": 0.1})
+    risk.attach()
+    assert risk.check(1, "upbit", "KRW-ETH", "buy", quantity=100.0) is None  # 적용할 한도 없음
+
+    with pytest.raises(RiskLimitError):
+        risk.check(1, "upbit", "KRW-BTC", "buy", quantity=0.2)
+    with pytest.raises(RiskLimitError):
+        risk.check(1, "upbit", "KRW-BTC", "buy", amount=1000000)  # 시세를 몰라 수량 추정 불가
+    risk.on_price("upbit", "KRW-BTC", 50000000.0)
+    assert risk.check(1, "upbit", "KRW-BTC", "buy", amount=1000000) == pytest.approx(0.02)
+
+    risk.set_limits(1, "upbit", "KRW-BTC", max_position=0.15)
+    book.apply_fill(_fill("buy", 0.1, 50000000.0))
+    risk.check(1, "upbit", "KRW-BTC", "buy", quantity=0.05)
+    risk.reserve(1, "upbit", "KRW-BTC", "buy", 0.05)
+    with pytest.raises(RiskLimitError):
+        risk.check(1, "upbit", "KRW-BTC", "buy", quantity=0.01)  # 보유 0.1 + 예약 0.05 + 0.01
+    risk.release(1, "upbit", "KRW-BTC", "buy", 0.05)
+    risk.check(1, "upbit", "KRW-BTC", "buy", quantity=0.01)
+    with pytest.raises(RiskLimitError):
+        risk.check(1, "upbit", "KRW-BTC", "sell", quantity=0.3, price=50000000.0)  # 공매도 0.2 > 0.15
+    with pytest.raises(ValueError):
+        risk.check(1, "upbit", "KRW-BTC", "hold", quantity=0.01)
+    risk.check(1, "upbit", "KRW-BTC", "sell", quantity=0.1)
+    assert risk.stats()["rejections"] >= 4
+
+
+def test_default_limits_with_market_data_prices():
+    """기본 1회 주문 한도에서 시세 저장소 시세로 총액 주문 수량을 추정하는지 테스트"""
+    risk = RiskEngine(book=PortfolioBook())
+    store = MarketDataStore()
+    unbind = risk.bind_market_data(store)
+    with pytest.raises(RiskLimitError):
+        risk.check(1, "upbit", "KRW-BTC", "buy", amount=1000000)  # 시세 수신 전
+
+    store.apply({"type": "ticker", "code": "KRW-BTC", "trade_price": 50000000.0})
+    assert risk.check(1, "upbit", "KRW-BTC", "buy", amount=1000000) == pytest.approx(0.02)
+    with pytest.raises(RiskLimitError):
+        risk.check(1, "upbit", "KRW-BTC", "buy", amount=50000000.0 * settings.MAX_TRADE_AMOUNT * 2)
+    unbind()
+    store.apply({"type": "ticker", "code": "KRW-BTC", "trade_price": 100000000.0})
+    assert risk.check(1, "upbit", "KRW-BTC", "buy", amount=1000000) == pytest.approx(0.02)
+
+
+def test_stop_loss_and_take_profit_triggers():
+    """틱별 손절/익절 판정과 재감시 테스트"""
+    risk = RiskEngine(book=PortfolioBook(), max_order_quantity={}, default_stop_loss=2.0, default_take_profit=4.0)
+    risk.update_positions([
+        Position(1, "upbit", "KRW-BTC", quantity=1.0, avg_cost=100.0),
+        Position(2, "upbit", "KRW-BTC", quantity=-1.0, avg_cost=100.0),
+        Position(3, "upbit", "KRW-BTC", quantity=0.0),
+        Position(4, "upbit", "KRW-ETH", quantity=2.0, avg_cost=10.0),
+    ])
+    risk.set_limits(1, "upbit", "KRW-BTC", stop_loss=5.0)
+    received = []
+    risk.add_listener(received.extend)
+
+    assert risk.on_price("upbit", "KRW-BTC", 97.0) == []  # 롱 손절 95, 숏 손절 102
+    triggers = risk.on_price("upbit", "KRW-BTC", 103.0)
+    assert [(t.user_id, t.kind) for t in triggers] == [(2, STOP_LOSS)]
+    assert risk.on_price("upbit", "KRW-BTC", 103.0) == []  # 포지션이 바뀔 때까지 다시 알리지 않음
+    assert [(t.user_id, t.kind) for t in risk.on_price("upbit", "KRW-BTC", 104.0)] == [(1, TAKE_PROFIT)]
+    assert [(t.user_id, t.kind) for t in risk.on_price("upbit", "KRW-BTC", 94.0)] == []
+
+    risk.update_positions([Position(1, "upbit", "KRW-BTC", quantity=2.0, avg_cost=100.0)])
+    triggers = risk.scan({("upbit", "KRW-BTC"): 94.0, ("upbit", "KRW-ETH"): 10.5})
+    assert sorted((t.user_id, t.kind) for t in triggers) == [(1, STOP_LOSS), (4, TAKE_PROFIT)]
+    assert {t.quantity for t in triggers} == {2.0} and len(received) == 4
+    assert risk.stats()["watched_positions"] == 0
+
+
+def test_limits_loaded_from_trading_settings(tmp_path):
+    """활성 매매 설정과 장부 포지션 적재 테스트"""
+    engine = create_engine(f"sqlite:///{tmp_path}/risk.db")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all([
+        TradingSetting(user_id=7, exchange="upbit", symbol="KRW-BTC", is_active=True,
+                       max_position_size=0.5, stop_loss_percentage=3.0),
+        TradingSetting(user_id=7, exchange="upbit", symbol="KRW-BTC", is_active=True, max_position_size=0.2),
+        TradingSetting(user_id=7, exchange="upbit", symbol="KRW-ETH", is_active=False, max_position_size=0.0),
+    ])
+    session.commit()
+    book = PortfolioBook()
+    book.apply_fill(_fill("buy", 0.15, 100.0, user_id=7))
+    risk = RiskEngine(book=book, max_order_quantity={})
+    try:
+        assert risk.load(session) == 1
+    finally:
+        session.close()
+        engine.dispose()
+
+    with pytest.raises(RiskLimitError):
+        risk.check(7, "upbit", "KRW-BTC", "buy", quantity=0.1)
+    risk.check(7, "upbit", "KRW-ETH", "buy", quantity=1.0)
+    assert [t.kind for t in risk.on_price("upbit", "KRW-BTC", 96.9)] == [STOP_LOSS]
+
+    book.apply_fill(_fill("sell", 0.15, 100.0, user_id=7))  # 장부 변경 알림으로 포지션 갱신
+    risk.check(7, "upbit", "KRW-BTC", "buy", quantity=0.2)
+    risk.detach()
@@ -0,0 +1,82 @@
+"""
+업비트 비동기 API 클라이언트 테스트
+"""
+
+import asyncio
+import pytest
+from app.trading.upbit import async_api
+from app.services.rate_limiter import EXCHANGE_REQUEST_LATENCY
+from app.trading.upbit.async_api import AsyncUpbitAPI
+from app.trading.upbit.exceptions import UpbitAPIError
+
+
+def _run(coro):
+    async def runner():
+        try:
+            return await coro
+        finally:
+            await async_api.close_session()
+    return asyncio.run(runner())
+
+def _client(exchange, secret_key=None):
+    return AsyncUpbitAPI(exchange.access_key, secret_key or exchange.secret_key, base_url=exchange.url)
+
+def test_get_current_price(mock_upbit):
+    """현재가 조회 테스트"""
+    assert _run(_client(mock_upbit).get_current_price("KRW-BTC")) == 50000000.0
+
+def test_get_balance(mock_upbit):
+    """잔고 조회 테스트"""
+    client = _client(mock_upbit)
+    assert _run(client.get_balance()) == 1000000.0
+    assert _run(client.get_balance("KRW-BTC")) == 0.5
+    assert _run(client.get_balance("KRW-XRP")) == 0.0
+
+def test_place_market_order_signs_query(mock_upbit):
+    """시장가 주문 JWT 서명 테스트"""
+    order = _run(_client(mock_upbit).place_market_order("KRW-BTC", "bid", price=10000))
+    assert order["ord_type"] == "price"
+    assert mock_upbit.orders[0]["market"] == "KRW-BTC"
+
+def test_invalid_secret_rejected(mock_upbit):
+    """잘못된 시크릿 키 테스트"""
+    with pytest.raises(UpbitAPIError, match="잔고 조회 실패"):
+        _run(_client(mock_upbit, secret_key="wrong-secret").get_balance())
+
+def test_request_latency_recorded_by_endpoint_and_status(mock_upbit):
+    """거래소 요청 시간 지표 테스트"""
+    ok = EXCHANGE_REQUEST_LATENCY.labels("upbit", "/v1/accounts", "200")
+    rejected = EXCHANGE_REQUEST_LATENCY.labels("upbit", "/v1/accounts", "401")
+    before_ok, before_rejected = ok.count, rejected.count
+    _run(_client(mock_upbit).get_balance())
+    with pytest.raises(UpbitAPIError):
+        _run(_client(mock_upbit, secret_key="wrong-secret").get_balance())
+    assert ok.count == before_ok + 1
+    assert rejected.count == before_rejected + 1
+
+def test_session_shared_within_loop(mock_upbit):
+    """공유 세션 재사용 테스트"""
+    async def scenario():
+        client = _client(mock_upbit)
+        await client.get_current_price("KRW-BTC")
+        first = await async_api.get_session()
+        await client.get_current_price("KRW-ETH")
+        return first is await async_api.get_session()
+
+    assert _run(scenario())
+
+def test_session_from_previous_loop_closed(mock_upbit):
+    """이벤트 루프가 바뀌면 이전 세션을 닫는지 테스트"""
+    async def first_loop():
+        await _client(mock_upbit).get_current_price("KRW-BTC")
+        return await async_api.get_session()
+
+    stale = asyncio.run(first_loop())  # 세션을 닫지 않고 루프 종료
+
+    async def second_loop():
+        session = await async_api.get_session()
+        await _client(mock_upbit).get_current_price("KRW-ETH")
+        return session
+
+    current = _run(second_loop())
+    assert stale.closed and current is not stale
@@ -0,0 +1,127 @@
+"""
+인증 클라이언트 풀 테스트
+"""
+
+import asyncio
+
+import pytest
+
+from app.core.security import CryptoUtils
+from app.trading.upbit import services
+from app.trading.upbit.api import UpbitAPI
+from app.trading.upbit.client_pool import UpbitClientPool
+from app.trading.upbit.exceptions import UpbitAPIKeyError
+from app.trading.upbit.models import ApiKey
+from app.trading.upbit.services import ApiKeyService, AsyncApiKeyService
+from tests.conftest import TestingAsyncSessionLocal
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def pool(monkeypatch):
+    """서비스가 무효화를 알리는 독립된 풀"""
+    pool = UpbitClientPool(ttl=60.0, max_size=2, clock=FakeClock())
+    monkeypatch.setattr(services, "client_pool", pool)
+    return pool
+
+def test_client_reused_until_ttl(db, pool):
+    """TTL 안에서 클라이언트 재사용 테스트"""
+    service = ApiKeyService(db)
+    key = service.create_api_key("upbit", "pool-access", "pool-secret")
+
+    client = service.get_client(key.id)
+    assert isinstance(client, UpbitAPI)
+    assert (client.access_key, client.secret_key) == ("pool-access", "pool-secret")
+    assert service.get_client(key.id) is client
+
+    pool.clock.now = 61.0
+    assert service.get_client(key.id) is not client
+    assert pool.stats() == {"hits": 1, "misses": 2, "evictions": 1, "invalidations": 0, "size": 1}
+
+def test_least_recently_used_evicted(db, pool):
+    """최대 개수 초과 시 LRU 폐기 테스트"""
+    service = ApiKeyService(db)
+    first, second, third = (service.create_api_key("upbit", f"a{i}", f"s{i}").id for i in range(3))
+    kept = service.get_client(first)
+    service.get_client(second)
+    service.get_client(first)
+    service.get_client(third)
+
+    assert service.get_client(first) is kept
+    assert pool.stats()["size"] == 2 and pool.stats()["evictions"] == 1
+    assert pool.stats()["misses"] == 3
+
+def test_status_change_and_delete_invalidate(db, pool):
+    """키 비활성화/삭제 시 즉시 무효화 테스트"""
+    service = ApiKeyService(db)
+    key_id = service.create_api_key("upbit", "access", "secret").id
+    service.get_client(key_id)
+
+    service.update_api_key_status(key_id, False)
+    assert pool.stats()["size"] == 0
+    with pytest.raises(UpbitAPIKeyError):
+        service.get_client(key_id)
+
+    service.update_api_key_status(key_id, True)
+    service.get_client(key_id)
+    service.delete_api_key(key_id)
+    assert pool.stats()["invalidations"] == 2
+    with pytest.raises(UpbitAPIKeyError):
+        service.get_client(key_id)
+
+def test_async_service_shares_pool(db, pool):
+    """비동기 서비스의 풀 조회/무효화 테스트"""
+    key_id = ApiKeyService(db).create_api_key("upbit", "async-access", "async-secret").id
+
+    async def scenario():
+        async with TestingAsyncSessionLocal() as session:
+            service = AsyncApiKeyService(session)
+            client = await service.get_client(key_id)
+            same = await service.get_client(key_id)
+            await service.update_api_key_status(key_id, False)
+            return client, same
+
+    client, same = asyncio.run(scenario())
+    assert client is same and client.access_key == "async-access"
+    assert pool.stats()["invalidations"] == 1 and pool.stats()["size"] == 0
+
+def test_invalidate_during_key_fetch_skips_caching(pool):
+    """키를 읽는 동안 무효화되면 만든 클라이언트를 보관하지 않는지 테스트"""
+    class SlowService:
+        crypto = CryptoUtils("pool-test-key")
+
+        def __init__(self):
+            self.fetching = asyncio.Event()
+            self.release = asyncio.Event()
+
+        async def get_api_key(self, key_id):
+            self.fetching.set()
+            await self.release.wait()
+            return ApiKey(id=key_id, exchange="upbit", is_active=True,
+                          access_key=self.crypto.encrypt("stale-access"), secret_key=self.crypto.encrypt("stale-secret"))
+
+    async def scenario():
+        service = SlowService()
+        pending = asyncio.create_task(pool.aget(service, 7))
+        await service.fetching.wait()
+        pool.invalidate(7)  # 키 비활성화/삭제가 조회 도중 커밋됨
+        service.release.set()
+        return await pending
+
+    client = asyncio.run(scenario())
+    assert client.access_key == "stale-access"
+    assert pool.stats()["size"] == 0
+
+def test_rejects_other_exchange_key(db, pool):
+    """업비트가 아닌 거래소 키로 클라이언트를 만들지 않는지 테스트"""
+    service = ApiKeyService(db)
+    key_id = service.create_api_key("binance", "binance-access", "binance-secret").id
+    with pytest.raises(UpbitAPIKeyError):
+        service.get_client(key_id)
+    assert pool.stats()["size"] == 0
@@ -0,0 +1,31 @@
+"""
+API 키 일괄 암복호화 프로세스 풀 테스트
+"""
+
+import asyncio
+
+from cryptography.fernet import Fernet
+from app.core.security import CryptoUtils
+from app.trading.upbit.crypto_pool import CryptoPool
+
+def test_parallel_encrypt_and_reencrypt():
+    """작업 프로세스 병렬 암호화와 전송용 재암호화 테스트"""
+    crypto = CryptoUtils("pool-secret")
+    transport_key = Fernet.generate_key()
+    pairs = [(f"access-{i}", f"secret-{i}") for i in range(10)]
+    pool = CryptoPool(processes=2, min_parallel=1)
+
+    async def scenario():
+        stored = await pool.encrypt(crypto, pairs)
+        exported = await pool.reencrypt(crypto, stored + [("broken", "broken")], transport_key)
+        wrapped = [(Fernet(transport_key).encrypt(b"a").decode(), "not-a-token")]
+        return stored, exported, await pool.encrypt(crypto, wrapped, transport_key)
+
+    try:
+        stored, exported, rejected = asyncio.run(scenario())
+    finally:
+        pool.shutdown()
+    assert [(crypto.decrypt(a), crypto.decrypt(s)) for a, s in stored] == pairs
+    transport = Fernet(transport_key)
+    assert [transport.decrypt(s.encode()).decode() for _, s in exported[:-1]] == [s for _, s in pairs]
+    assert exported[-1] == "저장된 키를 복호화할 수 없습니다." and rejected == ["전송 키로 복호화할 수 없습니다."]
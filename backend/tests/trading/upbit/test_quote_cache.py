@@ -0,0 +1,131 @@
+"""
+시세 캐시 테스트
+"""
+
+import asyncio
+import threading
+from app.trading.upbit import async_api
+from app.trading.upbit.async_api import AsyncUpbitAPI
+from app.trading.upbit.quote_cache import QuoteCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def test_ttl_hits_and_misses():
+    """TTL 내 캐시 적중 테스트"""
+    clock = FakeClock()
+    cache = QuoteCache(ttl=1.0, clock=clock)
+    calls = []
+    fetch = lambda chunk: calls.append(chunk) or {t: 100.0 for t in chunk}
+
+    assert cache.get_many(["KRW-BTC", "KRW-ETH"], fetch) == {"KRW-BTC": 100.0, "KRW-ETH": 100.0}
+    cache.get_many(["KRW-BTC"], fetch)
+    clock.now = 2.0
+    cache.get_many(["KRW-BTC"], fetch)
+
+    assert calls == [["KRW-BTC", "KRW-ETH"], ["KRW-BTC"]]
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 3
+
+def test_tickers_fetched_in_chunks():
+    """티커 묶음 조회 테스트"""
+    cache = QuoteCache(ttl=1.0, chunk_size=2)
+    calls = []
+    tickers = [f"KRW-T{i}" for i in range(5)]
+
+    prices = cache.get_many(tickers, lambda chunk: calls.append(chunk) or {t: 1.0 for t in chunk})
+
+    assert len(prices) == 5
+    assert [len(chunk) for chunk in calls] == [2, 2, 1]
+
+def test_concurrent_threads_share_fetch():
+    """동시 요청 병합 테스트 (스레드)"""
+    cache = QuoteCache(ttl=1.0)
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def slow_fetch(chunk):
+        calls.append(chunk)
+        started.set()
+        release.wait(1)
+        return {t: 1.0 for t in chunk}
+
+    results = []
+    owner = threading.Thread(target=lambda: results.append(cache.get_many(["KRW-BTC"], slow_fetch)))
+    owner.start()
+    started.wait(1)
+    waiter = threading.Thread(target=lambda: results.append(cache.get_many(["KRW-BTC"], slow_fetch)))
+    waiter.start()
+    release.set()
+    owner.join()
+    waiter.join()
+
+    assert calls == [["KRW-BTC"]]
+    assert results == [{"KRW-BTC": 1.0}, {"KRW-BTC": 1.0}]
+    assert cache.stats()["coalesced"] == 1
+
+def test_fetch_error_propagates_to_waiters():
+    """업스트림 오류 전파 테스트"""
+    cache = QuoteCache(ttl=1.0)
+
+    async def failing_fetch(chunk):
+        await asyncio.sleep(0.01)
+        raise RuntimeError("upstream down")
+
+    async def scenario():
+        return await asyncio.gather(
+            cache.aget_many(["KRW-BTC"], failing_fetch),
+            cache.aget_many(["KRW-BTC"], failing_fetch),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert cache.stats()["upstream_requests"] == 1
+
+def test_cancelled_owner_lets_waiter_refetch():
+    """조회 주체 취소 시 대기자가 다시 조회하는지 테스트"""
+    cache = QuoteCache(ttl=1.0)
+    calls = []
+
+    async def scenario():
+        started = asyncio.Event()
+
+        async def fetch(chunk):
+            calls.append(chunk)
+            if len(calls) == 1:
+                started.set()
+                await asyncio.Event().wait()  # 첫 조회는 취소될 때까지 대기
+            return {t: 1.0 for t in chunk}
+
+        owner = asyncio.create_task(cache.aget_many(["KRW-BTC"], fetch))
+        await started.wait()
+        waiter = asyncio.create_task(cache.aget_many(["KRW-BTC"], fetch))
+        await asyncio.sleep(0)
+        owner.cancel()
+        return await asyncio.wait_for(waiter, 1), owner.cancelled()
+
+    assert asyncio.run(scenario()) == ({"KRW-BTC": 1.0}, True)
+    assert calls == [["KRW-BTC"], ["KRW-BTC"]]
+    assert cache.stats()["coalesced"] == 1
+
+def test_async_client_coalesces_concurrent_callers(mock_upbit, monkeypatch):
+    """비동기 클라이언트 일괄 조회 테스트"""
+    cache = QuoteCache(ttl=5.0)
+    monkeypatch.setattr(async_api, "quote_cache", cache)
+    client = AsyncUpbitAPI(mock_upbit.access_key, mock_upbit.secret_key, base_url=mock_upbit.url)
+
+    async def scenario():
+        try:
+            return await asyncio.gather(*(client.get_current_prices(["KRW-BTC", "KRW-ETH"]) for _ in range(10)))
+        finally:
+            await async_api.close_session()
+
+    results = asyncio.run(scenario())
+    assert all(r == {"KRW-BTC": 50000000.0, "KRW-ETH": 3000000.0} for r in results)
+    assert mock_upbit.request_counts["/v1/ticker"] == 1